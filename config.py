@@ -8,14 +8,14 @@ Loads API keys from .env file
 import os
 from datetime import time
 
-# Load environment variables from .env file
+# Load environment variables from .env file (status is reported by validate_config)
 try:
     from dotenv import load_dotenv
 
     load_dotenv()
-    print("[INFO] Loaded environment variables from .env file")
+    DOTENV_AVAILABLE = True
 except ImportError:
-    print("[WARNING] python-dotenv not installed - loading from system environment")
+    DOTENV_AVAILABLE = False
 
 # Trading Configuration
 TRADING_MODE = "LIVE"  # LIVE, DEMO, TEST
@@ -49,6 +49,94 @@ TRAILING_STOP_PCT = 0.015  # 1.5% default trailing stop distance
 TRAILING_STOP_ACTIVATION = 0.010  # 1.0% profit before trailing activates
 TRAILING_STOP_MIN_MOVE = 0.005  # 0.5% minimum move to adjust trailing stop
 
+# Order Protection Mode - who holds the protective orders
+# "managed"  - bot places a plain stop and cancel/replaces it as the trail moves
+# "bracket"  - broker-native bracket order (entry + stop loss + take profit legs)
+# "trailing" - market entry + broker-native trailing_stop order (trails on the broker)
+ORDER_PROTECTION_MODE = "managed"
+NATIVE_PROTECTION_FILL_TIMEOUT = 10  # Cancel trailing entries unfilled after (s)
+
+# Emergency execution (bulk liquidation / protection)
+EMERGENCY_MAX_PARALLEL = 8  # Maximum orders in flight at once
+EMERGENCY_CONFIRM_TIMEOUT = 30  # Seconds to wait for fills/acceptance
+
+# Order tracking
+TRADE_UPDATE_STREAM_ENABLED = True  # Follow order events over the trade_updates stream
+ORDER_INDEX_RECONCILE_SECONDS = 60  # Full open-order reconcile interval
+RISK_RECONCILE_SECONDS = 300  # Full risk ledger (positions/equity) reconcile interval
+
+# Protective checks (all positions evaluated in one batch per tick)
+RAPID_HARD_STOP_PCT = 0.25  # Hard stop (% loss) once the minimum hold has passed
+HOLD_EMERGENCY_STOP_PCT = 2.0  # Emergency stop (% loss) during the minimum hold
+
+# Adaptive protective polling - check interval grows with ATR distance to a trigger
+PROTECTIVE_MIN_INTERVAL = 0.1  # Seconds between checks at a stop/target
+PROTECTIVE_MAX_INTERVAL = 5.0  # Seconds between checks far from any trigger
+PROTECTIVE_SECONDS_PER_ATR = 4.0  # Interval added per ATR of distance
+PROTECTIVE_SYNC_SECONDS = 1.0  # Broker connection/position sync cadence
+
+# Live performance statistics
+PERFORMANCE_ROLLING_WINDOW = 50  # Trades in the rolling win rate
+
+# Engine state snapshot (warm restart within a trading day)
+STATE_SNAPSHOT_ENABLED = True
+STATE_SNAPSHOT_PATH = "logs/engine_state.pkl"
+STATE_SNAPSHOT_SECONDS = 5  # Seconds between snapshots
+
+# Trading cycle time budget (lower-priority symbols defer to the next cycle)
+CYCLE_BUDGET_SECONDS = 10.0  # Wall time for one trading cycle's symbol work
+SYMBOL_BUDGET_SECONDS = 1.0  # Expected per-symbol time; slower symbols are logged
+
+# Per-symbol state table
+SYMBOL_STATE_PRUNE_SECONDS = 300  # How often rows of idle symbols are recycled
+
+# Metrics endpoint (Prometheus text format, served off the trading thread)
+METRICS_ENABLED = False
+METRICS_HOST = "127.0.0.1"  # Bind address; keep local unless scraped remotely
+METRICS_PORT = 9108
+
+# Structured event journal (JSONL, one segment per day; see docs/EVENT_JOURNAL.md)
+EVENT_JOURNAL_ENABLED = True
+EVENT_JOURNAL_DIR = "logs/journal"
+
+# Slow-cycle profiling (stack samples of over-budget cycles, collapsed-stack files)
+PROFILE_CYCLES_ENABLED = False
+PROFILE_SLOW_CYCLE_SECONDS = 5.0  # Cycles slower than this are written out
+PROFILE_SAMPLE_SECONDS = 0.005  # Stack sampling interval while a cycle runs
+PROFILE_DIR = "logs/profiles"
+PROFILE_MAX_FILES = 200  # Oldest profiles beyond this are deleted
+
+# API traffic cassettes: record every REST exchange of a session, replay it offline
+API_CASSETTE_MODE = "off"  # "off", "record" or "replay" (utils/api_cassette.py)
+API_CASSETTE_DIR = "logs/cassettes"
+API_CASSETTE_PATH = None  # Cassette to replay; the newest in API_CASSETTE_DIR if unset
+API_CASSETTE_REPLAY_SPEED = 0.0  # 0 = as fast as possible, 1 = recorded latency
+API_CASSETTE_IGNORE_FIELDS = ("start", "end", "after", "until", "client_order_id")
+
+# Local fake broker for offline end-to-end runs (utils/fake_broker.py)
+FAKE_BROKER_HOST = "127.0.0.1"
+FAKE_BROKER_PORT = 8765
+FAKE_BROKER_LATENCY_MS = 20.0  # Added to every REST response
+FAKE_BROKER_JITTER_MS = 10.0  # +/- uniform jitter around the latency
+FAKE_BROKER_RATE_LIMIT = 200  # Requests per minute per key, 0 = unlimited
+FAKE_BROKER_FILL_DELAY_MS = 50.0  # Order accepted -> fill event
+FAKE_BROKER_PARTIAL_FILL_PROB = 0.1  # Market orders that fill in two pieces
+FAKE_BROKER_REJECT_PROB = 0.02  # Orders refused at submission
+
+# Logging (queued to a background writer; INFO/DEBUG rate limited per call site)
+LOG_ASYNC = True
+LOG_RATE_LIMIT_ENABLED = True
+LOG_SITE_RATE = 0.2  # Sustained records/second per call site
+LOG_SITE_BURST = 30  # Records a call site may log before it is limited
+LOG_SAMPLE_EVERY = 10  # Once limited, keep 1 in N records
+# Order/fill audit trails, never rate limited
+LOG_RATE_LIMIT_EXEMPT = (
+    "order_manager",
+    "emergency_executor",
+    "trade_updates",
+    "trade_closer",
+)
+
 # Trading Hours (Eastern Time) - Avoid volatile opening/closing periods
 MARKET_OPEN = time(10, 0)  # 10:00 AM (30 min after market open)
 MARKET_CLOSE = time(15, 30)  # 3:30 PM (30 min before market close)
@@ -93,11 +181,6 @@ ALPACA_SECRET_KEY = os.getenv("ALPACA_SECRET_KEY")
 ALPACA_BASE_URL = os.getenv("ALPACA_BASE_URL", "https://paper-api.alpaca.markets")
 ALPACA_TRADING_ENV = os.getenv("ALPACA_TRADING_ENV", "paper")
 
-print(f"[CONFIG] Alpaca API Key: {'SET' if ALPACA_API_KEY else 'NOT SET'}")
-print(f"[CONFIG] Alpaca Secret Key: {'SET' if ALPACA_SECRET_KEY else 'NOT SET'}")
-print(f"[CONFIG] Alpaca Base URL: {ALPACA_BASE_URL}")
-print(f"[CONFIG] Trading Environment: {ALPACA_TRADING_ENV}")
-
 # Logging Configuration
 LOG_LEVEL = "INFO"
 LOG_TO_FILE = True
@@ -119,8 +202,21 @@ MIN_VOLUME = 100000  # Minimum daily volume
 MAX_SPREAD_PCT = 0.5  # Maximum bid-ask spread percentage
 
 
+def print_config_summary():
+    """Print where credentials came from and which Alpaca environment is used"""
+    if DOTENV_AVAILABLE:
+        print("[INFO] Loaded environment variables from .env file")
+    else:
+        print("[WARNING] python-dotenv not installed - loading from system environment")
+    print(f"[CONFIG] Alpaca API Key: {'SET' if ALPACA_API_KEY else 'NOT SET'}")
+    print(f"[CONFIG] Alpaca Secret Key: {'SET' if ALPACA_SECRET_KEY else 'NOT SET'}")
+    print(f"[CONFIG] Alpaca Base URL: {ALPACA_BASE_URL}")
+    print(f"[CONFIG] Trading Environment: {ALPACA_TRADING_ENV}")
+
+
 def validate_config():
     """Validate configuration settings"""
+    print_config_summary()
     if not ALPACA_API_KEY or not ALPACA_SECRET_KEY:
         raise ValueError("Alpaca API credentials not found in environment variables")
 
@@ -130,6 +226,11 @@ def validate_config():
     if STOP_LOSS_PCT <= 0 or STOP_LOSS_PCT >= 1:
         raise ValueError("STOP_LOSS_PCT must be between 0 and 1")
 
+    if ORDER_PROTECTION_MODE not in ("managed", "bracket", "trailing"):
+        raise ValueError(
+            "ORDER_PROTECTION_MODE must be one of: managed, bracket, trailing"
+        )
+
     print("[CONFIG] Configuration validation passed")
     return True
 
@@ -150,6 +251,55 @@ config = {
     "TRAILING_STOP_PCT": TRAILING_STOP_PCT,
     "TRAILING_STOP_ACTIVATION": TRAILING_STOP_ACTIVATION,
     "TRAILING_STOP_MIN_MOVE": TRAILING_STOP_MIN_MOVE,
+    "ORDER_PROTECTION_MODE": ORDER_PROTECTION_MODE,
+    "NATIVE_PROTECTION_FILL_TIMEOUT": NATIVE_PROTECTION_FILL_TIMEOUT,
+    "EMERGENCY_MAX_PARALLEL": EMERGENCY_MAX_PARALLEL,
+    "EMERGENCY_CONFIRM_TIMEOUT": EMERGENCY_CONFIRM_TIMEOUT,
+    "TRADE_UPDATE_STREAM_ENABLED": TRADE_UPDATE_STREAM_ENABLED,
+    "ORDER_INDEX_RECONCILE_SECONDS": ORDER_INDEX_RECONCILE_SECONDS,
+    "RISK_RECONCILE_SECONDS": RISK_RECONCILE_SECONDS,
+    "RAPID_HARD_STOP_PCT": RAPID_HARD_STOP_PCT,
+    "HOLD_EMERGENCY_STOP_PCT": HOLD_EMERGENCY_STOP_PCT,
+    "PROTECTIVE_MIN_INTERVAL": PROTECTIVE_MIN_INTERVAL,
+    "PROTECTIVE_MAX_INTERVAL": PROTECTIVE_MAX_INTERVAL,
+    "PROTECTIVE_SECONDS_PER_ATR": PROTECTIVE_SECONDS_PER_ATR,
+    "PROTECTIVE_SYNC_SECONDS": PROTECTIVE_SYNC_SECONDS,
+    "PERFORMANCE_ROLLING_WINDOW": PERFORMANCE_ROLLING_WINDOW,
+    "STATE_SNAPSHOT_ENABLED": STATE_SNAPSHOT_ENABLED,
+    "STATE_SNAPSHOT_PATH": STATE_SNAPSHOT_PATH,
+    "STATE_SNAPSHOT_SECONDS": STATE_SNAPSHOT_SECONDS,
+    "CYCLE_BUDGET_SECONDS": CYCLE_BUDGET_SECONDS,
+    "SYMBOL_BUDGET_SECONDS": SYMBOL_BUDGET_SECONDS,
+    "SYMBOL_STATE_PRUNE_SECONDS": SYMBOL_STATE_PRUNE_SECONDS,
+    "METRICS_ENABLED": METRICS_ENABLED,
+    "METRICS_HOST": METRICS_HOST,
+    "METRICS_PORT": METRICS_PORT,
+    "EVENT_JOURNAL_ENABLED": EVENT_JOURNAL_ENABLED,
+    "EVENT_JOURNAL_DIR": EVENT_JOURNAL_DIR,
+    "PROFILE_CYCLES_ENABLED": PROFILE_CYCLES_ENABLED,
+    "PROFILE_SLOW_CYCLE_SECONDS": PROFILE_SLOW_CYCLE_SECONDS,
+    "PROFILE_SAMPLE_SECONDS": PROFILE_SAMPLE_SECONDS,
+    "PROFILE_DIR": PROFILE_DIR,
+    "PROFILE_MAX_FILES": PROFILE_MAX_FILES,
+    "API_CASSETTE_MODE": API_CASSETTE_MODE,
+    "API_CASSETTE_DIR": API_CASSETTE_DIR,
+    "API_CASSETTE_PATH": API_CASSETTE_PATH,
+    "API_CASSETTE_REPLAY_SPEED": API_CASSETTE_REPLAY_SPEED,
+    "API_CASSETTE_IGNORE_FIELDS": API_CASSETTE_IGNORE_FIELDS,
+    "FAKE_BROKER_HOST": FAKE_BROKER_HOST,
+    "FAKE_BROKER_PORT": FAKE_BROKER_PORT,
+    "FAKE_BROKER_LATENCY_MS": FAKE_BROKER_LATENCY_MS,
+    "FAKE_BROKER_JITTER_MS": FAKE_BROKER_JITTER_MS,
+    "FAKE_BROKER_RATE_LIMIT": FAKE_BROKER_RATE_LIMIT,
+    "FAKE_BROKER_FILL_DELAY_MS": FAKE_BROKER_FILL_DELAY_MS,
+    "FAKE_BROKER_PARTIAL_FILL_PROB": FAKE_BROKER_PARTIAL_FILL_PROB,
+    "FAKE_BROKER_REJECT_PROB": FAKE_BROKER_REJECT_PROB,
+    "LOG_ASYNC": LOG_ASYNC,
+    "LOG_RATE_LIMIT_ENABLED": LOG_RATE_LIMIT_ENABLED,
+    "LOG_SITE_RATE": LOG_SITE_RATE,
+    "LOG_SITE_BURST": LOG_SITE_BURST,
+    "LOG_SAMPLE_EVERY": LOG_SAMPLE_EVERY,
+    "LOG_RATE_LIMIT_EXEMPT": LOG_RATE_LIMIT_EXEMPT,
     "MARKET_OPEN": MARKET_OPEN,
     "MARKET_CLOSE": MARKET_CLOSE,
     "TRADING_START": TRADING_START,
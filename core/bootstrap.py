@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Startup Bootstrap
+Runs named startup phases on a thread pool, each as soon as the phases it
+depends on have finished, so independent broker round trips overlap. Every
+phase is timed and the breakdown goes to the startup log.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from utils.logger import setup_logger
+
+
+class Bootstrap:
+    """Dependency-aware parallel startup sequence
+
+    Phases are registered with add() and executed by run(). A failing
+    required phase aborts startup with its exception; a failing optional
+    phase is logged and its result is None.
+    """
+
+    def __init__(self, name: str = "startup", max_workers: int = 4):
+        self.logger = setup_logger("bootstrap")
+        self.name = name
+        self.max_workers = max_workers
+        self._phases: Dict[str, Tuple[Callable, Tuple[str, ...], bool]] = {}
+
+        self.results: Dict[str, object] = {}
+        self.errors: Dict[str, Exception] = {}
+        # phase -> (start offset from run(), duration) in seconds
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self.total_seconds = 0.0
+        self._started: Optional[float] = None
+
+    def add(
+        self,
+        name: str,
+        fn: Callable,
+        after: Iterable[str] = (),
+        required: bool = True,
+    ) -> "Bootstrap":
+        if name in self._phases:
+            raise ValueError(f"Duplicate startup phase: {name}")
+        self._phases[name] = (fn, tuple(after), required)
+        return self
+
+    def _timed(self, name: str, fn: Callable):
+        started = time.monotonic()
+        try:
+            return fn()
+        finally:
+            self.timings[name] = (
+                started - self._started,
+                time.monotonic() - started,
+            )
+
+    def run(self) -> Dict[str, object]:
+        """Execute all phases; returns phase results by name"""
+        for name, (_, after, _) in self._phases.items():
+            unknown = [dep for dep in after if dep not in self._phases]
+            if unknown:
+                raise ValueError(f"Startup phase {name} depends on unknown {unknown}")
+
+        self._started = time.monotonic()
+        pending = dict(self._phases)
+        finished = set()
+        running = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="bootstrap"
+        ) as pool:
+            while pending or running:
+                for name in [
+                    n
+                    for n, (_, after, _) in pending.items()
+                    if finished.issuperset(after)
+                ]:
+                    fn = pending.pop(name)[0]
+                    running[pool.submit(self._timed, name, fn)] = name
+
+                if not running:
+                    raise ValueError(
+                        f"Startup phases with circular dependencies: {sorted(pending)}"
+                    )
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    finished.add(name)
+                    try:
+                        self.results[name] = future.result()
+                    except Exception as e:
+                        self.errors[name] = e
+                        self.results[name] = None
+                        if self._phases[name][2]:
+                            self.logger.error(
+                                f"❌ {self.name}: phase {name} failed: {e}"
+                            )
+                            pending.clear()
+                            raise
+                        self.logger.warning(
+                            f"⚠️ {self.name}: optional phase {name} failed: {e}"
+                        )
+
+        self.total_seconds = time.monotonic() - self._started
+        self.log_timings()
+        return self.results
+
+    def log_timings(self):
+        """One line per phase: when it started and how long it took"""
+        serial = sum(duration for _, duration in self.timings.values())
+        self.logger.info(
+            f"⏱️ {self.name}: {len(self.timings)} phases in {self.total_seconds:.3f}s "
+            f"({serial:.3f}s if run serially)"
+        )
+        for name, (offset, duration) in sorted(
+            self.timings.items(), key=lambda item: item[1][0]
+        ):
+            status = " FAILED" if name in self.errors else ""
+            self.logger.info(f"   {name:<20} +{offset:.3f}s  {duration:.3f}s{status}")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Client Order IDs
+Deterministic client_order_ids derived from the signal that caused an order,
+and a local registry of our submissions and their latest known status
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# make_signal_id lives with the signal types; importable from here as before
+from utils.signal_types import make_signal_id
+
+# Alpaca rejects client_order_id values longer than this
+MAX_CLIENT_ORDER_ID_LENGTH = 48
+
+# Registry statuses after which an order will not change again
+FINAL_STATUSES = ("filled", "canceled", "expired", "rejected", "done_for_day", "failed")
+
+# Statuses that mean a fill was confirmed (fully or in part)
+FILL_STATUSES = ("filled", "partially_filled")
+
+# Broker-final statuses without a fill - the signal may be retried under a new id
+DEAD_STATUSES = ("canceled", "expired", "rejected", "done_for_day")
+
+
+def _field(order, name, default=None):
+    if isinstance(order, dict):
+        return order.get(name, default)
+    return getattr(order, name, default)
+
+
+def make_client_order_id(
+    symbol: str, side: str, signal_id: str, purpose: str = "entry"
+) -> str:
+    """client_order_id for one order of a signal: rib-{purpose}-{symbol}-{side}-{signal_id}
+
+    Retrying with the same signal and purpose gives the same id, so the broker
+    itself refuses a second copy of an order that already went through.
+    """
+    safe_signal = re.sub(r"[^A-Za-z0-9]", "", str(signal_id))
+    client_order_id = f"rib-{purpose}-{symbol}-{side}-{safe_signal}".lower()
+    return client_order_id[:MAX_CLIENT_ORDER_ID_LENGTH]
+
+
+class ClientOrderRegistry:
+    """Our submissions keyed by client_order_id, with an order_id -> client id map
+
+    Records are created before the REST call, so a submission that times out is
+    still known as outstanding and can be resolved by id instead of by looking
+    at positions.
+    """
+
+    def __init__(self, max_records: int = 2000):
+        self._lock = threading.RLock()
+        self._records: "OrderedDict[str, Dict]" = OrderedDict()
+        self._by_order_id: Dict[str, str] = {}
+        self._max_records = max_records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, client_order_id: str) -> bool:
+        return client_order_id in self._records
+
+    def begin(self, client_order_id: str, symbol: str, side: str, qty) -> Dict:
+        """Register a submission that is about to be sent"""
+        with self._lock:
+            record = {
+                "client_order_id": client_order_id,
+                "order_id": None,
+                "symbol": symbol,
+                "side": side,
+                "qty": float(qty),
+                "status": "submitting",
+                "filled_qty": 0.0,
+                "filled_avg_price": None,
+                "error": None,
+                "submitted_at": time.monotonic(),
+                "updated_at": time.monotonic(),
+            }
+            self._records[client_order_id] = record
+            self._records.move_to_end(client_order_id)
+            self._trim()
+            return record
+
+    def record_order(self, client_order_id: str, order) -> Optional[Dict]:
+        """Attach the broker's Order (REST response or lookup) to a submission"""
+        with self._lock:
+            record = self._records.get(client_order_id)
+            if record is None:
+                return None
+            order_id = _field(order, "id")
+            if order_id:
+                record["order_id"] = order_id
+                self._by_order_id[order_id] = client_order_id
+            # A stream event may already have moved the status further along
+            if record["status"] not in FINAL_STATUSES:
+                record["status"] = _field(order, "status") or record["status"]
+                self._apply_fill(record, order)
+            record["updated_at"] = time.monotonic()
+            return dict(record)
+
+    def record_failure(self, client_order_id: str, error):
+        """Mark a submission the broker never accepted"""
+        with self._lock:
+            record = self._records.get(client_order_id)
+            if record is not None:
+                record["status"] = "failed"
+                record["error"] = str(error)
+                record["updated_at"] = time.monotonic()
+
+    def on_trade_update(self, event: Dict):
+        """TradeUpdateFeed subscriber - apply status/fill changes to our orders"""
+        client_order_id = event.get("client_order_id")
+        with self._lock:
+            record = self._records.get(client_order_id)
+            if record is None:
+                return
+            if event.get("order_id"):
+                record["order_id"] = event["order_id"]
+                self._by_order_id[event["order_id"]] = client_order_id
+            record["status"] = event.get("status") or event.get("event")
+            self._apply_fill(record, event)
+            record["updated_at"] = time.monotonic()
+
+    @staticmethod
+    def _apply_fill(record: Dict, source):
+        filled_qty = _field(source, "filled_qty")
+        if filled_qty is not None:
+            record["filled_qty"] = float(filled_qty)
+        filled_avg_price = _field(source, "filled_avg_price")
+        if filled_avg_price is not None:
+            record["filled_avg_price"] = float(filled_avg_price)
+
+    def get(self, client_order_id: str) -> Optional[Dict]:
+        with self._lock:
+            record = self._records.get(client_order_id)
+            return dict(record) if record is not None else None
+
+    def get_by_order_id(self, order_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self.get(self._by_order_id.get(order_id) or order_id)
+
+    def is_duplicate(self, client_order_id: str) -> bool:
+        """True when a submission with this id is outstanding or has filled"""
+        with self._lock:
+            record = self._records.get(client_order_id)
+            return record is not None and record["status"] not in (
+                ("failed",) + DEAD_STATUSES
+            )
+
+    def next_client_order_id(
+        self, symbol: str, side: str, signal_id: str, purpose: str = "entry"
+    ) -> str:
+        """Client id for the next attempt of a signal's order
+
+        A submission that never reached the broker ("failed") keeps its id; one
+        the broker cancelled or rejected needs a fresh id (entry2, entry3, ...)
+        because the broker does not accept a client_order_id twice.
+        """
+        attempt = 1
+        with self._lock:
+            while True:
+                suffix = purpose if attempt == 1 else f"{purpose}{attempt}"
+                client_order_id = make_client_order_id(symbol, side, signal_id, suffix)
+                record = self._records.get(client_order_id)
+                if record is None or record["status"] not in DEAD_STATUSES:
+                    return client_order_id
+                attempt += 1
+
+    def outstanding(self) -> List[Dict]:
+        """Submissions that have not reached a final status yet"""
+        with self._lock:
+            return [
+                dict(record)
+                for record in self._records.values()
+                if record["status"] not in FINAL_STATUSES
+            ]
+
+    def _trim(self):
+        while len(self._records) > self._max_records:
+            _, record = self._records.popitem(last=False)
+            self._by_order_id.pop(record["order_id"], None)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Cycle Scheduler
+Deadline-aware ordering of per-symbol work in a trading cycle. Symbols are
+taken in priority order (held positions, then those nearest to a signal, then
+the rest) and work that no longer fits the cycle's time budget is deferred to
+the front of its tier in the next cycle. Overruns are counted for diagnostics.
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional
+
+from config import config
+
+# Priority tiers, most urgent first
+TIER_HELD = 0
+TIER_NEAR_SIGNAL = 1
+TIER_REST = 2
+
+# Weight of the newest sample in a symbol's processing time estimate
+COST_EWMA_ALPHA = 0.3
+
+
+class CycleRun:
+    """One cycle's plan and progress; produced by CycleScheduler.begin_cycle"""
+
+    def __init__(self, scheduler: "CycleScheduler", order: List[str], deadline: float):
+        self.scheduler = scheduler
+        self.order = order
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.processed: List[str] = []
+        self.deferred: List[str] = []
+        self.symbol_overruns: List[str] = []
+
+    def __iter__(self):
+        """Symbols to process now; stops once the next one would miss the deadline"""
+        for index, symbol in enumerate(self.order):
+            if not self.fits(symbol):
+                self.deferred = self.order[index:]
+                return
+            started = time.monotonic()
+            yield symbol
+            self.record(symbol, time.monotonic() - started)
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def fits(self, symbol: str) -> bool:
+        """The symbol's expected cost fits what is left of the budget
+
+        The first symbol always runs so a cycle makes progress.
+        """
+        if not self.processed:
+            return True
+        return self.scheduler.expected_cost(symbol) <= self.remaining()
+
+    def record(self, symbol: str, seconds: float):
+        self.processed.append(symbol)
+        self.scheduler.observe(symbol, seconds)
+        if seconds > self.scheduler.symbol_budget:
+            self.symbol_overruns.append(symbol)
+
+    def finish(self) -> Dict:
+        return self.scheduler.finish_cycle(self)
+
+
+class CycleScheduler:
+    """Orders symbols for each cycle and enforces the cycle budget"""
+
+    def __init__(self, cycle_budget=None, symbol_budget=None):
+        self.cycle_budget = cycle_budget or config.get("CYCLE_BUDGET_SECONDS", 10.0)
+        self.symbol_budget = symbol_budget or config.get("SYMBOL_BUDGET_SECONDS", 1.0)
+        self._cost: Dict[str, float] = {}  # EWMA seconds per symbol
+        self._proximity: Dict[str, float] = {}  # 0..1, higher is nearer a signal
+        self._deferred: List[str] = []
+
+        self.cycles = 0
+        self.overrun_cycles = 0  # cycles that deferred work
+        self.symbol_overruns = 0  # symbols over their own budget
+        self.deferred_total = 0
+        self.last_cycle: Dict = {}
+
+    def expected_cost(self, symbol: str) -> float:
+        """Estimated seconds for a symbol (its budget until first measured)"""
+        return self._cost.get(symbol, self.symbol_budget)
+
+    def observe(self, symbol: str, seconds: float):
+        previous = self._cost.get(symbol)
+        self._cost[symbol] = (
+            seconds
+            if previous is None
+            else COST_EWMA_ALPHA * seconds + (1 - COST_EWMA_ALPHA) * previous
+        )
+
+    def set_proximity(self, symbol: str, proximity: Optional[float]):
+        """How close the symbol came to a signal on its last run (0 = none)"""
+        self._proximity[symbol] = float(proximity or 0.0)
+
+    def tier(self, symbol: str, held: Iterable[str]) -> int:
+        if symbol in held:
+            return TIER_HELD
+        if self._proximity.get(symbol, 0.0) > 0:
+            return TIER_NEAR_SIGNAL
+        return TIER_REST
+
+    def plan(self, symbols: List[str], held: Iterable[str] = ()) -> List[str]:
+        """Symbols in processing order
+
+        Within a tier, work deferred last cycle goes first, then symbols
+        nearer to a signal; ties keep watchlist order.
+        """
+        held = set(held)
+        deferred = {s: i for i, s in enumerate(self._deferred)}
+        position = {s: i for i, s in enumerate(symbols)}
+        return sorted(
+            symbols,
+            key=lambda s: (
+                self.tier(s, held),
+                deferred.get(s, len(deferred)),
+                -self._proximity.get(s, 0.0),
+                position[s],
+            ),
+        )
+
+    def begin_cycle(
+        self,
+        symbols: List[str],
+        held: Iterable[str] = (),
+        budget: Optional[float] = None,
+    ) -> CycleRun:
+        budget = self.cycle_budget if budget is None else budget
+        return CycleRun(self, self.plan(symbols, held), time.monotonic() + budget)
+
+    def finish_cycle(self, run: CycleRun) -> Dict:
+        elapsed = time.monotonic() - run.started
+        self._deferred = list(run.deferred)
+        self.cycles += 1
+        self.symbol_overruns += len(run.symbol_overruns)
+        if run.deferred:
+            self.overrun_cycles += 1
+            self.deferred_total += len(run.deferred)
+        self.last_cycle = {
+            "elapsed_s": round(elapsed, 3),
+            "budget_s": round(run.deadline - run.started, 3),
+            "processed": len(run.processed),
+            "deferred": list(run.deferred),
+            "slow_symbols": list(run.symbol_overruns),
+        }
+        return self.last_cycle
+
+    def stats(self) -> Dict:
+        return {
+            "cycles": self.cycles,
+            "overrun_cycles": self.overrun_cycles,
+            "overrun_rate": (
+                round(self.overrun_cycles / self.cycles, 3) if self.cycles else 0.0
+            ),
+            "deferred_total": self.deferred_total,
+            "symbol_overruns": self.symbol_overruns,
+            "cycle_budget_s": self.cycle_budget,
+            "symbol_budget_s": self.symbol_budget,
+            "last_cycle": self.last_cycle,
+        }
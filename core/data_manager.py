@@ -12,26 +12,38 @@ import alpaca_trade_api as tradeapi
 import pandas as pd
 
 from config import config
+from utils.api_client import InstrumentedREST
 from utils.logger import clean_message, setup_logger
 
 
 class DataManager:
     """Manages market data and Alpaca API connection"""
 
-    def __init__(self):
+    def __init__(self, verify_connection=True):
         self.logger = setup_logger("data_manager")
         self.logger.info("Initializing Data Manager...")
 
         # Initialize Alpaca API
         try:
-            self.api = tradeapi.REST(
-                config["ALPACA_API_KEY"],
-                config["ALPACA_SECRET_KEY"],
-                config["ALPACA_BASE_URL"],
-                api_version="v2",
+            self.api = InstrumentedREST(
+                tradeapi.REST(
+                    config["ALPACA_API_KEY"],
+                    config["ALPACA_SECRET_KEY"],
+                    config["ALPACA_BASE_URL"],
+                    api_version="v2",
+                )
             )
+        except Exception as e:
+            self.logger.error(f"[ERROR] Failed to connect to Alpaca: {e}")
+            raise
+
+        # Callers that bootstrap in parallel run the connection test themselves
+        if verify_connection:
+            self.verify_connection()
 
-            # Test connection
+    def verify_connection(self):
+        """Test the connection with an account request; raises on failure"""
+        try:
             account = self.api.get_account()
             equity = float(account.equity)
             buying_power = float(account.buying_power)
@@ -40,6 +52,7 @@ class DataManager:
             self.logger.info(f"[ALPACA] Account Equity: ${equity:,.2f}")
             self.logger.info(f"[ALPACA] Buying Power: ${buying_power:,.2f}")
             self.logger.info(f"[ALPACA] Status: {account.status}")
+            return account
 
         except Exception as e:
             self.logger.error(f"[ERROR] Failed to connect to Alpaca: {e}")
@@ -129,6 +142,21 @@ class DataManager:
             self.logger.error(f"[ERROR] Failed to get price for {symbol}: {e}")
             return None
 
+    def get_latest_prices(self, symbols):
+        """Latest trade price for many symbols in one request"""
+        if not symbols:
+            return {}
+        try:
+            trades = self.api.get_latest_trades(list(symbols))
+            return {
+                symbol: float(trade.price)
+                for symbol, trade in trades.items()
+                if trade is not None
+            }
+        except Exception as e:
+            self.logger.error(f"[ERROR] Failed to get latest prices: {e}")
+            return {}
+
     def get_bars(self, symbol, timeframe="15Min", limit=100):
         """Get historical bars for a symbol with sufficient data for indicators"""
         try:
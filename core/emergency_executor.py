@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Emergency Executor
+Flattens or protects many positions at once: bulk cancel, bounded-parallel
+order submission and fill confirmation from the shared trade update stream
+"""
+
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from config import config
+from core.trade_updates import TERMINAL_EVENTS, get_trade_update_feed
+from utils.logger import setup_logger
+
+# Broker order statuses that count as confirmed for each confirmation mode
+FILLED_STATUSES = ("filled",)
+ACCEPTED_STATUSES = ("new", "accepted", "pending_new", "held", "filled")
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (pct in 0-100) of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class EmergencyExecutor:
+    """Submits a batch of orders concurrently and confirms them from one stream
+
+    Each request is a dict of submit_order() keyword arguments. Requests get a
+    unique client_order_id so stream events can be matched even before the
+    REST response for that order has come back.
+    """
+
+    def __init__(self, api, max_workers=None, feed=None):
+        self.logger = setup_logger("emergency_executor")
+        self.api = api
+        self.max_workers = max_workers or config.get("EMERGENCY_MAX_PARALLEL", 8)
+        self.feed = feed or get_trade_update_feed()
+
+        self._lock = threading.Condition()
+        self._pending: Dict[str, Dict] = {}  # client_order_id -> tracking record
+
+    def cancel_all_orders(self, symbols=None) -> int:
+        """Cancel open orders in bulk (all, or only those for the given symbols)"""
+        try:
+            if symbols is None:
+                # One DELETE /v2/orders call for the whole account
+                cancelled = self.api.cancel_all_orders()
+                count = len(cancelled or [])
+            else:
+                wanted = set(symbols)
+                orders = [
+                    order
+                    for order in self.api.list_orders(status="open")
+                    if order.symbol in wanted
+                ]
+                with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                    list(pool.map(self._cancel_quietly, [o.id for o in orders]))
+                count = len(orders)
+
+            self.logger.info(f"🧹 Bulk cancel requested for {count} open orders")
+            return count
+
+        except Exception as e:
+            self.logger.error(f"❌ Bulk cancel failed: {e}")
+            return 0
+
+    def _cancel_quietly(self, order_id):
+        try:
+            self.api.cancel_order(order_id)
+        except Exception as e:
+            self.logger.debug(f"Cancel {order_id}: {e}")
+
+    def wait_for_no_open_orders(self, symbols=None, timeout=3.0, interval=0.25):
+        """Wait (bounded) until cancels have released the shares they held"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                open_orders = self.api.list_orders(status="open")
+                if symbols is not None:
+                    wanted = set(symbols)
+                    open_orders = [o for o in open_orders if o.symbol in wanted]
+                if not open_orders:
+                    return True
+            except Exception as e:
+                self.logger.debug(f"Open order check failed: {e}")
+            time.sleep(interval)
+        return False
+
+    def liquidation_requests(self, positions: List[Dict]) -> List[Dict]:
+        """Build market exit orders for DataManager.get_positions() style dicts"""
+        requests = []
+        for position in positions:
+            qty = abs(float(position["qty"]))
+            if qty == 0:
+                continue
+            side = "buy" if position.get("side") == "short" else "sell"
+            requests.append(
+                {
+                    "symbol": position["symbol"],
+                    "qty": qty,
+                    "side": side,
+                    "type": "market",
+                    "time_in_force": "day",
+                }
+            )
+        return requests
+
+    def flatten(self, positions: List[Dict], timeout=30.0) -> Dict:
+        """Cancel every open order, then liquidate all positions concurrently"""
+        self.cancel_all_orders()
+        self.wait_for_no_open_orders()
+        return self.submit_all(
+            self.liquidation_requests(positions), confirm="fill", timeout=timeout
+        )
+
+    def submit_all(self, requests: List[Dict], confirm="fill", timeout=30.0) -> Dict:
+        """Submit requests concurrently and wait for confirmation
+
+        confirm="fill"     - done when the order fills (liquidation)
+        confirm="accepted" - done when the broker accepts it (protection orders)
+        """
+        run_id = uuid.uuid4().hex[:8]
+        statuses = FILLED_STATUSES if confirm == "fill" else ACCEPTED_STATUSES
+        started = time.monotonic()
+
+        stream_ok = self.feed.start()
+        self.feed.subscribe(self._on_trade_update)
+
+        try:
+            with self._lock:
+                for i, request in enumerate(requests):
+                    client_order_id = f"emg-{run_id}-{i}-{request['symbol']}"
+                    request["client_order_id"] = client_order_id
+                    self._pending[client_order_id] = {
+                        "symbol": request["symbol"],
+                        "confirm": confirm,
+                        "submitted_at": None,
+                        "done_at": None,
+                        "status": "submitting",
+                        "order_id": None,
+                        "error": None,
+                    }
+
+            self.logger.warning(
+                f"🚨 Submitting {len(requests)} orders with up to "
+                f"{self.max_workers} in flight (confirm={confirm})"
+            )
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                list(pool.map(lambda r: self._submit_one(r, statuses), requests))
+
+            self._await_confirmation(requests, statuses, stream_ok, started, timeout)
+            return self._build_report(requests, started)
+
+        finally:
+            self.feed.unsubscribe(self._on_trade_update)
+            with self._lock:
+                for request in requests:
+                    self._pending.pop(request.get("client_order_id"), None)
+
+    def _submit_one(self, request: Dict, statuses):
+        client_order_id = request["client_order_id"]
+        record = self._pending[client_order_id]
+        record["submitted_at"] = time.monotonic()
+
+        try:
+            order = self.api.submit_order(**request)
+            with self._lock:
+                record["order_id"] = order.id
+                if record["done_at"] is None:
+                    record["status"] = order.status
+                    if order.status in statuses:
+                        record["done_at"] = time.monotonic()
+                self._lock.notify_all()
+
+        except Exception as e:
+            with self._lock:
+                record["status"] = "failed"
+                record["error"] = str(e)
+                record["done_at"] = time.monotonic()
+                self._lock.notify_all()
+            self.logger.error(f"[{request['symbol']}] ❌ Emergency order failed: {e}")
+
+    def _on_trade_update(self, event: Dict):
+        with self._lock:
+            record = self._pending.get(event.get("client_order_id"))
+            if record is None or record["done_at"] is not None:
+                return
+
+            confirmed = event["event"] == "fill" or (
+                record["confirm"] == "accepted"
+                and event["event"] in ("new", "accepted")
+            )
+            if confirmed or event["event"] in TERMINAL_EVENTS:
+                record["status"] = event["status"] or event["event"]
+                record["order_id"] = record["order_id"] or event["order_id"]
+                record["done_at"] = event["received_at"]
+                self._lock.notify_all()
+
+    def _outstanding(self, requests):
+        return [
+            r["client_order_id"]
+            for r in requests
+            if self._pending[r["client_order_id"]]["done_at"] is None
+        ]
+
+    def _await_confirmation(self, requests, statuses, stream_ok, started, timeout):
+        """Block until every order is confirmed, falling back to one REST poll"""
+        deadline = started + timeout
+        last_poll = 0.0
+
+        while True:
+            with self._lock:
+                outstanding = self._outstanding(requests)
+                if not outstanding or time.monotonic() >= deadline:
+                    return
+                self._lock.wait(timeout=0.1)
+
+            # Without a live stream, confirm with one order-list call per second
+            now = time.monotonic()
+            if not (stream_ok and self.feed.is_connected) and now - last_poll >= 1.0:
+                last_poll = now
+                self._poll_orders(outstanding, statuses)
+
+    def _poll_orders(self, outstanding, statuses):
+        try:
+            since = datetime.now(timezone.utc) - timedelta(minutes=10)
+            orders = self.api.list_orders(
+                status="all", after=since.isoformat(), limit=500
+            )
+        except Exception as e:
+            self.logger.debug(f"Order poll failed: {e}")
+            return
+
+        wanted = set(outstanding)
+        with self._lock:
+            for order in orders:
+                client_order_id = getattr(order, "client_order_id", None)
+                if client_order_id not in wanted:
+                    continue
+                record = self._pending[client_order_id]
+                if order.status in statuses or order.status in (
+                    "canceled",
+                    "expired",
+                    "rejected",
+                ):
+                    record["status"] = order.status
+                    record["done_at"] = time.monotonic()
+            self._lock.notify_all()
+
+    def _build_report(self, requests, started) -> Dict:
+        results = {}
+        latencies = []
+        for request in requests:
+            record = self._pending[request["client_order_id"]]
+            confirmed = record["done_at"] is not None and record["status"] in (
+                FILLED_STATUSES if record["confirm"] == "fill" else ACCEPTED_STATUSES
+            )
+            latency = record["done_at"] - started if record["done_at"] else None
+            if confirmed:
+                latencies.append(latency)
+            results[request["client_order_id"]] = {
+                "symbol": request["symbol"],
+                "order_id": record["order_id"],
+                "status": record["status"],
+                "confirmed": confirmed,
+                "seconds": latency,
+                "error": record["error"],
+            }
+
+        report = {
+            "submitted": len(requests),
+            "confirmed": len(latencies),
+            "failed": sum(1 for r in results.values() if r["status"] == "failed"),
+            "unconfirmed": sum(1 for r in results.values() if r["seconds"] is None),
+            "p50_seconds": percentile(latencies, 50),
+            "p99_seconds": percentile(latencies, 99),
+            "total_seconds": time.monotonic() - started,
+            "results": results,
+        }
+
+        p50 = report["p50_seconds"]
+        p99 = report["p99_seconds"]
+        self.logger.warning(
+            f"🏁 Emergency batch: {report['confirmed']}/{report['submitted']} confirmed, "
+            f"{report['failed']} failed, {report['unconfirmed']} unconfirmed | "
+            f"time-to-flat p50 {p50 if p50 is None else f'{p50:.3f}s'} "
+            f"p99 {p99 if p99 is None else f'{p99:.3f}s'} "
+            f"(total {report['total_seconds']:.3f}s)"
+        )
+        return report
@@ -22,22 +22,79 @@ import pytz
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config import config, validate_config
+from core.bootstrap import Bootstrap
+from core.cycle_scheduler import CycleScheduler
 from core.data_manager import DataManager
+from core.monitor_scheduler import ProtectiveMonitorScheduler
 from core.order_manager import OrderManager
+from core.protective_checks import (
+    EMERGENCY_STOP,
+    HARD_STOP,
+    MAX_HOLD,
+    STOP_LOSS,
+    TRAILING_STOP,
+    ProtectiveChecker,
+    ProtectiveTrigger,
+)
 from core.risk_manager import RiskManager
+from core.state_snapshot import StateSnapshotter
+from core.symbol_state import SymbolStateTable
+from core.timer_wheel import GLOBAL, CooldownService
 from strategies import MeanReversionStrategy, MomentumStrategy, VWAPStrategy
+from utils.clock import system_clock
+from utils.cycle_profiler import CycleProfiler
+from utils.event_journal import EventJournal
+from utils.latency import latency
 from utils.logger import setup_logger
+from utils.metrics import MetricsServer, metrics
+from utils.online_stats import OnlinePerformanceStats
 from utils.signal_types import ScalpingSignal
 from utils.trade_record import TradeRecord
 
 # (Moved ScalpingSignal to utils.signal_types)
 
+# Columns of logs/trade_diagnostics.csv
+TRADE_DIAGNOSTICS_COLUMNS = (
+    "symbol",
+    "strategy",
+    "side",
+    "entry_time",
+    "entry_price",
+    "stop_loss",
+    "profit_target",
+    "position_size",
+    "confidence",
+    "spread_pct",
+    "volume",
+    "volume_ratio",
+    "exit_time",
+    "exit_price",
+    "realized_pnl",
+    "realized_pct",
+    "r_multiple",
+    "hold_time_s",
+    "mae_pct",
+    "mfe_pct",
+    "mae_r",
+    "mfe_r",
+    "exit_reason",
+    "adaptive_stop_pct",
+    "atr_pct_entry",
+    "r_multiple_peak",
+)
+
 
 class IntradayEngine:
     """Main intraday trading engine for swing trades"""
 
-    def __init__(self, demo_mode=False, bypass_market_hours=False):
-        """Initialize intraday trading engine"""
+    def __init__(self, demo_mode=False, bypass_market_hours=False, clock=None):
+        """Initialize intraday trading engine
+
+        clock supplies the time and sleeps (utils/clock.py); a SimulatedClock
+        runs the loop faster than real time against recorded or synthetic data.
+        """
+        self._launched = time.monotonic()
+        self.clock = clock or system_clock
         self.logger = setup_logger("intraday_engine")
         self.demo_mode = demo_mode
         self.bypass_market_hours = bypass_market_hours
@@ -53,39 +110,32 @@ class IntradayEngine:
             config  # Use main config instead of separate timeframe config
         )
 
-        # Validate configuration
-        if not validate_config():
-            raise ValueError("Invalid configuration")
-
-        # Initialize components
-        self.risk_manager = RiskManager()
-        self.data_manager = DataManager()
-        self.order_manager = OrderManager(self.data_manager)
-
-        # HARD ASSERT: Require live Alpaca connection before proceeding (no silent fallback)
-        if not getattr(self.data_manager, "api", None):
-            self.logger.error(
-                "❌ CRITICAL: Alpaca live data connection not established during engine init"
-            )
-            self.logger.error(
-                "🔎 Troubleshoot: 1) Verify ALPACA_API_KEY / ALPACA_SECRET_KEY 2) Check internet access 3) Confirm alpaca-py installed 4) Paper account not rate-limited"
-            )
-            raise RuntimeError(
-                "Alpaca live data connection required – initialization aborted."
-            )
-
-        # Initialize trading connection (optional check)
-        try:
-            if hasattr(self.order_manager, "initialize_trading"):
-                if not self.order_manager.initialize_trading():
-                    self.logger.warning(
-                        "⚠️ OrderManager trading connection failed - running in simulation mode"
-                    )
-        except Exception as e:
-            self.logger.warning(f"⚠️ OrderManager initialization check failed: {e}")
-
-        # Sync position count with broker to fix any state mismatches
-        self.risk_manager.sync_position_count_with_broker(self.order_manager)
+        # Startup: components are constructed without broker calls, then the
+        # connection test, open-order reconcile and risk ledger reconcile run
+        # concurrently
+        self.bootstrap = Bootstrap("engine init")
+        self.bootstrap.add("config", self._validate_config)
+        self.bootstrap.add("components", self._create_components, after=("config",))
+        self.bootstrap.add(
+            "account",
+            lambda: self.data_manager.verify_connection(),
+            after=("components",),
+        )
+        self.bootstrap.add(
+            "open_orders",
+            lambda: self.order_manager.maybe_reconcile_orders(force=True),
+            after=("components",),
+            required=False,
+        )
+        self.bootstrap.add(
+            "risk_ledger",
+            lambda: self.risk_manager.sync_position_count_with_broker(
+                self.order_manager
+            ),
+            after=("components",),
+            required=False,
+        )
+        self.bootstrap.run()
 
         # Initialize strategy classes (will create instances per symbol)
         self.strategy_classes = {
@@ -99,19 +149,22 @@ class IntradayEngine:
         self.position_peaks = {}
         self.daily_pnl = 0.0
         self.trade_count = 0
-        self.symbol_trade_count = {}
-        self.trade_day = datetime.utcnow().date()
+        self.trade_day = self.clock.utcnow().date()
         self.is_running = False
-        self.last_data_update = {}
+
+        # Per-symbol timestamps and counters (see the properties below)
+        self.symbol_state = SymbolStateTable()
+        self._last_symbol_prune = self.clock.time()
+        # Running cooldowns on a timer wheel (eligible symbols kept current)
+        self.cooldowns = CooldownService(clock=self.clock)
+        # Per-cycle time budget and symbol priority
+        self.cycle_scheduler = CycleScheduler()
 
         # Wash trade prevention
-        self.last_order_time = {}
         self.min_order_interval = 3
 
         # Signal cooldown prevention - prevent rapid signal generation
-        self.last_signal_time = {}
         self.signal_cooldown_period = getattr(config, "SIGNAL_COOLDOWN_SECONDS", 60)
-        self.failed_signal_cooldown = {}
         self.failed_signal_cooldown_period = getattr(
             config, "FAILED_SIGNAL_COOLDOWN_SECONDS", 300
         )
@@ -133,7 +186,6 @@ class IntradayEngine:
         }
 
         # Trailing stop protection
-        self.recently_closed_profitable = {}
         self.profitable_closure_cooldown = 120
 
         # Performance metrics and loss streak/pause
@@ -145,52 +197,29 @@ class IntradayEngine:
             "max_drawdown": 0.0,
             "sharpe_ratio": 0.0,
         }
+        # Streaming per-trade statistics behind sharpe_ratio/max_drawdown
+        self.online_stats = OnlinePerformanceStats(
+            window=config.get("PERFORMANCE_ROLLING_WINDOW", 50)
+        )
         self.consecutive_losses = 0
         self.global_pause_until = 0.0
 
         # Per-symbol performance aggregation for end-of-day reporting
         self.symbol_perf = {}
+        # Periodic snapshot of the state above for warm restarts
+        self.state_snapshotter = (
+            StateSnapshotter() if config.get("STATE_SNAPSHOT_ENABLED", True) else None
+        )
+        # Structured event journal (signals, rejections, orders, fills, exits)
+        self.journal = (
+            EventJournal(config.get("EVENT_JOURNAL_DIR", "logs/journal"))
+            if config.get("EVENT_JOURNAL_ENABLED", True)
+            else None
+        )
         # Trade diagnostics
         self._trade_records = {}
+        # File and header are created with the first record
         self._trade_log_path = Path("logs") / "trade_diagnostics.csv"
-        try:
-            if not self._trade_log_path.parent.exists():
-                self._trade_log_path.parent.mkdir(parents=True, exist_ok=True)
-            if not self._trade_log_path.exists():
-                with open(self._trade_log_path, "w", newline="") as tf:
-                    writer = csv.writer(tf)
-                    writer.writerow(
-                        [
-                            "symbol",
-                            "strategy",
-                            "side",
-                            "entry_time",
-                            "entry_price",
-                            "stop_loss",
-                            "profit_target",
-                            "position_size",
-                            "confidence",
-                            "spread_pct",
-                            "volume",
-                            "volume_ratio",
-                            "exit_time",
-                            "exit_price",
-                            "realized_pnl",
-                            "realized_pct",
-                            "r_multiple",
-                            "hold_time_s",
-                            "mae_pct",
-                            "mfe_pct",
-                            "mae_r",
-                            "mfe_r",
-                            "exit_reason",
-                            "adaptive_stop_pct",
-                            "atr_pct_entry",
-                            "r_multiple_peak",
-                        ]
-                    )
-        except Exception as e:
-            self.logger.debug(f"Trade diagnostics init failed: {e}")
 
         self.logger.info(
             f"✅ Scalping engine initialized - Timeframe: {config.TIMEFRAME}"
@@ -198,9 +227,82 @@ class IntradayEngine:
         # Reporting state
         self._daily_report_generated_date = None
 
+        # Main loop health (lag = how late the loop wakes from its sleep)
+        self.loop_iterations = 0
+        self.loop_lag = 0.0
+        self.metrics_server = None
+        if config.get("METRICS_ENABLED", False):
+            self._start_metrics_server()
+        # Stack samples of cycles that run over PROFILE_SLOW_CYCLE_SECONDS
+        self.cycle_profiler = (
+            CycleProfiler().start()
+            if config.get("PROFILE_CYCLES_ENABLED", False)
+            else None
+        )
+        self.last_cycle_symbols = []
+
+    # Dict-style views over symbol_state columns
+    @property
+    def last_order_time(self):
+        return self.symbol_state.view("last_order_time")
+
+    @property
+    def last_signal_time(self):
+        return self.symbol_state.view("last_signal_time")
+
+    @property
+    def failed_signal_cooldown(self):
+        return self.symbol_state.view("failed_signal_time")
+
+    @property
+    def recently_closed_profitable(self):
+        return self.symbol_state.view("profitable_close_time")
+
+    @property
+    def symbol_trade_count(self):
+        return self.symbol_state.view("trade_count")
+
+    @property
+    def last_data_update(self):
+        return self.symbol_state.view("last_data_update")
+
+    @property
+    def _last_data_diag(self):
+        return self.symbol_state.view("last_data_diag")
+
+    def _validate_config(self):
+        if not validate_config():
+            raise ValueError("Invalid configuration")
+
+    def _create_components(self):
+        """Construct components; no broker round trips happen here"""
+        self.risk_manager = RiskManager()
+        self.data_manager = DataManager(verify_connection=False)
+        self.order_manager = OrderManager(self.data_manager, reconcile=False)
+        self.protective_checker = ProtectiveChecker()
+        self.monitor_scheduler = ProtectiveMonitorScheduler(clock=self.clock)
+        self._last_protective_sync = 0.0
+
+        # HARD ASSERT: Require live Alpaca connection before proceeding (no silent fallback)
+        if not getattr(self.data_manager, "api", None):
+            self.logger.error(
+                "❌ CRITICAL: Alpaca live data connection not established during engine init"
+            )
+            self.logger.error(
+                "🔎 Troubleshoot: 1) Verify ALPACA_API_KEY / ALPACA_SECRET_KEY 2) Check internet access 3) Confirm alpaca-py installed 4) Paper account not rate-limited"
+            )
+            raise RuntimeError(
+                "Alpaca live data connection required – initialization aborted."
+            )
+
+        # Risk ledger follows fills from the trade update stream; one full
+        # reconcile at startup, then only periodically
+        if getattr(self.order_manager, "trade_updates", None) is not None:
+            self.risk_manager.attach_trade_updates(self.order_manager.trade_updates)
+
     def get_diagnostics(self) -> Dict[str, object]:
         """Return lightweight diagnostic info explaining trading inactivity."""
-        now = time.time()
+        now = self.clock.time()
         # Safely compute last signal check age even if stored as datetime/epoch
         last_check_age = None
         if hasattr(self, "last_signal_check"):
@@ -248,8 +350,112 @@ class IntradayEngine:
                 else 0
             ),
             "last_order_error": last_order_error,
+            "performance": self.online_stats.snapshot(),
+            "cycle": self.cycle_scheduler.stats(),
+            "latency": latency.summary(),
+            "cycle_profiler": (
+                self.cycle_profiler.stats() if self.cycle_profiler else None
+            ),
         }
 
+    def _journal_event(self, event_type: str, **fields):
+        """Append to the event journal; journaling never interrupts trading"""
+        if self.journal is None:
+            return
+        try:
+            self.journal.emit(event_type, **fields)
+        except Exception as e:
+            self.logger.debug(f"Journal {event_type} event failed: {e}")
+
+    def _journal_rejection(self, signal: ScalpingSignal, reason: str, **detail):
+        self._journal_event(
+            "rejection",
+            symbol=signal.symbol,
+            stage="execution",
+            reason=reason,
+            side=signal.signal_type.lower(),
+            strategy=signal.strategy,
+            signal_id=signal.signal_id,
+            **detail,
+        )
+
+    def _start_metrics_server(self):
+        """Serve engine metrics over HTTP; the engine runs on without them"""
+        try:
+            metrics.add_collector(self._collect_metrics)
+            self.metrics_server = MetricsServer(
+                metrics,
+                host=config.get("METRICS_HOST", "127.0.0.1"),
+                port=config.get("METRICS_PORT", 9108),
+            ).start()
+        except Exception as e:
+            metrics.remove_collector(self._collect_metrics)
+            self.metrics_server = None
+            self.logger.warning(f"⚠️ Metrics endpoint unavailable: {e}")
+
+    def _collect_metrics(self):
+        """Engine gauges and counters, read on the scrape thread"""
+        cycles = self.cycle_scheduler
+        hits = metrics.value("indicator_cache_requests_total", result="hit")
+        misses = metrics.value("indicator_cache_requests_total", result="miss")
+        hit_ratio = hits / (hits + misses) if hits + misses else None
+        families = [
+            ("engine_running", "gauge", "Main loop is running", self.is_running),
+            (
+                "engine_loop_iterations_total",
+                "counter",
+                "Main loop iterations",
+                self.loop_iterations,
+            ),
+            (
+                "engine_loop_lag_seconds",
+                "gauge",
+                "How late the main loop woke from its last sleep",
+                self.loop_lag,
+            ),
+            (
+                "engine_trading_cycles_total",
+                "counter",
+                "Trading cycles run",
+                cycles.cycles,
+            ),
+            (
+                "engine_cycle_overruns_total",
+                "counter",
+                "Trading cycles that deferred symbols",
+                cycles.overrun_cycles,
+            ),
+            (
+                "engine_deferred_symbols_total",
+                "counter",
+                "Symbols deferred to the next cycle",
+                cycles.deferred_total,
+            ),
+            (
+                "engine_open_positions",
+                "gauge",
+                "Positions tracked by the engine",
+                len(self.active_positions),
+            ),
+            ("engine_trades_total", "counter", "Trades opened today", self.trade_count),
+            ("engine_daily_pnl_dollars", "gauge", "Realized P&L today", self.daily_pnl),
+            (
+                "engine_active_cooldowns",
+                "gauge",
+                "Cooldowns currently running",
+                self.cooldowns.active_count(),
+            ),
+            (
+                "indicator_cache_hit_ratio",
+                "gauge",
+                "Share of indicator requests served from cache",
+                hit_ratio,
+            ),
+        ]
+        return [
+            (name, kind, text, [({}, value)]) for name, kind, text, value in families
+        ]
+
     def _get_timestamp_age_seconds(self, ts) -> float:
         """Return age in seconds for a timestamp that may be a float (epoch) or datetime-like."""
         try:
@@ -257,24 +463,26 @@ class IntradayEngine:
                 return 0.0
             # If already epoch seconds
             if isinstance(ts, (int, float)):
-                return time.time() - float(ts)
+                return self.clock.time() - float(ts)
             # pandas.Timestamp -> datetime
             if hasattr(ts, "to_pydatetime"):
                 ts = ts.to_pydatetime()
             # Assume datetime-like
-            from datetime import datetime as _dt
             from datetime import timezone as _tz
 
             if getattr(ts, "tzinfo", None) is None:
                 ts = ts.replace(tzinfo=_tz.utc)
-            now_utc = _dt.now(_tz.utc)
+            now_utc = self.clock.now(_tz.utc)
             return (now_utc - ts).total_seconds()
         except Exception:
             return 0.0
 
     def is_market_hours(self) -> bool:
         """Check if we're in valid trading hours"""
-        now = datetime.now()
+        if self.bypass_market_hours:
+            return True  # offline runs (fake broker, replays) keep their own clock
+
+        now = self.clock.now()
         current_time = now.strftime("%H:%M")
 
         # Check if it's a weekday
@@ -291,16 +499,16 @@ class IntradayEngine:
 
     def can_submit_order(self, symbol: str) -> bool:
         """Check if enough time has passed since last order to prevent wash trades"""
-        current_time = time.time()
         # Global pause gate
-        if current_time < self.global_pause_until:
-            remaining_time = int(self.global_pause_until - current_time)
-            self.logger.debug(f"⏸️ Global pause active: {remaining_time}s remaining")
+        remaining_time = self.cooldowns.remaining("global_pause", GLOBAL)
+        if remaining_time:
+            self.logger.debug(
+                f"⏸️ Global pause active: {int(remaining_time)}s remaining"
+            )
             return False
-        last_order = self.last_order_time.get(symbol, 0)
 
-        if current_time - last_order < self.min_order_interval:
-            remaining_time = self.min_order_interval - (current_time - last_order)
+        remaining_time = self.cooldowns.remaining("order", symbol)
+        if remaining_time:
             self.logger.debug(
                 f"⏳ Wash trade prevention: waiting {remaining_time:.1f}s more for {symbol}"
             )
@@ -310,61 +518,111 @@ class IntradayEngine:
 
     def record_order_time(self, symbol: str):
         """Record the time of an order submission for wash trade prevention"""
-        self.last_order_time[symbol] = time.time()
+        self.last_order_time[symbol] = self.clock.time()
+        self.cooldowns.start("order", symbol, self.min_order_interval)
 
     def can_generate_signal(self, symbol: str) -> bool:
         """Check if enough time has passed to generate a new signal (adaptive)."""
-        now = time.time()
+        if self.cooldowns.is_eligible(symbol):
+            return True
+        # In cooldown: work out which one for the log
+        now = self.clock.time()
+        state = self.symbol_state
         base_cd = self.signal_cooldown_period
         effective_cd = base_cd * self.adaptive_cooldown_multiplier
-        last_sig = self.last_signal_time.get(symbol, 0)
+        last_sig = state.get("last_signal_time", symbol)
         if last_sig:
             since_last = now - last_sig
             if since_last < effective_cd:
                 remaining = effective_cd - since_last
                 # Verbose once per ~5s per symbol to avoid log spam
-                if not hasattr(self, "_last_cd_log"):
-                    self._last_cd_log = {}
-                last_log = self._last_cd_log.get(symbol, 0)
-                if now - last_log >= 5:
+                if now - state.get("last_cooldown_log", symbol) >= 5:
                     self.logger.info(
                         f"⏳ Cooldown active {symbol}: {remaining:.1f}s remaining (elapsed {since_last:.1f}s / needed {effective_cd:.1f}s | base {base_cd}s x mult {self.adaptive_cooldown_multiplier:.2f})"
                     )
-                    self._last_cd_log[symbol] = now
+                    state.set("last_cooldown_log", symbol, now)
                 return False
-        last_fail = self.failed_signal_cooldown.get(symbol, 0)
+        last_fail = state.get("failed_signal_time", symbol)
         if last_fail:
             since_fail = now - last_fail
             if since_fail < self.failed_signal_cooldown_period:
                 remaining = self.failed_signal_cooldown_period - since_fail
-                if not hasattr(self, "_last_fail_cd_log"):
-                    self._last_fail_cd_log = {}
-                last_log = self._last_fail_cd_log.get(symbol, 0)
-                if now - last_log >= 10:
+                if now - state.get("last_failed_log", symbol) >= 10:
                     self.logger.info(
                         f"🚫 Failed-signal cooldown {symbol}: {remaining:.1f}s remaining (elapsed {since_fail:.1f}s / needed {self.failed_signal_cooldown_period:.1f}s)"
                     )
-                    self._last_fail_cd_log[symbol] = now
-                return False
-        if symbol in self.recently_closed_profitable:
-            closed_time = self.recently_closed_profitable[symbol]
-            # closed_time may be datetime (legacy) or epoch float; normalize to age seconds
-            try:
-                age = self._get_timestamp_age_seconds(closed_time)
-            except Exception:
-                # Fallback to legacy behavior if helper fails
-                age = now - closed_time if isinstance(closed_time, (int, float)) else 0
-            if age < self.profitable_closure_cooldown:
+                    state.set("last_failed_log", symbol, now)
                 return False
+        closed_time = state.get("profitable_close_time", symbol)
+        if closed_time and now - closed_time < self.profitable_closure_cooldown:
+            return False
         return True
 
+    def _rebuild_cooldowns(self):
+        """Re-register cooldowns still running in restored state"""
+        now = self.clock.time()
+        for kind, stamps, period in (
+            (
+                "signal",
+                self.last_signal_time,
+                self.signal_cooldown_period * self.adaptive_cooldown_multiplier,
+            ),
+            (
+                "failed_signal",
+                self.failed_signal_cooldown,
+                self.failed_signal_cooldown_period,
+            ),
+            (
+                "profitable_close",
+                self.recently_closed_profitable,
+                self.profitable_closure_cooldown,
+            ),
+            ("order", self.last_order_time, self.min_order_interval),
+        ):
+            for symbol, stamp in stamps.items():
+                self.cooldowns.start(kind, symbol, stamp + period - now, now=now)
+        self.cooldowns.start(
+            "global_pause", GLOBAL, self.global_pause_until - now, now=now
+        )
+
+    def _prune_symbol_state(self):
+        """Recycle rows of symbols idle for longer than every cooldown"""
+        now = self.clock.time()
+        if now - self._last_symbol_prune < config.get(
+            "SYMBOL_STATE_PRUNE_SECONDS", 300
+        ):
+            return
+        self._last_symbol_prune = now
+        max_age = max(
+            self.signal_cooldown_period * self.max_adaptive_cooldown_multiplier,
+            self.failed_signal_cooldown_period,
+            self.profitable_closure_cooldown,
+            int(getattr(config, "MINUTES_BETWEEN_TRADES_PER_SYMBOL", 0)) * 60,
+            60,  # data diagnostics throttle
+        )
+        released = self.symbol_state.prune(
+            now, max_age, keep=self.active_positions.keys()
+        )
+        if released:
+            self.logger.debug(
+                f"🧹 Released {released} idle symbols ({len(self.symbol_state)} tracked)"
+            )
+
     def record_signal_time(self, symbol: str):
         """Record the time of signal generation"""
-        self.last_signal_time[symbol] = time.time()
+        self.last_signal_time[symbol] = self.clock.time()
+        self.cooldowns.start(
+            "signal",
+            symbol,
+            self.signal_cooldown_period * self.adaptive_cooldown_multiplier,
+        )
 
     def record_failed_signal(self, symbol: str):
         """Record a failed signal for extended cooldown"""
-        self.failed_signal_cooldown[symbol] = time.time()
+        self.failed_signal_cooldown[symbol] = self.clock.time()
+        self.cooldowns.start(
+            "failed_signal", symbol, self.failed_signal_cooldown_period
+        )
         self.logger.info(
             f"🚫 Recording failed signal for {symbol} - extended cooldown activated"
         )
@@ -501,7 +759,7 @@ class IntradayEngine:
         # Time of day adjustment (more volatile at open/close)
         from datetime import datetime
 
-        current_time = datetime.now().time()
+        current_time = self.clock.now().time()
 
         # Market open volatility (9:30-10:30 ET)
         if (
@@ -628,7 +886,7 @@ class IntradayEngine:
             if not hasattr(self, "last_watchlist_log_time"):
                 self.last_watchlist_log_time = 0
 
-            current_time = time.time()
+            current_time = self.clock.time()
             if (
                 current_time - self.last_watchlist_log_time >= 300
             ):  # Log every 5 minutes
@@ -642,6 +900,21 @@ class IntradayEngine:
             self.logger.error(f"❌ Error filtering watchlist: {e}")
             return config.INTRADAY_WATCHLIST[:5]  # Fallback to first 5
 
+    def _apply_short_exposure_bias(self, signals: List[ScalpingSignal]):
+        """Favour longs over shorts once short exposure nears MAX_SHORT_EXPOSURE
+
+        No limit is configured by default, which leaves signals unbiased.
+        """
+        current_short_exposure = getattr(self.risk_manager, "total_short_exposure", 0)
+        max_short_exposure = config.get("MAX_SHORT_EXPOSURE")
+        ratio = current_short_exposure / max_short_exposure if max_short_exposure else 0
+        if ratio > 0.8:
+            for sig in signals:
+                if sig.signal_type == "BUY":
+                    sig.confidence *= 1.3
+                elif sig.signal_type == "SELL":
+                    sig.confidence *= 0.7
+
     def generate_signals(self, symbol: str, data: pd.DataFrame) -> List[ScalpingSignal]:
         """
         Generate trading signals with enhanced data consistency and speed
@@ -649,16 +922,14 @@ class IntradayEngine:
         FIX 3: FASTER SIGNAL EXECUTION - Pre-validate and timestamp signals
         """
         signals: List[ScalpingSignal] = []
-        generation_start_time = time.time()
+        generation_start_time = self.clock.time()
         total_strategy_raw = 0
         price_gap_rejections = 0
         try:
             # Throttled data diagnostics
             try:
-                if not hasattr(self, "_last_data_diag"):
-                    self._last_data_diag = {}
                 last_diag = self._last_data_diag.get(symbol, 0)
-                if time.time() - last_diag >= 60:
+                if self.clock.time() - last_diag >= 60:
                     cols = list(data.columns)
                     self.logger.info(
                         f"🧪 {symbol} data snapshot: bars={len(data)}, cols={cols[-12:]} (showing last 12)"
@@ -674,7 +945,9 @@ class IntradayEngine:
                     ]
                     missing = [c for c in required_cols if c not in data.columns]
                     if missing:
-                        self.logger.warning(f"⚠️ {symbol} missing indicators: {missing}")
+                        self.logger.warning(
+                            f"⚠️ {symbol} missing indicators: {missing}"
+                        )
                     else:
                         last_row = data.iloc[-1][required_cols]
                         nan_cols = [c for c, v in last_row.items() if pd.isna(v)]
@@ -682,7 +955,7 @@ class IntradayEngine:
                             self.logger.warning(
                                 f"⚠️ {symbol} NaN indicators latest bar: {nan_cols}"
                             )
-                    self._last_data_diag[symbol] = time.time()
+                    self._last_data_diag[symbol] = self.clock.time()
             except Exception as diag_err:
                 self.logger.debug(f"Diag error {symbol}: {diag_err}")
 
@@ -704,7 +977,8 @@ class IntradayEngine:
                     strategy = strategy_class(symbol)
 
                     # Call the strategy's generate_signal method (returns dict or None)
-                    strategy_signal = strategy.generate_signal(symbol, data)
+                    with latency.span(f"strategy.{strategy_name}"):
+                        strategy_signal = strategy.generate_signal(symbol, data)
                     if strategy_signal:
                         # Convert dict signal to ScalpingSignal object
                         scalping_signal = ScalpingSignal(
@@ -751,26 +1025,22 @@ class IntradayEngine:
                     continue
 
             if signals:
-                current_short_exposure = getattr(
-                    self.risk_manager, "total_short_exposure", 0
-                )
-                max_short_exposure = config.MAX_SHORT_EXPOSURE
-                ratio = (
-                    current_short_exposure / max_short_exposure
-                    if max_short_exposure
-                    else 0
-                )
-                if ratio > 0.8:
-                    for sig in signals:
-                        if sig.signal_type == "BUY":
-                            sig.confidence *= 1.3
-                        elif sig.signal_type == "SELL":
-                            sig.confidence *= 0.7
+                self._apply_short_exposure_bias(signals)
                 signals.sort(key=lambda x: x.confidence, reverse=True)
                 best = signals[0]
                 self.logger.info(
                     f"🎯 Best signal {symbol} {best.signal_type} {best.strategy} conf={best.confidence:.2f}"
                 )
+                self._journal_event(
+                    "signal",
+                    symbol=symbol,
+                    side=best.signal_type.lower(),
+                    strategy=best.strategy,
+                    confidence=best.confidence,
+                    price=best.entry_price,
+                    signal_id=best.signal_id,
+                    candidates=len(signals),
+                )
                 return [best]
             else:
                 if not hasattr(self, "signal_rejections"):
@@ -783,6 +1053,14 @@ class IntradayEngine:
                 if not reasons:
                     reasons.append("post_filter_fail")
                 self.signal_rejections[symbol] = ",".join(reasons)
+                if total_strategy_raw:
+                    self._journal_event(
+                        "rejection",
+                        symbol=symbol,
+                        stage="generation",
+                        reason=self.signal_rejections[symbol],
+                        raw_signals=total_strategy_raw,
+                    )
                 self.logger.info(
                     f"🛑 No executable signals {symbol} raw={total_strategy_raw} gap_rej={price_gap_rejections}"
                 )
@@ -836,89 +1114,54 @@ class IntradayEngine:
         """
         Verify that an order was actually filled before creating position tracking.
         This prevents phantom positions when orders are rejected/cancelled.
+        The order is looked up by id in the order manager's registry (kept current
+        by trade updates); broker positions are only checked if it never resolves.
         """
         try:
             # Allow order_id to be an object with .id
             raw_order_id = getattr(order_id, "id", order_id)
             self.logger.info(f"🔍 Verifying order fill for {raw_order_id} ({symbol})")
 
-            start_time = time.time()
-            check_interval = 1  # Check every 1 second
+            start_time = self.clock.time()
+            # Registry lookups are in-memory while the stream is up, REST otherwise
+            check_interval = 0.1 if self.order_manager.trade_updates_connected() else 1
 
-            while time.time() - start_time < timeout:
+            while self.clock.time() - start_time < timeout:
                 try:
-                    # Method 1: Check broker positions directly
-                    broker_position = self.order_manager.get_position_info(
-                        symbol, context="order_fill_verification", force_fresh=True
-                    )
-
-                    if (
-                        broker_position
-                        and abs(float(broker_position.get("qty", 0))) > 0
-                    ):
-                        # Normalize side detection: prefer explicit 'side' (long/short), then qty sign, then market_value
-                        broker_side = self._normalize_broker_position_side(
-                            broker_position
-                        )
-                        broker_qty = abs(float(broker_position.get("qty", 0)))
-
-                        # Verify direction matches intention
-                        if broker_side == intended_side:
-                            # Verify quantity is reasonable (allow some variance for partial fills)
-                            qty_difference = abs(broker_qty - expected_quantity)
-                            qty_tolerance = max(
-                                1, expected_quantity * 0.1
-                            )  # 10% tolerance or 1 share minimum
-
-                            if qty_difference <= qty_tolerance:
+                    order_status = self.order_manager.get_order_status(raw_order_id)
+                    if order_status:
+                        status = (order_status.get("status") or "").lower()
+                        if status in ["filled", "partially_filled"]:
+                            filled_qty = float(order_status.get("filled_qty") or 0)
+                            if filled_qty > 0:
+                                if filled_qty < expected_quantity:
+                                    self.logger.warning(
+                                        f"⚠️ Partial fill: expected {expected_quantity}, got {filled_qty}"
+                                    )
                                 self.logger.info(
-                                    f"✅ ORDER FILL VERIFIED: {symbol} - {broker_side} {broker_qty} shares"
+                                    f"✅ ORDER FILL VERIFIED: {symbol} - {order_status.get('side', intended_side)} {filled_qty} shares"
                                 )
                                 return True
-                            else:
-                                self.logger.warning(
-                                    f"⚠️ Quantity mismatch: expected {expected_quantity}, got {broker_qty}"
-                                )
-                        else:
+                        elif status in [
+                            "canceled",
+                            "cancelled",
+                            "rejected",
+                            "expired",
+                            "failed",
+                        ]:
                             self.logger.warning(
-                                f"⚠️ Direction mismatch: expected {intended_side}, got {broker_side}"
-                            )
-
-                    # Method 2: If available, check order status via order manager
-                    if hasattr(self.order_manager, "get_order_status"):
-                        try:
-                            order_status = self.order_manager.get_order_status(
-                                raw_order_id
-                            )
-                            if order_status:
-                                status = order_status.get("status", "").lower()
-                                if status in ["filled", "partially_filled"]:
-                                    filled_qty = float(
-                                        order_status.get("filled_qty", 0)
-                                    )
-                                    if filled_qty > 0:
-                                        self.logger.info(
-                                            f"✅ ORDER STATUS VERIFIED: {raw_order_id} filled {filled_qty} shares"
-                                        )
-                                        return True
-                                elif status in ["cancelled", "rejected", "expired"]:
-                                    self.logger.warning(
-                                        f"🚫 ORDER CANCELLED/REJECTED: {raw_order_id} status: {status}"
-                                    )
-                                    return False
-                        except Exception as status_error:
-                            self.logger.debug(
-                                f"Could not check order status: {status_error}"
+                                f"🚫 ORDER CANCELLED/REJECTED: {raw_order_id} status: {status}"
                             )
+                            return False
 
                     # Wait before next check
-                    time.sleep(check_interval)
+                    self.clock.sleep(check_interval)
 
                 except Exception as check_error:
                     self.logger.warning(
                         f"Error in fill verification check: {check_error}"
                     )
-                    time.sleep(check_interval)
+                    self.clock.sleep(check_interval)
 
             # Timeout reached without confirmation
             self.logger.error(
@@ -933,7 +1176,12 @@ class IntradayEngine:
                 final_position = self.order_manager.get_position_info(
                     symbol, context="final_verification", force_fresh=True
                 )
-                if final_position and abs(float(final_position.get("qty", 0))) > 0:
+                if (
+                    final_position
+                    and abs(float(final_position.get("qty", 0))) > 0
+                    and self._normalize_broker_position_side(final_position)
+                    == intended_side
+                ):
                     self.logger.warning(
                         f"⚠️ Position exists after timeout - possible delayed fill"
                     )
@@ -948,6 +1196,25 @@ class IntradayEngine:
             # On verification error, assume order failed to be safe
             return False
 
+    def _entry_fill_confirmed(self, position: dict) -> bool:
+        """True when the registry holds a stream-confirmed fill for the entry order
+
+        Broker-held protection legs can close a position without us knowing,
+        so natively protected symbols always get the broker position check.
+        """
+        client_order_id = position.get("client_order_id")
+        symbol = position["signal"].symbol
+        if not client_order_id or not self.order_manager.trade_updates_connected():
+            return False
+        if self.order_manager.is_natively_protected(symbol):
+            return False
+        record = self.order_manager.client_orders.get(client_order_id)
+        return bool(
+            record
+            and record["status"] == "filled"
+            and record["side"] == position.get("intended_side")
+        )
+
     def _normalize_broker_position_side(self, broker_position: dict) -> str:
         """Return 'buy' for long and 'sell' for short using robust detection.
         Prefers broker 'side' (long/short), falls back to qty sign or market_value sign.
@@ -983,8 +1250,12 @@ class IntradayEngine:
         # Default safe assumption
         return "buy"
 
-    def sync_positions_with_broker(self):
-        """Synchronize internal position tracking with actual broker positions"""
+    def sync_positions_with_broker(self, broker_positions=None):
+        """Synchronize internal position tracking with actual broker positions
+
+        broker_positions: an already fetched list_positions() result to use
+        instead of a new request
+        """
         try:
             if (
                 not self.order_manager
@@ -993,8 +1264,10 @@ class IntradayEngine:
             ):
                 return
 
-            # Get all actual positions from broker
-            actual_positions = self.order_manager.data_manager.api.list_positions()
+            if broker_positions is None:
+                broker_positions = self.order_manager.data_manager.api.list_positions()
+            # Get all actual positions from broker (as plain dicts)
+            actual_positions = [getattr(pos, "_raw", pos) for pos in broker_positions]
 
             if not actual_positions:
                 self.logger.debug("📊 No actual positions found at broker")
@@ -1106,7 +1379,7 @@ class IntradayEngine:
                                     entry_price=entry_price,
                                     stop_loss=stop_loss,
                                     profit_target=profit_target,
-                                    timestamp=datetime.now(),
+                                    timestamp=self.clock.now(),
                                     metadata={"adopted": True},
                                 )
 
@@ -1114,7 +1387,8 @@ class IntradayEngine:
                                 self.active_positions[symbol] = {
                                     "order_id": f"adopted_{symbol}",
                                     "signal": adopted_signal,
-                                    "entry_time": datetime.now(),
+                                    "entry_time": self.clock.now(),
+                                    "entry_ts": self.clock.time(),
                                     "position_size": abs(qty),
                                     "entry_price": entry_price,
                                     "stop_loss": stop_loss,
@@ -1178,6 +1452,18 @@ class IntradayEngine:
                                     f"⛔ Excluding {symbol} from trading (untracked position)"
                                 )
 
+            # Positions held on both sides: pick up fills that happened while
+            # tracking was stale (e.g. across a warm restart)
+            for pos in actual_positions:
+                position = self.active_positions.get(pos["symbol"])
+                broker_qty = abs(float(pos["qty"]))
+                if position and broker_qty and broker_qty != position["position_size"]:
+                    self.logger.warning(
+                        f"🔁 {pos['symbol']} size changed at broker: "
+                        f"{position['position_size']} -> {broker_qty}"
+                    )
+                    position["position_size"] = broker_qty
+
             # Find positions tracked internally but not at broker
             orphaned_tracking = tracked_symbols - actual_symbols
             if orphaned_tracking:
@@ -1218,6 +1504,9 @@ class IntradayEngine:
                     self.logger.info(
                         f"📋 FAILED: Individualized confidence check failed for {signal.symbol}"
                     )
+                    self._journal_rejection(
+                        signal, "confidence", detail=confidence_decision["reason"]
+                    )
                     return False
                 else:
                     self.logger.info(
@@ -1233,16 +1522,22 @@ class IntradayEngine:
                 self.logger.info(
                     f"📋 FAILED: Confidence system error for {signal.symbol}"
                 )
+                self._journal_rejection(
+                    signal, "confidence_error", detail=str(conf_error)
+                )
                 return False
 
             # Lightweight pre-trade quality filter
-            if not self._pre_trade_filter(signal):
+            with latency.span("pre_trade_filter"):
+                passed_filter = self._pre_trade_filter(signal)
+            if not passed_filter:
                 self.logger.debug(
                     f"🚫 Pre-trade filter rejected {signal.symbol} ({signal.signal_type}) conf={getattr(signal, 'confidence', None)}"
                 )
                 self.logger.info(
                     f"📋 FAILED: Pre-trade filter rejected {signal.symbol}"
                 )
+                self._journal_rejection(signal, "pre_trade_filter")
                 return False
             # TRAILING STOP PROTECTION: Check if symbol recently closed profitably
             if signal.symbol in self.recently_closed_profitable:
@@ -1257,6 +1552,7 @@ class IntradayEngine:
                     self.logger.info(
                         f"📋 FAILED: Profitable closure cooldown for {signal.symbol}"
                     )
+                    self._journal_rejection(signal, "profitable_close_cooldown")
                     return False
                 else:
                     # Cooldown expired, remove from tracking
@@ -1294,6 +1590,7 @@ class IntradayEngine:
                     self.logger.info(
                         f"📋 FAILED: Position conflict for {signal.symbol}"
                     )
+                    self._journal_rejection(signal, "broker_position_conflict")
                     return False
 
             self.logger.info(
@@ -1320,6 +1617,7 @@ class IntradayEngine:
                     self.logger.info(
                         f"[FAILED] FAILED: Tracked position conflict for {signal.symbol}"
                     )
+                    self._journal_rejection(signal, "tracked_position_conflict")
                     return False
 
             self.logger.info(
@@ -1337,6 +1635,7 @@ class IntradayEngine:
                     self.logger.info(
                         f"📋 FAILED: Risk check failed for {signal.symbol}"
                     )
+                    self._journal_rejection(signal, "risk_check")
                     return False
             except Exception as risk_exception:
                 # CRITICAL FIX: Handle risk limit exceptions properly
@@ -1347,6 +1646,9 @@ class IntradayEngine:
                     f"🛑 ORDER CANCELLED - Will NOT create phantom position"
                 )
                 self.logger.info(f"📋 FAILED: Risk limit violation for {signal.symbol}")
+                self._journal_rejection(
+                    signal, "risk_limit", detail=str(risk_exception)
+                )
                 return False
 
             self.logger.info(f"📋 CHECKPOINT 4: Risk checks passed for {signal.symbol}")
@@ -1443,6 +1745,7 @@ class IntradayEngine:
                 self.logger.info(
                     f"📋 FAILED: Invalid position size for {signal.symbol}"
                 )
+                self._journal_rejection(signal, "position_size")
                 return False
 
             self.logger.info(
@@ -1457,6 +1760,7 @@ class IntradayEngine:
                 self.logger.info(
                     f"📋 FAILED: Wash trade prevention for {signal.symbol}"
                 )
+                self._journal_rejection(signal, "wash_trade")
                 return False
 
             self.logger.info(
@@ -1475,7 +1779,7 @@ class IntradayEngine:
                     f"✅ Cancelled {cancelled_count} pending orders for {signal.symbol}"
                 )
                 # Wait for cancellations to process
-                time.sleep(2)
+                self.clock.sleep(2)
 
             # CRITICAL FIX: Validate order direction before submission
             intended_side = signal.signal_type.lower()
@@ -1491,40 +1795,20 @@ class IntradayEngine:
             self.record_order_time(signal.symbol)
 
             # Submit market order with validation
-            order_result = self.order_manager.submit_market_order(
-                symbol=signal.symbol, side=intended_side, quantity=position_size
-            )
+            with latency.span("order_submit"):
+                order_result = self.order_manager.submit_market_order(
+                    symbol=signal.symbol,
+                    side=intended_side,
+                    quantity=position_size,
+                    signal_id=signal.signal_id,
+                )
 
             self.logger.info(
                 f"📋 CHECKPOINT 8: Order submission result for {signal.symbol}: {bool(order_result)}"
             )
 
             # CRITICAL FIX: Verify order was submitted correctly AND verify order fill
-            if order_result:
-                readable_id = getattr(order_result, "id", str(order_result))
-                self.logger.info(f"✅ Order submitted with ID: {readable_id}")
-
-                # Additional validation: Check if this is a simulated order
-                if str(readable_id).startswith("SIM_"):
-                    self.logger.warning(f"⚠️ SIMULATED ORDER DETECTED: {readable_id}")
-                    self.logger.warning(
-                        f"⚠️ Position tracking may not reflect real broker state"
-                    )
-
-                # NEW: Verify order fill before creating position tracking
-                fill_info = self._verify_order_fill(
-                    order_result, signal.symbol, intended_side, position_size
-                )
-
-                if not fill_info:
-                    self.logger.error(
-                        f"🚫 ORDER NOT FILLED: {readable_id} for {signal.symbol}"
-                    )
-                    self.logger.error(f"🚫 Will NOT create phantom position tracking")
-                    # Record this as a failed signal for extended cooldown
-                    self.record_failed_signal(signal.symbol)
-                    return False
-            else:
+            if not order_result:
                 # Enrich failure with last OrderManager error if present
                 last_err = None
                 try:
@@ -1544,249 +1828,308 @@ class IntradayEngine:
                     self.logger.error(
                         f"🧩 EXECUTION FAILURE for {signal.symbol} ({signal.signal_type}) | ERROR_CODE=unknown MSG=no_details"
                     )
+                self._journal_rejection(
+                    signal,
+                    "order_rejected",
+                    detail=(last_err or {}).get("message"),
+                )
                 # Mark as failed signal for cooldown/backoff
                 self.record_failed_signal(signal.symbol)
                 return False
 
-                # Get ACTUAL execution price from broker position (more reliable than order fill price)
-                actual_position = self.order_manager.get_position_info(
-                    signal.symbol, context="execution_price", force_fresh=True
+            readable_id = getattr(order_result, "id", str(order_result))
+            self.logger.info(f"✅ Order submitted with ID: {readable_id}")
+            self._journal_event(
+                "order",
+                symbol=signal.symbol,
+                side=intended_side,
+                qty=position_size,
+                order_id=str(readable_id),
+                purpose="entry",
+                signal_id=signal.signal_id,
+            )
+
+            # Additional validation: Check if this is a simulated order
+            if str(readable_id).startswith("SIM_"):
+                self.logger.warning(f"⚠️ SIMULATED ORDER DETECTED: {readable_id}")
+                self.logger.warning(
+                    f"⚠️ Position tracking may not reflect real broker state"
                 )
-                if actual_position and abs(float(actual_position.get("qty", 0))) > 0:
-                    # Calculate actual average entry price from broker
-                    actual_entry_price = abs(
-                        float(
-                            actual_position.get("avg_entry_price", signal.entry_price)
-                        )
-                    )
-                    actual_qty = abs(float(actual_position.get("qty", position_size)))
 
-                    self.logger.info(
-                        f"📍 ACTUAL EXECUTION: {signal.symbol} - {actual_qty} shares @ ${actual_entry_price:.2f}"
-                    )
+            # NEW: Verify order fill before creating position tracking
+            with latency.span("fill_confirm"):
+                fill_info = self._verify_order_fill(
+                    order_result, signal.symbol, intended_side, position_size
+                )
+            if fill_info:
+                latency.record(
+                    "signal_to_fill", self._get_timestamp_age_seconds(signal.timestamp)
+                )
 
-                    # Recalculate stop loss and profit target based on ACTUAL execution price
-                    from utils.signal_helper import calculate_adaptive_signal_levels
+            if not fill_info:
+                self.logger.error(
+                    f"🚫 ORDER NOT FILLED: {readable_id} for {signal.symbol}"
+                )
+                self.logger.error(f"🚫 Will NOT create phantom position tracking")
+                self._journal_rejection(signal, "not_filled", order_id=str(readable_id))
+                # Record this as a failed signal for extended cooldown
+                self.record_failed_signal(signal.symbol)
+                return False
 
-                    actual_levels = calculate_adaptive_signal_levels(
-                        symbol=signal.symbol,
-                        entry_price=actual_entry_price,
-                        signal_type=signal.signal_type,
-                        data_manager=self.data_manager,
-                        timeframe=config.TIMEFRAME,
-                    )
+            # Get ACTUAL execution price from the order's fill (registry lookup by id),
+            # falling back to the broker position
+            fill = self.order_manager.get_order_status(readable_id) or {}
+            if fill.get("filled_avg_price") and fill.get("filled_qty"):
+                actual_position = {
+                    "qty": fill["filled_qty"],
+                    "avg_entry_price": fill["filled_avg_price"],
+                }
+            else:
+                actual_position = self.order_manager.get_position_info(
+                    signal.symbol, context="execution_price", force_fresh=True
+                )
+            if actual_position and abs(float(actual_position.get("qty", 0))) > 0:
+                # Calculate actual average entry price from broker
+                actual_entry_price = abs(
+                    float(actual_position.get("avg_entry_price", signal.entry_price))
+                )
+                actual_qty = abs(float(actual_position.get("qty", position_size)))
 
-                    actual_stop_loss = actual_levels["stop_loss"]
-                    actual_profit_target = actual_levels["profit_target"]
+                self.logger.info(
+                    f"📍 ACTUAL EXECUTION: {signal.symbol} - {actual_qty} shares @ ${actual_entry_price:.2f}"
+                )
 
-                    self.logger.info(
-                        f"🎯 RECALCULATED LEVELS: {signal.symbol} - Stop: ${actual_stop_loss:.2f}, Target: ${actual_profit_target:.2f}"
-                    )
+                # Recalculate stop loss and profit target based on ACTUAL execution price
+                from utils.signal_helper import calculate_adaptive_signal_levels
 
-                    # Use actual execution data for position tracking
-                    execution_entry_price = actual_entry_price
-                    execution_stop_loss = actual_stop_loss
-                    execution_profit_target = actual_profit_target
-                    execution_position_size = actual_qty
-                    # Record slippage vs intended signal entry
-                    try:
-                        self._record_slippage(
-                            signal.entry_price,
-                            actual_entry_price,
-                            signal.signal_type,
-                            signal.symbol,
-                        )
-                    except Exception as e:
-                        self.logger.debug(f"Slippage recording error: {e}")
-                else:
-                    self.logger.warning(
-                        f"⚠️ Could not get actual execution price for {signal.symbol}, using signal prices"
-                    )
-                    execution_entry_price = signal.entry_price
-                    execution_stop_loss = signal.stop_loss
-                    execution_profit_target = signal.profit_target
-                    execution_position_size = position_size
-
-                # Track position with ACTUAL execution data
-                # Grace & adaptive metadata
-                grace_until = time.time() + getattr(config, "INITIAL_STOP_GRACE", 0)
-                catastrophic_mult = getattr(config, "CATASTROPHIC_MULT", 1.2)
-                self.active_positions[signal.symbol] = {
-                    "order_id": readable_id,
-                    "signal": signal,
-                    "entry_time": datetime.now(),
-                    "position_size": execution_position_size,
-                    "entry_price": execution_entry_price,
-                    "stop_loss": execution_stop_loss,
-                    "original_stop_loss": execution_stop_loss,  # Track original for trailing stop detection
-                    "profit_target": execution_profit_target,
-                    "intended_side": intended_side,  # Track intended direction
-                    "minimum_hold_time": getattr(config, "INITIAL_STOP_GRACE", 0),
-                    "adaptive_stop_pct": adaptive_stop_pct,
-                    "atr_pct_entry": atr_pct,
-                    "stop_grace_until": grace_until,
-                    "catastrophic_mult": catastrophic_mult,
-                    "breakeven_set": False,
-                    "trailing_started": False,
-                    "r_multiple_peak": 0.0,
-                }
+                actual_levels = calculate_adaptive_signal_levels(
+                    symbol=signal.symbol,
+                    entry_price=actual_entry_price,
+                    signal_type=signal.signal_type,
+                    data_manager=self.data_manager,
+                    timeframe=config.TIMEFRAME,
+                )
 
-                # Initialize peak tracking for new position
-                self.position_peaks[signal.symbol] = {
-                    "peak_price": execution_entry_price,
-                    "peak_pnl_pct": 0.0,
-                    "peak_absolute_pnl": 0.0,
-                    "initial_stop": execution_stop_loss,
-                    "trailing_active": False,
-                }
-                # Initialize MAE/MFE trackers
-                self.active_positions[signal.symbol]["mae_pct"] = 0.0
-                self.active_positions[signal.symbol]["mfe_pct"] = 0.0
+                actual_stop_loss = actual_levels["stop_loss"]
+                actual_profit_target = actual_levels["profit_target"]
 
-                # Track position with risk manager using actual execution data
-                self.risk_manager.track_position_opened(
-                    signal.symbol,
-                    signal.signal_type,
-                    execution_position_size,
-                    execution_entry_price,
+                self.logger.info(
+                    f"🎯 RECALCULATED LEVELS: {signal.symbol} - Stop: ${actual_stop_loss:.2f}, Target: ${actual_profit_target:.2f}"
                 )
 
-                # Increment trade counters (entries only)
+                # Use actual execution data for position tracking
+                execution_entry_price = actual_entry_price
+                execution_stop_loss = actual_stop_loss
+                execution_profit_target = actual_profit_target
+                execution_position_size = actual_qty
+                # Record slippage vs intended signal entry
                 try:
-                    today = datetime.utcnow().date()
-                    if today != self.trade_day:
-                        self.trade_day = today
-                        self.symbol_trade_count.clear()
-                        self.trade_count = 0
-                    self.trade_count += 1
-                    self.symbol_trade_count[signal.symbol] = (
-                        self.symbol_trade_count.get(signal.symbol, 0) + 1
+                    self._record_slippage(
+                        signal.entry_price,
+                        actual_entry_price,
+                        signal.signal_type,
+                        signal.symbol,
                     )
                 except Exception as e:
-                    self.logger.warning(f"Error updating trade counts: {e}")
-                atr_pct_str = f"{atr_pct:.3f}" if atr_pct else "n/a"
-                self.logger.info(
-                    f"✅ Position created for {signal.symbol}: {execution_position_size} @ ${execution_entry_price:.2f} "
-                    f"Stop ${execution_stop_loss:.2f} ({self.active_positions[signal.symbol]['adaptive_stop_pct']:.3f}%) "
-                    f"Target ${execution_profit_target:.2f} ATR% {atr_pct_str}"
+                    self.logger.debug(f"Slippage recording error: {e}")
+            else:
+                self.logger.warning(
+                    f"⚠️ Could not get actual execution price for {signal.symbol}, using signal prices"
                 )
-                # Create TradeRecord with enhanced decision context
-                try:
-                    md = self.data_manager.get_current_market_data(signal.symbol) or {}
+                execution_entry_price = signal.entry_price
+                execution_stop_loss = signal.stop_loss
+                execution_profit_target = signal.profit_target
+                execution_position_size = position_size
+
+            # Track position with ACTUAL execution data
+            # Grace & adaptive metadata
+            grace_until = self.clock.time() + getattr(config, "INITIAL_STOP_GRACE", 0)
+            catastrophic_mult = getattr(config, "CATASTROPHIC_MULT", 1.2)
+            self.active_positions[signal.symbol] = {
+                "order_id": readable_id,
+                "client_order_id": fill.get("client_order_id"),
+                "signal": signal,
+                "entry_time": self.clock.now(),
+                "entry_ts": self.clock.time(),  # epoch, for hold-time math
+                "position_size": execution_position_size,
+                "entry_price": execution_entry_price,
+                "stop_loss": execution_stop_loss,
+                "original_stop_loss": execution_stop_loss,  # Track original for trailing stop detection
+                "profit_target": execution_profit_target,
+                "intended_side": intended_side,  # Track intended direction
+                "minimum_hold_time": getattr(config, "INITIAL_STOP_GRACE", 0),
+                "adaptive_stop_pct": adaptive_stop_pct,
+                "atr_pct_entry": atr_pct,
+                "stop_grace_until": grace_until,
+                "catastrophic_mult": catastrophic_mult,
+                "breakeven_set": False,
+                "trailing_started": False,
+                "r_multiple_peak": 0.0,
+            }
 
-                    # 🔍 ENHANCED: Capture complete decision context for trade analysis
-                    try:
-                        from core.unified_indicators import unified_indicator_service
-                        from stock_specific_config import (
-                            get_real_time_confidence_for_trade,
-                        )
+            self._journal_event(
+                "fill",
+                symbol=signal.symbol,
+                side=intended_side,
+                qty=execution_position_size,
+                price=execution_entry_price,
+                order_id=str(readable_id),
+                signal_id=signal.signal_id,
+                strategy=signal.strategy,
+                confidence=signal.confidence,
+                stop_loss=execution_stop_loss,
+                profit_target=execution_profit_target,
+            )
 
-                        # Get current indicator snapshot
-                        bars = self.data_manager.get_bars(
-                            signal.symbol, timeframe=config.TIMEFRAME, limit=50
-                        )
-                        if bars is not None and len(bars) > 20:
-                            indicator_result = (
-                                unified_indicator_service.get_indicators_for_strategy(
-                                    bars, signal.symbol, signal.strategy
-                                )
-                            )
-                            indicators_snapshot = (
-                                indicator_result.get("current_values", {})
-                                if "error" not in indicator_result
-                                else {}
-                            )
-                        else:
-                            indicators_snapshot = {}
+            # Initialize peak tracking for new position
+            self.position_peaks[signal.symbol] = {
+                "peak_price": execution_entry_price,
+                "peak_pnl_pct": 0.0,
+                "peak_absolute_pnl": 0.0,
+                "initial_stop": execution_stop_loss,
+                "trailing_active": False,
+            }
+            # Initialize MAE/MFE trackers
+            self.active_positions[signal.symbol]["mae_pct"] = 0.0
+            self.active_positions[signal.symbol]["mfe_pct"] = 0.0
+
+            # Track position with risk manager using actual execution data
+            self.risk_manager.track_position_opened(
+                signal.symbol,
+                signal.signal_type,
+                execution_position_size,
+                execution_entry_price,
+                stop_price=execution_stop_loss,
+            )
 
-                        # Get confidence breakdown
-                        confidence_data = get_real_time_confidence_for_trade(
-                            signal.symbol
-                        )
-                        confidence_breakdown = confidence_data.get(
-                            "technical_summary", {}
-                        )
+            # Increment trade counters (entries only)
+            try:
+                today = self.clock.utcnow().date()
+                if today != self.trade_day:
+                    self.trade_day = today
+                    self.symbol_trade_count.clear()
+                    self.trade_count = 0
+                self.trade_count += 1
+                self.symbol_state.increment("trade_count", signal.symbol)
+            except Exception as e:
+                self.logger.warning(f"Error updating trade counts: {e}")
+            atr_pct_str = f"{atr_pct:.3f}" if atr_pct else "n/a"
+            self.logger.info(
+                f"✅ Position created for {signal.symbol}: {execution_position_size} @ ${execution_entry_price:.2f} "
+                f"Stop ${execution_stop_loss:.2f} ({self.active_positions[signal.symbol]['adaptive_stop_pct']:.3f}%) "
+                f"Target ${execution_profit_target:.2f} ATR% {atr_pct_str}"
+            )
+            # Create TradeRecord with enhanced decision context
+            try:
+                md = self.data_manager.get_current_market_data(signal.symbol) or {}
 
-                        # Determine market regime
-                        market_regime = self._determine_market_regime(
-                            md, indicators_snapshot
-                        )
+                # 🔍 ENHANCED: Capture complete decision context for trade analysis
+                try:
+                    from core.unified_indicators import unified_indicator_service
+                    from stock_specific_config import (
+                        get_real_time_confidence_for_trade,
+                    )
 
-                        # Calculate risk assessment
-                        risk_assessment = {
-                            "stop_loss_pct": adaptive_stop_pct,
-                            "atr_pct": atr_pct,
-                            "position_size_calc": f"Risk-based sizing: {execution_position_size} shares",
-                            "max_risk_amount": abs(
-                                execution_entry_price - execution_stop_loss
+                    # Get current indicator snapshot
+                    bars = self.data_manager.get_bars(
+                        signal.symbol, timeframe=config.TIMEFRAME, limit=50
+                    )
+                    if bars is not None and len(bars) > 20:
+                        indicator_result = (
+                            unified_indicator_service.get_indicators_for_strategy(
+                                bars, signal.symbol, signal.strategy
                             )
-                            * execution_position_size,
-                        }
-
-                    except Exception as context_error:
-                        self.logger.debug(
-                            f"Decision context capture failed {signal.symbol}: {context_error}"
                         )
+                        indicators_snapshot = (
+                            indicator_result.get("current_values", {})
+                            if "error" not in indicator_result
+                            else {}
+                        )
+                    else:
                         indicators_snapshot = {}
-                        confidence_breakdown = {}
-                        market_regime = "unknown"
-                        risk_assessment = {}
-
-                    tr = TradeRecord(
-                        symbol=signal.symbol,
-                        strategy=signal.strategy,
-                        side=signal.signal_type,
-                        entry_time=datetime.utcnow(),
-                        entry_price=execution_entry_price,
-                        stop_loss=execution_stop_loss,
-                        profit_target=execution_profit_target,
-                        position_size=int(execution_position_size),
-                        confidence=signal.confidence,
-                        spread_pct=md.get("spread_pct"),
-                        volume=md.get("volume"),
-                        volume_ratio=md.get("volume_ratio"),
-                        # 🔍 Enhanced decision context
-                        signal_reason=getattr(
-                            signal, "reason", "Signal reason not captured"
-                        ),
-                        indicators_at_entry=indicators_snapshot,
-                        confidence_breakdown=confidence_breakdown,
-                        market_regime=market_regime,
-                        atr_percentile=atr_pct,
-                        relative_volume=md.get("volume_ratio"),
-                        risk_assessment=risk_assessment,
-                        strategy_signals={
-                            "strategy_used": signal.strategy,
-                            "confidence_threshold": 65,
-                        },
-                    )
-                    self._trade_records[signal.symbol] = tr
-
-                    # 🔍 Log decision context for immediate visibility
-                    self.logger.info(f"🔍 TRADE DECISION CONTEXT for {signal.symbol}:")
-                    self.logger.info(
-                        f"   📊 Strategy: {signal.strategy} | Confidence: {signal.confidence:.1%}"
-                    )
-                    self.logger.info(
-                        f"   🎯 Reason: {getattr(signal, 'reason', 'Not captured')}"
-                    )
-                    self.logger.info(f"   📈 Market Regime: {market_regime}")
-                    self.logger.info(
-                        f"   ⚖️ Risk: {adaptive_stop_pct:.2f}% stop | ATR: {atr_pct or 'N/A'}"
+
+                    # Get confidence breakdown
+                    confidence_data = get_real_time_confidence_for_trade(signal.symbol)
+                    confidence_breakdown = confidence_data.get("technical_summary", {})
+
+                    # Determine market regime
+                    market_regime = self._determine_market_regime(
+                        md, indicators_snapshot
                     )
-                    if indicators_snapshot:
-                        key_indicators = {
-                            k: v
-                            for k, v in indicators_snapshot.items()
-                            if k in ["rsi", "macd", "vwap", "ema_9", "volume_ratio"]
-                        }
-                        self.logger.info(f"   📊 Key Indicators: {key_indicators}")
 
-                except Exception as terr:
+                    # Calculate risk assessment
+                    risk_assessment = {
+                        "stop_loss_pct": adaptive_stop_pct,
+                        "atr_pct": atr_pct,
+                        "position_size_calc": f"Risk-based sizing: {execution_position_size} shares",
+                        "max_risk_amount": abs(
+                            execution_entry_price - execution_stop_loss
+                        )
+                        * execution_position_size,
+                    }
+
+                except Exception as context_error:
                     self.logger.debug(
-                        f"TradeRecord create failed {signal.symbol}: {terr}"
+                        f"Decision context capture failed {signal.symbol}: {context_error}"
                     )
-                return True
+                    indicators_snapshot = {}
+                    confidence_breakdown = {}
+                    market_regime = "unknown"
+                    risk_assessment = {}
+
+                tr = TradeRecord(
+                    symbol=signal.symbol,
+                    strategy=signal.strategy,
+                    side=signal.signal_type,
+                    entry_time=self.clock.utcnow(),
+                    entry_price=execution_entry_price,
+                    stop_loss=execution_stop_loss,
+                    profit_target=execution_profit_target,
+                    position_size=int(execution_position_size),
+                    confidence=signal.confidence,
+                    spread_pct=md.get("spread_pct"),
+                    volume=md.get("volume"),
+                    volume_ratio=md.get("volume_ratio"),
+                    # 🔍 Enhanced decision context
+                    signal_reason=getattr(
+                        signal, "reason", "Signal reason not captured"
+                    ),
+                    indicators_at_entry=indicators_snapshot,
+                    confidence_breakdown=confidence_breakdown,
+                    market_regime=market_regime,
+                    atr_percentile=atr_pct,
+                    relative_volume=md.get("volume_ratio"),
+                    risk_assessment=risk_assessment,
+                    strategy_signals={
+                        "strategy_used": signal.strategy,
+                        "confidence_threshold": 65,
+                    },
+                )
+                self._trade_records[signal.symbol] = tr
+
+                # 🔍 Log decision context for immediate visibility
+                self.logger.info(f"🔍 TRADE DECISION CONTEXT for {signal.symbol}:")
+                self.logger.info(
+                    f"   📊 Strategy: {signal.strategy} | Confidence: {signal.confidence:.1%}"
+                )
+                self.logger.info(
+                    f"   🎯 Reason: {getattr(signal, 'reason', 'Not captured')}"
+                )
+                self.logger.info(f"   📈 Market Regime: {market_regime}")
+                self.logger.info(
+                    f"   ⚖️ Risk: {adaptive_stop_pct:.2f}% stop | ATR: {atr_pct or 'N/A'}"
+                )
+                if indicators_snapshot:
+                    key_indicators = {
+                        k: v
+                        for k, v in indicators_snapshot.items()
+                        if k in ["rsi", "macd", "vwap", "ema_9", "volume_ratio"]
+                    }
+                    self.logger.info(f"   📊 Key Indicators: {key_indicators}")
+
+            except Exception as terr:
+                self.logger.debug(f"TradeRecord create failed {signal.symbol}: {terr}")
+            return True
 
         except Exception as e:
             self.logger.error(f"❌ Error executing signal for {signal.symbol}: {e}")
@@ -1824,6 +2167,7 @@ class IntradayEngine:
                 self.update_trailing_stop_with_peak_tracking(
                     symbol, position, current_price, pnl_pct
                 )
+                self.risk_manager.update_stop(symbol, position["stop_loss"])
 
                 # Update MAE/MFE tracking
                 if "mae_pct" in position:
@@ -1834,7 +2178,7 @@ class IntradayEngine:
                         position["mfe_pct"] = max(position.get("mfe_pct", 0.0), pnl_pct)
 
                 # Check time-based exit
-                hold_time = (datetime.now() - position["entry_time"]).total_seconds()
+                hold_time = self.clock.time() - position["entry_ts"]
                 max_hold_time = self.timeframe_config.max_hold_time
 
                 # Exit conditions
@@ -1844,7 +2188,7 @@ class IntradayEngine:
                 # Enhanced stop loss handling with grace & catastrophic thresholds
                 stop_loss_exceeded = False
                 actual_loss_pct = 0.0
-                now_ts = time.time()
+                now_ts = self.clock.time()
                 grace_active = now_ts < position.get("stop_grace_until", 0)
                 planned_stop_pct = position.get(
                     "adaptive_stop_pct", config.STOP_LOSS_PCT
@@ -1927,6 +2271,13 @@ class IntradayEngine:
                         if not position.get("breakeven_set") and r_mult >= getattr(
                             config, "BREAKEVEN_TRIGGER_R", 1.0
                         ):
+                            self._journal_event(
+                                "stop_move",
+                                symbol=symbol,
+                                old_stop=position["stop_loss"],
+                                new_stop=position["entry_price"],
+                                reason="breakeven",
+                            )
                             position["stop_loss"] = position["entry_price"]
                             position["breakeven_set"] = True
                             self.logger.info(
@@ -1992,6 +2343,13 @@ class IntradayEngine:
                                             self.logger.info(
                                                 f"🔧 Trail raise {symbol}: {position['stop_loss']:.2f} -> {new_stop:.2f}"
                                             )
+                                            self._journal_event(
+                                                "stop_move",
+                                                symbol=symbol,
+                                                old_stop=position["stop_loss"],
+                                                new_stop=new_stop,
+                                                reason="atr_trail",
+                                            )
                                             position["stop_loss"] = new_stop
                                     else:
                                         new_stop = min(
@@ -2001,6 +2359,14 @@ class IntradayEngine:
                                             self.logger.info(
                                                 f"🔧 Trail lower {symbol}: {position['stop_loss']:.2f} -> {new_stop:.2f}"
                                             )
+                                            self._journal_event(
+                                                "stop_move",
+                                                symbol=symbol,
+                                                old_stop=position["stop_loss"],
+                                                new_stop=new_stop,
+                                                reason="atr_trail",
+                                            )
+                                            position["stop_loss"] = new_stop
                             except Exception as trail_err:
                                 self.logger.debug(
                                     f"Trail manage error {symbol}: {trail_err}"
@@ -2095,6 +2461,13 @@ class IntradayEngine:
                         if new_trailing_stop > position["stop_loss"]:
                             old_stop = position["stop_loss"]
                             position["stop_loss"] = new_trailing_stop
+                            self._journal_event(
+                                "stop_move",
+                                symbol=symbol,
+                                old_stop=old_stop,
+                                new_stop=new_trailing_stop,
+                                reason="trailing",
+                            )
 
                             # Calculate what percentage this protects
                             protected_profit_pct = (
@@ -2114,6 +2487,13 @@ class IntradayEngine:
                         if new_trailing_stop < position["stop_loss"]:
                             old_stop = position["stop_loss"]
                             position["stop_loss"] = new_trailing_stop
+                            self._journal_event(
+                                "stop_move",
+                                symbol=symbol,
+                                old_stop=old_stop,
+                                new_stop=new_trailing_stop,
+                                reason="trailing",
+                            )
 
                             # Calculate what percentage this protects
                             protected_profit_pct = (
@@ -2174,49 +2554,53 @@ class IntradayEngine:
             signal = position["signal"]
 
             # CRITICAL FIX: Verify we actually have a broker position to close
-            try:
-                broker_position = self.order_manager.get_position_info(
-                    symbol, context="position_validation", force_fresh=True
-                )
-                if broker_position is None or broker_position.get("qty", 0) == 0:
-                    self.logger.error(f"🚫 PHANTOM POSITION DETECTED: {symbol}")
-                    self.logger.error(
-                        f"🚫 Tracked position exists but no broker position found"
-                    )
-                    self.logger.error(f"🚫 Removing phantom position from tracking")
-                    del self.active_positions[symbol]
-                    # Clean up peak tracking too
-                    if symbol in self.position_peaks:
-                        del self.position_peaks[symbol]
-                    return False
-
-                intended_side = position.get("intended_side", "unknown")
-                broker_side = self._normalize_broker_position_side(broker_position)
-                # Verify position direction matches intention (long vs short)
-                if intended_side not in ("buy", "sell"):
-                    self.logger.warning(
-                        f"⚠️ Intended side unknown for {symbol} during close; proceeding defensively"
+            # (skipped when the stream has already confirmed the entry fill by id)
+            if not self._entry_fill_confirmed(position):
+                try:
+                    broker_position = self.order_manager.get_position_info(
+                        symbol, context="position_validation", force_fresh=True
                     )
-                elif broker_side != intended_side:
-                    # Add detailed context to aid debugging
-                    try:
-                        dbg_qty = broker_position.get("qty")
-                        dbg_side = broker_position.get("side")
-                        dbg_mv = broker_position.get("market_value")
-                        self.logger.error(f"🚫 POSITION DIRECTION MISMATCH: {symbol}")
+                    if broker_position is None or broker_position.get("qty", 0) == 0:
+                        self.logger.error(f"🚫 PHANTOM POSITION DETECTED: {symbol}")
                         self.logger.error(
-                            f"🚫 Intended: {intended_side}, Broker(normalized): {broker_side}, Broker(raw side): {dbg_side}, qty: {dbg_qty}, mkt_val: {dbg_mv}"
+                            f"🚫 Tracked position exists but no broker position found"
                         )
-                        self.logger.error(f"🚫 This indicates an execution failure")
-                    except Exception:
-                        self.logger.error(
-                            f"🚫 POSITION DIRECTION MISMATCH: {symbol} (intended={intended_side}, broker={broker_side})"
+                        self.logger.error(f"🚫 Removing phantom position from tracking")
+                        del self.active_positions[symbol]
+                        # Clean up peak tracking too
+                        if symbol in self.position_peaks:
+                            del self.position_peaks[symbol]
+                        return False
+
+                    intended_side = position.get("intended_side", "unknown")
+                    broker_side = self._normalize_broker_position_side(broker_position)
+                    # Verify position direction matches intention (long vs short)
+                    if intended_side not in ("buy", "sell"):
+                        self.logger.warning(
+                            f"⚠️ Intended side unknown for {symbol} during close; proceeding defensively"
                         )
+                    elif broker_side != intended_side:
+                        # Add detailed context to aid debugging
+                        try:
+                            dbg_qty = broker_position.get("qty")
+                            dbg_side = broker_position.get("side")
+                            dbg_mv = broker_position.get("market_value")
+                            self.logger.error(
+                                f"🚫 POSITION DIRECTION MISMATCH: {symbol}"
+                            )
+                            self.logger.error(
+                                f"🚫 Intended: {intended_side}, Broker(normalized): {broker_side}, Broker(raw side): {dbg_side}, qty: {dbg_qty}, mkt_val: {dbg_mv}"
+                            )
+                            self.logger.error(f"🚫 This indicates an execution failure")
+                        except Exception:
+                            self.logger.error(
+                                f"🚫 POSITION DIRECTION MISMATCH: {symbol} (intended={intended_side}, broker={broker_side})"
+                            )
 
-            except Exception as validation_error:
-                self.logger.warning(
-                    f"⚠️ Could not validate broker position for {symbol}: {validation_error}"
-                )
+                except Exception as validation_error:
+                    self.logger.warning(
+                        f"⚠️ Could not validate broker position for {symbol}: {validation_error}"
+                    )
 
             # CRITICAL: Cancel any pending orders for this symbol first
             self.logger.info(
@@ -2230,7 +2614,7 @@ class IntradayEngine:
                     f"✅ Cancelled {cancelled_count} pending orders for {symbol}"
                 )
                 # Wait for cancellations to process
-                time.sleep(2)
+                self.clock.sleep(2)
 
             # Determine exit side
             exit_side = "sell" if signal.signal_type == "BUY" else "buy"
@@ -2250,23 +2634,30 @@ class IntradayEngine:
                 f"📤 Submitting {exit_side} order to close {symbol} position"
             )
             exit_order_id = self.order_manager.submit_market_order(
-                symbol=symbol, side=exit_side, quantity=position["position_size"]
+                symbol=symbol,
+                side=exit_side,
+                quantity=position["position_size"],
+                signal_id=signal.signal_id,
+                purpose="exit",
             )
 
             if exit_order_id:
+                self._journal_event(
+                    "order",
+                    symbol=symbol,
+                    side=exit_side,
+                    qty=position["position_size"],
+                    order_id=str(getattr(exit_order_id, "id", exit_order_id)),
+                    purpose="exit",
+                    signal_id=signal.signal_id,
+                )
                 # Prefer broker filled price for exit if available; fallback to live mid-price
                 exit_price = None
                 try:
                     raw_id = getattr(exit_order_id, "id", exit_order_id)
-                    if (
-                        hasattr(self.order_manager, "alpaca_trader")
-                        and self.order_manager.alpaca_trader
-                    ):
-                        status = self.order_manager.alpaca_trader.get_order_status(
-                            raw_id
-                        )
-                        if status and float(status.get("filled_avg_price") or 0) > 0:
-                            exit_price = float(status["filled_avg_price"])
+                    status = self.order_manager.get_order_status(raw_id)
+                    if status and float(status.get("filled_avg_price") or 0) > 0:
+                        exit_price = float(status["filled_avg_price"])
                 except Exception as _ex_stat:
                     self.logger.debug(
                         f"Exit fill price lookup failed {symbol}: {_ex_stat}"
@@ -2301,6 +2692,19 @@ class IntradayEngine:
                 self.logger.info(
                     f"💰 Realized P&L: ${realized_pnl:+.2f} | Daily P&L: ${self.daily_pnl:+.2f}"
                 )
+                self._journal_event(
+                    "exit",
+                    symbol=symbol,
+                    side=exit_side,
+                    qty=position["position_size"],
+                    entry_price=position["entry_price"],
+                    exit_price=exit_price,
+                    pnl=realized_pnl,
+                    reason=position.get("_pending_exit_reason", "close"),
+                    order_id=str(getattr(exit_order_id, "id", exit_order_id)),
+                    strategy=signal.strategy,
+                    signal_id=signal.signal_id,
+                )
                 # Finalize trade diagnostics
                 try:
                     tr = self._trade_records.get(symbol)
@@ -2327,11 +2731,7 @@ class IntradayEngine:
 
                 # Track position closure with risk manager
                 self.risk_manager.track_position_closed(
-                    symbol,
-                    signal.signal_type,
-                    position["position_size"],
-                    position["entry_price"],
-                    exit_price,
+                    symbol, position["position_size"], exit_price, realized_pnl
                 )
 
                 # Remove from active positions and clean up peak tracking
@@ -2346,9 +2746,12 @@ class IntradayEngine:
                         # TRAILING STOP PROTECTION: If position was profitable and trailing stop was active,
                         # add to cooldown to prevent rapid re-entry
                         if peak_info["trailing_active"] and realized_pnl > 0:
-                            import time as _t
-
-                            self.recently_closed_profitable[symbol] = _t.time()
+                            self.recently_closed_profitable[symbol] = self.clock.time()
+                            self.cooldowns.start(
+                                "profitable_close",
+                                symbol,
+                                self.profitable_closure_cooldown,
+                            )
                             self.logger.info(
                                 f"🛡️ {symbol} added to profitable closure cooldown ({self.profitable_closure_cooldown}s)"
                             )
@@ -2369,6 +2772,11 @@ class IntradayEngine:
         """Update performance tracking metrics"""
         self.performance_metrics["total_trades"] += 1
         self.performance_metrics["total_pnl"] += pnl
+        self.online_stats.update(pnl)
+        self.performance_metrics["sharpe_ratio"] = self.online_stats.sharpe_ratio
+        self.performance_metrics["max_drawdown"] = (
+            self.online_stats.drawdown.max_drawdown
+        )
 
         if pnl > 0:
             self.performance_metrics["winning_trades"] += 1
@@ -2432,7 +2840,8 @@ class IntradayEngine:
                         0,
                         int(getattr(config, "CONSECUTIVE_LOSS_PAUSE_MINUTES", 10)) * 60,
                     )
-                    self.global_pause_until = time.time() + pause_sec
+                    self.global_pause_until = self.clock.time() + pause_sec
+                    self.cooldowns.start("global_pause", GLOBAL, pause_sec)
                     self.logger.warning(
                         f"⏸️ Global trading pause for {pause_sec//60}m after {self.consecutive_losses} consecutive losses"
                     )
@@ -2497,7 +2906,7 @@ class IntradayEngine:
         """Enhanced pre-trade filter with profitability optimizations"""
         try:
             # Daily caps
-            today = datetime.utcnow().date()
+            today = self.clock.utcnow().date()
             if today != self.trade_day:
                 self.trade_day = today
                 self.symbol_trade_count.clear()
@@ -2525,8 +2934,8 @@ class IntradayEngine:
             )
             if spacing:
                 last_time = self.last_order_time.get(signal.symbol)
-                if last_time and (time.time() - last_time) < spacing:
-                    remain = int(spacing - (time.time() - last_time))
+                if last_time and (self.clock.time() - last_time) < spacing:
+                    remain = int(spacing - (self.clock.time() - last_time))
                     self.logger.debug(
                         f"🕒 Reject {signal.symbol}: spacing {remain}s remaining"
                     )
@@ -2543,7 +2952,7 @@ class IntradayEngine:
                 min_conf += 0.05
 
             # Time-based confidence adjustment (require higher confidence during lunch hours)
-            current_hour = datetime.now().hour
+            current_hour = self.clock.now().hour
             if 12 <= current_hour <= 13:  # Lunch hour - lower volume/predictability
                 min_conf += 0.05
 
@@ -2649,8 +3058,13 @@ class IntradayEngine:
     def _append_trade_record(self, tr: TradeRecord):
         """Append a finalized trade record to CSV log."""
         try:
+            new_file = not self._trade_log_path.exists()
+            if new_file:
+                self._trade_log_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self._trade_log_path, "a", newline="") as tf:
                 writer = csv.writer(tf)
+                if new_file:
+                    writer.writerow(TRADE_DIAGNOSTICS_COLUMNS)
                 writer.writerow(
                     [
                         tr.symbol,
@@ -2706,15 +3120,6 @@ class IntradayEngine:
     def run_trading_cycle(self):
         """Main trading cycle - run continuously during market hours"""
         try:
-            # CRITICAL: Force immediate output to see if method is called
-            import sys
-
-            print("=" * 50, file=sys.stderr)
-            print("DEBUG: run_trading_cycle CALLED!", file=sys.stderr)
-            print("=" * 50, file=sys.stderr)
-            sys.stderr.flush()
-
-            print("[CYCLE] ENTERING run_trading_cycle method...")  # Debug print
             self.logger.info("[CYCLE] Starting trading cycle...")
 
             # CRITICAL SAFETY CHECK: Verify we have live data connection (attempt reconnection if missing)
@@ -2722,11 +3127,9 @@ class IntradayEngine:
                 self.logger.error(
                     "[ERROR] CRITICAL: No live data connection after retry - stopping cycle"
                 )
-                time.sleep(5)
+                self.clock.sleep(5)
                 return
 
-            print("[DATA] Data manager check passed...")  # Debug print
-
             # Test live data connection with first symbol from watchlist
             try:
                 test_symbol = (
@@ -2775,60 +3178,68 @@ class IntradayEngine:
             if hasattr(self, "last_filter_rejections") and self.last_filter_rejections:
                 self.logger.info(f"🚫 FILTER REJECTIONS: {self.last_filter_rejections}")
 
-            # Process each symbol
-            for symbol in symbols:
+            # Only symbols out of every signal cooldown are processed
+            self._prune_symbol_state()
+            self.cooldowns.watch(symbols)
+            eligible = self.cooldowns.eligible_symbols()
+            cooling = [s for s in symbols if s not in eligible]
+            if cooling:
+                self.logger.info(f"⏳ Cooldown active, skipping: {cooling}")
+            symbols = [s for s in symbols if s in eligible]
+
+            # Broker positions once per cycle for the per-symbol double-check
+            broker_qty = {
+                p["symbol"]: float(p.get("qty", 0))
+                for p in self.data_manager.get_positions()
+            }
+
+            # Process symbols in priority order until the cycle budget runs out
+            cycle = self.cycle_scheduler.begin_cycle(
+                symbols, held=self.active_positions.keys()
+            )
+            for symbol in cycle:
                 try:
                     self.logger.info(
-                        f"🔍 SYMBOL PROCESSING: {symbol} - Starting analysis..."
+                        "🔍 SYMBOL PROCESSING: %s - Starting analysis...", symbol
                     )
 
                     # Skip if we already have a position in this symbol
                     if symbol in self.active_positions:
                         self.logger.info(
-                            f"⏭️ SKIP REASON: {symbol} - already have position in active_positions"
+                            "⏭️ SKIP REASON: %s - already have position in active_positions",
+                            symbol,
                         )
                         continue
 
                     # Double-check: verify no actual broker position exists
-                    positions = self.data_manager.get_positions()
-                    actual_position = next(
-                        (p for p in positions if p["symbol"] == symbol), None
-                    )
-                    if (
-                        actual_position
-                        and abs(float(actual_position.get("qty", 0))) > 0
-                    ):
+                    if abs(broker_qty.get(symbol, 0.0)) > 0:
                         self.logger.info(
-                            f"⚠️ Skipping {symbol} - has actual position: {actual_position.get('qty', 0)} shares"
+                            "⚠️ Skipping %s - has actual position: %s shares",
+                            symbol,
+                            broker_qty[symbol],
                         )
                         continue
 
-                    # We now allow signal generation during cooldown for diagnostics; only execution gate later
-                    cooldown_active = not self.can_generate_signal(symbol)
-                    if cooldown_active:
-                        self.logger.debug(
-                            f"⏳ Cooldown active pre-generation {symbol} - generation allowed for diagnostics"
-                        )
-
-                    self.logger.info(f"📊 Getting market data for {symbol}...")
+                    self.logger.info("📊 Getting market data for %s...", symbol)
 
                     # FIX 1: DATA CONSISTENCY - Get market data from consistent source
                     # Use live data source for both signal generation AND validation
-                    data = self.data_manager.get_bars(
-                        symbol,
-                        timeframe=config.TIMEFRAME,
-                        limit=100,  # Get enough bars for indicators
-                    )
+                    with latency.span("data_fetch"):
+                        data = self.data_manager.get_bars(
+                            symbol,
+                            timeframe=config.TIMEFRAME,
+                            limit=100,  # Get enough bars for indicators
+                        )
 
                     if (
                         data is None or len(data) < 20
                     ):  # Need minimum data for indicators
                         self.logger.info(
-                            f"⚠️ Insufficient live data for {symbol} - skipping"
+                            "⚠️ Insufficient live data for %s - skipping", symbol
                         )
                         continue
 
-                    self.logger.info(f"✅ Got {len(data)} bars of data for {symbol}")
+                    self.logger.info("✅ Got %d bars of data for %s", len(data), symbol)
 
                     # FIX 2: TIMESTAMP VALIDATION - Verify data freshness
                     if hasattr(data, "index") and len(data) > 0:
@@ -2844,7 +3255,7 @@ class IntradayEngine:
                         # Use timezone-aware UTC computations to avoid negative ages from mixed tz
                         from datetime import timezone as _tz
 
-                        now_dt = datetime.now(_tz.utc)
+                        now_dt = self.clock.now(_tz.utc)
                         try:
                             bar_ts = latest_bar_time
                             # If index is tz-naive, assume it's already UTC
@@ -2856,9 +3267,14 @@ class IntradayEngine:
                             bar_ts = latest_bar_time.to_pydatetime().replace(
                                 tzinfo=None
                             )
-                            data_age = (datetime.utcnow() - bar_ts).total_seconds()
+                            data_age = (self.clock.utcnow() - bar_ts).total_seconds()
                         self.logger.info(
-                            f"🕒 {symbol} latest bar: {bar_ts} | now: {now_dt} | age: {data_age:.0f}s | last3: {last_times}"
+                            "🕒 %s latest bar: %s | now: %s | age: %.0fs | last3: %s",
+                            symbol,
+                            bar_ts,
+                            now_dt,
+                            data_age,
+                            last_times,
                         )
 
                         # Allow temporary override for diagnostics
@@ -2876,25 +3292,32 @@ class IntradayEngine:
                                 continue
 
                     # FIX 3: FASTER EXECUTION - Generate signals with pre-validation
-                    signal_start_time = time.time()
-                    self.logger.info(f"🎯 Generating signals for {symbol}...")
+                    signal_start_time = time.perf_counter()
+                    self.logger.info("🎯 Generating signals for %s...", symbol)
                     signals = self.generate_signals(symbol, data)
-                    signal_generation_time = time.time() - signal_start_time
+                    signal_generation_time = time.perf_counter() - signal_start_time
+                    latency.record("signal_generation", signal_generation_time)
+                    # Symbols that produced signals are tried early next cycle
+                    self.cycle_scheduler.set_proximity(
+                        symbol, max((s.confidence for s in signals or []), default=0.0)
+                    )
 
                     self.logger.info(
-                        f"📈 {symbol}: Generated {len(signals) if signals else 0} signals in {signal_generation_time:.2f}s"
+                        "📈 %s: Generated %d signals in %.2fs",
+                        symbol,
+                        len(signals) if signals else 0,
+                        signal_generation_time,
                     )
 
                     # Track signal generation speed
-                    if signal_generation_time > 1.0:  # Log slow signal generation
+                    if signal_generation_time > self.cycle_scheduler.symbol_budget:
                         self.logger.warning(
                             f"⚠️ Slow signal generation for {symbol}: {signal_generation_time:.2f}s"
                         )
 
-                    # Execute best signal if available (and cooldown not active)
+                    # Execute best signal if available
                     if (
                         signals
-                        and not cooldown_active
                         and len(self.active_positions) < config.MAX_OPEN_POSITIONS
                     ):
                         self.logger.info(
@@ -2904,7 +3327,7 @@ class IntradayEngine:
 
                         # Fast validation using same data source (no separate call needed)
                         # Since we pre-validated in generate_signals, just do final freshness check
-                        execution_start_time = time.time()
+                        execution_start_time = time.perf_counter()
 
                         # Quick freshness check only (data source already consistent)
                         signal_age = self._get_timestamp_age_seconds(
@@ -2922,7 +3345,10 @@ class IntradayEngine:
                                 # Direct execution without debug print statements
                                 self.record_signal_time(symbol)
                                 execution_success = self.execute_signal(best_signal)
-                                execution_time = time.time() - execution_start_time
+                                execution_time = (
+                                    time.perf_counter() - execution_start_time
+                                )
+                                latency.record("execution", execution_time)
 
                                 if execution_success:
                                     self.logger.info(
@@ -2948,21 +3374,17 @@ class IntradayEngine:
                             self.logger.warning(
                                 f"🚫 Signal rejected for {symbol}: Too slow ({signal_age:.1f}s old)"
                             )
+                            self._journal_rejection(
+                                best_signal, "stale_signal", age_s=round(signal_age, 3)
+                            )
                             self.record_failed_signal(symbol)
                     else:
                         if not signals:
-                            self.logger.info(f"📊 No signals generated for {symbol}")
+                            self.logger.info("📊 No signals generated for %s", symbol)
                         else:
-                            if cooldown_active:
-                                self.logger.info(
-                                    f"⏳ Cooldown blocked execution for {symbol} (signals={len(signals)})"
-                                )
-                            elif (
-                                len(self.active_positions) >= config.MAX_OPEN_POSITIONS
-                            ):
-                                self.logger.info(
-                                    f"📈 Max positions reached ({len(self.active_positions)}/{config.MAX_OPEN_POSITIONS}), skipping {symbol}"
-                                )
+                            self.logger.info(
+                                f"📈 Max positions reached ({len(self.active_positions)}/{config.MAX_OPEN_POSITIONS}), skipping {symbol}"
+                            )
 
                 except Exception as e:
                     import traceback as _tb
@@ -2972,11 +3394,20 @@ class IntradayEngine:
                     )
                     continue
 
+            summary = cycle.finish()
+            self.last_cycle_symbols = list(cycle.processed)
+            if summary["deferred"]:
+                self.logger.warning(
+                    f"⏱️ Cycle budget {summary['budget_s']:.1f}s spent after "
+                    f"{summary['processed']} symbols - deferred to next cycle: "
+                    f"{summary['deferred']}"
+                )
+
             # Manage existing positions
             self.manage_positions()
 
             # Log status periodically
-            current_time = time.time()
+            current_time = self.clock.time()
             if not hasattr(self, "last_status_time"):
                 self.last_status_time = 0
 
@@ -2985,13 +3416,28 @@ class IntradayEngine:
                 self.last_status_time = current_time
 
         except Exception as e:
-            print(f"❌ EXCEPTION in trading cycle: {e}")  # Debug print
             import traceback
 
-            print(f"❌ TRACEBACK: {traceback.format_exc()}")  # Full stack trace
             self.logger.error(f"❌ Error in trading cycle: {e}")
             self.logger.error(f"❌ Traceback: {traceback.format_exc()}")
 
+    def _run_profiled_cycle(self):
+        """Run a trading cycle, keeping a stack profile if it runs slow"""
+        if self.cycle_profiler is None:
+            self.run_trading_cycle()
+            return
+        self.last_cycle_symbols = []
+        self.cycle_profiler.begin_cycle()
+        try:
+            self.run_trading_cycle()
+        finally:
+            path = self.cycle_profiler.end_cycle(self.last_cycle_symbols)
+        if path:
+            self.logger.warning(
+                f"🐢 Slow cycle #{self.cycle_profiler.cycle_number} over "
+                f"{self.cycle_profiler.slow_seconds:.1f}s - profile saved to {path}"
+            )
+
     def log_status(self):
         """Log current trading status"""
         win_rate = 0
@@ -3002,7 +3448,7 @@ class IntradayEngine:
                 * 100
             )
 
-        current_time = datetime.now().strftime("%H:%M:%S")
+        current_time = self.clock.now().strftime("%H:%M:%S")
 
         if len(self.active_positions) > 0:
             pos_str = ", ".join(
@@ -3037,13 +3483,31 @@ class IntradayEngine:
                 f"[WARNING] OrderManager initialization check failed: {e} - using existing connection"
             )
 
-        # CRITICAL: Immediately sync with broker positions on startup
-        self.logger.info("[STARTUP] STARTUP: Syncing with broker positions...")
-        self.sync_positions_with_broker()
-
-        # CRITICAL: Immediately check for stop loss violations after sync
-        self.logger.info("[STARTUP] STARTUP: Checking for stop loss violations...")
-        self.check_position_stop_losses()
+        # Snapshot restore and the broker position fetch overlap; the sync and
+        # the first protective check then reuse that one position list
+        startup = Bootstrap("engine start")
+        startup.add("snapshot", self._restore_state_snapshot, required=False)
+        startup.add(
+            "broker_positions",
+            lambda: self.order_manager.data_manager.api.list_positions(),
+            required=False,
+        )
+        startup.add(
+            "position_sync",
+            lambda: self.sync_positions_with_broker(
+                startup.results["broker_positions"]
+            ),
+            after=("snapshot", "broker_positions"),
+        )
+        startup.add(
+            "protective_check",
+            lambda: self._startup_protective_check(startup.results["broker_positions"]),
+            after=("position_sync",),
+        )
+        startup.run()
+        self.logger.info(
+            f"⏱️ First protective check {time.monotonic() - self._launched:.3f}s after launch"
+        )
 
         self.logger.info("✅ Engine ready - monitoring market for signals...")
 
@@ -3055,18 +3519,26 @@ class IntradayEngine:
 
         try:
             while self.is_running:
+                self.loop_iterations += 1
                 # CRITICAL: ALWAYS check positions for stop losses, regardless of market hours
                 self.check_position_stop_losses()
+                if self.state_snapshotter:
+                    self.state_snapshotter.maybe_save(self)
 
                 market_open = self.is_market_hours()
                 self.logger.info(
-                    f"🕐 Market hours check: {market_open} (Current time: {datetime.now().strftime('%H:%M:%S')})"
+                    "🕐 Market hours check: %s (Current time: %s)",
+                    market_open,
+                    self.clock.now().strftime("%H:%M:%S"),
                 )
 
                 if market_open:
-                    current_time = time.time()
+                    current_time = self.clock.time()
                     # Ensure data connection each loop
                     self.data_manager.ensure_connection()
+                    # Periodic open-order index / risk ledger reconcile (no-op until due)
+                    self.order_manager.maybe_reconcile_orders()
+                    self.risk_manager.maybe_reconcile(self.order_manager)
 
                     # Run full trading cycle (signal generation) every 5 seconds during market hours
                     if (
@@ -3076,21 +3548,21 @@ class IntradayEngine:
                         self.logger.info(
                             f"🔄 Signal check interval reached, running trading cycle..."
                         )
-                        self.run_trading_cycle()
+                        self._run_profiled_cycle()
                         self.last_signal_check = current_time
                     else:
                         time_remaining = self.timeframe_config.signal_delay - (
                             current_time - self.last_signal_check
                         )
                         self.logger.info(
-                            f"⏳ Next signal check in {time_remaining:.1f}s"
+                            "⏳ Next signal check in %.1fs", time_remaining
                         )
 
-                    # Sleep for 1 second to maintain frequent stop loss monitoring
-                    time.sleep(1)
+                    # Sleep ~1 second, waking early for positions near a trigger
+                    self._sleep_with_protection(self._loop_sleep_seconds())
                 else:
                     self.logger.info(
-                        f"❌ NOT in market hours - Current time: {datetime.now().strftime('%H:%M:%S')}, "
+                        f"❌ NOT in market hours - Current time: {self.clock.now().strftime('%H:%M:%S')}, "
                         f"Trading hours: {config.TRADING_START}-{config.TRADING_END}, "
                         f"Lunch break: {config.LUNCH_BREAK_START}-{config.LUNCH_BREAK_END}"
                     )
@@ -3102,7 +3574,9 @@ class IntradayEngine:
                         # Sync positions every cycle outside market hours
                         self.sync_positions_with_broker()
                         self.manage_positions()  # Check exits, trailing stops, etc.
-                        time.sleep(30)  # Check every 30 seconds outside market hours
+                        self.clock.sleep(
+                            30
+                        )  # Check every 30 seconds outside market hours
                     else:
                         self.logger.info(
                             "⏰ Outside market hours, no positions to monitor..."
@@ -3111,7 +3585,7 @@ class IntradayEngine:
                         self.sync_positions_with_broker()
                         # Auto-generate daily report once after market close if not already
                         try:
-                            today = datetime.utcnow().date()
+                            today = self.clock.utcnow().date()
                             if self._daily_report_generated_date != today:
                                 # Only generate if we had any trades today
                                 if self.trade_count > 0:
@@ -3128,7 +3602,7 @@ class IntradayEngine:
                             self.logger.warning(
                                 f"⚠️ Auto-report generation failed: {rep_e}"
                             )
-                        time.sleep(300)  # Wait 5 minutes when no positions
+                        self.clock.sleep(300)  # Wait 5 minutes when no positions
 
         except KeyboardInterrupt:
             self.logger.info("👋 Shutting down gracefully...")
@@ -3138,131 +3612,164 @@ class IntradayEngine:
             self.logger.error(f"❌ Critical error in scalping engine: {e}")
             self.stop()
 
-    def check_position_stop_losses(self):
-        """Rapid check of all positions for stop loss violations - runs every 1 second"""
+    def _exit_on_protective_trigger(self, trigger: ProtectiveTrigger):
+        """Log and close one position flagged by the batched protective check"""
+        symbol = trigger.symbol
+        position = self.active_positions.get(symbol)
+        if position is None:
+            return
 
-        # CRITICAL SAFETY CHECK: Verify live data connection before checking stops (attempt reconnect)
-        if not self.data_manager.ensure_connection():
-            self.logger.error(
-                "❌ CRITICAL: No live data for stop loss checks (after retry) - pausing"
+        price = trigger.price
+        loss_pct = trigger.loss_pct
+        if trigger.reason == EMERGENCY_STOP:
+            self.logger.warning(
+                f"🚨 EMERGENCY STOP during hold period: {symbol} - {loss_pct:.3f}% loss"
             )
-            time.sleep(5)
-            return
+            exit_reason = (
+                f"RAPID Emergency stop: {loss_pct:.3f}% loss during hold period"
+            )
+        elif trigger.reason == TRAILING_STOP:
+            original_stop = position.get("original_stop_loss", trigger.stop)
+            self.logger.info(
+                f"🎯 TRAILING STOP PROTECTED PROFIT: {symbol} - Stop moved from ${original_stop:.2f} to ${trigger.stop:.2f}"
+            )
+            exit_reason = f"RAPID Trailing Stop: ${price:.2f} (Loss: {loss_pct:.3f}%) - PROTECTED PROFIT"
+        elif trigger.reason == STOP_LOSS:
+            exit_reason = f"RAPID Stop loss: ${price:.2f} (Loss: {loss_pct:.3f}%)"
+        elif trigger.reason == HARD_STOP:
+            exit_reason = f"RAPID Hard stop: {loss_pct:.3f}% loss exceeds {self.protective_checker.hard_stop_pct}% safety limit"
+        elif trigger.reason == MAX_HOLD:
+            exit_reason = (
+                f"Max hold time ({self.protective_checker.max_hold_seconds}s) reached"
+            )
+        else:
+            exit_reason = f"Profit target hit: ${price:.2f}"
 
-        # CRITICAL FIX: Always check broker positions, not just bot-tracked positions
-        # First sync with broker to get ALL real positions
-        self.sync_positions_with_broker()
+        # Log violation if exceeds configured limit
+        stop_loss_pct = config.get("STOP_LOSS_PCT", 0.015) * 100
+        if loss_pct > stop_loss_pct:
+            violation = loss_pct - stop_loss_pct
+            self.logger.warning(
+                f"🚨 RAPID STOP VIOLATION: {symbol} - Expected {stop_loss_pct:.3f}% but lost {loss_pct:.3f}% (excess: {violation:.3f}%)"
+            )
 
-        # Now check bot-tracked positions (these have full signal data)
-        for symbol in list(self.active_positions.keys()):
-            try:
-                position = self.active_positions[symbol]
-                signal = position.get("signal")
+        # Immediately close position
+        self.logger.info(f"🛑 RAPID STOP TRIGGERED: {symbol} - {exit_reason}")
+        position["_pending_exit_reason"] = trigger.reason
+        self.close_position(symbol)
 
-                if not signal:
-                    continue
+    @latency.timed("stop_check")
+    def check_position_stop_losses(self):
+        """Rapid check of positions for stop loss violations
 
-                # Get current price for this symbol - ONLY LIVE DATA
-                market_data = self.data_manager.get_current_market_data(
-                    symbol, "stop_loss_check"
-                )
-                if market_data is None:
-                    self.logger.warning(
-                        f"⚠️ No live data for stop loss check on {symbol}"
-                    )
-                    continue
+        Broker sync runs at a fixed cadence; each position is priced only when
+        the monitor scheduler says it is due (sooner the nearer its stop/target).
+        """
+        now = self.clock.monotonic()
+        sync_due = now - self._last_protective_sync >= config.get(
+            "PROTECTIVE_SYNC_SECONDS", 1.0
+        )
 
-                # Verify data is from live source
-                if market_data.get("source") != "alpaca_live":
-                    self.logger.error(
-                        f"❌ CRITICAL: Non-live data in stop loss check for {symbol}"
-                    )
-                    continue
+        if sync_due:
+            self._last_protective_sync = now
+            # CRITICAL SAFETY CHECK: Verify live data connection before checking stops (attempt reconnect)
+            if not self.data_manager.ensure_connection():
+                self.logger.error(
+                    "❌ CRITICAL: No live data for stop loss checks (after retry) - pausing"
+                )
+                self.clock.sleep(5)
+                return
 
-                current_price = market_data.get("price")
-                if current_price is None or current_price <= 0:
-                    continue
+            # CRITICAL FIX: Always check broker positions, not just bot-tracked positions
+            # First sync with broker to get ALL real positions
+            self.sync_positions_with_broker()
 
-                entry_price = position["entry_price"]
+        # Now check bot-tracked positions (these have full signal data):
+        # one price request and one vectorized pass for all that are due
+        symbols = self._protected_symbols()
+        self.monitor_scheduler.retain(symbols)
+        due = self.monitor_scheduler.due(symbols, now)
+        if due:
+            prices = self.data_manager.get_latest_prices(due)
+            missing = [s for s in due if not prices.get(s)]
+            if missing:
+                self.logger.warning(
+                    f"⚠️ No live data for stop loss check on {', '.join(missing)}"
+                )
 
-                # Calculate actual loss percentage
-                if signal.signal_type == "BUY":
-                    loss_pct = (
-                        ((entry_price - current_price) / entry_price) * 100
-                        if current_price < entry_price
-                        else 0
+            result = self.protective_checker.check(
+                {s: self.active_positions[s] for s in due},
+                prices,
+                now=self.clock.time(),
+            )
+            self.monitor_scheduler.reschedule(result.distance_atr, now)
+            for trigger in result.triggers:
+                try:
+                    self._exit_on_protective_trigger(trigger)
+                except Exception as e:
+                    self.logger.error(
+                        f"❌ Error in rapid stop loss check for {trigger.symbol}: {e}"
                     )
-                    stop_loss_hit = current_price <= position["stop_loss"]
-                else:  # SELL
-                    loss_pct = (
-                        ((current_price - entry_price) / entry_price) * 100
-                        if current_price > entry_price
-                        else 0
-                    )
-                    stop_loss_hit = current_price >= position["stop_loss"]
-
-                # Check minimum hold time before evaluating stop loss
-                entry_time = position.get("entry_time", datetime.now())
-                min_hold_time = position.get(
-                    "minimum_hold_time", 30
-                )  # Default 30 seconds
-                time_since_entry = (datetime.now() - entry_time).total_seconds()
-
-                if time_since_entry < min_hold_time:
-                    # Only apply hard emergency stop during minimum hold period
-                    if loss_pct > 2.0:  # Emergency stop at 2% during hold period
-                        self.logger.warning(
-                            f"🚨 EMERGENCY STOP during hold period: {symbol} - {loss_pct:.3f}% loss"
-                        )
-                        self.logger.info(
-                            f"🛑 EMERGENCY STOP TRIGGERED: {symbol} - Loss exceeds 2% emergency threshold"
-                        )
-                        self.close_position(symbol)
-                    else:
-                        # Skip normal stop loss evaluation during minimum hold time
-                        self.logger.debug(
-                            f"⏳ {symbol} in minimum hold period ({time_since_entry:.0f}s/{min_hold_time}s) - skipping stop loss"
-                        )
-                        continue
 
-                # Critical stop loss checks (after minimum hold time)
-                if stop_loss_hit or loss_pct > 0.25:  # Hard stop at 0.25%
-                    exit_reason = ""
+        if sync_due:
+            self._check_untracked_broker_positions()
 
-                    if stop_loss_hit:
-                        # ENHANCED: Determine if this was a trailing stop or original stop
-                        original_stop = position.get(
-                            "original_stop_loss", position["stop_loss"]
-                        )
-                        if position["stop_loss"] != original_stop:
-                            exit_reason = f"RAPID Trailing Stop: ${current_price:.2f} (Loss: {loss_pct:.3f}%) - PROTECTED PROFIT"
-                            self.logger.info(
-                                f"🎯 TRAILING STOP PROTECTED PROFIT: {symbol} - Stop moved from ${original_stop:.2f} to ${position['stop_loss']:.2f}"
-                            )
-                        else:
-                            exit_reason = f"RAPID Stop loss: ${current_price:.2f} (Loss: {loss_pct:.3f}%)"
-                    else:
-                        exit_reason = f"RAPID Hard stop: {loss_pct:.3f}% loss exceeds 0.25% safety limit"
+    def _restore_state_snapshot(self) -> bool:
+        # Warm restart: resume in-memory state from the last snapshot; the
+        # broker sync then only corrects what changed while we were down
+        if self.state_snapshotter and self.state_snapshotter.restore(self):
+            self._rebuild_cooldowns()
+            self.logger.info("[STARTUP] STARTUP: Resumed from state snapshot")
+            return True
+        return False
 
-                    # Log violation if exceeds configured limit
-                    if loss_pct > config.STOP_LOSS_PCT:
-                        violation = loss_pct - config.STOP_LOSS_PCT
-                        self.logger.warning(
-                            f"🚨 RAPID STOP VIOLATION: {symbol} - Expected {config.STOP_LOSS_PCT:.3f}% but lost {loss_pct:.3f}% (excess: {violation:.3f}%)"
-                        )
+    def _startup_protective_check(self, broker_positions=None):
+        """First stop loss check, on the positions just synced at startup"""
+        self.logger.info("[STARTUP] STARTUP: Checking for stop loss violations...")
+        # The startup sync counts as this tick's broker sync
+        self._last_protective_sync = self.clock.monotonic()
+        self.check_position_stop_losses()
+        self._check_untracked_broker_positions(broker_positions)
 
-                    # Immediately close position
-                    self.logger.info(
-                        f"🛑 RAPID STOP TRIGGERED: {symbol} - {exit_reason}"
-                    )
-                    self.close_position(symbol)
+    def _protected_symbols(self) -> List[str]:
+        """Tracked symbols the protective monitor is responsible for"""
+        return [s for s, p in self.active_positions.items() if p.get("signal")]
 
-            except Exception as e:
-                self.logger.error(
-                    f"❌ Error in rapid stop loss check for {symbol}: {e}"
+    def _loop_sleep_seconds(self) -> float:
+        """Pause between market-hours loop passes
+
+        One second on the wall clock. A simulated clock skips straight to the
+        next signal check or scheduled event (a new bar, say), since nothing
+        the loop looks at can change before then.
+        """
+        if not self.clock.simulated:
+            return 1
+        wake = [self.last_signal_check + self.timeframe_config.signal_delay]
+        next_event = self.clock.next_event()
+        if next_event is not None:
+            wake.append(next_event)
+        return max(1, min(wake) - self.clock.time())
+
+    def _sleep_with_protection(self, seconds: float):
+        """Sleep, waking early whenever a position is due for a protective check"""
+        deadline = self.clock.monotonic() + seconds
+        while True:
+            remaining = deadline - self.clock.monotonic()
+            if remaining <= 0:
+                self.loop_lag = -remaining
+                latency.record("loop_lag", self.loop_lag)
+                return
+            self.clock.sleep(
+                min(
+                    remaining,
+                    self.monitor_scheduler.seconds_until_next(default=remaining),
                 )
-                continue
+            )
+            if self.monitor_scheduler.due(self._protected_symbols()):
+                self.check_position_stop_losses()
 
+    def _check_untracked_broker_positions(self, broker_positions=None):
+        """Hard stop for broker positions the bot is not tracking"""
         # ADDITIONAL SAFETY: Check ALL broker positions for basic stop loss
         # This catches positions that bot might have lost track of
         try:
@@ -3271,27 +3778,30 @@ class IntradayEngine:
                 and hasattr(self.order_manager, "data_manager")
                 and self.order_manager.data_manager.api
             ):
-                broker_positions = self.order_manager.data_manager.api.list_positions()
+                if broker_positions is None:
+                    broker_positions = (
+                        self.order_manager.data_manager.api.list_positions()
+                    )
 
                 for pos in broker_positions:
-                    symbol = pos["symbol"]
+                    symbol = pos.symbol
 
                     # Skip if we're already tracking this position
                     if symbol in self.active_positions:
                         continue
 
                     # Check untracked position for excessive loss
-                    unrealized_pnl_pct = float(pos["unrealized_plpc"]) * 100
+                    unrealized_pnl_pct = float(pos.unrealized_plpc) * 100
                     loss_pct = abs(unrealized_pnl_pct) if unrealized_pnl_pct < 0 else 0
 
                     # Apply hard stop to ANY position
-                    if loss_pct > 0.25:  # Hard stop at 0.25%
+                    if loss_pct > self.protective_checker.hard_stop_pct:
                         self.logger.warning(
                             f"🚨 UNTRACKED POSITION HARD STOP: {symbol} - {loss_pct:.3f}% loss"
                         )
 
                         # Emergency close this position
-                        qty = float(pos["qty"])
+                        qty = float(pos.qty)
                         side = "sell" if qty > 0 else "buy"
                         abs_qty = abs(qty)
 
@@ -3306,7 +3816,7 @@ class IntradayEngine:
                         )
 
                         # Emergency close this position
-                        qty = float(pos["qty"])
+                        qty = float(pos.qty)
                         side = "sell" if qty > 0 else "buy"
                         abs_qty = abs(qty)
 
@@ -3326,6 +3836,10 @@ class IntradayEngine:
         # Close all active positions
         for symbol in list(self.active_positions.keys()):
             self.close_position(symbol)
+        if self.state_snapshotter:
+            self.state_snapshotter.save(self)
+        if self.cycle_profiler:
+            self.cycle_profiler.stop()
 
         # Final status report
         self.log_final_report()
@@ -3390,7 +3904,7 @@ class IntradayEngine:
             else tr.realized_pnl or 0.0
         )
         sp["equity_path"].append(cumulative)
-        peak = max(sp["equity_path"]) if sp["equity_path"] else cumulative
+        peak = sp["equity_peak"] = max(sp.get("equity_peak", cumulative), cumulative)
         drawdown = peak - cumulative
         if drawdown > sp["max_drawdown"]:
             sp["max_drawdown"] = drawdown
@@ -3403,7 +3917,9 @@ class IntradayEngine:
         # Time bucket (15-min exit ET)
         try:
             tz = pytz.timezone("US/Eastern")
-            exit_et = tr.exit_time.astimezone(tz) if tr.exit_time else datetime.now(tz)
+            exit_et = (
+                tr.exit_time.astimezone(tz) if tr.exit_time else self.clock.now(tz)
+            )
             bucket_minute = (exit_et.minute // 15) * 15
             bucket = f"{exit_et.hour:02d}:{bucket_minute:02d}"
             tb = sp["time_buckets"].setdefault(bucket, {"pnl": 0.0, "trades": 0})
@@ -3471,7 +3987,7 @@ class IntradayEngine:
         if not self.symbol_perf:
             self.logger.info("No symbol performance data to report.")
             return
-        date_str = datetime.now().strftime("%Y%m%d")
+        date_str = self.clock.now().strftime("%Y%m%d")
         reports_dir = Path("reports") / "daily"
         reports_dir.mkdir(parents=True, exist_ok=True)
         summary_csv = reports_dir / f"{date_str}_symbol_summary.csv"
@@ -3618,11 +4134,8 @@ class IntradayEngine:
         try:
             self.logger.info(f"Starting trading session with symbols: {symbols}")
 
-            # Initialize components
-            self.data_manager = DataManager()
-            self.risk_manager = RiskManager()
-            self.order_manager = OrderManager(self.data_manager)
-
+            # Components were bootstrapped in __init__; rebuilding them here
+            # would repeat the broker round trips and drop the risk ledger
             # Start the main trading loop
             self.start()
 
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Protective Monitor Scheduler
+Per-position check times for the rapid stop loss monitor. A position close to
+its stop or target (in ATR units) is checked as often as every 100 ms; one far
+away from both only every few seconds.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from config import config
+from utils.clock import system_clock
+
+# Re-check cadence for a position we could not price on its last check
+MISSING_PRICE_INTERVAL = 1.0
+
+
+class ProtectiveMonitorScheduler:
+    """Tracks when each held symbol is next due for a protective check"""
+
+    def __init__(
+        self, min_interval=None, max_interval=None, seconds_per_atr=None, clock=None
+    ):
+        self.clock = clock or system_clock
+        self.min_interval = min_interval or config.get("PROTECTIVE_MIN_INTERVAL", 0.1)
+        self.max_interval = max_interval or config.get("PROTECTIVE_MAX_INTERVAL", 5.0)
+        self.seconds_per_atr = seconds_per_atr or config.get(
+            "PROTECTIVE_SECONDS_PER_ATR", 4.0
+        )
+        self._next_check: Dict[str, float] = {}
+        self.intervals: Dict[str, float] = {}  # last interval chosen per symbol
+
+    def due(self, symbols: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """Symbols whose next check time has arrived (new symbols are due at once)"""
+        now = self.clock.monotonic() if now is None else now
+        return [s for s in symbols if self._next_check.get(s, 0.0) <= now]
+
+    def reschedule(self, distance_atr: Dict[str, float], now: Optional[float] = None):
+        """Set the next check for each checked symbol from its trigger distance"""
+        if not distance_atr:
+            return
+        now = self.clock.monotonic() if now is None else now
+        symbols = list(distance_atr)
+        distances = np.array([distance_atr[s] for s in symbols], dtype=float)
+
+        intervals = np.clip(
+            self.min_interval + distances * self.seconds_per_atr,
+            self.min_interval,
+            self.max_interval,
+        )
+        intervals[np.isnan(distances)] = MISSING_PRICE_INTERVAL
+
+        for symbol, interval in zip(symbols, intervals):
+            self.intervals[symbol] = float(interval)
+            self._next_check[symbol] = now + float(interval)
+
+    def retain(self, symbols: Iterable[str]):
+        """Forget symbols that are no longer held"""
+        keep = set(symbols)
+        for symbol in list(self._next_check):
+            if symbol not in keep:
+                del self._next_check[symbol]
+                self.intervals.pop(symbol, None)
+
+    def seconds_until_next(self, now: Optional[float] = None, default=1.0) -> float:
+        """Time until the earliest scheduled check (default when nothing is held)"""
+        if not self._next_check:
+            return default
+        now = self.clock.monotonic() if now is None else now
+        return max(0.0, min(self._next_check.values()) - now)
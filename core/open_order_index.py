@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Open Order Index
+In-memory view of the account's open orders, keyed by symbol and order type.
+Kept current from our own submissions/cancels and from trade update events,
+with a periodic full reconcile against the broker.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from core.trade_updates import TERMINAL_EVENTS
+
+# Broker statuses for orders that can no longer fill
+CLOSED_STATUSES = (
+    "filled",
+    "canceled",
+    "expired",
+    "rejected",
+    "done_for_day",
+    "replaced",
+)
+
+# Order types that protect a position (stop-side exits)
+STOP_ORDER_TYPES = ("stop", "stop_limit", "trailing_stop")
+
+
+def _field(order, name, default=None):
+    if isinstance(order, dict):
+        return order.get(name, default)
+    return getattr(order, name, default)
+
+
+def _normalize_type(order_type) -> str:
+    # Accept plain strings as well as enum-style values
+    return str(getattr(order_type, "value", order_type) or "").lower()
+
+
+class OpenOrderIndex:
+    """Open orders indexed by id, by symbol and by (symbol, order type)"""
+
+    def __init__(self, closed_memory: int = 1000):
+        self._lock = threading.RLock()
+        self._orders: Dict[str, Dict] = {}  # order_id -> record
+        self._by_symbol: Dict[str, set] = defaultdict(set)
+        self._by_type: Dict[tuple, set] = defaultdict(set)
+
+        # Ids we already saw close, so a late REST response can't resurrect them
+        self._closed_ids: "OrderedDict[str, float]" = OrderedDict()
+        self._closed_memory = closed_memory
+
+        self.last_reconciled: Optional[float] = None
+        self.reconcile_count = 0
+        self.reconcile_drift = 0  # orders added/removed by the last reconcile
+        self.last_reconcile_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+    @staticmethod
+    def to_record(order) -> Dict:
+        """Build an index record from an Order entity or trade update order dict"""
+        return {
+            "id": _field(order, "id"),
+            "client_order_id": _field(order, "client_order_id"),
+            "symbol": _field(order, "symbol"),
+            "side": _field(order, "side"),
+            "type": _normalize_type(
+                _field(order, "order_type") or _field(order, "type")
+            ),
+            "qty": _field(order, "qty"),
+            "stop_price": _field(order, "stop_price"),
+            "limit_price": _field(order, "limit_price"),
+            "status": _field(order, "status"),
+        }
+
+    def add(self, order):
+        """Index an order (and any bracket/OCO legs) unless it is already closed"""
+        with self._lock:
+            for leg in _field(order, "legs") or []:
+                self.add(leg)
+
+            record = self.to_record(order)
+            order_id = record["id"]
+            if not order_id or order_id in self._closed_ids:
+                return
+            if record["status"] in CLOSED_STATUSES:
+                self.remove(order_id)
+                return
+
+            self._discard_keys(order_id)
+            record["indexed_at"] = time.monotonic()
+            self._orders[order_id] = record
+            self._by_symbol[record["symbol"]].add(order_id)
+            self._by_type[(record["symbol"], record["type"])].add(order_id)
+
+    def remove(self, order_id: str):
+        """Drop an order that was filled, cancelled or otherwise closed"""
+        with self._lock:
+            self._discard_keys(order_id)
+            self._orders.pop(order_id, None)
+            self._closed_ids[order_id] = time.monotonic()
+            while len(self._closed_ids) > self._closed_memory:
+                self._closed_ids.popitem(last=False)
+
+    def _discard_keys(self, order_id: str):
+        record = self._orders.get(order_id)
+        if record is None:
+            return
+        symbol_ids = self._by_symbol.get(record["symbol"])
+        if symbol_ids is not None:
+            symbol_ids.discard(order_id)
+            if not symbol_ids:
+                del self._by_symbol[record["symbol"]]
+        type_key = (record["symbol"], record["type"])
+        type_ids = self._by_type.get(type_key)
+        if type_ids is not None:
+            type_ids.discard(order_id)
+            if not type_ids:
+                del self._by_type[type_key]
+
+    def on_trade_update(self, event: Dict):
+        """TradeUpdateFeed subscriber - apply one order event"""
+        order = event.get("order") or {}
+        if not order.get("id"):
+            return
+        if event.get("event") in TERMINAL_EVENTS or event.get("event") == "replaced":
+            self.remove(order["id"])
+        else:
+            self.add(order)
+
+    def get(self, order_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self._orders.get(order_id)
+
+    def orders_for(
+        self, symbol: str, order_types: Optional[Iterable[str]] = None
+    ) -> List[Dict]:
+        """Open orders for a symbol, optionally limited to some order types"""
+        with self._lock:
+            if order_types is None:
+                ids = list(self._by_symbol.get(symbol, ()))
+            else:
+                ids = [
+                    order_id
+                    for order_type in order_types
+                    for order_id in self._by_type.get((symbol, order_type), ())
+                ]
+            return [self._orders[order_id] for order_id in ids]
+
+    def all_orders(self) -> List[Dict]:
+        with self._lock:
+            return list(self._orders.values())
+
+    def clear(self):
+        with self._lock:
+            for order_id in list(self._orders):
+                self.remove(order_id)
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        return (
+            self.last_reconciled is None
+            or time.monotonic() - self.last_reconciled >= max_age_seconds
+        )
+
+    def reconcile(self, api) -> int:
+        """Replace the index with the broker's open-order list; returns the drift"""
+        started = time.monotonic()
+        broker_orders = api.list_orders(status="open", nested=False)
+
+        with self._lock:
+            broker_ids = {_field(order, "id") for order in broker_orders}
+            known_ids = set(self._orders)
+
+            for order_id in known_ids - broker_ids:
+                # Keep orders we indexed while the list call was in flight
+                if self._orders[order_id]["indexed_at"] < started:
+                    self.remove(order_id)
+            for order in broker_orders:
+                # The listing overrides closes we saw before it was requested;
+                # closes seen while it was in flight are newer than the listing
+                order_id = _field(order, "id")
+                if self._closed_ids.get(order_id, started) < started:
+                    del self._closed_ids[order_id]
+                self.add(order)
+
+            self.reconcile_drift = len(known_ids ^ broker_ids)
+            self.reconcile_count += 1
+            self.last_reconciled = time.monotonic()
+            self.last_reconcile_seconds = self.last_reconciled - started
+
+        return self.reconcile_drift
@@ -5,11 +5,18 @@ Handles trade execution and order management with stock-specific thresholds
 ASCII-only, no Unicode characters
 """
 
+import threading
+import time
+import uuid
 from datetime import datetime
 
 import alpaca_trade_api as tradeapi
 
 from config import config
+from core.client_order_ids import FINAL_STATUSES, ClientOrderRegistry
+from core.open_order_index import STOP_ORDER_TYPES, OpenOrderIndex
+from core.trade_updates import get_trade_update_feed
+from core.timer_wheel import CooldownService
 from core.trailing_stop_manager import TrailingStopManager
 from utils.logger import clean_message, setup_logger
 from utils.price_utils import (
@@ -31,36 +38,71 @@ try:
 except ImportError:
     STOCK_SPECIFIC_AVAILABLE = False
 
+# Valid values for config ORDER_PROTECTION_MODE
+PROTECTION_MODES = ("managed", "bracket", "trailing")
+
+# Broker answers to a cancel for an order that is no longer open
+NOT_CANCELABLE_STATUS = (404, 422)
+
 
 class OrderManager:
     """Manages trade execution and orders"""
 
-    def __init__(self, data_manager):
+    def __init__(self, data_manager, reconcile=True):
         self.logger = setup_logger("order_manager")
         self.data_manager = data_manager
         self.api = data_manager.api
 
-        # Initialize trailing stop manager
-        self.trailing_stop_manager = TrailingStopManager(self)
+        # Trailing stop manager is created on first use
+        self._trailing_stop_manager = None
 
         # Trading cooldown tracking
-        self.last_trade_times = {}  # symbol -> last trade timestamp
+        self.trade_cooldowns = CooldownService(blocking_kinds=())
+
+        # Broker-held protection: symbol -> {"mode": str, "order_ids": [ids]}
+        self.native_protection = {}
+        # Trailing-mode entries whose exit waits for the fill: entry id -> plan
+        self.pending_protection = {}
+        self._pending_lock = threading.Lock()
+
+        # Open orders by symbol/type - kept current from our submissions,
+        # trade update events and a periodic reconcile
+        self.open_orders = OpenOrderIndex()
+        self.reconcile_interval = config.get("ORDER_INDEX_RECONCILE_SECONDS", 60)
+
+        # Our own submissions by deterministic client_order_id
+        self.client_orders = ClientOrderRegistry()
+        self.last_error = None
+
+        if config.get("TRADE_UPDATE_STREAM_ENABLED", True):
+            self.trade_updates = get_trade_update_feed()
+            self.trade_updates.subscribe(self.open_orders.on_trade_update)
+            self.trade_updates.subscribe(self.client_orders.on_trade_update)
+            self.trade_updates.subscribe(self.on_trade_update)
+            self.trade_updates.start()
+        # A parallel bootstrap runs the initial reconcile alongside other
+        # broker calls instead
+        if reconcile:
+            self.maybe_reconcile_orders(force=True)
 
         self.logger.info("Order Manager initialized with trailing stop support")
+        if self.uses_native_protection():
+            self.logger.info(
+                f"Order protection mode: {self.get_protection_mode()} (broker-native)"
+            )
+
+    @property
+    def trailing_stop_manager(self):
+        if self._trailing_stop_manager is None:
+            self._trailing_stop_manager = TrailingStopManager(self)
+        return self._trailing_stop_manager
 
     def is_trading_allowed(self, symbol):
         """Check if trading is allowed based on cooldown period"""
-        if symbol not in self.last_trade_times:
-            return True
-
-        from config import config
-
-        cooldown_minutes = config.get("TRADE_COOLDOWN_MINUTES", 5)
-        last_trade_time = self.last_trade_times[symbol]
-        current_time = datetime.now()
-        time_diff = (current_time - last_trade_time).total_seconds() / 60
-
-        if time_diff < cooldown_minutes:
+        remaining = self.trade_cooldowns.remaining("trade", symbol)
+        if remaining:
+            cooldown_minutes = config.get("TRADE_COOLDOWN_MINUTES", 5)
+            time_diff = cooldown_minutes - remaining / 60
             self.logger.info(
                 f"[{symbol}] Trade cooldown active: {time_diff:.1f}/{cooldown_minutes} minutes"
             )
@@ -69,8 +111,10 @@ class OrderManager:
         return True
 
     def update_last_trade_time(self, symbol):
-        """Update the last trade time for a symbol"""
-        self.last_trade_times[symbol] = datetime.now()
+        """Start the trade cooldown for a symbol"""
+        self.trade_cooldowns.start(
+            "trade", symbol, config.get("TRADE_COOLDOWN_MINUTES", 5) * 60
+        )
 
     def calculate_position_size(self, symbol, price, account_equity):
         """Calculate appropriate position size - Limited to 10 shares per trade"""
@@ -118,6 +162,383 @@ class OrderManager:
                 "profile": "moderate_volatility",
             }
 
+    def _submit_order(self, **order_kwargs):
+        """Submit an order and record it in the open-order index"""
+        order = self.api.submit_order(**order_kwargs)
+        self.open_orders.add(order)
+        return order
+
+    def _cancel_order(self, order_id):
+        """Cancel an order and drop it from the open-order index
+
+        Returns False when the broker reports the order is no longer open
+        (already filled, cancelled or unknown); its stale index entry is
+        dropped as well. Any other failure raises.
+        """
+        try:
+            self.api.cancel_order(order_id)
+        except Exception as e:
+            if getattr(e, "status_code", None) not in NOT_CANCELABLE_STATUS:
+                raise
+            self.open_orders.remove(order_id)
+            return False
+        self.open_orders.remove(order_id)
+        return True
+
+    def maybe_reconcile_orders(self, force=False):
+        """Reconcile the open-order index with the broker when it is due"""
+        # Runs every tick: also settle entries still waiting for protection
+        if self.pending_protection:
+            self.check_pending_protection()
+        if not force and not self.open_orders.is_stale(self.reconcile_interval):
+            return
+        try:
+            drift = self.open_orders.reconcile(self.api)
+            if drift:
+                self.logger.info(
+                    f"[ORDERS] Reconciled open-order index: {drift} orders corrected"
+                )
+        except Exception as e:
+            self.logger.warning(f"[ORDERS] Open-order reconcile failed: {e}")
+
+    def submit_market_order(
+        self, symbol, side, quantity, signal_id=None, purpose="entry"
+    ):
+        """Submit a market order once per signal; returns the broker order id
+
+        The client_order_id is derived from the signal id, so calling this
+        again for the same signal returns the existing order instead of
+        sending a duplicate. If the REST call fails we look the order up by
+        its client_order_id once before treating it as not submitted.
+        """
+        if signal_id is None:
+            signal_id = uuid.uuid4().hex[:12]
+        client_order_id = self.client_orders.next_client_order_id(
+            symbol, side, signal_id, purpose
+        )
+
+        if self.client_orders.is_duplicate(client_order_id):
+            existing = self.client_orders.get(client_order_id)
+            self.logger.warning(
+                f"[{symbol}] Duplicate {purpose} order suppressed: {client_order_id} "
+                f"(status: {existing['status']})"
+            )
+            return existing["order_id"] or client_order_id
+
+        self.client_orders.begin(client_order_id, symbol, side, quantity)
+        try:
+            order = self._submit_order(
+                symbol=symbol,
+                qty=quantity,
+                side=side,
+                type="market",
+                time_in_force="day",
+                client_order_id=client_order_id,
+            )
+            self.client_orders.record_order(client_order_id, order)
+            self.update_last_trade_time(symbol)
+            self.logger.info(
+                f"[{symbol}] Market {side} order submitted: {quantity} shares "
+                f"({client_order_id})"
+            )
+            return order.id
+
+        except Exception as e:
+            # A timeout doesn't say whether the order reached the broker
+            order = self._lookup_client_order(client_order_id)
+            if order is not None:
+                self.open_orders.add(order)
+                self.client_orders.record_order(client_order_id, order)
+                self.update_last_trade_time(symbol)
+                self.logger.warning(
+                    f"[{symbol}] Submit raised but order exists at broker: "
+                    f"{client_order_id} ({e})"
+                )
+                return order.id
+
+            self.client_orders.record_failure(client_order_id, e)
+            self.last_error = {
+                "code": getattr(e, "code", None) or type(e).__name__,
+                "message": clean_message(str(e)),
+                "details": {
+                    "symbol": symbol,
+                    "side": side,
+                    "qty": quantity,
+                    "client_order_id": client_order_id,
+                },
+            }
+            self.logger.error(f"[{symbol}] Market {side} order failed: {e}")
+            return None
+
+    def _lookup_client_order(self, client_order_id):
+        try:
+            return self.api.get_order_by_client_order_id(client_order_id)
+        except Exception:
+            return None
+
+    def get_order_status(self, order_id):
+        """Latest known status of one of our orders, by order id or client id
+
+        Served from the registry (kept current by trade updates); only orders
+        the registry has no fill information for fall back to one REST call.
+        """
+        record = self.client_orders.get_by_order_id(order_id)
+        if record is not None and (
+            record["status"] in FINAL_STATUSES or self.trade_updates_connected()
+        ):
+            return record
+
+        try:
+            order = self.api.get_order(order_id)
+        except Exception as e:
+            self.logger.debug(f"Order status lookup failed for {order_id}: {e}")
+            return record
+
+        if record is not None:
+            return self.client_orders.record_order(record["client_order_id"], order)
+        return {
+            "order_id": order.id,
+            "client_order_id": order.client_order_id,
+            "symbol": order.symbol,
+            "side": order.side,
+            "status": order.status,
+            "filled_qty": float(order.filled_qty or 0),
+            "filled_avg_price": (
+                float(order.filled_avg_price) if order.filled_avg_price else None
+            ),
+        }
+
+    def trade_updates_connected(self):
+        feed = getattr(self, "trade_updates", None)
+        return bool(feed is not None and feed.is_connected)
+
+    def get_last_error(self):
+        """Details of the most recent failed order submission (or None)"""
+        return self.last_error
+
+    def get_position_info(self, symbol, context=None, force_fresh=False):
+        """Broker position for a symbol as a dict, or None when flat"""
+        try:
+            position = self.api.get_position(symbol)
+        except Exception as e:
+            self.logger.debug(f"[{symbol}] No position ({context}): {e}")
+            return None
+        return {
+            "symbol": position.symbol,
+            "qty": float(position.qty),
+            "side": position.side,
+            "market_value": float(position.market_value or 0),
+            "avg_entry_price": float(position.avg_entry_price),
+        }
+
+    def get_protection_mode(self):
+        """Get the configured order protection mode"""
+        mode = str(config.get("ORDER_PROTECTION_MODE", "managed")).lower()
+        return mode if mode in PROTECTION_MODES else "managed"
+
+    def uses_native_protection(self):
+        """Check if stops/targets are held by the broker instead of the bot"""
+        return self.get_protection_mode() != "managed"
+
+    def is_natively_protected(self, symbol):
+        """Check if a symbol's protective orders are held by the broker"""
+        return symbol in self.native_protection
+
+    def _submit_protected_entry(
+        self, symbol, shares, side, stop_loss_price, take_profit_price, thresholds
+    ):
+        """Submit an entry order with broker-native protection attached
+
+        bracket:  one order - market entry + stop loss leg + take profit leg
+        trailing: market entry, then a trailing_stop order at the stock-specific
+                  trailing distance for the filled quantity once the fill is
+                  confirmed (see _entry_final) - an exit sent before that is
+                  rejected for lack of shares (no separate target, it would
+                  double-commit the shares). An entry still unfilled after
+                  NATIVE_PROTECTION_FILL_TIMEOUT is cancelled.
+        """
+        mode = self.get_protection_mode()
+        exit_side = "sell" if side == "buy" else "buy"
+
+        if mode == "bracket":
+            order = self._submit_order(
+                symbol=symbol,
+                qty=shares,
+                side=side,
+                type="market",
+                time_in_force="day",
+                order_class="bracket",
+                take_profit={"limit_price": round_to_cent(take_profit_price)},
+                stop_loss={"stop_price": round_to_cent(stop_loss_price)},
+            )
+            leg_ids = [leg.id for leg in (getattr(order, "legs", None) or [])]
+            self.native_protection[symbol] = {"mode": mode, "order_ids": leg_ids}
+            self.logger.info(
+                f"[BRACKET] {symbol}: entry {order.id} with stop ${stop_loss_price:.2f} "
+                f"/ target ${take_profit_price:.2f} held by broker"
+            )
+            return order
+
+        order = self._submit_order(
+            symbol=symbol,
+            qty=shares,
+            side=side,
+            type="market",
+            time_in_force="day",
+        )
+
+        # Nothing protective is sent until the entry's fill is confirmed; the
+        # symbol counts as natively protected meanwhile so no plain stop goes
+        # out against the open entry
+        with self._pending_lock:
+            self.pending_protection[order.id] = {
+                "symbol": symbol,
+                "exit_side": exit_side,
+                "trail_percent": round(thresholds["trailing_distance_pct"] * 100, 2),
+                "stop_price": round_to_cent(stop_loss_price),
+                "deadline": time.monotonic()
+                + config.get("NATIVE_PROTECTION_FILL_TIMEOUT", 10),
+            }
+            self.native_protection[symbol] = {"mode": mode, "order_ids": []}
+        self.logger.info(
+            f"[TRAILING] {symbol}: entry {order.id} submitted - trailing stop "
+            f"follows its fill"
+        )
+        return order
+
+    def on_trade_update(self, event):
+        """TradeUpdateFeed subscriber - protect trailing-mode entries once final"""
+        if event.get("order_id") in self.pending_protection and (
+            event.get("status") in FINAL_STATUSES
+        ):
+            self._entry_final(
+                event["order_id"], event["status"], event.get("filled_qty") or 0
+            )
+
+    def check_pending_protection(self):
+        """Settle pending entries: poll their status, cancel them past the timeout
+
+        With the trade update stream up, fills arrive through on_trade_update
+        and this only enforces the timeout.
+        """
+        streaming = self.trade_updates_connected()
+        for order_id, plan in list(self.pending_protection.items()):
+            if not streaming:
+                status = self.get_order_status(order_id) or {}
+                if status.get("status") in FINAL_STATUSES:
+                    self._entry_final(
+                        order_id, status["status"], status.get("filled_qty") or 0
+                    )
+                    continue
+            if time.monotonic() >= plan["deadline"]:
+                # Its final (canceled) status, with any partial fill, settles it
+                self.logger.warning(
+                    f"[TRAILING] {plan['symbol']}: entry {order_id} not filled within "
+                    f"{config.get('NATIVE_PROTECTION_FILL_TIMEOUT', 10)}s - cancelling"
+                )
+                try:
+                    self._cancel_order(order_id)
+                except Exception as e:
+                    self.logger.error(
+                        f"[TRAILING] {plan['symbol']}: cancel of entry {order_id} "
+                        f"failed: {e}"
+                    )
+                plan["deadline"] = float("inf")  # one cancel attempt is enough
+
+    def _entry_final(self, order_id, status, filled_qty):
+        """Attach the exit for whatever a trailing-mode entry filled"""
+        with self._pending_lock:
+            plan = self.pending_protection.pop(order_id, None)
+        if plan is None:
+            return  # already settled by the other path
+        symbol = plan["symbol"]
+        filled_qty = float(filled_qty)
+
+        if not filled_qty:
+            self.native_protection.pop(symbol, None)
+            self.trailing_stop_manager.remove_position(symbol, f"Entry {status}")
+            self.logger.info(
+                f"[TRAILING] {symbol}: entry {order_id} {status} unfilled - "
+                f"nothing to protect"
+            )
+            return
+
+        try:
+            trail_order = self._submit_order(
+                symbol=symbol,
+                qty=filled_qty,
+                side=plan["exit_side"],
+                type="trailing_stop",
+                trail_percent=plan["trail_percent"],
+                time_in_force="day",
+            )
+            self.native_protection.setdefault(
+                symbol, {"mode": "trailing", "order_ids": []}
+            )["order_ids"].append(trail_order.id)
+            self.logger.info(
+                f"[TRAILING] {symbol}: native trailing stop {trail_order.id} "
+                f"at {plan['trail_percent']:.2f}% on {filled_qty:g} shares held by broker"
+            )
+            return
+        except Exception as e:
+            self.logger.warning(
+                f"[TRAILING] {symbol}: native trailing stop rejected ({e}) - "
+                f"falling back to managed stop"
+            )
+
+        # Bot-managed protection for the shares actually held
+        self.native_protection.pop(symbol, None)
+        try:
+            stop_order = self._submit_order(
+                symbol=symbol,
+                qty=filled_qty,
+                side=plan["exit_side"],
+                type="stop",
+                stop_price=plan["stop_price"],
+                time_in_force="day",
+            )
+            self.trailing_stop_manager.stop_orders[symbol] = stop_order.id
+            self.logger.info(
+                f"[SUCCESS] Stop loss order placed - Order ID: {stop_order.id} "
+                f"({filled_qty:g} shares)"
+            )
+        except Exception as e:
+            self.logger.error(f"[ERROR] {symbol}: Failed to place stop loss: {e}")
+
+    def _cancel_native_protection(self, symbol):
+        """Cancel broker-held protective orders before closing a position"""
+        # An entry still waiting for its fill gets no exit attached later
+        with self._pending_lock:
+            pending = [
+                order_id
+                for order_id, plan in self.pending_protection.items()
+                if plan["symbol"] == symbol
+            ]
+            for order_id in pending:
+                del self.pending_protection[order_id]
+        for order_id in pending:
+            try:
+                self._cancel_order(order_id)
+            except Exception as e:
+                self.logger.debug(f"[{symbol}] Pending entry {order_id}: {e}")
+
+        protection = self.native_protection.pop(symbol, None)
+        if not protection:
+            return 0
+
+        cancelled_count = 0
+        for order_id in protection["order_ids"]:
+            try:
+                if self._cancel_order(order_id):
+                    cancelled_count += 1
+            except Exception as e:
+                self.logger.debug(f"[{symbol}] Protective order {order_id}: {e}")
+
+        self.logger.info(
+            f"[{symbol}] Cancelled {cancelled_count} broker-held protective orders"
+        )
+        return cancelled_count
+
     def place_buy_order(self, symbol, signal_data):
         """Place a buy order with cooldown and precision checks"""
         try:
@@ -206,14 +627,24 @@ class OrderManager:
                 f"Confidence: {signal_data.get('confidence', 0)*100:.1f}%"
             )
 
-            # Place market buy order
-            order = self.api.submit_order(
-                symbol=symbol,
-                qty=shares,
-                side="buy",
-                type="market",
-                time_in_force="day",
-            )
+            # Place market buy order (with broker-held protection if configured)
+            if self.uses_native_protection():
+                order = self._submit_protected_entry(
+                    symbol,
+                    shares,
+                    "buy",
+                    stop_loss_price,
+                    take_profit_price,
+                    thresholds,
+                )
+            else:
+                order = self._submit_order(
+                    symbol=symbol,
+                    qty=shares,
+                    side="buy",
+                    type="market",
+                    time_in_force="day",
+                )
 
             self.logger.info(f"[SUCCESS] Buy order placed - Order ID: {order.id}")
 
@@ -231,34 +662,36 @@ class OrderManager:
             )
 
             # Place stop loss order (will be managed by trailing stop system)
-            try:
-                stop_order = self.api.submit_order(
-                    symbol=symbol,
-                    qty=shares,
-                    side="sell",
-                    type="stop",
-                    stop_price=stop_loss_price,
-                    time_in_force="day",
-                )
-                self.logger.info(
-                    f"[SUCCESS] Stop loss order placed - Order ID: {stop_order.id}"
-                )
-
-                # Store stop order ID for potential updates
-                if hasattr(self.trailing_stop_manager, "stop_orders"):
-                    self.trailing_stop_manager.stop_orders[symbol] = stop_order.id
-
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "wash trade" in error_msg or "complex orders" in error_msg:
-                    self.logger.warning(
-                        f"[WASH_TRADE] {symbol}: Stop loss blocked by wash trade rules"
+            # Skipped when the broker already holds the protective orders
+            if not self.is_natively_protected(symbol):
+                try:
+                    stop_order = self._submit_order(
+                        symbol=symbol,
+                        qty=shares,
+                        side="sell",
+                        type="stop",
+                        stop_price=stop_loss_price,
+                        time_in_force="day",
                     )
                     self.logger.info(
-                        f"[WASH_TRADE] {symbol}: Trailing stop manager will handle protection"
+                        f"[SUCCESS] Stop loss order placed - Order ID: {stop_order.id}"
                     )
-                else:
-                    self.logger.error(f"[ERROR] Failed to place stop loss: {e}")
+
+                    # Store stop order ID for potential updates
+                    if hasattr(self.trailing_stop_manager, "stop_orders"):
+                        self.trailing_stop_manager.stop_orders[symbol] = stop_order.id
+
+                except Exception as e:
+                    error_msg = str(e).lower()
+                    if "wash trade" in error_msg or "complex orders" in error_msg:
+                        self.logger.warning(
+                            f"[WASH_TRADE] {symbol}: Stop loss blocked by wash trade rules"
+                        )
+                        self.logger.info(
+                            f"[WASH_TRADE] {symbol}: Trailing stop manager will handle protection"
+                        )
+                    else:
+                        self.logger.error(f"[ERROR] Failed to place stop loss: {e}")
 
             # Log position details with stock-specific trailing stop info
             self.logger.info("=" * 50)
@@ -342,11 +775,14 @@ class OrderManager:
                 self.logger.error(f"[ERROR] Could not get current price for {symbol}")
                 return None
 
+            # Release shares held by broker-native stop/target orders
+            self._cancel_native_protection(symbol)
+
             self.logger.info(f"[ORDER] Placing SELL order for {symbol}")
             self.logger.info(f"[ORDER] Shares: {qty}, Price: ${current_price:.2f}")
 
             # Place market sell order
-            order = self.api.submit_order(
+            order = self._submit_order(
                 symbol=symbol, qty=qty, side="sell", type="market", time_in_force="day"
             )
 
@@ -425,64 +861,66 @@ class OrderManager:
             update_info = self.trailing_stop_manager.update_position_price(
                 symbol, current_price
             )
+            if update_info:
+                self._apply_stop_update(update_info)
 
-            if update_info and update_info["action"] == "update_stop":
-                # Cancel existing stop order and place new one
-                if symbol in self.trailing_stop_manager.stop_orders:
-                    try:
-                        old_order_id = self.trailing_stop_manager.stop_orders[symbol]
-                        self.api.cancel_order(old_order_id)
-                        self.logger.info(
-                            f"[{symbol}] Cancelled old stop order: {old_order_id}"
-                        )
-                    except Exception as e:
-                        self.logger.warning(
-                            f"[{symbol}] Failed to cancel old stop order: {e}"
-                        )
+        except Exception as e:
+            self.logger.error(f"[{symbol}] Failed to update trailing stops: {e}")
 
-                # Place new trailing stop order
-                try:
-                    position_status = self.trailing_stop_manager.get_position_status(
-                        symbol
-                    )
-                    if position_status:
-                        # Ensure stop price is properly rounded to prevent sub-penny errors
-                        stop_price = round_to_cent(update_info["new_stop_price"])
-
-                        # Validate the price precision
-                        if not validate_price_precision(
-                            stop_price, f"{symbol} updated_stop"
-                        ):
-                            self.logger.warning(
-                                f"[{symbol}] Updated stop price precision issue: {stop_price}"
-                            )
-                            stop_price = round_to_cent(stop_price)
-
-                        new_stop_order = self.api.submit_order(
-                            symbol=symbol,
-                            qty=abs(
-                                int(position_status["quantity"])
-                            ),  # Get actual quantity from position
-                            side="sell",
-                            type="stop",
-                            stop_price=stop_price,
-                            time_in_force="day",
-                        )
+    def _apply_stop_update(self, update_info: dict):
+        """Move the resting stop order to a new trailing stop level"""
+        symbol = update_info["symbol"]
 
-                        self.trailing_stop_manager.stop_orders[symbol] = (
-                            new_stop_order.id
-                        )
-                        self.logger.info(
-                            f"[{symbol}] New trailing stop order placed: {new_stop_order.id} at ${stop_price:.2f}"
-                        )
+        # Broker trails/holds the stop itself - monitoring only, no churn
+        if self.is_natively_protected(symbol):
+            return
 
-                except Exception as e:
-                    self.logger.error(
-                        f"[{symbol}] Failed to place new trailing stop order: {e}"
+        if update_info["action"] != "update_stop":
+            return
+
+        # Cancel existing stop order and place new one
+        if symbol in self.trailing_stop_manager.stop_orders:
+            try:
+                old_order_id = self.trailing_stop_manager.stop_orders[symbol]
+                self._cancel_order(old_order_id)
+                self.logger.info(f"[{symbol}] Cancelled old stop order: {old_order_id}")
+            except Exception as e:
+                self.logger.warning(f"[{symbol}] Failed to cancel old stop order: {e}")
+
+        # Place new trailing stop order
+        try:
+            position_status = self.trailing_stop_manager.get_position_status(symbol)
+            if position_status:
+                # Ensure stop price is properly rounded to prevent sub-penny errors
+                stop_price = round_to_cent(update_info["new_stop_price"])
+
+                # Validate the price precision
+                if not validate_price_precision(stop_price, f"{symbol} updated_stop"):
+                    self.logger.warning(
+                        f"[{symbol}] Updated stop price precision issue: {stop_price}"
                     )
+                    stop_price = round_to_cent(stop_price)
+
+                new_stop_order = self._submit_order(
+                    symbol=symbol,
+                    qty=abs(
+                        int(position_status["quantity"])
+                    ),  # Get actual quantity from position
+                    side="buy" if position_status["side"] == "short" else "sell",
+                    type="stop",
+                    stop_price=stop_price,
+                    time_in_force="day",
+                )
+
+                self.trailing_stop_manager.stop_orders[symbol] = new_stop_order.id
+                self.logger.info(
+                    f"[{symbol}] New trailing stop order placed: {new_stop_order.id} at ${stop_price:.2f}"
+                )
 
         except Exception as e:
-            self.logger.error(f"[{symbol}] Failed to update trailing stops: {e}")
+            self.logger.error(
+                f"[{symbol}] Failed to place new trailing stop order: {e}"
+            )
 
     def get_current_positions_qty(self) -> dict:
         """Get current position quantities for all symbols"""
@@ -497,47 +935,74 @@ class OrderManager:
             return {}
 
     def check_trailing_stop_triggers(self):
-        """Check if any trailing stops have been triggered"""
+        """Check if any trailing stops have been triggered
+
+        All tracked positions are updated in one vectorized pass over the
+        trailing stop book; only moved stops and triggered positions do any
+        order work afterwards.
+        """
         try:
             if not config["TRAILING_STOP_ENABLED"]:
                 return []
 
+            self.maybe_reconcile_orders()
+
             # First, sync trailing stop manager with actual account positions
             self.trailing_stop_manager.sync_with_account_positions(self.data_manager)
 
-            triggered_positions = []
+            # Forget broker-held protection for positions that are gone
+            for symbol in list(self.native_protection):
+                if symbol not in self.trailing_stop_manager.active_positions:
+                    del self.native_protection[symbol]
 
+            # Get current prices
+            prices = {}
             for symbol in list(self.trailing_stop_manager.active_positions.keys()):
-                # Get current price
                 try:
                     current_price = self.data_manager.get_current_price(symbol)
                     if current_price:
-                        # Update position and check for trigger
-                        self.update_trailing_stops(symbol, current_price)
-
-                        if self.trailing_stop_manager.check_stop_triggered(
-                            symbol, current_price
-                        ):
-                            triggered_positions.append(symbol)
-
-                            # Execute trailing stop sell - need to cancel existing orders first
-                            position_status = (
-                                self.trailing_stop_manager.get_position_status(symbol)
-                            )
-                            if position_status:
-                                self.logger.warning(
-                                    f"[{symbol}] 🛑 EXECUTING TRAILING STOP SELL"
-                                )
-
-                                # Cancel any existing stop loss orders for this symbol
-                                self._cancel_existing_stop_orders(symbol)
-
-                                # Now place the market sell order
-                                sell_result = self.place_sell_order(symbol)
-                                if sell_result:
-                                    self.trailing_stop_manager.remove_position(
-                                        symbol, "Trailing stop triggered"
-                                    )
+                        prices[symbol] = current_price
+                except Exception as e:
+                    self.logger.error(
+                        f"[{symbol}] Failed to get price for trailing stop: {e}"
+                    )
+
+            # Update every position and check for triggers in one pass
+            result = self.trailing_stop_manager.update_all_prices(prices)
+
+            for update_info in result["updates"]:
+                self._apply_stop_update(update_info)
+
+            triggered_positions = []
+
+            for symbol in result["triggered"]:
+                try:
+                    if self.is_natively_protected(symbol):
+                        # Broker-held stop executes on its own; the
+                        # position drops out on the next account sync
+                        self.logger.info(
+                            f"[{symbol}] Stop level reached - broker-held stop will execute"
+                        )
+                        continue
+
+                    triggered_positions.append(symbol)
+
+                    # Execute trailing stop sell - need to cancel existing orders first
+                    self.logger.warning(f"[{symbol}] 🛑 EXECUTING TRAILING STOP SELL")
+
+                    # Cancel any existing stop loss orders for this symbol
+                    self._cancel_existing_stop_orders(symbol)
+
+                    # Now place the market exit order (cover for shorts)
+                    position = self.trailing_stop_manager.active_positions[symbol]
+                    if position.side == "short":
+                        sell_result = self.place_cover_order(symbol)
+                    else:
+                        sell_result = self.place_sell_order(symbol)
+                    if sell_result:
+                        self.trailing_stop_manager.remove_position(
+                            symbol, "Trailing stop triggered"
+                        )
 
                 except Exception as e:
                     self.logger.error(
@@ -579,16 +1044,27 @@ class OrderManager:
             return "Error generating trailing stop summary"
 
     def cancel_all_orders(self, symbol=None):
-        """Cancel all open orders"""
+        """Cancel all open orders (or only a symbol's, straight from the index)"""
         try:
-            orders = self.api.list_orders(status="open")
-
-            cancelled_count = 0
-            for order in orders:
-                if symbol is None or order.symbol == symbol:
-                    self.api.cancel_order(order.id)
+            if symbol is None:
+                # One bulk cancel call for the whole account
+                cancelled = self.api.cancel_all_orders()
+                cancelled_count = len(cancelled or [])
+                self.open_orders.clear()
+            else:
+                cancelled_count = 0
+                for order in self.open_orders.orders_for(symbol):
+                    try:
+                        if not self._cancel_order(order["id"]):
+                            continue  # stale index entry, already closed
+                    except Exception as e:
+                        self.logger.error(
+                            f"[ERROR] Failed to cancel order {order['id']} "
+                            f"for {symbol}: {e}"
+                        )
+                        continue
                     cancelled_count += 1
-                    self.logger.info(f"[CANCELLED] Order {order.id} for {order.symbol}")
+                    self.logger.info(f"[CANCELLED] Order {order['id']} for {symbol}")
 
             self.logger.info(f"[INFO] Cancelled {cancelled_count} orders")
             return cancelled_count
@@ -597,20 +1073,32 @@ class OrderManager:
             self.logger.error(f"[ERROR] Failed to cancel orders: {e}")
             return 0
 
+    def cancel_pending_orders_for_symbol(self, symbol):
+        """Cancel every open order for a symbol without listing broker orders"""
+        cancelled_count = 0
+        for order in self.open_orders.orders_for(symbol):
+            try:
+                if self._cancel_order(order["id"]):
+                    cancelled_count += 1
+            except Exception as e:
+                # The next reconcile corrects the index
+                self.logger.debug(f"[{symbol}] Cancel {order['id']} failed: {e}")
+        return cancelled_count
+
     def get_open_orders(self):
         """Get all open orders"""
         try:
-            orders = self.api.list_orders(status="open")
+            self.maybe_reconcile_orders()
             return [
                 {
-                    "id": order.id,
-                    "symbol": order.symbol,
-                    "qty": int(order.qty),
-                    "side": order.side,
-                    "type": order.order_type,
-                    "status": order.status,
+                    "id": order["id"],
+                    "symbol": order["symbol"],
+                    "qty": int(float(order["qty"] or 0)),
+                    "side": order["side"],
+                    "type": order["type"],
+                    "status": order["status"],
                 }
-                for order in orders
+                for order in self.open_orders.all_orders()
             ]
         except Exception as e:
             self.logger.error(f"[ERROR] Failed to get open orders: {e}")
@@ -714,14 +1202,25 @@ class OrderManager:
                 f"Confidence: {signal_confidence:.1f}%"
             )
 
-            # Place market short order (sell to open)
-            order = self.api.submit_order(
-                symbol=symbol,
-                qty=shares,
-                side="sell",  # Sell to open short position
-                type="market",
-                time_in_force="day",
-            )
+            # Place market short order (sell to open), with broker-held
+            # protection if configured
+            if self.uses_native_protection():
+                order = self._submit_protected_entry(
+                    symbol,
+                    shares,
+                    "sell",
+                    stop_loss_price,
+                    take_profit_price,
+                    thresholds,
+                )
+            else:
+                order = self._submit_order(
+                    symbol=symbol,
+                    qty=shares,
+                    side="sell",  # Sell to open short position
+                    type="market",
+                    time_in_force="day",
+                )
 
             self.logger.info(f"[SUCCESS] Short order placed - Order ID: {order.id}")
 
@@ -739,23 +1238,24 @@ class OrderManager:
             )
 
             # Place stop loss order (buy to cover when price goes up)
-            try:
-                stop_order = self.api.submit_order(
-                    symbol=symbol,
-                    qty=shares,
-                    side="buy",  # Buy to cover short position
-                    type="stop",
-                    stop_price=stop_loss_price,
-                    time_in_force="day",
-                )
-                self.logger.info(
-                    f"[SUCCESS] Short stop loss order placed - Order ID: {stop_order.id}"
-                )
+            if not self.is_natively_protected(symbol):
+                try:
+                    stop_order = self._submit_order(
+                        symbol=symbol,
+                        qty=shares,
+                        side="buy",  # Buy to cover short position
+                        type="stop",
+                        stop_price=stop_loss_price,
+                        time_in_force="day",
+                    )
+                    self.logger.info(
+                        f"[SUCCESS] Short stop loss order placed - Order ID: {stop_order.id}"
+                    )
 
-            except Exception as stop_error:
-                self.logger.error(
-                    f"[ERROR] Failed to place stop loss for short {symbol}: {stop_error}"
-                )
+                except Exception as stop_error:
+                    self.logger.error(
+                        f"[ERROR] Failed to place stop loss for short {symbol}: {stop_error}"
+                    )
 
             return {
                 "order_id": order.id,
@@ -801,11 +1301,14 @@ class OrderManager:
                 self.logger.error(f"[ERROR] Could not get current price for {symbol}")
                 return None
 
+            # Release shares held by broker-native stop/target orders
+            self._cancel_native_protection(symbol)
+
             self.logger.info(f"[ORDER] Placing BUY-TO-COVER order for {symbol}")
             self.logger.info(f"[ORDER] Shares: {qty}, Price: ${current_price:.2f}")
 
             # Place market buy order to cover short
-            order = self.api.submit_order(
+            order = self._submit_order(
                 symbol=symbol,
                 qty=qty,
                 side="buy",  # Buy to cover short position
@@ -830,17 +1333,26 @@ class OrderManager:
     def _cancel_existing_stop_orders(self, symbol: str):
         """Cancel any existing stop loss orders for a symbol to free up shares"""
         try:
-            # Get all active orders for this symbol
-            orders = self.api.get_orders(status="new", symbols=[symbol])
-
             cancelled_count = 0
-            for order in orders:
-                if order.order_type.name == "STOP" and order.symbol == symbol:
-                    self.logger.info(
-                        f"[CANCEL] Cancelling existing stop order {order.id} for {symbol}"
+            for order in self.open_orders.orders_for(symbol, STOP_ORDER_TYPES):
+                self.logger.info(
+                    f"[CANCEL] Cancelling existing stop order {order['id']} for {symbol}"
+                )
+                try:
+                    if not self._cancel_order(order["id"]):
+                        self.logger.info(
+                            f"[INFO] Stop order {order['id']} for {symbol} was "
+                            f"already closed"
+                        )
+                        continue
+                except Exception as e:
+                    # Keep going: the stops after this one still hold shares
+                    self.logger.error(
+                        f"[ERROR] Failed to cancel stop order {order['id']} "
+                        f"for {symbol}: {e}"
                     )
-                    self.api.cancel_order_by_id(order.id)
-                    cancelled_count += 1
+                    continue
+                cancelled_count += 1
 
             if cancelled_count > 0:
                 self.logger.info(
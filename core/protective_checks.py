@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Protective Checks
+Batched stop / target / max-hold evaluation for every open position at once.
+One price snapshot in, the list of positions that must exit out.
+"""
+
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+from config import config
+from utils.logger import setup_logger
+
+# Trigger reasons, in priority order when several fire on the same tick
+EMERGENCY_STOP = "emergency_stop"
+TRAILING_STOP = "trailing_stop"
+STOP_LOSS = "stop_loss"
+HARD_STOP = "hard_stop"
+MAX_HOLD = "max_hold"
+PROFIT_TARGET = "profit_target"
+
+# Fields the engine sets on every position it tracks. A position missing one
+# is left out of the pass and reported, never checked with made-up values.
+REQUIRED_FIELDS = (
+    "entry_price",
+    "stop_loss",
+    "original_stop_loss",
+    "profit_target",
+    "entry_ts",
+)
+
+
+class ProtectiveTrigger(NamedTuple):
+    symbol: str
+    reason: str
+    price: float
+    loss_pct: float
+    stop: float
+
+
+class ProtectiveCheck(NamedTuple):
+    triggers: List[ProtectiveTrigger]
+    # Distance from price to the nearest stop/target in ATR units (NaN: no price)
+    distance_atr: Dict[str, float]
+
+
+def _atr_unit(position: Dict) -> float:
+    """Recent volatility (ATR in price) for a position, from its entry context"""
+    entry = position["entry_price"]
+    atr_pct = position.get("atr_pct_entry")
+    if atr_pct:
+        return atr_pct / 100.0 * entry
+    # Without ATR, the planned stop distance is the next best volatility unit
+    stop_distance = abs(entry - position["original_stop_loss"])
+    return stop_distance or entry * config.get("STOP_LOSS_PCT", 0.015)
+
+
+class ProtectiveChecker:
+    """Evaluates engine active_positions against a dict of latest prices"""
+
+    def __init__(
+        self, hard_stop_pct=None, emergency_stop_pct=None, max_hold_seconds=None
+    ):
+        self.logger = setup_logger("protective_checks")
+        self.hard_stop_pct = hard_stop_pct or config.get("RAPID_HARD_STOP_PCT", 0.25)
+        self.emergency_stop_pct = emergency_stop_pct or config.get(
+            "HOLD_EMERGENCY_STOP_PCT", 2.0
+        )
+        self.max_hold_seconds = max_hold_seconds or config.get("max_hold_time", 7200)
+        self._malformed = set()  # symbols already reported as malformed
+
+    @staticmethod
+    def build_table(positions: Dict[str, Dict]) -> Dict[str, np.ndarray]:
+        """Column arrays for positions that carry a signal
+
+        "malformed" lists (symbol, missing fields) for positions left out.
+        """
+        symbols, rows, malformed = [], [], []
+        for symbol, position in positions.items():
+            if position.get("signal") is None:
+                continue
+            missing = [f for f in REQUIRED_FIELDS if position.get(f) is None]
+            if missing:
+                malformed.append((symbol, missing))
+                continue
+            symbols.append(symbol)
+            rows.append(position)
+        return {
+            "symbols": symbols,
+            "malformed": malformed,
+            "side": np.array(
+                [1 if p["signal"].signal_type == "BUY" else -1 for p in rows],
+                dtype=np.int8,
+            ),
+            "entry": np.array([p["entry_price"] for p in rows], dtype=float),
+            "stop": np.array([p["stop_loss"] for p in rows], dtype=float),
+            "original_stop": np.array(
+                [p["original_stop_loss"] for p in rows], dtype=float
+            ),
+            "target": np.array([p["profit_target"] for p in rows], dtype=float),
+            "entry_ts": np.array([p["entry_ts"] for p in rows], dtype=float),
+            # Adopted broker positions have no minimum hold
+            "min_hold": np.array(
+                [p.get("minimum_hold_time", 30) or 0 for p in rows], dtype=float
+            ),
+            "atr": np.array([_atr_unit(p) for p in rows], dtype=float),
+        }
+
+    def _report_malformed(self, malformed):
+        symbols = {symbol for symbol, _ in malformed}
+        for symbol, missing in malformed:
+            if symbol not in self._malformed:
+                self.logger.error(
+                    f"❌ {symbol}: position is missing {', '.join(missing)} - "
+                    f"NOT covered by protective checks"
+                )
+        self._malformed = symbols
+
+    def evaluate(
+        self,
+        positions: Dict[str, Dict],
+        prices: Dict[str, float],
+        now: float,
+    ) -> List[ProtectiveTrigger]:
+        """Positions whose exit conditions are met at these prices"""
+        return self.check(positions, prices, now).triggers
+
+    def check(
+        self,
+        positions: Dict[str, Dict],
+        prices: Dict[str, float],
+        now: float,
+    ) -> ProtectiveCheck:
+        """Triggers plus each position's distance to its nearest trigger
+
+        now and each position's entry_ts are epoch seconds from the engine's
+        clock. Symbols without a (positive) price are skipped for this tick.
+        """
+        table = self.build_table(positions)
+        self._report_malformed(table["malformed"])
+        symbols = table["symbols"]
+        if not symbols:
+            return ProtectiveCheck([], {})
+
+        price = np.array([prices.get(s) or np.nan for s in symbols], dtype=float)
+        price[price <= 0] = np.nan
+        valid = ~np.isnan(price)
+
+        side = table["side"]
+        entry = table["entry"]
+        stop = table["stop"]
+        with np.errstate(invalid="ignore"):
+            # Loss in percent of entry, 0 while the position is in profit
+            loss_pct = np.maximum(side * (entry - price) / entry * 100.0, 0.0)
+            stop_hit = side * (price - stop) <= 0
+            target_hit = side * (price - table["target"]) >= 0
+
+        held = now - table["entry_ts"]
+        in_hold = held < table["min_hold"]
+        trailed = stop != table["original_stop"]
+
+        emergency = valid & in_hold & (loss_pct > self.emergency_stop_pct)
+        after_hold = valid & ~in_hold
+        conditions = [
+            emergency,
+            after_hold & stop_hit & trailed,
+            after_hold & stop_hit,
+            after_hold & (loss_pct > self.hard_stop_pct),
+            after_hold & (held > self.max_hold_seconds),
+            after_hold & target_hit,
+        ]
+        reasons = np.select(
+            conditions,
+            [
+                EMERGENCY_STOP,
+                TRAILING_STOP,
+                STOP_LOSS,
+                HARD_STOP,
+                MAX_HOLD,
+                PROFIT_TARGET,
+            ],
+            default="",
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            nearest = np.minimum(np.abs(price - stop), np.abs(table["target"] - price))
+            distance_atr = np.where(stop_hit | target_hit, 0.0, nearest / table["atr"])
+
+        triggers = [
+            ProtectiveTrigger(
+                symbols[i],
+                str(reasons[i]),
+                float(price[i]),
+                float(loss_pct[i]),
+                float(stop[i]),
+            )
+            for i in np.flatnonzero(reasons != "")
+        ]
+        return ProtectiveCheck(
+            triggers, {s: float(d) for s, d in zip(symbols, distance_atr)}
+        )
@@ -9,7 +9,6 @@ from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 
 
 class RealTimeConfidenceCalculator:
@@ -34,6 +33,9 @@ class RealTimeConfidenceCalculator:
     ):
         """Get recent market data for calculations"""
         try:
+            # Imported on first use: yfinance is heavy and only needed here
+            import yfinance as yf
+
             ticker = yf.Ticker(symbol)
             data = ticker.history(period=period, interval=interval)
 
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Risk Ledger
+Signed per-symbol positions with exposure and open-risk aggregates that are
+updated incrementally on every fill, plus an occasional full reconcile
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+
+class RiskLedger:
+    """Positions and running exposure totals, O(1) per fill
+
+    Notional is carried at cost (average entry price x quantity). Open risk is
+    what each position loses if it exits at its stop.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._positions: Dict[str, Dict] = {}
+        # Stops set before the position's first fill reached the ledger
+        self._pending_stops: Dict[str, float] = {}
+        # Monotonic time of each symbol's last applied fill
+        self._last_fill: Dict[str, float] = {}
+
+        self.long_exposure = 0.0
+        self.short_exposure = 0.0
+        self.open_risk = 0.0
+
+        self.reconcile_count = 0
+        self.reconcile_drift = 0  # symbols corrected by the last reconcile
+        self.last_reconciled: Optional[float] = None
+        self.last_reconcile_seconds = 0.0
+        self.total_reconcile_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    @property
+    def gross_exposure(self) -> float:
+        return self.long_exposure + self.short_exposure
+
+    @property
+    def net_exposure(self) -> float:
+        return self.long_exposure - self.short_exposure
+
+    def position(self, symbol: str) -> Optional[Dict]:
+        with self._lock:
+            record = self._positions.get(symbol)
+            return dict(record) if record is not None else None
+
+    def notional(self, symbol: str) -> float:
+        with self._lock:
+            record = self._positions.get(symbol)
+            return record["notional"] if record is not None else 0.0
+
+    @staticmethod
+    def _risk_to_stop(qty: float, avg_price: float, stop: Optional[float]) -> float:
+        if not stop:
+            return 0.0
+        # Long loses (avg - stop) per share, short loses (stop - avg)
+        per_share = (avg_price - stop) if qty > 0 else (stop - avg_price)
+        return abs(qty) * max(per_share, 0.0)
+
+    def _unbook(self, record: Dict):
+        if record["qty"] > 0:
+            self.long_exposure -= record["notional"]
+        else:
+            self.short_exposure -= record["notional"]
+        self.open_risk -= record["risk"]
+
+    def _book(self, record: Dict):
+        record["notional"] = abs(record["qty"]) * record["avg_price"]
+        record["risk"] = self._risk_to_stop(
+            record["qty"], record["avg_price"], record["stop"]
+        )
+        if record["qty"] > 0:
+            self.long_exposure += record["notional"]
+        else:
+            self.short_exposure += record["notional"]
+        self.open_risk += record["risk"]
+
+    def apply_fill(
+        self,
+        symbol: str,
+        side: str,
+        qty: float,
+        price: float,
+        position_qty: Optional[float] = None,
+    ):
+        """Apply one (partial) fill: side is the order side, buy or sell
+
+        position_qty is the signed position after the fill, as trade update
+        events report it; a fill the ledger already holds that size for (a
+        reconcile listed it before the event arrived) is not applied twice.
+        """
+        delta = abs(float(qty)) if side.lower() in ("buy", "long") else -abs(float(qty))
+        price = float(price)
+
+        with self._lock:
+            self._last_fill[symbol] = time.monotonic()
+            record = self._positions.get(symbol)
+            held = record["qty"] if record is not None else 0.0
+            if position_qty is not None and abs(held - float(position_qty)) < 1e-9:
+                return
+            if record is None:
+                stop = self._pending_stops.pop(symbol, None)
+                record = {"qty": 0.0, "avg_price": price, "stop": stop}
+            else:
+                self._unbook(record)
+
+            old_qty = record["qty"]
+            new_qty = old_qty + delta
+            if old_qty == 0 or ((old_qty > 0) != (new_qty > 0) and new_qty != 0):
+                # Opened, or flipped through flat: the remainder is priced here
+                record["avg_price"] = price
+            elif abs(new_qty) > abs(old_qty):
+                # Added to the position: weighted average entry
+                record["avg_price"] = (
+                    old_qty * record["avg_price"] + delta * price
+                ) / new_qty
+
+            record["qty"] = new_qty
+            if abs(new_qty) < 1e-9:
+                del self._positions[symbol]
+                return
+            self._positions[symbol] = record
+            self._book(record)
+
+    def set_stop(self, symbol: str, stop: Optional[float]):
+        """Update the stop a position's open risk is measured to
+
+        For a symbol the ledger does not hold yet (its fill event is still on
+        the way) the stop is kept and applied when the position appears.
+        """
+        with self._lock:
+            record = self._positions.get(symbol)
+            if record is None:
+                if stop:
+                    self._pending_stops[symbol] = stop
+                else:
+                    self._pending_stops.pop(symbol, None)
+                return
+            self._unbook(record)
+            record["stop"] = stop
+            self._book(record)
+
+    def reconcile(
+        self, positions: Iterable[Dict], started: Optional[float] = None
+    ) -> int:
+        """Replace the ledger with broker positions; returns the symbols corrected
+
+        positions are DataManager.get_positions() style dicts (symbol, signed
+        qty, avg_entry_price). Stops already known for a symbol, or waiting for
+        its first fill, are kept.
+        Pass started (time.monotonic() before the broker call) to include the
+        round trip in the recorded reconcile cost; symbols with a fill applied
+        since then keep their ledger entry, which is newer than the listing.
+        """
+        started = time.monotonic() if started is None else started
+        with self._lock:
+            previous = self._positions
+            self._positions = {}
+            self.long_exposure = self.short_exposure = self.open_risk = 0.0
+
+            recent = {s for s, at in self._last_fill.items() if at >= started}
+            for symbol in recent & set(previous):
+                self._positions[symbol] = previous[symbol]
+                self._book(previous[symbol])
+
+            drift = 0
+            for position in positions:
+                qty = float(position["qty"])
+                symbol = position["symbol"]
+                if qty == 0 or symbol in recent:
+                    continue
+                if position.get("side") == "short":
+                    qty = -abs(qty)
+                known = previous.get(symbol)
+                record = {
+                    "qty": qty,
+                    "avg_price": float(position["avg_entry_price"]),
+                    "stop": (
+                        known["stop"]
+                        if known
+                        else self._pending_stops.pop(symbol, None)
+                    ),
+                }
+                if known is None or abs(known["qty"] - qty) > 1e-9:
+                    drift += 1
+                self._positions[symbol] = record
+                self._book(record)
+            drift += len(set(previous) - set(self._positions))
+            self._last_fill = {s: self._last_fill[s] for s in recent}
+
+            self.reconcile_drift = drift
+            self.reconcile_count += 1
+            self.last_reconciled = time.monotonic()
+            self.last_reconcile_seconds = self.last_reconciled - started
+            self.total_reconcile_seconds += self.last_reconcile_seconds
+        return drift
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        return (
+            self.last_reconciled is None
+            or time.monotonic() - self.last_reconciled >= max_age_seconds
+        )
+
+    def summary(self) -> Dict:
+        with self._lock:
+            return {
+                "positions": len(self._positions),
+                "long_exposure": self.long_exposure,
+                "short_exposure": self.short_exposure,
+                "gross_exposure": self.gross_exposure,
+                "net_exposure": self.net_exposure,
+                "open_risk": self.open_risk,
+                "reconcile_count": self.reconcile_count,
+                "reconcile_drift": self.reconcile_drift,
+                "last_reconcile_seconds": self.last_reconcile_seconds,
+                "total_reconcile_seconds": self.total_reconcile_seconds,
+            }
@@ -5,6 +5,7 @@ Handles position sizing, risk limits, and exposure management for intraday tradi
 """
 
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
@@ -13,8 +14,12 @@ from typing import Dict, Optional
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config import config
+from core.risk_ledger import RiskLedger
 from utils.logger import setup_logger
 
+# Trade update events that change a position
+FILL_EVENTS = ("fill", "partial_fill")
+
 
 class RiskManager:
     """Manages risk parameters and position limits for intraday trading"""
@@ -24,43 +29,67 @@ class RiskManager:
 
         # Risk tracking
         self.account_equity = 100000.0  # Default, will be updated from broker
-        self.open_positions_count = 0
-        self.total_long_exposure = 0.0
-        self.total_short_exposure = 0.0
         self.daily_pnl = 0.0
         self.positions_tracker = {}  # symbol -> position info
 
+        # Exposure/open risk, updated per fill and reconciled occasionally
+        self.ledger = RiskLedger()
+        self.trade_updates = None
+        self.reconcile_interval = config.get("RISK_RECONCILE_SECONDS", 300)
+
         self.logger.info("🛡️ Risk Manager initialized")
         self.logger.info(f"📊 Max positions: {config.get('MAX_OPEN_POSITIONS', 5)}")
         self.logger.info(
             f"💰 Max position size: ${config.get('MAX_POSITION_SIZE', 5000)}"
         )
 
+    @property
+    def open_positions_count(self) -> int:
+        return len(self.ledger)
+
+    @property
+    def total_long_exposure(self) -> float:
+        return self.ledger.long_exposure
+
+    @property
+    def total_short_exposure(self) -> float:
+        return self.ledger.short_exposure
+
+    def attach_trade_updates(self, feed):
+        """Feed the ledger from trade update fills"""
+        self.trade_updates = feed
+        feed.subscribe(self.on_trade_update)
+
+    def _fills_streaming(self) -> bool:
+        return self.trade_updates is not None and self.trade_updates.is_connected
+
+    def on_trade_update(self, event: Dict):
+        """TradeUpdateFeed subscriber - apply each fill to the ledger"""
+        if event.get("event") not in FILL_EVENTS or not event.get("fill_qty"):
+            return
+        self.ledger.apply_fill(
+            event["symbol"],
+            event["side"],
+            event["fill_qty"],
+            event["price"],
+            position_qty=event.get("position_qty"),
+        )
+
     def sync_position_count_with_broker(self, order_manager):
-        """Sync position counts with broker data"""
+        """Full reconcile of the ledger and account equity with the broker"""
         try:
-            # Get current positions from broker
-            positions = order_manager.get_current_positions_qty()
-            self.open_positions_count = len(positions)
-
-            # Calculate total exposure
-            self.total_long_exposure = 0.0
-            self.total_short_exposure = 0.0
-
-            for symbol, qty in positions.items():
-                if qty > 0:
-                    # Get current price for exposure calculation
-                    try:
-                        current_price = order_manager.data_manager.get_current_price(
-                            symbol
-                        )
-                        if current_price:
-                            exposure = qty * current_price
-                            self.total_long_exposure += exposure
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Could not calculate exposure for {symbol}: {e}"
-                        )
+            started = time.monotonic()
+            # list_positions directly: a failed call must not look like "flat"
+            positions = [
+                {
+                    "symbol": pos.symbol,
+                    "qty": float(pos.qty),
+                    "side": pos.side,
+                    "avg_entry_price": float(pos.avg_entry_price),
+                }
+                for pos in order_manager.data_manager.api.list_positions()
+            ]
+            drift = self.ledger.reconcile(positions, started=started)
 
             # Update account equity
             try:
@@ -72,12 +101,19 @@ class RiskManager:
             self.logger.info(
                 f"📊 Synced with broker - Positions: {self.open_positions_count}, "
                 f"Long exposure: ${self.total_long_exposure:.2f}, "
-                f"Account equity: ${self.account_equity:.2f}"
+                f"Short exposure: ${self.total_short_exposure:.2f}, "
+                f"Account equity: ${self.account_equity:.2f} "
+                f"({drift} corrected, {self.ledger.last_reconcile_seconds:.3f}s)"
             )
 
         except Exception as e:
             self.logger.error(f"Failed to sync with broker: {e}")
 
+    def maybe_reconcile(self, order_manager):
+        """Reconcile with the broker when the last full reconcile is stale"""
+        if self.ledger.is_stale(self.reconcile_interval):
+            self.sync_position_count_with_broker(order_manager)
+
     def can_open_position(
         self, symbol: str, entry_price: float, signal_type: str
     ) -> bool:
@@ -92,7 +128,7 @@ class RiskManager:
                 return False
 
             # Check if we already have a position in this symbol
-            if symbol in self.positions_tracker:
+            if symbol in self.positions_tracker or symbol in self.ledger:
                 self.logger.warning(f"[{symbol}] Already have position in this symbol")
                 return False
 
@@ -108,7 +144,7 @@ class RiskManager:
             max_total_exposure = self.account_equity * config.get(
                 "MAX_TOTAL_EXPOSURE_PCT", 0.8
             )
-            current_exposure = self.total_long_exposure + self.total_short_exposure
+            current_exposure = self.ledger.gross_exposure
 
             position_value = (
                 self.calculate_position_size(symbol, entry_price, self.account_equity)
@@ -155,73 +191,78 @@ class RiskManager:
             return 1
 
     def track_position_opened(
-        self, symbol: str, signal_type: str, quantity: int, entry_price: float
+        self,
+        symbol: str,
+        signal_type: str,
+        quantity: int,
+        entry_price: float,
+        stop_price: Optional[float] = None,
     ):
         """Track when a position is opened"""
         try:
             position_value = quantity * entry_price
+            side = "buy" if signal_type.lower() in ["buy", "long"] else "sell"
 
             self.positions_tracker[symbol] = {
                 "signal_type": signal_type,
+                "side": side,
                 "quantity": quantity,
                 "entry_price": entry_price,
                 "entry_time": datetime.now(),
                 "position_value": position_value,
             }
 
-            self.open_positions_count += 1
-
-            if signal_type in ["buy", "long"]:
-                self.total_long_exposure += position_value
-            else:
-                self.total_short_exposure += position_value
+            # With the stream up the fill event reaches the ledger itself; if it
+            # has not arrived yet the ledger holds the stop until it does
+            if not self._fills_streaming():
+                self.ledger.apply_fill(symbol, side, quantity, entry_price)
+            self.ledger.set_stop(symbol, stop_price)
 
             self.logger.info(
                 f"[{symbol}] Position opened - {signal_type.upper()} {quantity} @ ${entry_price:.2f}"
             )
             self.logger.info(
                 f"📊 Total positions: {self.open_positions_count}, "
-                f"Long exposure: ${self.total_long_exposure:.2f}"
+                f"Long exposure: ${self.total_long_exposure:.2f}, "
+                f"Short exposure: ${self.total_short_exposure:.2f}"
             )
 
         except Exception as e:
             self.logger.error(f"[{symbol}] Error tracking position opened: {e}")
 
+    def update_stop(self, symbol: str, stop_price: float):
+        """Re-measure a position's open risk after its stop moved"""
+        self.ledger.set_stop(symbol, stop_price)
+
     def track_position_closed(
         self, symbol: str, quantity: int, exit_price: float, pnl: float
     ):
         """Track when a position is closed"""
         try:
-            if symbol in self.positions_tracker:
-                position_info = self.positions_tracker[symbol]
-                position_value = position_info["position_value"]
-                signal_type = position_info["signal_type"]
-
-                # Update exposure
-                if signal_type in ["buy", "long"]:
-                    self.total_long_exposure = max(
-                        0, self.total_long_exposure - position_value
-                    )
-                else:
-                    self.total_short_exposure = max(
-                        0, self.total_short_exposure - position_value
-                    )
-
-                # Update daily P&L
-                self.daily_pnl += pnl
-
-                # Remove from tracker
-                del self.positions_tracker[symbol]
-                self.open_positions_count = max(0, self.open_positions_count - 1)
-
-                self.logger.info(
-                    f"[{symbol}] Position closed - {quantity} @ ${exit_price:.2f}, "
-                    f"P&L: ${pnl:.2f}"
-                )
-                self.logger.info(
-                    f"📊 Total positions: {self.open_positions_count}, "
-                    f"Daily P&L: ${self.daily_pnl:.2f}"
-                )
+            position_info = self.positions_tracker.pop(symbol, None)
+            if position_info is None:
+                return
+
+            # An entry fill that never reached the ledger leaves no stop behind
+            if symbol not in self.ledger:
+                self.ledger.set_stop(symbol, None)
+
+            # Exit is the opposite side of the entry
+            if not self._fills_streaming() and symbol in self.ledger:
+                exit_side = "sell" if position_info["side"] == "buy" else "buy"
+                self.ledger.apply_fill(symbol, exit_side, quantity, exit_price)
+
+            # Update daily P&L
+            self.daily_pnl += pnl
+
+            self.logger.info(
+                f"[{symbol}] Position closed - {quantity} @ ${exit_price:.2f}, "
+                f"P&L: ${pnl:.2f}"
+            )
+            self.logger.info(
+                f"📊 Total positions: {self.open_positions_count}, "
+                f"Daily P&L: ${self.daily_pnl:.2f}"
+            )
 
         except Exception as e:
             self.logger.error(f"[{symbol}] Error tracking position closed: {e}")
@@ -233,14 +274,22 @@ class RiskManager:
             "open_positions": self.open_positions_count,
             "total_long_exposure": self.total_long_exposure,
             "total_short_exposure": self.total_short_exposure,
+            "gross_exposure": self.ledger.gross_exposure,
+            "net_exposure": self.ledger.net_exposure,
+            "open_risk": self.ledger.open_risk,
             "daily_pnl": self.daily_pnl,
             "exposure_pct": (
-                (self.total_long_exposure + self.total_short_exposure)
-                / self.account_equity
+                self.ledger.gross_exposure / self.account_equity
                 if self.account_equity > 0
                 else 0
             ),
             "positions": list(self.positions_tracker.keys()),
+            "reconcile": {
+                "count": self.ledger.reconcile_count,
+                "drift": self.ledger.reconcile_drift,
+                "last_seconds": self.ledger.last_reconcile_seconds,
+                "total_seconds": self.ledger.total_reconcile_seconds,
+            },
         }
 
     def reset_daily_tracking(self):
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Engine State Snapshot
+Periodic atomic pickle of the engine's in-memory trading state (positions,
+peaks, cooldowns, diagnostics) so a mid-session restart resumes where it
+stopped instead of rebuilding from broker calls
+"""
+
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import config
+from utils.clock import system_clock
+from utils.logger import setup_logger
+
+SNAPSHOT_VERSION = 2
+
+# Engine attributes carried across a restart ("a.b" reaches into a component)
+ENGINE_STATE_FIELDS = (
+    "active_positions",
+    "position_peaks",
+    "daily_pnl",
+    "trade_count",
+    "trade_day",
+    "symbol_state",
+    "adaptive_cooldown_multiplier",
+    "recent_losses",
+    "consecutive_losses",
+    "global_pause_until",
+    "slippage_stats",
+    "performance_metrics",
+    "online_stats",
+    "symbol_perf",
+    "_trade_records",
+    "risk_manager.positions_tracker",
+    "risk_manager.daily_pnl",
+)
+
+
+def _resolve(obj, dotted: str):
+    """(owner, attribute name) for a possibly dotted field"""
+    *path, name = dotted.split(".")
+    for part in path:
+        obj = getattr(obj, part)
+    return obj, name
+
+
+class StateSnapshotter:
+    """Writes and restores engine state snapshots"""
+
+    def __init__(self, path=None, interval=None, fields=ENGINE_STATE_FIELDS):
+        self.logger = setup_logger("state_snapshot")
+        self.path = Path(
+            path or config.get("STATE_SNAPSHOT_PATH", "logs/engine_state.pkl")
+        )
+        self.interval = interval or config.get("STATE_SNAPSHOT_SECONDS", 5)
+        self.fields = fields
+
+        self.last_saved: Optional[float] = None
+        self.last_save_seconds = 0.0
+        self.last_size_bytes = 0
+
+    def capture(self, engine) -> Dict:
+        state = {}
+        for field in self.fields:
+            try:
+                owner, name = _resolve(engine, field)
+                if hasattr(owner, name):
+                    state[field] = getattr(owner, name)
+            except AttributeError:
+                continue
+        return state
+
+    def save(self, engine) -> bool:
+        """Write a snapshot atomically (temp file in the same directory + rename)"""
+        started = time.monotonic()
+        try:
+            payload = pickle.dumps(
+                {
+                    "version": SNAPSHOT_VERSION,
+                    "saved_at": time.time(),
+                    "state": self.capture(engine),
+                },
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as tmp:
+                    tmp.write(payload)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            self.last_saved = time.monotonic()
+            self.last_save_seconds = self.last_saved - started
+            self.last_size_bytes = len(payload)
+            return True
+
+        except Exception as e:
+            self.logger.error(f"❌ State snapshot failed: {e}")
+            return False
+
+    def maybe_save(self, engine) -> bool:
+        """Save when the snapshot interval has elapsed"""
+        if (
+            self.last_saved is not None
+            and time.monotonic() - self.last_saved < self.interval
+        ):
+            return False
+        return self.save(engine)
+
+    def load(self, clock=None) -> Optional[Dict]:
+        """State from the snapshot file, or None if missing/unreadable/outdated
+
+        clock decides what "today" is; pass the engine's, whose trade_day
+        the snapshot carries.
+        """
+        clock = clock or system_clock
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable state snapshot: {e}")
+            return None
+
+        if payload.get("version") != SNAPSHOT_VERSION:
+            self.logger.info("State snapshot version changed - starting fresh")
+            return None
+        state = payload.get("state", {})
+        # Only resume within the same trading day; positions from an earlier
+        # session are adopted from the broker instead
+        if state.get("trade_day") != clock.utcnow().date():
+            self.logger.info("State snapshot is from another trading day - ignored")
+            return None
+        return state
+
+    def restore(self, engine) -> bool:
+        """Load the snapshot into the engine; True if state was restored"""
+        started = time.monotonic()
+        state = self.load(getattr(engine, "clock", None))
+        if not state:
+            return False
+
+        for field, value in state.items():
+            try:
+                owner, name = _resolve(engine, field)
+                setattr(owner, name, value)
+            except AttributeError:
+                continue
+
+        self.logger.info(
+            f"♻️ Restored engine state: {len(state.get('active_positions', {}))} positions, "
+            f"{len(state)} fields in {time.monotonic() - started:.3f}s"
+        )
+        return True
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Symbol State Table
+Per-symbol engine bookkeeping (order/signal timestamps, cooldowns, trade
+counts) in numpy columns indexed by an interned symbol id. Reads and writes
+are O(1), cooldowns for a whole watchlist are one vectorized expression, and
+ids of idle symbols are recycled so memory stays bounded.
+"""
+
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Epoch-second timestamps; 0.0 means "never"
+TIMESTAMP_COLUMNS = (
+    "last_order_time",
+    "last_signal_time",
+    "failed_signal_time",
+    "profitable_close_time",
+    "last_data_update",
+    "last_data_diag",
+    "last_cooldown_log",
+    "last_failed_log",
+)
+# Counters; 0 means "none"
+COUNT_COLUMNS = ("trade_count",)
+
+
+class SymbolColumn(MutableMapping):
+    """Dict-style view of one column: symbols whose value is set (non-zero)"""
+
+    def __init__(self, table: "SymbolStateTable", column: str):
+        self._table = table
+        self._column = column
+
+    def __getitem__(self, symbol: str):
+        value = self._table.get(self._column, symbol)
+        if not value:
+            raise KeyError(symbol)
+        return value
+
+    def __setitem__(self, symbol: str, value):
+        self._table.set(self._column, symbol, value)
+
+    def __delitem__(self, symbol: str):
+        if not self._table.get(self._column, symbol):
+            raise KeyError(symbol)
+        self._table.set(self._column, symbol, 0)
+
+    def __iter__(self):
+        return iter(self._table.symbols_with(self._column))
+
+    def __len__(self) -> int:
+        return len(self._table.symbols_with(self._column))
+
+    def clear(self):
+        self._table.clear_column(self._column)
+
+    def __repr__(self) -> str:
+        return f"SymbolColumn({self._column}, {dict(self)})"
+
+
+class SymbolStateTable:
+    """Columns of per-symbol state, one row per interned symbol"""
+
+    def __init__(self, capacity: int = 64):
+        self._ids: Dict[str, int] = {}
+        self._symbols: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._columns: Dict[str, np.ndarray] = {}
+        for name in TIMESTAMP_COLUMNS:
+            self._columns[name] = np.zeros(capacity, dtype=float)
+        for name in COUNT_COLUMNS:
+            self._columns[name] = np.zeros(capacity, dtype=np.int64)
+        self._views: Dict[str, SymbolColumn] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_views"] = {}
+        return state
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns[TIMESTAMP_COLUMNS[0]])
+
+    def intern(self, symbol: str) -> int:
+        """Row id for a symbol, allocating (or recycling) one if needed"""
+        sid = self._ids.get(symbol)
+        if sid is not None:
+            return sid
+        if self._free:
+            sid = self._free.pop()
+            self._symbols[sid] = symbol
+        else:
+            sid = len(self._symbols)
+            if sid >= self.capacity:
+                self._grow(max(2 * self.capacity, sid + 1))
+            self._symbols.append(symbol)
+        self._ids[symbol] = sid
+        return sid
+
+    def _grow(self, capacity: int):
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: len(column)] = column
+            self._columns[name] = grown
+
+    def get(self, column: str, symbol: str, default=0):
+        sid = self._ids.get(symbol)
+        if sid is None:
+            return default
+        value = self._columns[column][sid]
+        return value.item() if value else default
+
+    def set(self, column: str, symbol: str, value):
+        self._columns[column][self.intern(symbol)] = value or 0
+
+    def increment(self, column: str, symbol: str, by: int = 1) -> int:
+        sid = self.intern(symbol)
+        self._columns[column][sid] += by
+        return int(self._columns[column][sid])
+
+    def clear_column(self, column: str):
+        self._columns[column][:] = 0
+
+    def view(self, column: str) -> SymbolColumn:
+        """Dict-style view of a column (cached per column)"""
+        if column not in self._columns:
+            raise KeyError(column)
+        view = self._views.get(column)
+        if view is None:
+            view = self._views[column] = SymbolColumn(self, column)
+        return view
+
+    def symbols_with(self, column: str) -> List[str]:
+        """Symbols whose value in a column is set"""
+        values = self._columns[column]
+        return [symbol for symbol, sid in self._ids.items() if values[sid]]
+
+    def ids(self, symbols: Iterable[str]) -> np.ndarray:
+        return np.array([self.intern(s) for s in symbols], dtype=np.int64)
+
+    def signal_cooldown_mask(
+        self,
+        symbols: List[str],
+        now: float,
+        signal_cooldown: float,
+        failed_cooldown: float,
+        profitable_cooldown: float,
+    ) -> np.ndarray:
+        """True where a symbol is still in any signal cooldown"""
+        ids = self.ids(symbols)
+        c = self._columns
+
+        def active(column: str, period: float) -> np.ndarray:
+            stamps = c[column][ids]
+            return (stamps > 0) & (now - stamps < period)
+
+        return (
+            active("last_signal_time", signal_cooldown)
+            | active("failed_signal_time", failed_cooldown)
+            | active("profitable_close_time", profitable_cooldown)
+        )
+
+    def prune(self, now: float, max_age: float, keep: Iterable[str] = ()) -> int:
+        """Release rows with no counts and no timestamp newer than max_age
+
+        Released ids are reused by later interns. Returns the rows released.
+        """
+        if not self._ids:
+            return 0
+        keep = set(keep)
+        n = len(self._symbols)
+        stamps = np.stack([self._columns[c][:n] for c in TIMESTAMP_COLUMNS])
+        counts = np.stack([self._columns[c][:n] for c in COUNT_COLUMNS])
+        idle = (stamps.max(axis=0) <= now - max_age) & (counts.max(axis=0) == 0)
+
+        released = 0
+        for sid in np.flatnonzero(idle):
+            symbol = self._symbols[sid]
+            if symbol is None or symbol in keep:
+                continue
+            for column in self._columns.values():
+                column[sid] = 0
+            del self._ids[symbol]
+            self._symbols[sid] = None
+            self._free.append(int(sid))
+            released += 1
+        return released
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Timer Wheel
+Hierarchical timing wheel for cooldowns and other expiries. Scheduling and
+cancelling are O(1); advancing the clock touches only the slots that come
+due, cascading far-off timers down to finer wheels as they approach.
+CooldownService builds on it: named cooldowns per symbol that fire callbacks
+on expiry and keep the set of currently eligible symbols up to date.
+"""
+
+import math
+import threading
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from utils.clock import system_clock
+
+# Symbol-independent cooldowns (e.g. the global trading pause) use this key
+GLOBAL = "*"
+
+# Cooldown kinds that make a symbol ineligible for signal generation
+SIGNAL_BLOCKING_KINDS = ("signal", "failed_signal", "profitable_close")
+
+
+class _Timer:
+    __slots__ = ("key", "expires", "callback", "level", "slot")
+
+    def __init__(self, key, expires: int, callback: Optional[Callable]):
+        self.key = key
+        self.expires = expires
+        self.callback = callback
+        self.level = -1
+        self.slot = -1
+
+
+class TimerWheel:
+    """Timers keyed by any hashable; re-scheduling a key replaces its timer
+
+    With the default 0.1s tick and (256, 64, 64, 64) slots the wheels span
+    25.6s, 27min, 29h and 78 days; anything later waits in an overflow list.
+    Timers fire at most one tick late and never early.
+    """
+
+    def __init__(
+        self,
+        tick: float = 0.1,
+        wheel_sizes: Tuple[int, ...] = (256, 64, 64, 64),
+        now: Optional[float] = None,
+        clock=None,
+    ):
+        self.clock = clock or system_clock
+        self.tick = tick
+        self.wheel_sizes = wheel_sizes
+        # Ticks per slot on each level
+        self._granularity = [1]
+        for size in wheel_sizes[:-1]:
+            self._granularity.append(self._granularity[-1] * size)
+        self._span = self._granularity[-1] * wheel_sizes[-1]
+
+        self._wheels: List[List[Dict]] = [
+            [{} for _ in range(size)] for size in wheel_sizes
+        ]
+        self._overflow: Dict = {}
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._current = self._to_tick(self.clock.time() if now is None else now)
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key) -> bool:
+        return key in self._timers
+
+    def _to_tick(self, t: float) -> int:
+        return int(math.floor(t / self.tick))
+
+    def schedule(
+        self,
+        key: Hashable,
+        deadline: float,
+        callback: Optional[Callable] = None,
+    ):
+        """Fire callback(key) once the clock passes deadline (epoch seconds)"""
+        self.cancel(key)
+        expires = max(int(math.ceil(deadline / self.tick)), self._current + 1)
+        timer = _Timer(key, expires, callback)
+        self._timers[key] = timer
+        self._place(timer)
+
+    def cancel(self, key: Hashable) -> bool:
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        if timer.level < 0:
+            self._overflow.pop(key, None)
+        else:
+            self._wheels[timer.level][timer.slot].pop(key, None)
+        return True
+
+    def _place(self, timer: _Timer):
+        delta = timer.expires - self._current
+        if delta >= self._span:
+            timer.level = timer.slot = -1
+            self._overflow[timer.key] = timer
+            return
+        level = 0
+        while delta >= self._granularity[level] * self.wheel_sizes[level]:
+            level += 1
+        slot = (timer.expires // self._granularity[level]) % self.wheel_sizes[level]
+        timer.level, timer.slot = level, slot
+        self._wheels[level][slot][timer.key] = timer
+
+    def _cascade(self, level: int):
+        """Move the timers of the slot now current on `level` to finer wheels"""
+        if level >= len(self.wheel_sizes):
+            if self._overflow:
+                pending, self._overflow = self._overflow, {}
+                for timer in pending.values():
+                    self._place(timer)
+            return
+        index = (self._current // self._granularity[level]) % self.wheel_sizes[level]
+        if index == 0:
+            self._cascade(level + 1)
+        slot = self._wheels[level][index]
+        if slot:
+            self._wheels[level][index] = {}
+            for timer in slot.values():
+                self._place(timer)
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        """Move the clock to now, firing due timers; returns the keys fired"""
+        target = self._to_tick(self.clock.time() if now is None else now)
+        fired: List[_Timer] = []
+        while self._current < target:
+            if not self._timers:
+                self._current = target
+                break
+            self._current += 1
+            size0 = self.wheel_sizes[0]
+            if self._current % size0 == 0:
+                self._cascade(1)
+            slot = self._wheels[0][self._current % size0]
+            if slot:
+                self._wheels[0][self._current % size0] = {}
+                for timer in slot.values():
+                    del self._timers[timer.key]
+                    fired.append(timer)
+
+        for timer in fired:
+            if timer.callback is not None:
+                timer.callback(timer.key)
+        return [timer.key for timer in fired]
+
+
+class CooldownService:
+    """Named cooldowns per symbol on a timer wheel
+
+    start("signal", "AAPL", 60) blocks AAPL for 60s; the symbol returns to the
+    eligible set when its last blocking cooldown expires. Queries advance the
+    wheel first, so expiry callbacks run on the querying thread.
+    """
+
+    def __init__(
+        self,
+        blocking_kinds: Iterable[str] = SIGNAL_BLOCKING_KINDS,
+        wheel: Optional[TimerWheel] = None,
+        clock=None,
+    ):
+        self._lock = threading.RLock()
+        self.clock = clock or system_clock
+        self.wheel = wheel if wheel is not None else TimerWheel(clock=self.clock)
+        self.blocking_kinds = frozenset(blocking_kinds)
+        self._deadlines: Dict[Tuple[str, Hashable], float] = {}
+        self._callbacks: Dict[Tuple[str, Hashable], Callable] = {}
+        self._blocks: Dict[Hashable, int] = {}  # active blocking cooldowns per key
+        self._eligible: Set[Hashable] = set()
+
+    def watch(self, symbols: Iterable[Hashable]):
+        """Add symbols to the universe tracked for eligibility"""
+        with self._lock:
+            for symbol in symbols:
+                if not self._blocks.get(symbol):
+                    self._eligible.add(symbol)
+
+    def start(
+        self,
+        kind: str,
+        key: Hashable,
+        seconds: float,
+        callback: Optional[Callable[[str, Hashable], None]] = None,
+        now: Optional[float] = None,
+    ):
+        """Start (or restart) a cooldown; callback(kind, key) runs on expiry"""
+        now = self.clock.time() if now is None else now
+        with self._lock:
+            self.cancel(kind, key)
+            if seconds <= 0:
+                return
+            entry = (kind, key)
+            self._deadlines[entry] = now + seconds
+            if callback is not None:
+                self._callbacks[entry] = callback
+            if kind in self.blocking_kinds:
+                self._blocks[key] = self._blocks.get(key, 0) + 1
+                self._eligible.discard(key)
+            self.wheel.schedule(entry, now + seconds, self._expired)
+
+    def cancel(self, kind: str, key: Hashable) -> bool:
+        with self._lock:
+            entry = (kind, key)
+            if entry not in self._deadlines:
+                return False
+            self.wheel.cancel(entry)
+            self._release(entry)
+            return True
+
+    def _release(self, entry: Tuple[str, Hashable]):
+        kind, key = entry
+        del self._deadlines[entry]
+        self._callbacks.pop(entry, None)
+        if kind in self.blocking_kinds:
+            self._blocks[key] -= 1
+            if not self._blocks[key]:
+                del self._blocks[key]
+                self._eligible.add(key)
+
+    def _expired(self, entry: Tuple[str, Hashable]):
+        callback = self._callbacks.get(entry)
+        self._release(entry)
+        if callback is not None:
+            callback(*entry)
+
+    def advance(self, now: Optional[float] = None):
+        with self._lock:
+            self.wheel.advance(now)
+
+    def active(self, kind: str, key: Hashable, now: Optional[float] = None) -> bool:
+        self.advance(now)
+        return (kind, key) in self._deadlines
+
+    def remaining(self, kind: str, key: Hashable, now: Optional[float] = None) -> float:
+        """Seconds left on a cooldown (0 when not active)"""
+        now = self.clock.time() if now is None else now
+        self.advance(now)
+        deadline = self._deadlines.get((kind, key))
+        return max(0.0, deadline - now) if deadline is not None else 0.0
+
+    def is_eligible(self, key: Hashable, now: Optional[float] = None) -> bool:
+        """No blocking cooldown is active for key"""
+        self.advance(now)
+        return not self._blocks.get(key)
+
+    def eligible_symbols(self, now: Optional[float] = None) -> Set[Hashable]:
+        """Watched symbols with no blocking cooldown (live set, do not modify)"""
+        self.advance(now)
+        return self._eligible
+
+    def active_count(self) -> int:
+        return len(self._deadlines)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Trade Update Feed
+One background Alpaca trade_updates stream shared by every component that
+needs order/fill events (emergency execution, order tracking)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from config import config
+from utils.logger import setup_logger
+
+try:
+    from alpaca_trade_api.common import URL
+    from alpaca_trade_api.stream import Stream
+
+    STREAM_AVAILABLE = True
+except ImportError:
+    STREAM_AVAILABLE = False
+
+# Events after which an order will not change again
+TERMINAL_EVENTS = ("fill", "canceled", "expired", "rejected", "done_for_day")
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_trade_update(data: dict) -> Dict:
+    """Flatten a raw trade_updates payload into the event dict subscribers get"""
+    order = data.get("order") or {}
+    return {
+        "event": data.get("event"),
+        "order_id": order.get("id"),
+        "client_order_id": order.get("client_order_id"),
+        "symbol": order.get("symbol"),
+        "side": order.get("side"),
+        "order_type": order.get("order_type") or order.get("type"),
+        "status": order.get("status"),
+        "qty": _to_float(order.get("qty")),
+        "filled_qty": _to_float(order.get("filled_qty")),
+        "filled_avg_price": _to_float(order.get("filled_avg_price")),
+        "price": _to_float(data.get("price")),
+        # Size of this (partial) fill and the resulting position size
+        "fill_qty": _to_float(data.get("qty")),
+        "position_qty": _to_float(data.get("position_qty")),
+        "timestamp": data.get("timestamp"),
+        "received_at": time.monotonic(),
+        "order": order,
+    }
+
+
+class TradeUpdateFeed:
+    """Runs the trade_updates websocket on a daemon thread and fans events out
+
+    Subscribers are plain callables taking the normalized event dict. They run
+    on the stream thread, so they should only update in-memory state.
+    """
+
+    def __init__(self, key_id=None, secret_key=None, base_url=None):
+        self.logger = setup_logger("trade_updates")
+        self.key_id = key_id or config["ALPACA_API_KEY"]
+        self.secret_key = secret_key or config["ALPACA_SECRET_KEY"]
+        self.base_url = base_url or config["ALPACA_BASE_URL"]
+
+        self._subscribers: List[Callable[[Dict], None]] = []
+        self._lock = threading.Lock()
+        self._stream = None
+        self._thread = None
+        self.events_received = 0
+        self.last_event_at = None
+
+    def subscribe(self, callback: Callable[[Dict], None]):
+        """Register a callback for every trade update"""
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Dict], None]):
+        """Remove a previously registered callback"""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def publish(self, event: Dict):
+        """Deliver a normalized event to every subscriber"""
+        self.events_received += 1
+        self.last_event_at = time.monotonic()
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                self.logger.error(f"Trade update subscriber failed: {e}")
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_connected(self) -> bool:
+        # The trading websocket flips _running once it is authenticated
+        trading_ws = getattr(self._stream, "_trading_ws", None)
+        return self.is_running and bool(getattr(trading_ws, "_running", False))
+
+    def start(self) -> bool:
+        """Start the stream thread (no-op if already running)"""
+        if self.is_running:
+            return True
+
+        if not STREAM_AVAILABLE:
+            self.logger.warning(
+                "Trade update stream unavailable - alpaca stream missing"
+            )
+            return False
+
+        try:
+            self._stream = Stream(
+                self.key_id, self.secret_key, base_url=URL(self.base_url), raw_data=True
+            )
+            self._stream.subscribe_trade_updates(self._on_message)
+            self._thread = threading.Thread(
+                target=self._stream.run, name="trade-updates", daemon=True
+            )
+            self._thread.start()
+            self.logger.info("📡 Trade update stream started")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to start trade update stream: {e}")
+            self._stream = None
+            return False
+
+    def stop(self):
+        """Stop the stream thread"""
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+            except Exception as e:
+                self.logger.debug(f"Trade update stream stop: {e}")
+        self._stream = None
+        self._thread = None
+
+    async def _on_message(self, msg):
+        data = msg.get("data", msg) if isinstance(msg, dict) else {}
+        self.publish(normalize_trade_update(data))
+
+
+_shared_feed = None
+_shared_feed_lock = threading.Lock()
+
+
+def get_trade_update_feed() -> TradeUpdateFeed:
+    """Get the process-wide trade update feed (one websocket per process)"""
+    global _shared_feed
+    with _shared_feed_lock:
+        if _shared_feed is None:
+            _shared_feed = TradeUpdateFeed()
+        return _shared_feed
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Trailing Stop Book
+Struct-of-arrays storage for trailing stop positions with a vectorized update
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+LONG = 1
+SHORT = -1
+
+
+class BookUpdate(NamedTuple):
+    """Result of one vectorized TrailingStopBook.update() pass (slot indices)"""
+
+    activated: np.ndarray  # slots whose trailing just switched on
+    moved: np.ndarray  # slots whose stop moved this pass
+    previous_stops: np.ndarray  # stop before the move, aligned with `moved`
+    triggered: np.ndarray  # slots whose price crossed the stop
+
+
+def round_to_cent_array(prices: np.ndarray) -> np.ndarray:
+    """Vectorized half-up rounding to the cent (matches price_utils.round_to_cent)"""
+    return np.floor(prices * 100.0 + 0.5 + 1e-9) / 100.0
+
+
+class TrailingStopBook:
+    """Compact struct-of-arrays position book for trailing stops
+
+    One slot (row) per symbol. Thresholds are resolved once when a position is
+    added, so the per-tick update over every position is a single pass of numpy
+    operations on a price vector aligned to the slots.
+    """
+
+    FLOAT_FIELDS = (
+        "entry",
+        "peak",
+        "trough",
+        "stop",
+        "initial_stop",
+        "activation",
+        "distance",
+        "min_move",
+        "price",
+        "quantity",
+        "updated_at",
+    )
+
+    def __init__(self, capacity: int = 16):
+        self.capacity = 0
+        self.slots: Dict[str, int] = {}  # symbol -> slot
+        self.symbols: List[Optional[str]] = []  # slot -> symbol
+        self._free: List[int] = []
+
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.empty(0, dtype=np.float64))
+        self.side = np.empty(0, dtype=np.int8)
+        self.active = np.empty(0, dtype=bool)  # trailing activated
+        self.live = np.empty(0, dtype=bool)  # slot in use
+
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.slots
+
+    def _grow(self, new_capacity: int):
+        """Resize every column, keeping existing rows"""
+        extra = new_capacity - self.capacity
+        for name in self.FLOAT_FIELDS:
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate([column, np.full(extra, np.nan)]))
+        self.side = np.concatenate([self.side, np.zeros(extra, dtype=np.int8)])
+        self.active = np.concatenate([self.active, np.zeros(extra, dtype=bool)])
+        self.live = np.concatenate([self.live, np.zeros(extra, dtype=bool)])
+        self.symbols.extend([None] * extra)
+        self._free.extend(range(new_capacity - 1, self.capacity - 1, -1))
+        self.capacity = new_capacity
+
+    def add(
+        self,
+        symbol: str,
+        entry_price: float,
+        quantity: float,
+        side: str,
+        stop_price: float,
+        activation_pct: float,
+        distance_pct: float,
+        min_move_pct: float,
+        now: float = 0.0,
+    ) -> int:
+        """Add (or reset) a position and return its slot"""
+        slot = self.slots.get(symbol)
+        if slot is None:
+            if not self._free:
+                self._grow(self.capacity * 2)
+            slot = self._free.pop()
+            self.slots[symbol] = slot
+            self.symbols[slot] = symbol
+
+        self.entry[slot] = entry_price
+        self.peak[slot] = entry_price
+        self.trough[slot] = entry_price
+        self.price[slot] = entry_price
+        self.stop[slot] = stop_price
+        self.initial_stop[slot] = stop_price
+        self.activation[slot] = activation_pct
+        self.distance[slot] = distance_pct
+        self.min_move[slot] = min_move_pct
+        self.quantity[slot] = quantity
+        self.updated_at[slot] = now
+        self.side[slot] = SHORT if side == "short" else LONG
+        self.active[slot] = False
+        self.live[slot] = True
+        return slot
+
+    def remove(self, symbol: str) -> bool:
+        """Free a symbol's slot for reuse"""
+        slot = self.slots.pop(symbol, None)
+        if slot is None:
+            return False
+
+        self.live[slot] = False
+        self.active[slot] = False
+        self.side[slot] = 0
+        self.symbols[slot] = None
+        for name in self.FLOAT_FIELDS:
+            getattr(self, name)[slot] = np.nan
+        self._free.append(slot)
+        return True
+
+    def slot(self, symbol: str) -> Optional[int]:
+        """Get the slot index for a symbol"""
+        return self.slots.get(symbol)
+
+    def price_vector(self, prices: Dict[str, float]) -> np.ndarray:
+        """Build a slot-aligned price vector (NaN = no price this pass)"""
+        vector = np.full(self.capacity, np.nan)
+        for symbol, price in prices.items():
+            slot = self.slots.get(symbol)
+            if slot is not None and price:
+                vector[slot] = price
+        return vector
+
+    def update(self, prices: np.ndarray, now: float = 0.0) -> BookUpdate:
+        """Update every peak/trough and stop for a slot-aligned price vector
+
+        Long:  peak = max(peak, price); activates at entry * (1 + activation);
+               stop ratchets up to peak * (1 - distance).
+        Short: trough = min(trough, price); activates at entry * (1 - activation);
+               stop ratchets down to trough * (1 + distance).
+        A stop only moves when the move is at least min_move of the old stop.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            valid = self.live & ~np.isnan(prices)
+            is_long = valid & (self.side == LONG)
+            is_short = valid & (self.side == SHORT)
+
+            self.price[valid] = prices[valid]
+            self.updated_at[valid] = now
+            np.maximum(self.peak, prices, out=self.peak, where=is_long)
+            np.minimum(self.trough, prices, out=self.trough, where=is_short)
+
+            activated = ~self.active & (
+                (is_long & (prices >= self.entry * (1 + self.activation)))
+                | (is_short & (prices <= self.entry * (1 - self.activation)))
+            )
+            self.active |= activated
+
+            candidate = round_to_cent_array(
+                np.where(
+                    self.side == SHORT,
+                    self.trough * (1 + self.distance),
+                    self.peak * (1 - self.distance),
+                )
+            )
+            # Positive when the candidate tightens the stop for either side
+            move_pct = (candidate - self.stop) * self.side / self.stop
+            moved = self.active & valid & (move_pct > 0) & (move_pct >= self.min_move)
+
+            moved_slots = np.flatnonzero(moved)
+            previous_stops = self.stop[moved_slots].copy()
+            self.stop[moved_slots] = candidate[moved_slots]
+
+            triggered = (is_long & (prices <= self.stop)) | (
+                is_short & (prices >= self.stop)
+            )
+
+        return BookUpdate(
+            activated=np.flatnonzero(activated),
+            moved=moved_slots,
+            previous_stops=previous_stops,
+            triggered=np.flatnonzero(triggered),
+        )
+
+    def profit_pct(self) -> np.ndarray:
+        """Per-slot profit fraction at the last price (sign-adjusted for shorts)"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (self.price - self.entry) * self.side / self.entry
+
+    def unrealized_pnl(self) -> np.ndarray:
+        """Per-slot unrealized P&L at the last price"""
+        return (self.price - self.entry) * self.side * self.quantity
@@ -6,7 +6,6 @@ Handles dynamic stop loss adjustments to protect profits
 
 import sys
 import time
-from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -15,40 +14,91 @@ from typing import Dict, List, Optional
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config import config
+from core.trailing_stop_book import SHORT, TrailingStopBook
 from utils.logger import setup_logger
-from utils.price_utils import (
-    calculate_trailing_stop_price,
-    round_to_cent,
-    validate_price_precision,
-)
+from utils.price_utils import round_to_cent
 
 
-@dataclass
 class TrailingStopPosition:
-    """Data class for tracking trailing stop positions"""
-
-    symbol: str
-    entry_price: float
-    entry_time: datetime
-    quantity: int
-    side: str  # 'long' or 'short'
-    current_price: float
-    highest_price: float  # For long positions
-    lowest_price: float  # For short positions
-    trailing_stop_price: float
-    initial_stop_price: float
-    is_trailing_active: bool
-    last_update_time: datetime
-    profit_pct: float
-    unrealized_pnl: float
+    """Read-only view of one position row in the TrailingStopBook"""
+
+    __slots__ = ("symbol", "entry_time", "custom_thresholds", "_book", "_slot")
+
+    def __init__(self, book, slot, symbol, entry_time, custom_thresholds=None):
+        self._book = book
+        self._slot = slot
+        self.symbol = symbol
+        self.entry_time = entry_time
+        self.custom_thresholds = custom_thresholds
+
+    @property
+    def entry_price(self) -> float:
+        return float(self._book.entry[self._slot])
+
+    @property
+    def quantity(self) -> int:
+        return int(self._book.quantity[self._slot])
+
+    @property
+    def side(self) -> str:
+        return "short" if self._book.side[self._slot] == SHORT else "long"
+
+    @property
+    def current_price(self) -> float:
+        return float(self._book.price[self._slot])
+
+    @property
+    def highest_price(self) -> float:
+        return float(self._book.peak[self._slot])
+
+    @property
+    def lowest_price(self) -> float:
+        return float(self._book.trough[self._slot])
+
+    @property
+    def trailing_stop_price(self) -> float:
+        return float(self._book.stop[self._slot])
+
+    @property
+    def initial_stop_price(self) -> float:
+        return float(self._book.initial_stop[self._slot])
+
+    @property
+    def is_trailing_active(self) -> bool:
+        return bool(self._book.active[self._slot])
+
+    @property
+    def last_update_time(self) -> datetime:
+        return datetime.fromtimestamp(self._book.updated_at[self._slot])
+
+    @property
+    def profit_pct(self) -> float:
+        book, slot = self._book, self._slot
+        return float(
+            (book.price[slot] - book.entry[slot]) * book.side[slot] / book.entry[slot]
+        )
+
+    @property
+    def unrealized_pnl(self) -> float:
+        book, slot = self._book, self._slot
+        return float(
+            (book.price[slot] - book.entry[slot])
+            * book.side[slot]
+            * book.quantity[slot]
+        )
 
 
 class TrailingStopManager:
-    """Manages trailing stop functionality for all positions"""
+    """Manages trailing stop functionality for all positions
+
+    Position state lives in a struct-of-arrays TrailingStopBook; active_positions
+    maps each symbol to a lightweight view of its row.
+    """
 
     def __init__(self, order_manager):
         self.logger = setup_logger("trailing_stop_manager")
         self.order_manager = order_manager
+        self.book = TrailingStopBook()
         self.active_positions: Dict[str, TrailingStopPosition] = {}
         self.stop_orders: Dict[str, str] = {}  # symbol -> stop_order_id
         self.logger.info("🎯 Trailing Stop Manager initialized")
@@ -81,62 +131,112 @@ class TrailingStopManager:
                 )
                 return
 
-            # Use custom thresholds if provided, otherwise fall back to config defaults
-            if custom_thresholds:
-                trailing_pct = custom_thresholds.get(
-                    "trailing_distance_pct", config["TRAILING_STOP_PCT"]
-                )
-                activation_pct = custom_thresholds.get(
-                    "trailing_activation_pct", config["TRAILING_STOP_ACTIVATION"]
-                )
-                stop_loss_pct = custom_thresholds.get(
-                    "stop_loss_pct", config["STOP_LOSS_PCT"]
-                )
-
-                self.logger.info(f"[{symbol}] 🎯 Using custom thresholds:")
-                self.logger.info(f"[{symbol}] 📊 Trailing distance: {trailing_pct:.1%}")
-                self.logger.info(
-                    f"[{symbol}] 🚀 Activation threshold: {activation_pct:.1%}"
-                )
-                self.logger.info(f"[{symbol}] 🛡️  Stop loss: {stop_loss_pct:.1%}")
-            else:
-                trailing_pct = config["TRAILING_STOP_PCT"]
-                activation_pct = config["TRAILING_STOP_ACTIVATION"]
-                stop_loss_pct = config["STOP_LOSS_PCT"]
+            # Resolve thresholds once - the book keeps them per slot
+            thresholds = custom_thresholds or {}
+            trailing_pct = thresholds.get(
+                "trailing_distance_pct", config["TRAILING_STOP_PCT"]
+            )
+            activation_pct = thresholds.get(
+                "trailing_activation_pct", config["TRAILING_STOP_ACTIVATION"]
+            )
+            stop_loss_pct = thresholds.get("stop_loss_pct", config["STOP_LOSS_PCT"])
+            min_move_pct = thresholds.get(
+                "min_move_pct", config["TRAILING_STOP_MIN_MOVE"]
+            )
 
             if initial_stop_price is None:
-                initial_stop_price = round_to_cent(entry_price * (1 - stop_loss_pct))
+                # Stop sits below entry for longs and above entry for shorts
+                direction = 1 if side == "short" else -1
+                initial_stop_price = round_to_cent(
+                    entry_price * (1 + direction * stop_loss_pct)
+                )
 
-            position = TrailingStopPosition(
-                symbol=symbol,
+            slot = self.book.add(
+                symbol,
                 entry_price=entry_price,
-                entry_time=datetime.now(),
                 quantity=quantity,
                 side=side,
-                current_price=entry_price,
-                highest_price=entry_price,
-                lowest_price=entry_price,
-                trailing_stop_price=initial_stop_price,
-                initial_stop_price=initial_stop_price,
-                is_trailing_active=False,
-                last_update_time=datetime.now(),
-                profit_pct=0.0,
-                unrealized_pnl=0.0,
+                stop_price=initial_stop_price,
+                activation_pct=activation_pct,
+                distance_pct=trailing_pct,
+                min_move_pct=min_move_pct,
+                now=time.time(),
+            )
+            self.active_positions[symbol] = TrailingStopPosition(
+                self.book, slot, symbol, datetime.now(), custom_thresholds
             )
 
-            # Store custom thresholds with position for later use
-            if custom_thresholds:
-                position.custom_thresholds = custom_thresholds
-
-            self.active_positions[symbol] = position
-            self.logger.info(f"[{symbol}] 📍 Position added to trailing stop tracking")
             self.logger.info(
-                f"[{symbol}] 💰 Entry: ${entry_price:.2f}, Initial Stop: ${initial_stop_price:.2f}"
+                f"[{symbol}] 📍 Position added to trailing stop tracking - "
+                f"Entry: ${entry_price:.2f}, Initial Stop: ${initial_stop_price:.2f}, "
+                f"Activation: {activation_pct:.1%}, Distance: {trailing_pct:.1%}"
             )
 
         except Exception as e:
             self.logger.error(f"[{symbol}] ❌ Failed to add position: {e}")
 
+    def update_all_prices(self, prices: Dict[str, float]) -> Dict[str, List]:
+        """Update every tracked position from a symbol -> price map in one pass
+
+        Returns {"updates": [update_info, ...], "triggered": [symbol, ...]}
+        where each update_info matches update_position_price()'s return value.
+        """
+        try:
+            result = self.book.update(self.book.price_vector(prices), time.time())
+            return {
+                "updates": self._collect_updates(result),
+                "triggered": self._collect_triggers(result),
+            }
+
+        except Exception as e:
+            self.logger.error(f"❌ Failed to update trailing stop book: {e}")
+            return {"updates": [], "triggered": []}
+
+    def _collect_updates(self, result) -> List[Dict]:
+        """Log activations/moves from a book pass and build update infos"""
+        book = self.book
+
+        for slot in result.activated:
+            self.logger.info(
+                f"[{book.symbols[slot]}] 🚀 Trailing stop ACTIVATED at ${book.price[slot]:.2f}"
+            )
+
+        updates = []
+        profit = book.profit_pct()
+        for slot, old_stop in zip(result.moved, result.previous_stops):
+            symbol = book.symbols[slot]
+            new_stop = float(book.stop[slot])
+            protected = (
+                (new_stop - book.entry[slot]) * book.side[slot] / book.entry[slot]
+            )
+            self.logger.info(
+                f"[{symbol}] 📈 Trailing stop adjusted: ${old_stop:.2f} → ${new_stop:.2f} "
+                f"(protected {protected:.1%})"
+            )
+            updates.append(
+                {
+                    "symbol": symbol,
+                    "action": "update_stop",
+                    "new_stop_price": new_stop,
+                    "old_stop_price": float(old_stop),
+                    "profit_protected": float(protected),
+                    "current_profit": float(profit[slot]),
+                }
+            )
+        return updates
+
+    def _collect_triggers(self, result) -> List[str]:
+        """Log and return the symbols whose stop was crossed in a book pass"""
+        triggered = []
+        for slot in result.triggered:
+            symbol = self.book.symbols[slot]
+            self.logger.warning(
+                f"[{symbol}] 🛑 TRAILING STOP TRIGGERED - Price: ${self.book.price[slot]:.2f} "
+                f"Stop: ${self.book.stop[slot]:.2f}"
+            )
+            triggered.append(symbol)
+        return triggered
+
     def update_position_price(
         self, symbol: str, current_price: float
     ) -> Optional[Dict]:
@@ -145,179 +245,11 @@ class TrailingStopManager:
             if symbol not in self.active_positions:
                 return None
 
-            position = self.active_positions[symbol]
-            position.current_price = current_price
-            position.last_update_time = datetime.now()
-
-            # Get thresholds (custom or default)
-            if hasattr(position, "custom_thresholds") and position.custom_thresholds:
-                trailing_pct = position.custom_thresholds.get(
-                    "trailing_distance_pct", config["TRAILING_STOP_PCT"]
-                )
-                activation_pct = position.custom_thresholds.get(
-                    "trailing_activation_pct", config["TRAILING_STOP_ACTIVATION"]
-                )
-                min_move_pct = position.custom_thresholds.get(
-                    "min_move_pct", config["TRAILING_STOP_MIN_MOVE"]
-                )
-            else:
-                trailing_pct = config["TRAILING_STOP_PCT"]
-                activation_pct = config["TRAILING_STOP_ACTIVATION"]
-                min_move_pct = config["TRAILING_STOP_MIN_MOVE"]
-
-            # Calculate profit metrics
-            if position.side == "long":
-                position.profit_pct = (
-                    current_price - position.entry_price
-                ) / position.entry_price
-                position.unrealized_pnl = (
-                    current_price - position.entry_price
-                ) * position.quantity
-
-                # Update highest price seen
-                if current_price > position.highest_price:
-                    position.highest_price = current_price
-
-                # Check if trailing should activate using custom thresholds
-                activation_threshold = position.entry_price * (1 + activation_pct)
-                if (
-                    not position.is_trailing_active
-                    and current_price >= activation_threshold
-                ):
-                    position.is_trailing_active = True
-                    self.logger.info(
-                        f"[{symbol}] 🚀 Trailing stop ACTIVATED at ${current_price:.2f} (+{position.profit_pct:.1%})"
-                    )
-                    self.logger.info(
-                        f"[{symbol}] 🎯 Using custom activation: {activation_pct:.1%}"
-                    )
-
-                # Adjust trailing stop if active using custom distance
-                if position.is_trailing_active:
-                    new_trailing_stop = calculate_trailing_stop_price(
-                        position.highest_price, trailing_pct
-                    )
-
-                    # Validate price precision
-                    if not validate_price_precision(
-                        new_trailing_stop, f"{symbol} trailing_stop"
-                    ):
-                        self.logger.warning(
-                            f"[{symbol}] Trailing stop precision issue: {new_trailing_stop}"
-                        )
-                        new_trailing_stop = round_to_cent(new_trailing_stop)
-
-                    # Only move stop up (never down)
-                    if new_trailing_stop > position.trailing_stop_price:
-                        # Check minimum move threshold
-                        move_pct = (
-                            new_trailing_stop - position.trailing_stop_price
-                        ) / position.trailing_stop_price
-                        if move_pct >= min_move_pct:
-                            old_stop = position.trailing_stop_price
-                            position.trailing_stop_price = new_trailing_stop
-
-                            self.logger.info(
-                                f"[{symbol}] 📈 Trailing stop adjusted: ${old_stop:.2f} → ${new_trailing_stop:.2f}"
-                            )
-                            self.logger.info(
-                                f"[{symbol}] 🎯 Custom distance: {trailing_pct:.1%}"
-                            )
-                            self.logger.info(
-                                f"[{symbol}] 💎 Protected profit: {((new_trailing_stop - position.entry_price) / position.entry_price):.1%}"
-                            )
-
-                            # Return update info for order modification
-                            return {
-                                "symbol": symbol,
-                                "action": "update_stop",
-                                "new_stop_price": new_trailing_stop,
-                                "old_stop_price": old_stop,
-                                "profit_protected": (
-                                    (new_trailing_stop - position.entry_price)
-                                    / position.entry_price
-                                ),
-                                "current_profit": position.profit_pct,
-                            }
-
-            elif position.side == "short":
-                # For short positions: profit when price goes DOWN
-                position.profit_pct = (
-                    position.entry_price - current_price
-                ) / position.entry_price
-                position.unrealized_pnl = (
-                    position.entry_price - current_price
-                ) * position.quantity
-
-                # Update lowest price seen (best for short positions)
-                if current_price < position.lowest_price:
-                    position.lowest_price = current_price
-
-                # Check if trailing should activate using custom thresholds
-                # For shorts: activate when price drops enough to show profit
-                activation_threshold = position.entry_price * (1 - activation_pct)
-                if (
-                    not position.is_trailing_active
-                    and current_price <= activation_threshold
-                ):
-                    position.is_trailing_active = True
-                    self.logger.info(
-                        f"[{symbol}] 🚀 SHORT Trailing stop ACTIVATED at ${current_price:.2f} (+{position.profit_pct:.1%})"
-                    )
-                    self.logger.info(
-                        f"[{symbol}] 🎯 Using custom activation: {activation_pct:.1%}"
-                    )
-
-                # Adjust trailing stop if active using custom distance
-                if position.is_trailing_active:
-                    # For shorts: trailing stop is ABOVE the lowest price seen
-                    new_trailing_stop = round_to_cent(
-                        position.lowest_price * (1 + trailing_pct)
-                    )
-
-                    # Validate price precision
-                    if not validate_price_precision(
-                        new_trailing_stop, f"{symbol} short_trailing_stop"
-                    ):
-                        self.logger.warning(
-                            f"[{symbol}] SHORT trailing stop precision issue: {new_trailing_stop}"
-                        )
-                        new_trailing_stop = round_to_cent(new_trailing_stop)
-
-                    # Only move stop down (never up for shorts, to protect more profit)
-                    if new_trailing_stop < position.trailing_stop_price:
-                        # Check minimum move threshold
-                        move_pct = (
-                            position.trailing_stop_price - new_trailing_stop
-                        ) / position.trailing_stop_price
-                        if move_pct >= min_move_pct:
-                            old_stop = position.trailing_stop_price
-                            position.trailing_stop_price = new_trailing_stop
-
-                            self.logger.info(
-                                f"[{symbol}] 📉 SHORT trailing stop adjusted: ${old_stop:.2f} → ${new_trailing_stop:.2f}"
-                            )
-                            self.logger.info(
-                                f"[{symbol}] 🎯 Custom distance: {trailing_pct:.1%}"
-                            )
-                            self.logger.info(
-                                f"[{symbol}] 💎 Protected profit: {((position.entry_price - new_trailing_stop) / position.entry_price):.1%}"
-                            )
-
-                            # Return update info for order modification
-                            return {
-                                "symbol": symbol,
-                                "action": "update_stop",
-                                "new_stop_price": new_trailing_stop,
-                                "old_stop_price": old_stop,
-                                "profit_protected": (
-                                    (position.entry_price - new_trailing_stop)
-                                    / position.entry_price
-                                ),
-                                "current_profit": position.profit_pct,
-                            }
-
-            return None
+            result = self.book.update(
+                self.book.price_vector({symbol: current_price}), time.time()
+            )
+            updates = self._collect_updates(result)
+            return updates[0] if updates else None
 
         except Exception as e:
             self.logger.error(f"[{symbol}] ❌ Failed to update position: {e}")
@@ -376,6 +308,7 @@ class TrailingStopManager:
                 )
 
                 del self.active_positions[symbol]
+                self.book.remove(symbol)
 
                 if symbol in self.stop_orders:
                     del self.stop_orders[symbol]
@@ -393,6 +326,8 @@ class TrailingStopManager:
 
             return {
                 "symbol": symbol,
+                "side": position.side,
+                "quantity": position.quantity,
                 "entry_price": position.entry_price,
                 "current_price": position.current_price,
                 "highest_price": position.highest_price,
@@ -11,6 +11,9 @@ from typing import Dict, Optional
 import numpy as np
 import pandas as pd
 
+from utils.latency import latency
+from utils.metrics import metrics
+
 
 class UnifiedIndicatorService:
     """
@@ -35,7 +38,9 @@ class UnifiedIndicatorService:
 
         # Return cached results if recent (within same bar)
         if cache_key in self._indicator_cache:
+            metrics.inc("indicator_cache_requests_total", result="hit")
             return self._indicator_cache[cache_key]
+        metrics.inc("indicator_cache_requests_total", result="miss")
 
         close = df["close"]
         high = df["high"]
@@ -180,7 +185,8 @@ class UnifiedIndicatorService:
         """
         Get strategy-specific indicator subset from unified calculations
         """
-        unified_result = self.calculate_unified_indicators(df, symbol)
+        with latency.span("indicators"):
+            unified_result = self.calculate_unified_indicators(df, symbol)
 
         if "error" in unified_result:
             return unified_result
@@ -10,8 +10,6 @@ import time
 from datetime import datetime
 from datetime import time as dt_time
 
-import pandas as pd
-
 from config import config, validate_config
 from core.data_manager import DataManager
 from core.order_manager import OrderManager
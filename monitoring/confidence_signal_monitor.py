@@ -5,12 +5,21 @@ CONFIDENCE SIGNAL FLOW MONITOR
 
 Tracks the complete signal flow from confidence monitor to order execution.
 Identifies where signals are getting lost in the pipeline.
+Engine and order activity are read from the event journal (logs/journal).
 """
 
-import os
 import subprocess
+import sys
 import time
+from collections import deque
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.event_journal import JournalReader, describe_event, read_events
+
+JOURNAL_DIR = Path("logs") / "journal"
 
 
 def get_latest_log_content(log_file, lines=50):
@@ -55,6 +64,18 @@ def get_recent_entries(lines, max_entries=5):
     return recent[-max_entries:]
 
 
+def track_event(event, engine_events, order_events, counts):
+    """Route a journal event to the engine or order section and count it"""
+    if event["type"] in ("signal", "rejection"):
+        engine_events.append(event)
+        if event["type"] == "signal":
+            counts["signal"] += 1
+    elif event["type"] in ("order", "fill"):
+        order_events.append(event)
+        if event["type"] == "order" and event["purpose"] == "entry":
+            counts["entry_order"] += 1
+
+
 def main():
     print("🧠 CONFIDENCE SIGNAL FLOW MONITOR")
     print("=" * 70)
@@ -63,6 +84,15 @@ def main():
 
     today = datetime.now().strftime("%Y%m%d")
 
+    # Seed from today's journal, then poll only newly appended events
+    engine_events = deque(maxlen=10)
+    order_events = deque(maxlen=10)
+    counts = {"signal": 0, "entry_order": 0}
+    start_of_day = datetime.combine(datetime.now().date(), datetime.min.time())
+    for event in read_events(JOURNAL_DIR, since=start_of_day.timestamp()):
+        track_event(event, engine_events, order_events, counts)
+    reader = JournalReader(JOURNAL_DIR, from_end=True)
+
     while True:
         print(f"\n⏰ {datetime.now().strftime('%H:%M:%S')} - Signal Flow Analysis")
         print("-" * 70)
@@ -120,53 +150,31 @@ def main():
         else:
             print("   ⚠️ No real-time confidence log found")
 
+        # Engine and order activity come from the event journal
+        for event in reader.poll():
+            track_event(event, engine_events, order_events, counts)
+
         # 3. INTRADAY ENGINE - Signal Reception & Processing
-        engine_logs = get_latest_log_content(
-            f"intraday_intraday_engine_{today}.log", 100
-        )
         print("\n🔄 INTRADAY ENGINE (Signal Reception):")
 
-        if engine_logs:
-            recent_engine = get_recent_entries(engine_logs, 4)
-            engine_signal_count = count_signals_in_timeframe(
-                engine_logs, ["signal", "cycle", "scanning"]
-            )
-
-            for line in recent_engine:
-                if "SIGNAL" in line.upper():
-                    print(f"   ⚡ {line}")
-                elif "CYCLE" in line.upper():
-                    print(f"   🔄 {line}")
-                elif "SCANNING" in line.upper():
-                    print(f"   🔍 {line}")
-                else:
-                    print(f"   📊 {line}")
-
-            print(f"   🔄 Engine signal events: {engine_signal_count}")
+        if engine_events:
+            for event in list(engine_events)[-4:]:
+                icon = "⚡" if event["type"] == "signal" else "🚫"
+                print(f"   {icon} {describe_event(event)}")
         else:
-            print("   ❌ No engine log found")
+            print("   ⏳ No engine signals journaled today")
+        print(f"   🔄 Engine signal events: {counts['signal']}")
 
         # 4. ORDER MANAGER - Trade Execution
-        order_logs = get_latest_log_content(f"intraday_order_manager_{today}.log", 100)
         print("\n💰 ORDER MANAGER (Trade Execution):")
 
-        if order_logs:
-            recent_orders = get_recent_entries(order_logs, 4)
-            order_count = count_signals_in_timeframe(
-                order_logs, ["buy", "sell", "order", "execution"]
-            )
-
-            for line in recent_orders:
-                if "BUY" in line.upper() or "SELL" in line.upper():
-                    print(f"   🚀 {line}")
-                elif "ORDER" in line.upper():
-                    print(f"   📋 {line}")
-                else:
-                    print(f"   💼 {line}")
-
-            print(f"   💰 Orders placed: {order_count}")
+        if order_events:
+            for event in list(order_events)[-4:]:
+                icon = "📋" if event["type"] == "order" else "🚀"
+                print(f"   {icon} {describe_event(event)}")
         else:
-            print("   ❌ No order manager log found")
+            print("   💤 No orders journaled today")
+        print(f"   💰 Orders placed: {counts['entry_order']}")
 
         # 5. SIGNAL FLOW ANALYSIS
         print("\n🔗 SIGNAL FLOW HEALTH CHECK:")
@@ -175,16 +183,8 @@ def main():
             conf_signals = count_signals_in_timeframe(
                 conf_logs, ["signal", "buy", "sell"]
             )
-            engine_signals = (
-                count_signals_in_timeframe(engine_logs, ["signal"])
-                if engine_logs
-                else 0
-            )
-            orders_placed = (
-                count_signals_in_timeframe(order_logs, ["buy", "sell"])
-                if order_logs
-                else 0
-            )
+            engine_signals = counts["signal"]
+            orders_placed = counts["entry_order"]
 
             print(f"   1️⃣ Confidence Signals: {conf_signals}")
             print(f"   2️⃣ Engine Received: {engine_signals}")
@@ -192,7 +192,9 @@ def main():
 
             # Diagnose issues
             if conf_signals > 0 and engine_signals == 0:
-                print("   ⚠️ ISSUE: Signals not reaching engine - Check signal routing!")
+                print(
+                    "   ⚠️ ISSUE: Signals not reaching engine - Check signal routing!"
+                )
             elif engine_signals > 0 and orders_placed == 0:
                 print("   ⚠️ ISSUE: Engine receiving signals but not placing orders!")
             elif conf_signals == 0:
@@ -4,12 +4,21 @@ ENHANCED SIGNAL MONITOR
 =======================
 
 Monitor live trading signals, cycles, and actions with detailed output.
+Trading activity is read from the engine's event journal (logs/journal).
 """
 
-import os
 import subprocess
+import sys
 import time
+from collections import deque
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.event_journal import EVENT_SCHEMA, JournalReader, describe_event, read_events
+
+JOURNAL_DIR = Path("logs") / "journal"
 
 
 def get_latest_log_content(log_file, lines=50):
@@ -33,43 +42,13 @@ def get_latest_log_content(log_file, lines=50):
         return []
 
 
-def filter_trading_signals(lines):
-    """Filter lines for actual trading signals and actions"""
-    signal_keywords = [
-        "SIGNAL",
-        "BUY",
-        "SELL",
-        "ORDER",
-        "EXECUTION",
-        "FILLED",
-        "CYCLE",
-        "SCANNING",
-        "GENERATED",
-        "PLACED",
-        "CANCELLED",
-        "PROFIT",
-        "STOP",
-        "TRAIL",
-        "POSITION",
-        "ENTRY",
-        "EXIT",
-    ]
-
-    trading_lines = []
-    for line in lines:
-        if any(keyword in line.upper() for keyword in signal_keywords):
-            # Only show recent entries (from today)
-            if (
-                "10:" in line
-                or "11:" in line
-                or "12:" in line
-                or "13:" in line
-                or "14:" in line
-                or "15:" in line
-            ):
-                trading_lines.append(line.strip())
-
-    return trading_lines[-10:]  # Return last 10 trading-related entries
+def print_events(title, empty_message, events, limit=5):
+    print(title)
+    if events:
+        for event in list(events)[-limit:]:
+            print(f"   {describe_event(event)}")
+    else:
+        print(f"   {empty_message}")
 
 
 def main():
@@ -78,78 +57,41 @@ def main():
 
     today = datetime.now().strftime("%Y%m%d")
 
-    # Track last seen entries to show only new ones
-    last_engine_entry = ""
-    last_order_entry = ""
+    # Today's journal so far, then only events appended since the last poll
+    recent = {kind: deque(maxlen=10) for kind in EVENT_SCHEMA}
+    start_of_day = datetime.combine(datetime.now().date(), datetime.min.time())
+    for event in read_events(JOURNAL_DIR, since=start_of_day.timestamp()):
+        recent[event["type"]].append(event)
+    reader = JournalReader(JOURNAL_DIR, from_end=True)
 
     while True:
+        for event in reader.poll():
+            if event["type"] in recent:
+                recent[event["type"]].append(event)
+
         print(f"\n⏰ {datetime.now().strftime('%H:%M:%S')} - Live Trading Activity")
         print("-" * 70)
 
-        # Check intraday engine for trading cycles and signals
-        engine_logs = get_latest_log_content(
-            f"intraday_intraday_engine_{today}.log", 100
+        print_events(
+            "🎯 TRADING SIGNALS:",
+            "⏳ No recent trading signals detected",
+            recent["signal"],
         )
-        trading_signals = filter_trading_signals(engine_logs)
-
-        if trading_signals:
-            print("🎯 TRADING SIGNALS & CYCLES:")
-            for line in trading_signals[-5:]:  # Show last 5 signal-related entries
-                if "CYCLE" in line.upper():
-                    print(f"   🔄 {line}")
-                elif "SIGNAL" in line.upper():
-                    print(f"   ⚡ {line}")
-                elif "SCANNING" in line.upper():
-                    print(f"   🔍 {line}")
-                else:
-                    print(f"   📊 {line}")
-        else:
-            print("🎯 TRADING SIGNALS & CYCLES:")
-            print("   ⏳ No recent trading signals detected")
-
-        # Check order manager for actual trades
-        order_logs = get_latest_log_content(f"intraday_order_manager_{today}.log", 50)
-        order_signals = filter_trading_signals(order_logs)
-
-        if order_signals:
-            print("\n� ORDERS & EXECUTIONS:")
-            for line in order_signals[-5:]:  # Show last 5 order-related entries
-                if "BUY" in line.upper() or "SELL" in line.upper():
-                    print(f"   🚀 {line}")
-                elif "ORDER" in line.upper():
-                    print(f"   📋 {line}")
-                elif "EXECUTION" in line.upper() or "FILLED" in line.upper():
-                    print(f"   ✅ {line}")
-                else:
-                    print(f"   � {line}")
-        else:
-            print("\n💰 ORDERS & EXECUTIONS:")
-            print("   💤 No recent order activity")
-
-        # Check risk manager for stops and trailing
-        risk_logs = get_latest_log_content(f"intraday_risk_manager_{today}.log", 30)
-        risk_signals = filter_trading_signals(risk_logs)
-
-        if risk_signals:
-            print("\n🛡️ RISK MANAGEMENT:")
-            for line in risk_signals[-3:]:  # Show last 3 risk-related entries
-                if "STOP" in line.upper():
-                    print(f"   🛑 {line}")
-                elif "TRAIL" in line.upper():
-                    print(f"   📈 {line}")
-                else:
-                    print(f"   🔒 {line}")
-
-        # Check trailing stop manager
-        trail_logs = get_latest_log_content(
-            f"intraday_trailing_stop_manager_{today}.log", 30
+        print_events("\n🚫 REJECTIONS:", "✅ No recent rejections", recent["rejection"])
+        print_events(
+            "\n💰 ORDERS & EXECUTIONS:",
+            "💤 No recent order activity",
+            sorted(
+                list(recent["order"]) + list(recent["fill"]), key=lambda e: e["seq"]
+            ),
+        )
+        print_events("\n🚪 EXITS:", "💤 No exits yet today", recent["exit"], limit=3)
+        print_events(
+            "\n📉 STOP MOVES:",
+            "💤 No stop moves yet today",
+            recent["stop_move"],
+            limit=3,
         )
-        trail_signals = filter_trading_signals(trail_logs)
-
-        if trail_signals:
-            print("\n� TRAILING STOPS:")
-            for line in trail_signals[-3:]:
-                print(f"   📉 {line}")
 
         # Show current bot status
         launcher_logs = get_latest_log_content(
@@ -161,7 +103,7 @@ def main():
             )
 
         print("\n" + "=" * 70)
-        print("💡 Watching for: SIGNALS, ORDERS, EXECUTIONS, STOPS, TRAILS")
+        print("💡 Watching for: SIGNALS, REJECTIONS, ORDERS, FILLS, EXITS, STOP MOVES")
         print("🔄 Updates every 8 seconds - Press Ctrl+C to stop")
 
         time.sleep(8)  # Update every 8 seconds for more responsive monitoring
@@ -29,6 +29,11 @@ class ContinuousPositionMonitor:
         self.logger = self._setup_logger()
         self.position_highs = {}  # Track highest profits for trailing
         self.position_lows = {}  # Track lowest prices for short trailing
+        # Broker-native protection: place one trailing stop per position and
+        # let the broker trail it instead of cancel/replacing on every new high
+        self.native_protection = (
+            config.get("ORDER_PROTECTION_MODE", "managed") != "managed"
+        )
 
     def _setup_logger(self):
         logger = logging.getLogger("position_monitor")
@@ -88,6 +93,42 @@ class ContinuousPositionMonitor:
             self.logger.error(f"Error fetching positions: {e}")
             return []
 
+    def get_protective_orders(self, symbol):
+        """Get open broker-held exit orders (stops, trailing stops, targets) for a symbol"""
+        orders = self.api.list_orders(status="open", symbols=[symbol])
+        return [
+            order
+            for order in orders
+            if order.order_type in ("trailing_stop", "stop", "stop_limit", "limit")
+        ]
+
+    def ensure_native_trailing_stop(self, position):
+        """Place a broker-native trailing stop once if the position has no protection"""
+        symbol = position["symbol"]
+
+        try:
+            if self.get_protective_orders(symbol):
+                return False  # Broker already trails/holds the stop
+
+            thresholds = get_stock_thresholds(symbol)
+            trail_percent = round(thresholds["trailing_distance_pct"] * 100, 2)
+            order = self.api.submit_order(
+                symbol=symbol,
+                qty=position["qty"],
+                side="sell" if position["side"] == "long" else "buy",
+                type="trailing_stop",
+                trail_percent=trail_percent,
+                time_in_force="gtc",
+            )
+            self.logger.info(
+                f"[{symbol}] Native trailing stop placed at {trail_percent:.2f}% - Order: {order.id}"
+            )
+            return True
+
+        except Exception as e:
+            self.logger.error(f"[{symbol}] Failed to place native trailing stop: {e}")
+            return False
+
     def update_trailing_stops(self, position):
         """Update trailing stops based on current profit levels"""
         symbol = position["symbol"]
@@ -95,6 +136,12 @@ class ContinuousPositionMonitor:
         current_profit = position["profit_pct"]
         current_price = position["current_price"]
 
+        if self.native_protection:
+            # Track highs for reporting only - the broker moves the stop
+            if current_profit > self.position_highs.get(symbol, float("-inf")):
+                self.position_highs[symbol] = current_profit
+            return self.ensure_native_trailing_stop(position)
+
         # Initialize tracking if first time seeing this position
         if symbol not in self.position_highs:
             self.position_highs[symbol] = current_profit
@@ -190,6 +237,15 @@ class ContinuousPositionMonitor:
 
         if current_profit >= take_profit_target:
             try:
+                if self.native_protection:
+                    protective_orders = self.get_protective_orders(symbol)
+                    if any(o.order_type == "limit" for o in protective_orders):
+                        return False  # Broker-held target leg will fill
+
+                    # Release shares held by broker-native protective orders
+                    for order in protective_orders:
+                        self.api.cancel_order(order.id)
+
                 # Close the position
                 if side == "long":
                     order = self.api.submit_order(
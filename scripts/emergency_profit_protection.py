@@ -17,6 +17,7 @@ from stock_specific_config import get_stock_thresholds
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import config
+from core.emergency_executor import EmergencyExecutor
 
 
 class EmergencyProfitProtection:
@@ -113,70 +114,73 @@ class EmergencyProfitProtection:
 
         return protection_levels
 
-    def create_protection_orders(self, protection_levels):
-        """Create protective orders for a position"""
+    def build_protection_requests(self, protection_levels):
+        """Build the protective order requests (submit_order kwargs) for a position"""
         symbol = protection_levels["symbol"]
         side = protection_levels["side"]
         qty = protection_levels["qty"]
+        exit_side = "sell" if side == "long" else "buy"
+        protection_mode = config.get("ORDER_PROTECTION_MODE", "managed")
 
+        if protection_mode == "trailing":
+            # One native trailing stop at the stock-specific distance
+            thresholds = get_stock_thresholds(symbol)
+            return [
+                {
+                    "symbol": symbol,
+                    "qty": qty,
+                    "side": exit_side,
+                    "type": "trailing_stop",
+                    "trail_percent": round(
+                        thresholds["trailing_distance_pct"] * 100, 2
+                    ),
+                    "time_in_force": "gtc",
+                }
+            ]
+
+        if protection_mode == "bracket":
+            # Profit-lock stop at 75% of the current gain
+            stop_price = protection_levels["trailing_stop_price"]
+        else:
+            # Where a 0.5% (of entry) trail from the current price would sit
+            trail = protection_levels["entry_price"] * 0.005
+            current = protection_levels["current_price"]
+            stop_price = current - trail if side == "long" else current + trail
+
+        # One OCO order: stop + take profit on the same shares, the broker
+        # cancels the other leg when one fills. Two separate exit orders for
+        # the full qty would have the second rejected for insufficient qty -
+        # and whichever lost that race, the stop could be the one missing.
+        return [
+            {
+                "symbol": symbol,
+                "qty": qty,
+                "side": exit_side,
+                "type": "limit",
+                "time_in_force": "gtc",
+                "order_class": "oco",
+                "take_profit": {
+                    "limit_price": round(protection_levels["take_profit_price"], 2)
+                },
+                "stop_loss": {"stop_price": round(stop_price, 2)},
+            }
+        ]
+
+    def create_protection_orders(self, protection_levels):
+        """Create protective orders for a position"""
+        symbol = protection_levels["symbol"]
         orders_created = []
 
         try:
             # Cancel any existing orders for this symbol
-            existing_orders = self.api.list_orders(status="open", symbols=symbol)
+            existing_orders = self.api.list_orders(status="open", symbols=[symbol])
             for order in existing_orders:
                 self.api.cancel_order(order.id)
                 self.logger.info(f"[{symbol}] Cancelled existing order: {order.id}")
 
-            if side == "long":
-                # Create trailing stop for long position
-                trailing_order = self.api.submit_order(
-                    symbol=symbol,
-                    qty=qty,
-                    side="sell",
-                    type="trailing_stop",
-                    trail_price=round(
-                        protection_levels["entry_price"] * 0.005, 2
-                    ),  # 0.5% trail
-                    time_in_force="gtc",
-                )
-                orders_created.append(("trailing_stop", trailing_order.id))
-
-                # Create take profit order
-                take_profit_order = self.api.submit_order(
-                    symbol=symbol,
-                    qty=qty,
-                    side="sell",
-                    type="limit",
-                    limit_price=round(protection_levels["take_profit_price"], 2),
-                    time_in_force="gtc",
-                )
-                orders_created.append(("take_profit", take_profit_order.id))
-
-            else:  # short position
-                # Create trailing stop for short position (buy to cover)
-                trailing_order = self.api.submit_order(
-                    symbol=symbol,
-                    qty=qty,
-                    side="buy",
-                    type="trailing_stop",
-                    trail_price=round(
-                        protection_levels["entry_price"] * 0.005, 2
-                    ),  # 0.5% trail
-                    time_in_force="gtc",
-                )
-                orders_created.append(("trailing_stop", trailing_order.id))
-
-                # Create take profit order (buy to cover)
-                take_profit_order = self.api.submit_order(
-                    symbol=symbol,
-                    qty=qty,
-                    side="buy",
-                    type="limit",
-                    limit_price=round(protection_levels["take_profit_price"], 2),
-                    time_in_force="gtc",
-                )
-                orders_created.append(("take_profit", take_profit_order.id))
+            for request in self.build_protection_requests(protection_levels):
+                order = self.api.submit_order(**request)
+                orders_created.append((request["type"], order.id))
 
             self.logger.info(
                 f"[{symbol}] Created {len(orders_created)} protection orders"
@@ -185,7 +189,7 @@ class EmergencyProfitProtection:
 
         except Exception as e:
             self.logger.error(f"[{symbol}] Failed to create protection orders: {e}")
-            return []
+            return orders_created
 
     def protect_all_positions(self):
         """Main function to protect all profitable positions"""
@@ -198,6 +202,8 @@ class EmergencyProfitProtection:
 
         protection_summary = []
 
+        protected_levels = []
+
         for position in positions:
             if float(position.unrealized_pl) > 0:  # Only protect profitable positions
                 self.logger.info(
@@ -222,22 +228,49 @@ class EmergencyProfitProtection:
                     f"[{position.symbol}] Unrealized P&L: ${protection_levels['unrealized_pl']:.2f}"
                 )
 
-                orders = self.create_protection_orders(protection_levels)
-
-                protection_summary.append(
-                    {
-                        "symbol": position.symbol,
-                        "side": protection_levels["side"],
-                        "profit_pct": protection_levels["profit_pct"],
-                        "unrealized_pl": protection_levels["unrealized_pl"],
-                        "orders_created": len(orders),
-                        "protection_active": len(orders) > 0,
-                    }
-                )
+                protected_levels.append(protection_levels)
+
+        # Cancel existing orders for the protected symbols in one pass, then
+        # submit every protection order concurrently
+        executor = EmergencyExecutor(self.api)
+        symbols = [levels["symbol"] for levels in protected_levels]
+        report = None
+        if protected_levels:
+            executor.cancel_all_orders(symbols=symbols)
+            executor.wait_for_no_open_orders(symbols=symbols)
+            requests = [
+                request
+                for levels in protected_levels
+                for request in self.build_protection_requests(levels)
+            ]
+            report = executor.submit_all(
+                requests,
+                confirm="accepted",
+                timeout=config.get("EMERGENCY_CONFIRM_TIMEOUT", 30),
+            )
 
-                self.logger.info(
-                    f"[{position.symbol}] ✅ Protection {'ACTIVE' if orders else 'FAILED'}"
-                )
+        for levels in protected_levels:
+            symbol = levels["symbol"]
+            confirmed = [
+                result
+                for result in report["results"].values()
+                if result["symbol"] == symbol and result["confirmed"]
+            ]
+
+            protection_summary.append(
+                {
+                    "symbol": symbol,
+                    "side": levels["side"],
+                    "profit_pct": levels["profit_pct"],
+                    "unrealized_pl": levels["unrealized_pl"],
+                    "orders_created": len(confirmed),
+                    "protection_active": len(confirmed) > 0,
+                }
+            )
+
+            self.logger.info(
+                f"[{symbol}] ✅ Protection {'ACTIVE' if confirmed else 'FAILED'}"
+            )
 
         # Summary report
         self.logger.info(f"\n🎯 PROFIT PROTECTION SUMMARY")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Fake broker end-to-end benchmark
+Runs the real engine - DataManager, OrderManager, the Alpaca REST client and
+the trade update stream - against the local fake broker (utils/fake_broker.py)
+and reports loop latency, symbol throughput, per-endpoint API latency and
+what the broker saw. Each loop iteration does what the live loop does during
+market hours, then the synthetic market moves one minute forward.
+
+Usage:
+    python scripts/fake_broker_e2e.py
+    python scripts/fake_broker_e2e.py --symbols 50 --cycles 60 --latency-ms 40
+    python scripts/fake_broker_e2e.py --rate-limit 0   # no 429 back-off
+    python scripts/fake_broker_e2e.py --serve   # only run the broker
+
+With --serve, point a normal bot run at the printed URLs (ALPACA_BASE_URL
+and APCA_API_DATA_URL) and press Ctrl+C to stop. Engine logs, journal and
+snapshots of a benchmark run go to a temporary directory.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# The fake broker accepts any key; config validation only needs one to be set
+os.environ.setdefault("ALPACA_API_KEY", "fake-broker-key")
+os.environ.setdefault("ALPACA_SECRET_KEY", "fake-broker-secret")
+
+from config import config
+from utils.api_client import api_latency
+from utils.fake_broker import FakeBroker
+from utils.latency import latency
+from utils.synthetic_market import SESSION_MINUTES, SyntheticMarket
+
+
+def point_at(broker: FakeBroker):
+    """Send the SDK, the config and everything built from it to the broker"""
+    os.environ.update(broker.environment())
+    config._config["ALPACA_BASE_URL"] = broker.url
+    config.ALPACA_BASE_URL = broker.url
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def describe(samples: list) -> str:
+    return (
+        f"mean {statistics.mean(samples) * 1000:8.1f} ms   "
+        f"p50 {percentile(samples, 50) * 1000:8.1f} ms   "
+        f"p95 {percentile(samples, 95) * 1000:8.1f} ms   "
+        f"max {max(samples) * 1000:8.1f} ms"
+    )
+
+
+def loop_iteration(engine):
+    """One market-hours pass of IntradayEngine.start() without the sleep"""
+    engine.check_position_stop_losses()
+    engine.data_manager.ensure_connection()
+    engine.order_manager.maybe_reconcile_orders()
+    engine.risk_manager.maybe_reconcile(engine.order_manager)
+    engine._run_profiled_cycle()
+
+
+def run_engine(broker: FakeBroker, cycles: int) -> int:
+    from core.intraday_engine import IntradayEngine
+
+    config.INTRADAY_WATCHLIST = list(broker.market.symbols)
+    started = time.perf_counter()
+    engine = IntradayEngine(bypass_market_hours=True)
+    print(f"engine init:   {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    deadline = time.monotonic() + 5
+    while not engine.order_manager.trade_updates_connected():
+        if time.monotonic() > deadline:
+            print("trade update stream did not connect; fills will be polled")
+            break
+        time.sleep(0.05)
+
+    api_latency.reset()
+    latency.reset()
+    samples, processed = [], 0
+    for _ in range(cycles):
+        started = time.perf_counter()
+        loop_iteration(engine)
+        samples.append(time.perf_counter() - started)
+        processed += (engine.cycle_scheduler.last_cycle or {}).get("processed", 0)
+        if not broker.advance():
+            break
+    broker.settle()
+
+    total = sum(samples)
+    print(f"loop ({len(samples)} iterations): {describe(samples)}")
+    print(
+        f"throughput:    {processed / total:.1f} symbols/s "
+        f"({processed} symbol passes in {total:.2f} s)"
+    )
+    print(f"positions:     {len(engine.active_positions)} open in the engine")
+
+    print("\nAPI latency by endpoint:")
+    for endpoint, summary in api_latency.summary().items():
+        if summary["count"]:
+            print(
+                f"  {endpoint:<30} n={summary['count']:<5} "
+                f"p50 {summary['p50_ms']:8.1f} ms   p99 {summary['p99_ms']:8.1f} ms"
+            )
+    print("\nEngine stages:")
+    for stage, summary in latency.summary().items():
+        if summary["count"]:
+            print(
+                f"  {stage:<30} n={summary['count']:<5} "
+                f"p50 {summary['p50_ms']:8.1f} ms   p99 {summary['p99_ms']:8.1f} ms"
+            )
+    print("\nBroker:")
+    for name, value in sorted(broker.stats().items()):
+        print(f"  {name:<30} {value}")
+
+    engine.order_manager.trade_updates.stop()
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end run on a fake broker")
+    parser.add_argument("--symbols", type=int, default=10)
+    parser.add_argument("--cycles", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--port", type=int, help="default: a free port (FAKE_BROKER_PORT with --serve)"
+    )
+    parser.add_argument("--latency-ms", type=float)
+    parser.add_argument("--jitter-ms", type=float)
+    parser.add_argument("--rate-limit", type=int, help="requests/min, 0 = off")
+    parser.add_argument("--partial-fill", type=float, help="probability")
+    parser.add_argument("--reject", type=float, help="probability")
+    parser.add_argument("--serve", action="store_true", help="only run the broker")
+    args = parser.parse_args(argv)
+
+    market = SyntheticMarket(args.symbols, days=2, seed=args.seed)
+    market.rewind(SESSION_MINUTES + 60)  # an hour into the last session
+    broker = FakeBroker(
+        market,
+        port=args.port if args.port is not None else (None if args.serve else 0),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        partial_fill_probability=args.partial_fill,
+        reject_probability=args.reject,
+        seed=args.seed,
+    ).start()
+
+    try:
+        if args.serve:
+            for name, value in broker.environment().items():
+                print(f"{name}={value}")
+            while True:
+                time.sleep(60)
+                broker.advance()
+        point_at(broker)
+        os.chdir(tempfile.mkdtemp(prefix="fake_broker_e2e_"))
+        return run_engine(broker, args.cycles)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        broker.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
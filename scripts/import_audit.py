@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Import cost audit
+Runs each entry point's imports in a fresh interpreter under
+`python -X importtime` and reports where cold-start time goes: total, the
+most expensive modules, and cost per top-level package.
+
+Usage:
+    python scripts/import_audit.py                    # all entry points
+    python scripts/import_audit.py core.intraday_engine --top 15
+    python scripts/import_audit.py --budget core.intraday_engine=1.5
+    python scripts/import_audit.py --json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Modules imported (not run) for each entry point
+ENTRY_POINTS = [
+    "main",
+    "launcher",
+    "core.intraday_engine",
+    "monitoring.confidence_signal_monitor",
+    "monitoring.live_dashboard",
+    "monitoring.real_time_monitor",
+    "monitoring.realtime_status_monitor",
+    "monitoring.signal_monitor",
+    "monitoring.system_status",
+]
+
+# Optional heavy dependencies the trading engine must not load at import
+HEAVY_OPTIONAL_MODULES = (
+    "yfinance",
+    "matplotlib",
+    "seaborn",
+    "plotly",
+    "dash",
+    "scipy",
+    "sklearn",
+    "streamlit",
+)
+
+_HEAVY_MARKER = "import-audit-heavy:"
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Rows of -X importtime output: module, self/cumulative us, depth"""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append(
+                {
+                    "module": module,
+                    "self_us": int(self_us),
+                    "cumulative_us": int(cumulative_us),
+                    "depth": len(indent) // 2,
+                }
+            )
+    return rows
+
+
+def audit(module: str, python: str = sys.executable) -> Dict:
+    """Import one module in a fresh interpreter and summarize the cost"""
+    probe = (
+        f"import sys; import {module}; print({_HEAVY_MARKER!r} + "
+        f"','.join(m for m in {HEAVY_OPTIONAL_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", probe],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    rows = parse_importtime(proc.stderr)
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else ""
+        return {"module": module, "ok": False, "error": error}
+
+    by_package = defaultdict(int)
+    for row in rows:
+        by_package[row["module"].split(".")[0]] += row["self_us"]
+
+    # Entry points may print at import; only the probe's own line counts
+    heavy = ""
+    for line in proc.stdout.splitlines():
+        if line.startswith(_HEAVY_MARKER):
+            heavy = line[len(_HEAVY_MARKER) :]
+    return {
+        "module": module,
+        "ok": True,
+        "total_s": sum(row["self_us"] for row in rows) / 1e6,
+        "modules": len(rows),
+        "top_modules": sorted(rows, key=lambda r: r["cumulative_us"], reverse=True),
+        "packages": dict(sorted(by_package.items(), key=lambda kv: -kv[1])),
+        "heavy_optional": [m for m in heavy.split(",") if m],
+    }
+
+
+def print_report(result: Dict, top: int):
+    print("=" * 70)
+    if not result["ok"]:
+        print(f"{result['module']}: import FAILED - {result['error']}")
+        return
+    print(f"{result['module']}: {result['total_s']:.3f}s, {result['modules']} modules")
+    if result["heavy_optional"]:
+        print(f"  heavy optional deps loaded: {', '.join(result['heavy_optional'])}")
+
+    print("  top modules (cumulative):")
+    for row in result["top_modules"][:top]:
+        print(f"    {row['cumulative_us'] / 1000:9.1f} ms  {row['module']}")
+    print("  by package (self time):")
+    for package, self_us in list(result["packages"].items())[:top]:
+        print(f"    {self_us / 1000:9.1f} ms  {package}")
+
+
+def _parse_budgets(values: List[str]) -> Dict[str, float]:
+    budgets = {}
+    for value in values:
+        module, _, seconds = value.partition("=")
+        budgets[module] = float(seconds)
+    return budgets
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-entry-point import cost audit")
+    parser.add_argument("modules", nargs="*", help="modules to audit (default: all)")
+    parser.add_argument("--top", type=int, default=10, help="rows per section")
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="MODULE=SECONDS",
+        help="fail if MODULE takes longer to import",
+    )
+    parser.add_argument("--json", action="store_true", help="machine readable output")
+    args = parser.parse_args(argv)
+
+    budgets = _parse_budgets(args.budget)
+    modules = args.modules or list(dict.fromkeys(ENTRY_POINTS + list(budgets)))
+    results = [audit(module) for module in modules]
+
+    if args.json:
+        for result in results:
+            if result["ok"]:
+                result["top_modules"] = result["top_modules"][: args.top]
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print_report(result, args.top)
+
+    over_budget = [
+        r["module"]
+        for r in results
+        if r["module"] in budgets
+        and (not r["ok"] or r["total_s"] > budgets[r["module"]])
+    ]
+    if over_budget:
+        print(f"Import budget exceeded: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
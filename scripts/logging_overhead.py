@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Logging overhead benchmark
+Times a simulated trading cycle (the per-symbol INFO lines the engine logs
+for a watchlist) with logging off, with synchronous file/console handlers,
+and with the queued backend with and without call-site rate limiting. The
+queued modes also report how long the listener takes to catch up afterwards.
+Log files go to a temporary directory and console output to /dev/null.
+
+Usage:
+    python scripts/logging_overhead.py
+    python scripts/logging_overhead.py --cycles 200 --symbols 50
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from config import config
+from utils import logger as log_backend
+
+MODES = {
+    "off": None,
+    "sync": {"LOG_ASYNC": False},
+    "queued": {"LOG_ASYNC": True, "LOG_RATE_LIMIT_ENABLED": False},
+    "queued+limited": {"LOG_ASYNC": True, "LOG_RATE_LIMIT_ENABLED": True},
+}
+
+
+def trading_cycle(logger, symbols):
+    """The engine's per-symbol log lines for one cycle"""
+    for symbol in symbols:
+        logger.info("🔍 SYMBOL PROCESSING: %s - Starting analysis...", symbol)
+        logger.info("📊 Getting market data for %s...", symbol)
+        logger.info("✅ Got %d bars of data for %s", 100, symbol)
+        logger.info(
+            "🕒 %s latest bar: %s | now: %s | age: %.0fs | last3: %s",
+            symbol,
+            "2024-01-02 15:59:00+00:00",
+            "2024-01-02 16:00:03+00:00",
+            63.0,
+            ["15:57", "15:58", "15:59"],
+        )
+        logger.info("🎯 Generating signals for %s...", symbol)
+        logger.info("📈 %s: Generated %d signals in %.2fs", symbol, 0, 0.012)
+        logger.info("📊 No signals generated for %s", symbol)
+
+
+def run_mode(mode, cycles, symbols):
+    overrides = MODES[mode] or {}
+    saved = {key: config.get(key) for key in overrides}
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    try:
+        logger = log_backend.setup_logger(f"bench_{mode.replace('+', '_')}")
+        if MODES[mode] is None:
+            logger.disabled = True
+        samples = []
+        for _ in range(cycles):
+            started = time.perf_counter()
+            trading_cycle(logger, symbols)
+            samples.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        log_backend.flush_logging(timeout=60)
+        drain = time.perf_counter() - started
+        for handler in logger.handlers + log_backend._router.routes.pop(
+            logger.name, []
+        ):
+            handler.close()
+        logger.handlers = []
+        return samples, drain
+    finally:
+        for key, value in saved.items():
+            setattr(config, key, value)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Loop time with logging on vs off")
+    parser.add_argument("--cycles", type=int, default=100)
+    parser.add_argument("--symbols", type=int, default=20)
+    args = parser.parse_args(argv)
+    symbols = [f"SYM{i}" for i in range(args.symbols)]
+
+    stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as log_dir, open(os.devnull, "w") as devnull:
+        cwd = os.getcwd()
+        os.chdir(log_dir)
+        sys.stdout = devnull
+        results = {}
+        try:
+            for mode in MODES:
+                results[mode] = run_mode(mode, args.cycles, symbols)
+        finally:
+            sys.stdout = stdout
+            os.chdir(cwd)
+
+    baseline = statistics.mean(results["off"][0])
+    print(
+        f"{args.cycles} cycles x {args.symbols} symbols "
+        f"({7 * args.symbols} log calls per cycle)"
+    )
+    for mode, (samples, drain) in results.items():
+        mean = statistics.mean(samples)
+        p99 = sorted(samples)[int(0.99 * (len(samples) - 1))]
+        drained = f"   drain {drain * 1000:7.1f} ms" if MODES[mode] else ""
+        print(
+            f"  {mode:15s} mean {mean * 1000:7.3f} ms   p99 {p99 * 1000:7.3f} ms   "
+            f"x{mean / baseline:6.1f} vs off{drained}"
+        )
+    logging.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
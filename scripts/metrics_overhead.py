@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Metrics overhead benchmark
+Measures what the metrics layer costs the 1 Hz trading loop: the per-call
+price of the instrumented API client, and the time of a simulated loop
+iteration with the metrics endpoint off versus on while it is being scraped.
+
+Usage:
+    python scripts/metrics_overhead.py
+    python scripts/metrics_overhead.py --iterations 2000 --scrape-hz 20
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.api_client import InstrumentedREST
+from utils.latency import latency
+from utils.metrics import MetricsServer, metrics
+
+# Work per simulated loop iteration: API calls and stage spans, roughly what
+# one engine loop does for a handful of symbols
+CALLS_PER_ITERATION = 20
+SPANS_PER_ITERATION = 20
+
+
+class _NullREST:
+    """Stand-in for tradeapi.REST whose calls do nothing"""
+
+    def get_latest_trades(self, symbols):
+        return {}
+
+    def list_positions(self):
+        return []
+
+
+def per_call_overhead(calls: int) -> float:
+    """Extra microseconds per API call added by InstrumentedREST"""
+    raw, wrapped = _NullREST(), InstrumentedREST(_NullREST())
+
+    def run(api) -> float:
+        started = time.perf_counter()
+        for _ in range(calls):
+            api.list_positions()
+        return time.perf_counter() - started
+
+    run(wrapped)  # warm the wrapper cache
+    return (min(run(wrapped) for _ in range(3)) - min(run(raw) for _ in range(3))) / (
+        calls / 1e6
+    )
+
+
+def loop_iteration(api):
+    for _ in range(CALLS_PER_ITERATION):
+        api.list_positions()
+    for i in range(SPANS_PER_ITERATION):
+        with latency.span(f"bench.stage{i % 5}"):
+            pass
+
+
+def time_loop(iterations: int, api) -> list:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        loop_iteration(api)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _scrape(url: str, hz: float, stop: threading.Event, scrapes: list):
+    while not stop.wait(1.0 / hz):
+        with urllib.request.urlopen(url) as response:
+            response.read()
+        scrapes.append(1)
+
+
+def describe(samples: list) -> str:
+    ordered = sorted(samples)
+    p99 = ordered[int(0.99 * (len(ordered) - 1))]
+    return (
+        f"mean {statistics.mean(samples) * 1e6:8.1f} us   "
+        f"p99 {p99 * 1e6:8.1f} us   "
+        f"({statistics.mean(samples) * 100:.4f}% of a 1 s loop)"
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Metrics overhead on the loop")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--scrape-hz", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    print(f"InstrumentedREST: +{per_call_overhead(20000):.2f} us per call")
+
+    raw = _NullREST()
+    baseline = time_loop(args.iterations, raw)
+    print(f"loop, metrics off:          {describe(baseline)}")
+
+    instrumented = InstrumentedREST(_NullREST())
+    unscraped = time_loop(args.iterations, instrumented)
+    print(f"loop, instrumented:         {describe(unscraped)}")
+
+    server = MetricsServer(metrics, port=0).start()
+    host, port = server.address
+    stop, scrapes = threading.Event(), []
+    scraper = threading.Thread(
+        target=_scrape,
+        args=(f"http://{host}:{port}/metrics", args.scrape_hz, stop, scrapes),
+        daemon=True,
+    )
+    scraper.start()
+    try:
+        scraped = time_loop(args.iterations, instrumented)
+    finally:
+        stop.set()
+        scraper.join()
+        server.stop()
+    print(f"loop, scraped at {args.scrape_hz:g} Hz:    {describe(scraped)}")
+
+    started = time.perf_counter()
+    body = metrics.render()
+    print(
+        f"render: {(time.perf_counter() - started) * 1000:.2f} ms for "
+        f"{len(body.splitlines())} lines ({len(scrapes)} scrapes during the run)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
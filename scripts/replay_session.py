@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+API session replay
+Replays a cassette recorded with API_CASSETTE_MODE="record" (see
+utils/api_cassette.py) through the real engine with no network access, or
+summarises what a cassette holds. Each loop iteration does what the live
+loop does during market hours until the recording is used up.
+
+Usage:
+    python scripts/replay_session.py --info
+    python scripts/replay_session.py logs/cassettes/session_20250102_093000_4242.cassette
+    python scripts/replay_session.py --speed 1   # at recorded API latency
+
+Without a path the newest cassette in API_CASSETTE_DIR is used. Order
+events from the trade_updates websocket are not part of a cassette, so the
+replayed engine polls fills over REST. Engine logs, journal and snapshots
+of a replay go to a temporary directory.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Nothing is sent anywhere; config validation only needs a key to be set
+os.environ.setdefault("ALPACA_API_KEY", "replay-key")
+os.environ.setdefault("ALPACA_SECRET_KEY", "replay-secret")
+
+from config import config
+from scripts.fake_broker_e2e import describe, loop_iteration
+from utils.api_cassette import CassettePlayer, get_cassette, latest_cassette
+from utils.api_client import api_latency
+from utils.latency import latency
+
+
+def show_info(path: Path) -> int:
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        meta = dict(conn.execute("SELECT name, value FROM meta"))
+        rows = conn.execute(
+            "SELECT route, COUNT(*), AVG(duration), MAX(duration), "
+            "SUM(status >= 400 OR status = 0) FROM interactions "
+            "GROUP BY route ORDER BY COUNT(*) DESC"
+        ).fetchall()
+        span = conn.execute(
+            "SELECT MAX(started + duration) FROM interactions"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+    print(f"cassette:      {path} ({path.stat().st_size / 1024:.0f} KiB)")
+    for name, value in sorted(meta.items()):
+        print(f"{name + ':':<15}{value}")
+    print(f"exchanges:     {sum(r[1] for r in rows)} over {span or 0:.1f} s")
+    print("\nBy route:")
+    for route, count, mean, worst, failed in rows:
+        print(
+            f"  {route:<45} n={count:<5} mean {mean * 1000:8.1f} ms   "
+            f"max {worst * 1000:8.1f} ms   errors {failed}"
+        )
+    return 0
+
+
+def replay(path: Path, speed: float, max_cycles: int) -> int:
+    from core.intraday_engine import IntradayEngine
+
+    config.API_CASSETTE_MODE = "replay"
+    config.API_CASSETTE_PATH = str(path)
+    config.API_CASSETTE_REPLAY_SPEED = speed
+    config.TRADE_UPDATE_STREAM_ENABLED = False
+    player: CassettePlayer = get_cassette()
+    watchlist = player.meta.get("watchlist")
+    if watchlist:
+        config.INTRADAY_WATCHLIST = json.loads(watchlist)
+
+    started = time.perf_counter()
+    engine = IntradayEngine(bypass_market_hours=True)
+    print(f"engine init:   {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    api_latency.reset()
+    latency.reset()
+    samples, processed = [], 0
+    while player.remaining and len(samples) < max_cycles:
+        served = player.served
+        started = time.perf_counter()
+        loop_iteration(engine)
+        samples.append(time.perf_counter() - started)
+        processed += (engine.cycle_scheduler.last_cycle or {}).get("processed", 0)
+        if player.served == served:
+            break  # the engine has left the recorded path; only repeats from here
+
+    if samples:
+        print(f"loop ({len(samples)} iterations): {describe(samples)}")
+        print(f"symbol passes: {processed} in {sum(samples):.2f} s")
+    print("\nAPI latency by endpoint:")
+    for endpoint, summary in api_latency.summary().items():
+        if summary["count"]:
+            print(
+                f"  {endpoint:<30} n={summary['count']:<5} "
+                f"p50 {summary['p50_ms']:8.1f} ms   p99 {summary['p99_ms']:8.1f} ms"
+            )
+    print("\nCassette:")
+    for name, value in player.stats().items():
+        print(f"  {name:<30} {value}")
+    player.close()
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded API session")
+    parser.add_argument("cassette", nargs="?", help="default: newest in the dir")
+    parser.add_argument("--dir", help="default: API_CASSETTE_DIR")
+    parser.add_argument(
+        "--speed", type=float, default=0.0, help="0 = as fast as possible"
+    )
+    parser.add_argument("--max-cycles", type=int, default=10000)
+    parser.add_argument("--info", action="store_true", help="only summarise")
+    args = parser.parse_args(argv)
+
+    path = args.cassette or latest_cassette(args.dir)
+    if path is None or not Path(path).exists():
+        print(f"No cassette found ({path or args.dir or config.API_CASSETTE_DIR})")
+        return 1
+    path = Path(path).resolve()
+    if args.info:
+        return show_info(path)
+    os.chdir(tempfile.mkdtemp(prefix="replay_session_"))
+    return replay(path, args.speed, args.max_cycles)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
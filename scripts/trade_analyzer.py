@@ -26,6 +26,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 import os
 
 from config import config
+from utils.event_journal import list_segments, read_events
 from utils.logger import setup_logger
 
 
@@ -56,20 +57,21 @@ class TradeDecisionAnalyzer:
             "decision_patterns": {},
         }
 
-        # Check if we have any log files to analyze
-        log_files = list(Path("logs").glob("*.log")) if Path("logs").exists() else []
+        # Analyze the engine's event journal if one has been written
+        journal_dir = Path("logs") / "journal"
+        segments = list_segments(journal_dir)
 
-        if log_files:
-            print(f"📁 Found {len(log_files)} log files to analyze")
-            analysis.update(self._analyze_log_files(log_files, days))
+        if segments:
+            print(f"📁 Found {len(segments)} journal segments to analyze")
+            analysis.update(self._analyze_journal(journal_dir, days))
         else:
-            print("⚠️  No log files found - generating sample analysis")
+            print("⚠️  No event journal found - generating sample analysis")
             analysis.update(self._generate_sample_analysis())
 
         return analysis
 
-    def _analyze_log_files(self, log_files: List[Path], days: int) -> Dict:
-        """Analyze actual log files for trading decisions"""
+    def _analyze_journal(self, journal_dir: Path, days: int) -> Dict:
+        """Analyze signal, rejection and fill events from the event journal"""
 
         signals_found = 0
         trades_executed = 0
@@ -78,57 +80,25 @@ class TradeDecisionAnalyzer:
         decision_reasons = []
 
         cutoff_time = datetime.now() - timedelta(days=days)
+        events = read_events(
+            journal_dir,
+            since=cutoff_time.timestamp(),
+            types=("signal", "rejection", "fill"),
+        )
 
-        for log_file in log_files:
-            try:
-                with open(log_file, "r") as f:
-                    for line in f:
-                        # Look for signal generation patterns
-                        if "Signal Generated" in line or "EXECUTE TRADE" in line:
-                            signals_found += 1
-
-                            # Extract confidence if available
-                            if "confidence" in line.lower():
-                                try:
-                                    # Try to extract confidence percentage
-                                    import re
-
-                                    conf_match = re.search(r"(\d+\.?\d*)%", line)
-                                    if conf_match:
-                                        confidence_scores.append(
-                                            float(conf_match.group(1))
-                                        )
-                                except:
-                                    pass
-
-                            # Extract strategy information
-                            if "strategy" in line.lower():
-                                for strategy in [
-                                    "mean_reversion",
-                                    "momentum_scalp",
-                                    "vwap_bounce",
-                                ]:
-                                    if strategy in line.lower():
-                                        strategies_used[strategy] = (
-                                            strategies_used.get(strategy, 0) + 1
-                                        )
-
-                            # Extract decision reasons
-                            if "reason:" in line.lower():
-                                try:
-                                    reason = line.split("reason:")[-1].strip()
-                                    decision_reasons.append(
-                                        reason[:100]
-                                    )  # Limit length
-                                except:
-                                    pass
-
-                        # Look for actual trade execution
-                        if "Order submitted" in line or "Position created" in line:
-                            trades_executed += 1
-
-            except Exception as e:
-                self.logger.debug(f"Error reading {log_file}: {e}")
+        for event in events:
+            if event["type"] == "signal":
+                signals_found += 1
+                confidence_scores.append(float(event["confidence"]) * 100)
+                for strategy in ["mean_reversion", "momentum_scalp", "vwap_bounce"]:
+                    if event["strategy"].startswith(strategy):
+                        strategies_used[strategy] = strategies_used.get(strategy, 0) + 1
+            elif event["type"] == "rejection":
+                decision_reasons.append(
+                    f"{event['symbol']} {event['stage']}: {event['reason']}"[:100]
+                )
+            elif event["type"] == "fill":
+                trades_executed += 1
 
         return {
             "signals_generated": signals_found,
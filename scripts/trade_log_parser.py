@@ -1,20 +1,41 @@
 """
 Real-time trade log parser for Command Center
-Monitors and parses trade execution logs in real-time
+Follows trade executions in the engine's event journal (logs/journal, see
+docs/EVENT_JOURNAL.md) in real-time
 """
 
-import json
 import logging
-import os
-import re
+import sys
 import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
-import pandas as pd
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.event_journal import JournalReader, read_events
+
+# Journal events that represent executed trades (entries and exits)
+TRADE_EVENT_TYPES = ("fill", "exit")
+
+# Display names by the strategy ids the engine journals
+STRATEGY_NAMES = {
+    "mean_reversion": "Mean Reversion",
+    "momentum_scalp": "Momentum Scalp",
+    "vwap_bounce": "VWAP Bounce",
+}
+
+
+def strategy_display_name(strategy: Optional[str]) -> str:
+    """Display name for a strategy id, e.g. vwap_bounce_optimized -> VWAP Bounce"""
+    if not strategy:
+        return "Unknown"
+    for key, name in STRATEGY_NAMES.items():
+        if strategy.startswith(key):
+            return name
+    return strategy.replace("_", " ").title()
 
 
 @dataclass
@@ -34,7 +55,7 @@ class TradeExecution:
 
 
 class TradeLogParser:
-    """Real-time trade log parser"""
+    """Real-time trade parser over the engine's event journal"""
 
     def __init__(self, log_directory: str = None):
         self.logger = self.setup_logger()
@@ -46,44 +67,21 @@ class TradeLogParser:
             # Default to workspace logs directory
             workspace_root = Path(__file__).parent.parent
             self.log_directory = workspace_root / "logs"
+        self.journal_directory = self.log_directory / "journal"
 
         # Data storage
         self.trade_executions = []
         self.trade_summary = {}
         self.last_update = datetime.now()
 
-        # File monitoring
-        self.monitored_files = {}
-        self.file_positions = {}
+        # Journal position (segment + byte offset) for incremental reads
+        self.reader = JournalReader(self.journal_directory, from_end=True)
 
         # Callbacks
         self.trade_callbacks = []
 
-        # Patterns for parsing different log formats
-        self.log_patterns = {
-            "trade_execution": [
-                r"EXECUTED.*?(\w+).*?(BUY|SELL).*?(\d+).*?shares.*?\$(\d+\.\d+)",
-                r"TRADE.*?(\w+).*?(BUY|SELL).*?qty:?\s*(\d+).*?price:?\s*\$?(\d+\.\d+)",
-                r"ORDER.*?(\w+).*?(BUY|SELL).*?(\d+).*?@.*?\$(\d+\.\d+).*?FILLED",
-            ],
-            "strategy_info": [
-                r"strategy:?\s*([\w\s]+)",
-                r"using\s+([\w\s]+)\s+strategy",
-                r"Strategy:\s*([\w\s]+)",
-            ],
-            "confidence_info": [
-                r"confidence:?\s*(\d+\.?\d*)%?",
-                r"conf:?\s*(\d+\.?\d*)%?",
-            ],
-            "pnl_info": [
-                r"P[&/]?L:?\s*\$?([+-]?\d+\.?\d*)",
-                r"profit:?\s*\$?([+-]?\d+\.?\d*)",
-                r"loss:?\s*\$?([+-]?\d+\.?\d*)",
-            ],
-        }
-
         self.logger.info(
-            f"📊 Trade log parser initialized - monitoring: {self.log_directory}"
+            f"📊 Trade log parser initialized - journal: {self.journal_directory}"
         )
 
     def setup_logger(self):
@@ -101,214 +99,51 @@ class TradeLogParser:
 
         return logger
 
-    def find_log_files(self) -> List[Path]:
-        """Find all relevant log files"""
-        if not self.log_directory.exists():
-            self.logger.warning(f"Log directory does not exist: {self.log_directory}")
-            return []
-
-        # Look for scalping-related log files
-        patterns = ["scalping_*.log", "*engine*.log", "*order*.log", "*trade*.log"]
-
-        log_files = []
-        for pattern in patterns:
-            log_files.extend(self.log_directory.glob(pattern))
-
-        # Sort by modification time (newest first)
-        log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-        self.logger.info(f"Found {len(log_files)} log files to monitor")
-        return log_files
-
-    def parse_trade_from_line(
-        self, line: str, timestamp: datetime = None
-    ) -> Optional[TradeExecution]:
-        """Parse a trade execution from a log line"""
-        try:
-            line = line.strip()
-            if not timestamp:
-                # Try to extract timestamp from line
-                timestamp = self.extract_timestamp(line) or datetime.now()
-
-            # Try different trade execution patterns
-            for pattern in self.log_patterns["trade_execution"]:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    symbol = match.group(1).upper()
-                    action = match.group(2).upper()
-                    quantity = int(match.group(3))
-                    price = float(match.group(4))
-
-                    # Extract additional info
-                    strategy = self.extract_strategy(line)
-                    confidence = self.extract_confidence(line)
-                    pnl = self.extract_pnl(line)
-
-                    trade = TradeExecution(
-                        timestamp=timestamp,
-                        symbol=symbol,
-                        action=action,
-                        quantity=quantity,
-                        price=price,
-                        strategy=strategy,
-                        confidence=confidence,
-                        pnl=pnl,
-                        order_id=self.extract_order_id(line),
-                        execution_details={"raw_line": line},
-                    )
-
-                    return trade
-
-        except Exception as e:
-            self.logger.debug(f"Error parsing trade from line: {e}")
-
-        return None
-
-    def extract_timestamp(self, line: str) -> Optional[datetime]:
-        """Extract timestamp from log line"""
-        # Common timestamp patterns
-        patterns = [
-            r"(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})",
-            r"(\d{2}:\d{2}:\d{2})",
-            r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, line)
-            if match:
-                try:
-                    timestamp_str = match.group(1)
-                    if len(timestamp_str) == 8:  # Just time
-                        today = datetime.now().date()
-                        time_part = datetime.strptime(timestamp_str, "%H:%M:%S").time()
-                        return datetime.combine(today, time_part)
-                    else:
-                        return datetime.fromisoformat(timestamp_str.replace("T", " "))
-                except:
-                    continue
-
-        return None
-
-    def extract_strategy(self, line: str) -> str:
-        """Extract strategy name from log line"""
-        for pattern in self.log_patterns["strategy_info"]:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                strategy = match.group(1).strip()
-                # Clean up strategy name
-                strategy = re.sub(r"\s+", " ", strategy).title()
-                return strategy
-
-        # Default strategies based on keywords
-        if "mean" in line.lower() or "reversion" in line.lower():
-            return "Mean Reversion"
-        elif "momentum" in line.lower() or "scalp" in line.lower():
-            return "Momentum Scalp"
-        elif "vwap" in line.lower() or "bounce" in line.lower():
-            return "VWAP Bounce"
-        else:
-            return "Unknown"
-
-    def extract_confidence(self, line: str) -> float:
-        """Extract confidence from log line"""
-        for pattern in self.log_patterns["confidence_info"]:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                try:
-                    confidence = float(match.group(1))
-                    # Convert to percentage if needed
-                    if confidence > 1:
-                        return confidence
-                    else:
-                        return confidence * 100
-                except:
-                    continue
-
-        return 0.0
-
-    def extract_pnl(self, line: str) -> float:
-        """Extract P&L from log line"""
-        for pattern in self.log_patterns["pnl_info"]:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                try:
-                    pnl = float(match.group(1))
-                    return pnl
-                except:
-                    continue
-
-        return 0.0
-
-    def extract_order_id(self, line: str) -> str:
-        """Extract order ID from log line"""
-        # Look for order ID patterns
-        patterns = [
-            r"order[_\s]?id:?\s*([a-zA-Z0-9-]+)",
-            r"id:?\s*([a-zA-Z0-9-]+)",
-            r"order:?\s*([a-zA-Z0-9-]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return ""
+    def trade_from_event(self, event: Dict) -> Optional[TradeExecution]:
+        """Trade execution for a fill (entry) or exit event; None otherwise"""
+        if event.get("type") not in TRADE_EVENT_TYPES:
+            return None
+        is_exit = event["type"] == "exit"
+        return TradeExecution(
+            timestamp=datetime.fromtimestamp(event["ts"]),
+            symbol=event["symbol"],
+            action=event["side"].upper(),
+            quantity=int(float(event["qty"])),
+            price=float(event["exit_price"] if is_exit else event["price"]),
+            strategy=strategy_display_name(event.get("strategy")),
+            confidence=float(event.get("confidence") or 0.0) * 100,
+            pnl=float(event["pnl"]) if is_exit else 0.0,
+            order_id=event.get("order_id", ""),
+            execution_details=event,
+        )
 
-    def monitor_file(self, file_path: Path) -> List[TradeExecution]:
-        """Monitor a single log file for new trades"""
+    def poll_new_trades(self) -> List[TradeExecution]:
+        """Trades journaled since the last poll"""
         new_trades = []
-
         try:
-            if not file_path.exists():
-                return new_trades
-
-            # Get current file position
-            current_pos = self.file_positions.get(str(file_path), 0)
-
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                f.seek(current_pos)
-                new_lines = f.readlines()
-                self.file_positions[str(file_path)] = f.tell()
-
-            # Parse new lines for trades
-            for line in new_lines:
-                trade = self.parse_trade_from_line(line)
+            for event in self.reader.poll():
+                trade = self.trade_from_event(event)
                 if trade:
                     new_trades.append(trade)
                     self.logger.info(
                         f"📈 New trade detected: {trade.symbol} {trade.action} {trade.quantity}@${trade.price:.2f}"
                     )
-
         except Exception as e:
-            self.logger.error(f"Error monitoring file {file_path}: {e}")
+            self.logger.error(f"Error reading event journal: {e}")
 
         return new_trades
 
     def scan_recent_trades(self, hours_back: int = 24) -> List[TradeExecution]:
-        """Scan log files for recent trades"""
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        """Read journaled trades from the last hours_back hours"""
+        cutoff = time.time() - hours_back * 3600
         recent_trades = []
-
-        log_files = self.find_log_files()
-
-        for log_file in log_files:
-            try:
-                # Check if file was modified recently
-                file_mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-                if file_mtime < cutoff_time:
-                    continue
-
-                with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-
-                for line in lines:
-                    trade = self.parse_trade_from_line(line)
-                    if trade and trade.timestamp >= cutoff_time:
-                        recent_trades.append(trade)
-
-            except Exception as e:
-                self.logger.error(f"Error scanning {log_file}: {e}")
+        try:
+            for event in read_events(
+                self.journal_directory, since=cutoff, types=TRADE_EVENT_TYPES
+            ):
+                recent_trades.append(self.trade_from_event(event))
+        except Exception as e:
+            self.logger.error(f"Error scanning event journal: {e}")
 
         # Sort by timestamp
         recent_trades.sort(key=lambda t: t.timestamp, reverse=True)
@@ -319,40 +154,19 @@ class TradeLogParser:
         return recent_trades
 
     def start_monitoring(self):
-        """Start real-time log monitoring"""
-        self.logger.info("🔍 Starting real-time trade log monitoring")
+        """Start real-time journal monitoring"""
+        self.logger.info("🔍 Starting real-time trade journal monitoring")
 
-        # Initial scan for recent trades
+        # Initial scan for recent trades, then follow new events
         self.trade_executions = self.scan_recent_trades(24)
         self.update_trade_summary()
-
-        # Get list of files to monitor
-        log_files = self.find_log_files()
-
-        # Initialize file positions
-        for log_file in log_files:
-            if log_file.exists():
-                self.file_positions[str(log_file)] = log_file.stat().st_size
+        self.reader = JournalReader(self.journal_directory, from_end=True)
 
         # Start monitoring loop
         def monitor_loop():
             while True:
                 try:
-                    # Check for new log files
-                    current_files = self.find_log_files()
-                    new_files = [
-                        f for f in current_files if str(f) not in self.file_positions
-                    ]
-
-                    for new_file in new_files:
-                        self.file_positions[str(new_file)] = 0
-                        self.logger.info(f"📁 Monitoring new log file: {new_file.name}")
-
-                    # Monitor all files for new trades
-                    new_trades = []
-                    for log_file in current_files:
-                        trades = self.monitor_file(log_file)
-                        new_trades.extend(trades)
+                    new_trades = self.poll_new_trades()
 
                     # Process new trades
                     if new_trades:
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark fixtures
+Synthetic market universes (utils/synthetic_market.py) and an engine wired
+to a SyntheticDataManager.
+
+Every benchmark is parametrized over a symbol count and a bar count. The
+default "smoke" scale keeps the normal test run short; "full" runs the
+whole grid (5/50/500 symbols x 100/1,000/10,000 bars) and takes a while:
+
+    python -m pytest tests/benchmarks --bench-scale=full
+
+Baselines live in tests/benchmarks/baselines (one folder per machine type).
+Save one, then compare later runs against it; the compare fails when a
+median is more than 25% slower:
+
+    python -m pytest tests/benchmarks --bench-scale=smoke \
+        --benchmark-storage=tests/benchmarks/baselines --benchmark-save=smoke
+    python -m pytest tests/benchmarks --bench-scale=smoke \
+        --benchmark-storage=tests/benchmarks/baselines \
+        --benchmark-compare --benchmark-compare-fail=median:25%
+"""
+
+import logging
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.synthetic_market import (
+    SESSION_MINUTES,
+    SyntheticDataManager,
+    SyntheticMarket,
+)
+
+SCALES = {
+    "smoke": {"symbols": (5,), "bars": (100, 1_000), "rounds": 5},
+    "full": {"symbols": (5, 50, 500), "bars": (100, 1_000, 10_000), "rounds": 5},
+}
+BENCH_DATE = date(2024, 6, 14)  # Fixed sessions keep every run on the same data
+
+
+def pytest_generate_tests(metafunc):
+    scale = SCALES[metafunc.config.getoption("--bench-scale")]
+    if "symbols" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "symbols", scale["symbols"], ids=[f"{n}sym" for n in scale["symbols"]]
+        )
+    if "bars" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "bars", scale["bars"], ids=[f"{n}bars" for n in scale["bars"]]
+        )
+
+
+@pytest.fixture(scope="session")
+def rounds(request):
+    return SCALES[request.config.getoption("--bench-scale")]["rounds"]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def bench_workdir(tmp_path_factory):
+    """Engine logs, journal and snapshots go to a scratch directory"""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("bench"))
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+    os.chdir(cwd)
+
+
+@pytest.fixture
+def market(symbols, bars):
+    """Synthetic market with at least `bars` one-minute bars per symbol"""
+    return SyntheticMarket(
+        symbols, days=-(-bars // SESSION_MINUTES), seed=bars, end_date=BENCH_DATE
+    )
+
+
+@pytest.fixture
+def universe(market, bars):
+    """{symbol: bars DataFrame} for every symbol in the market"""
+    return {symbol: market.bars(symbol, limit=bars) for symbol in market.symbols}
+
+
+class FakeOrderManager:
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.trade_updates = None
+
+    def maybe_reconcile_orders(self, force=False):
+        return None
+
+
+class FakeRiskManager:
+    account_equity = 100_000.0
+    total_short_exposure = 0.0
+
+    def sync_position_count_with_broker(self, order_manager):
+        return None
+
+
+def make_engine(market, lookback):
+    """IntradayEngine over a SyntheticDataManager with a cycle budget that never binds
+
+    Order placement is outside these benchmarks: execute_signal and the
+    signal cooldown it starts are stubbed so every round does the same work.
+    """
+    from config import config
+    from core.cycle_scheduler import CycleScheduler
+    from core.intraday_engine import IntradayEngine
+
+    class BenchmarkEngine(IntradayEngine):
+        def _validate_config(self):
+            pass
+
+        def _create_components(self):
+            self.data_manager = SyntheticDataManager(market, lookback=lookback)
+            self.order_manager = FakeOrderManager(self.data_manager)
+            self.risk_manager = FakeRiskManager()
+
+        def is_market_hours(self):
+            return True
+
+        def filter_watchlist(self):
+            self.last_filter_rejections = {}
+            return list(market.symbols)
+
+        def record_signal_time(self, symbol):
+            pass
+
+        def execute_signal(self, signal):
+            return False
+
+    engine = BenchmarkEngine(bypass_market_hours=True)
+    engine.journal = None
+    engine.cycle_scheduler = CycleScheduler(cycle_budget=1e9)
+    config.INTRADAY_WATCHLIST = list(market.symbols)
+    return engine
+
+
+@pytest.fixture
+def engine(market, bars):
+    from config import config
+
+    watchlist = config.INTRADAY_WATCHLIST
+    yield make_engine(market, bars)
+    config.INTRADAY_WATCHLIST = watchlist
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Indicator, strategy and trading cycle benchmarks
+Times one pass over every symbol in the universe per round; the indicator
+cache is cleared before each round so every round recomputes, as the first
+cycle after a new bar does.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from core.data_manager import DataManager
+from core.unified_indicators import UnifiedIndicatorService, unified_indicator_service
+from strategies import MeanReversionStrategy, MomentumScalpStrategy, VWAPBounceStrategy
+
+STRATEGIES = {
+    "mean_reversion": MeanReversionStrategy,
+    "momentum_scalp": MomentumScalpStrategy,
+    "vwap_bounce": VWAPBounceStrategy,
+}
+
+
+def run(benchmark, rounds, target, setup=None):
+    def fresh_round():
+        unified_indicator_service.clear_cache()
+        if setup:
+            setup()
+
+    benchmark.pedantic(target, setup=fresh_round, rounds=rounds, warmup_rounds=1)
+
+
+def test_unified_indicators(benchmark, rounds, universe):
+    service = UnifiedIndicatorService()
+
+    def target():
+        for symbol, df in universe.items():
+            service.calculate_unified_indicators(df, symbol)
+
+    run(benchmark, rounds, target, setup=service.clear_cache)
+
+
+def test_data_manager_indicators(benchmark, rounds, universe):
+    # Only the pure-pandas method is exercised; no Alpaca client is built
+    data_manager = DataManager.__new__(DataManager)
+
+    def target():
+        for df in universe.values():
+            data_manager.calculate_indicators(df.copy())
+
+    run(benchmark, rounds, target)
+
+
+@pytest.mark.parametrize("strategy", sorted(STRATEGIES))
+def test_strategy_generate_signal(benchmark, rounds, universe, strategy):
+    strategy_class = STRATEGIES[strategy]
+
+    def target():
+        for symbol, df in universe.items():
+            strategy_class(symbol).generate_signal(symbol, df)
+
+    run(benchmark, rounds, target)
+
+
+def test_vwap_volume_profile(benchmark, rounds, universe):
+    strategy = VWAPBounceStrategy("SYM0000")
+
+    def target():
+        for df in universe.values():
+            strategy.calculate_volume_profile(df, strategy.volume_profile_periods)
+
+    run(benchmark, rounds, target)
+
+
+def test_momentum_adx(benchmark, rounds, universe):
+    strategy = MomentumScalpStrategy("SYM0000")
+
+    def target():
+        for df in universe.values():
+            strategy.calculate_adx(df, strategy.adx_period)
+
+    run(benchmark, rounds, target)
+
+
+def test_engine_generate_signals(benchmark, rounds, universe, engine):
+    def target():
+        for symbol, df in universe.items():
+            engine.generate_signals(symbol, df)
+
+    run(benchmark, rounds, target)
+
+
+def test_full_trading_cycle(benchmark, rounds, universe, engine):
+    run(benchmark, rounds, engine.run_trading_cycle)
+    assert engine.cycle_scheduler.last_cycle["processed"] == len(universe)
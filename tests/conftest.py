@@ -0,0 +1,12 @@
+"""
+Shared pytest options
+"""
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-scale",
+        choices=("smoke", "full"),
+        default="smoke",
+        help="Symbol/bar grid for tests/benchmarks (default: smoke)",
+    )
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+API cassette tests
+Tests recording a REST session against the fake broker and replaying it
+offline: response order, volatile fields, errors, misses and pacing
+"""
+
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+tradeapi = pytest.importorskip("alpaca_trade_api")
+from alpaca_trade_api.rest import APIError
+
+from utils.api_cassette import (
+    CassetteMiss,
+    CassettePlayer,
+    CassetteRecorder,
+    attach_cassette,
+    latest_cassette,
+)
+from utils.api_client import InstrumentedREST
+from utils.fake_broker import FakeBroker
+from utils.synthetic_market import SyntheticMarket
+
+UNREACHABLE = "http://127.0.0.1:9"  # replays must never touch the network
+
+
+def make_api(base_url):
+    return tradeapi.REST("test-key", "test-secret", base_url, api_version="v2")
+
+
+@pytest.fixture
+def recording(tmp_path, monkeypatch):
+    """A short session against the fake broker, recorded to tmp_path"""
+    market = SyntheticMarket(["AAPL"], days=1, seed=2, end_date=date(2024, 6, 14))
+    broker = FakeBroker(
+        market,
+        port=0,
+        latency_ms=30,
+        jitter_ms=0,
+        rate_limit=0,
+        fill_delay_ms=1,
+        partial_fill_probability=0,
+        reject_probability=0,
+    ).start()
+    monkeypatch.setenv("APCA_API_DATA_URL", broker.url)
+    monkeypatch.setenv("APCA_RETRY_MAX", "0")
+    recorder = CassetteRecorder(directory=tmp_path)
+    api = make_api(broker.url)
+    attach_cassette(api, recorder)
+
+    session = {"equity": [api.get_account().equity]}
+    session["bars"] = api.get_bars(
+        "AAPL", "1Min", start="2024-06-13T00:00:00Z", limit=20
+    )._raw
+    order = api.submit_order(
+        symbol="AAPL", qty=3, side="buy", type="market", client_order_id="run-1"
+    )
+    broker.settle()
+    session["order"] = api.get_order(order.id)._raw
+    session["equity"].append(api.get_account().equity)
+    with pytest.raises(APIError):
+        api.get_order("missing")
+    broker.stop()
+    recorder.close()
+    monkeypatch.setenv("APCA_API_DATA_URL", UNREACHABLE)
+    return recorder, session
+
+
+def test_replay_serves_the_session_in_order(recording):
+    recorder, session = recording
+    assert recorder.recorded == 6
+    player = CassettePlayer(latest_cassette(recorder.path.parent))
+    api = make_api(UNREACHABLE)
+    attach_cassette(api, player)
+
+    assert api.get_account().equity == session["equity"][0]
+    # Time windows and client order ids differ from run to run
+    assert (
+        api.get_bars("AAPL", "1Min", start="2025-01-01T00:00:00Z", limit=20)._raw
+        == session["bars"]
+    )
+    order = api.submit_order(
+        symbol="AAPL", qty=3, side="buy", type="market", client_order_id="run-2"
+    )
+    assert api.get_order(order.id)._raw == session["order"]
+    assert api.get_account().equity == session["equity"][1]
+    with pytest.raises(APIError) as missing:
+        api.get_order("missing")
+    assert missing.value.status_code == 404
+    assert player.remaining == 0
+
+    # Polling past the recording repeats the last answer; unknown calls miss
+    assert api.get_account().equity == session["equity"][1]
+    with pytest.raises(CassetteMiss):
+        api.list_positions()
+    assert player.stats()["repeats"] == 1 and player.stats()["misses"] == 1
+
+
+def test_replay_pacing_and_instrumented_client(recording):
+    recorder, _ = recording
+
+    def replay(speed):
+        player = CassettePlayer(recorder.path, speed=speed)
+        api = InstrumentedREST(make_api(UNREACHABLE))
+        attach_cassette(api.rest, player)
+        started = time.perf_counter()
+        api.get_account()
+        api.get_account()
+        return time.perf_counter() - started
+
+    assert replay(speed=0) < 0.05
+    assert replay(speed=1.0) >= 0.05  # two recorded calls of ~30 ms each
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Startup bootstrap tests
+Tests that independent phases overlap, dependencies are respected and
+failures are handled by phase kind
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.bootstrap import Bootstrap
+
+
+def test_independent_phases_run_concurrently():
+    bootstrap = Bootstrap("test")
+    for name in ("account", "orders", "positions"):
+        bootstrap.add(name, lambda: time.sleep(0.2))
+    bootstrap.run()
+
+    assert bootstrap.total_seconds < 0.45
+    assert set(bootstrap.timings) == {"account", "orders", "positions"}
+
+
+def test_dependencies_run_after_their_inputs():
+    order = []
+    bootstrap = Bootstrap("test")
+    bootstrap.add("sync", lambda: order.append("sync"), after=("fetch", "snapshot"))
+    bootstrap.add("fetch", lambda: time.sleep(0.05) or order.append("fetch"))
+    bootstrap.add("snapshot", lambda: order.append("snapshot"))
+    bootstrap.add("check", lambda: order.append("check") or 42, after=("sync",))
+    results = bootstrap.run()
+
+    assert order[-2:] == ["sync", "check"]
+    assert results["check"] == 42
+
+
+def test_optional_failure_is_logged_and_required_failure_raises():
+    bootstrap = Bootstrap("test")
+    bootstrap.add("optional", lambda: 1 / 0, required=False)
+    bootstrap.add("after", lambda: "ran", after=("optional",))
+    results = bootstrap.run()
+    assert results["optional"] is None and results["after"] == "ran"
+    assert isinstance(bootstrap.errors["optional"], ZeroDivisionError)
+
+    bootstrap = Bootstrap("test")
+    bootstrap.add("required", lambda: 1 / 0)
+    bootstrap.add("never", lambda: "ran", after=("required",))
+    with pytest.raises(ZeroDivisionError):
+        bootstrap.run()
+    assert "never" not in bootstrap.results
+
+
+def test_unknown_or_circular_dependencies_are_rejected():
+    bootstrap = Bootstrap("test")
+    bootstrap.add("a", lambda: None, after=("missing",))
+    with pytest.raises(ValueError):
+        bootstrap.run()
+
+    bootstrap = Bootstrap("test")
+    bootstrap.add("a", lambda: None, after=("b",))
+    bootstrap.add("b", lambda: None, after=("a",))
+    with pytest.raises(ValueError):
+        bootstrap.run()
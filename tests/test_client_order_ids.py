@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Client order id tests
+Tests deterministic ids, retry de-duplication and status lookup by order id
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from core.client_order_ids import (
+        MAX_CLIENT_ORDER_ID_LENGTH,
+        ClientOrderRegistry,
+        make_client_order_id,
+        make_signal_id,
+    )
+    from core.trade_updates import normalize_trade_update
+except ImportError as e:
+    pytest.skip(f"Client order id import failed: {e}", allow_module_level=True)
+
+
+def test_ids_are_deterministic_and_bounded():
+    stamp = datetime(2025, 3, 4, 10, 30, 15)
+    signal_id = make_signal_id("SOFI", "BUY", "momentum_scalp", stamp)
+    assert signal_id == make_signal_id("SOFI", "BUY", "momentum_scalp", stamp)
+    assert signal_id != make_signal_id("SOFI", "SELL", "momentum_scalp", stamp)
+
+    client_order_id = make_client_order_id("SOFI", "buy", signal_id)
+    assert client_order_id == f"rib-entry-sofi-buy-{signal_id}"
+    long_id = make_client_order_id("GOOGL", "sell", "x" * 60, purpose="exit")
+    assert len(long_id) <= MAX_CLIENT_ORDER_ID_LENGTH
+
+
+def test_retries_are_deduplicated_until_order_dies():
+    registry = ClientOrderRegistry()
+    client_order_id = registry.next_client_order_id("SOFI", "buy", "abc123")
+    registry.begin(client_order_id, "SOFI", "buy", 10)
+    assert registry.is_duplicate(client_order_id)
+
+    # Never reached the broker - the same id may be sent again
+    registry.record_failure(client_order_id, TimeoutError("read timeout"))
+    assert not registry.is_duplicate(client_order_id)
+    assert registry.next_client_order_id("SOFI", "buy", "abc123") == client_order_id
+
+    # Rejected by the broker - the retry needs a new id
+    registry.begin(client_order_id, "SOFI", "buy", 10)
+    registry.record_order(client_order_id, SimpleNamespace(id="o-1", status="new"))
+    registry.on_trade_update(
+        normalize_trade_update(
+            {
+                "event": "rejected",
+                "order": {
+                    "id": "o-1",
+                    "client_order_id": client_order_id,
+                    "status": "rejected",
+                },
+            }
+        )
+    )
+    retry_id = registry.next_client_order_id("SOFI", "buy", "abc123")
+    assert retry_id == "rib-entry2-sofi-buy-abc123"
+
+
+def test_fill_events_resolve_status_by_order_id():
+    registry = ClientOrderRegistry()
+    registry.begin("rib-entry-nio-sell-s1", "NIO", "sell", 25)
+    registry.record_order(
+        "rib-entry-nio-sell-s1", SimpleNamespace(id="o-9", status="accepted")
+    )
+    registry.on_trade_update(
+        normalize_trade_update(
+            {
+                "event": "fill",
+                "order": {
+                    "id": "o-9",
+                    "client_order_id": "rib-entry-nio-sell-s1",
+                    "status": "filled",
+                    "filled_qty": "25",
+                    "filled_avg_price": "7.31",
+                },
+            }
+        )
+    )
+    # A late REST response must not roll the status back
+    registry.record_order(
+        "rib-entry-nio-sell-s1", SimpleNamespace(id="o-9", status="new")
+    )
+
+    record = registry.get_by_order_id("o-9")
+    assert record["status"] == "filled"
+    assert record["filled_qty"] == 25.0
+    assert record["filled_avg_price"] == pytest.approx(7.31)
+    assert registry.outstanding() == []
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Clock tests
+Tests the simulated clock's event ordering, time zones and sleeps, and the
+cooldown and protective monitor schedulers running on it
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.monitor_scheduler import ProtectiveMonitorScheduler
+from core.timer_wheel import CooldownService
+from utils.clock import SimulatedClock, system_clock
+from utils.synthetic_market import EASTERN
+
+OPEN = EASTERN.localize(datetime(2024, 6, 14, 9, 30))
+
+
+def test_sleep_fires_events_in_order_at_their_own_time():
+    clock = SimulatedClock(OPEN)
+    seen = []
+    clock.call_later(90, lambda: seen.append(("b", clock.elapsed)))
+    clock.call_later(30, lambda: seen.append(("a", clock.elapsed)))
+    bars = []
+    clock.call_every(60, lambda: bars.append(clock.elapsed) or len(bars) < 3)
+
+    started = time.perf_counter()
+    clock.sleep(3600)
+    assert time.perf_counter() - started < 0.5
+    assert seen == [("a", 30), ("b", 90)]
+    assert bars == [60, 120, 180]  # stopped once the callback returned False
+    assert clock.elapsed == clock.slept == 3600
+    assert clock.next_event() is None
+
+
+def test_simulated_time_reads_in_the_start_zone():
+    clock = SimulatedClock(OPEN)
+    assert clock.now() == datetime(2024, 6, 14, 9, 30)
+    assert clock.utcnow() == datetime(2024, 6, 14, 13, 30)
+    assert clock.now(EASTERN).hour == 9
+    assert clock.time() == OPEN.timestamp() == clock.monotonic()
+
+    clock.call_later(45, lambda: None)
+    assert clock.skip_to_next_event(limit=10) and clock.elapsed == 10
+    assert clock.skip_to_next_event() and clock.elapsed == 45
+    assert not clock.skip_to_next_event()
+    assert system_clock.simulated is False and clock.simulated is True
+
+
+def test_cooldowns_and_monitor_follow_the_clock():
+    clock = SimulatedClock(OPEN)
+    cooldowns = CooldownService(clock=clock)
+    cooldowns.watch(["AAPL", "MSFT"])
+    expired = []
+    cooldowns.start("signal", "AAPL", 300, callback=lambda *e: expired.append(e))
+    assert cooldowns.eligible_symbols() == {"MSFT"}
+    assert cooldowns.remaining("signal", "AAPL") == 300
+
+    clock.sleep(299)
+    assert not cooldowns.is_eligible("AAPL") and not expired
+    clock.sleep(1)
+    assert cooldowns.is_eligible("AAPL")
+    assert expired == [("signal", "AAPL")]
+
+    monitor = ProtectiveMonitorScheduler(
+        min_interval=0.1, max_interval=5.0, seconds_per_atr=4.0, clock=clock
+    )
+    monitor.reschedule({"AAPL": 0.5, "MSFT": 10.0})
+    assert monitor.seconds_until_next() == pytest.approx(2.1)
+    clock.sleep(monitor.seconds_until_next())
+    assert monitor.due(["AAPL", "MSFT"]) == ["AAPL"]
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Cycle profiler tests
+Tests that slow cycles are written as collapsed stacks and fast ones are dropped
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.cycle_profiler import CycleProfiler
+
+
+def busy_strategy(seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sum(range(100))
+
+
+def test_slow_cycle_is_written_as_collapsed_stacks(tmp_path):
+    profiler = CycleProfiler(tmp_path, interval=0.001, slow_seconds=0.05).start()
+    try:
+        profiler.begin_cycle()
+        busy_strategy(0.01)
+        assert profiler.end_cycle(["AAPL"]) is None
+
+        profiler.begin_cycle()
+        busy_strategy(0.15)
+        path = profiler.end_cycle(["AAPL", "TSLA"])
+    finally:
+        profiler.stop()
+
+    assert path.name.startswith("cycle_000002_")
+    assert path.name.endswith("_AAPL-TSLA.collapsed")
+    lines = path.read_text().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "busy_strategy (test_cycle_profiler.py)" in stack.split(";")
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_old_profiles_are_pruned(tmp_path):
+    profiler = CycleProfiler(tmp_path, interval=0.001, slow_seconds=0.0, max_files=2)
+    profiler.start()
+    try:
+        for _ in range(4):
+            profiler.begin_cycle()
+            busy_strategy(0.02)
+            profiler.end_cycle(["SPY"])
+    finally:
+        profiler.stop()
+
+    names = sorted(p.name[:12] for p in tmp_path.iterdir())
+    assert names == ["cycle_000003", "cycle_000004"]
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Cycle scheduler tests
+Tests symbol priority order, deadline deferral and overrun statistics
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.cycle_scheduler import CycleScheduler
+
+
+def test_priority_order_held_then_near_signal_then_rest():
+    scheduler = CycleScheduler(cycle_budget=10, symbol_budget=1)
+    scheduler.set_proximity("NIO", 0.6)
+    scheduler.set_proximity("SOFI", 0.9)
+
+    order = scheduler.plan(["AAPL", "NIO", "SOFI", "TQQQ", "INTC"], held=["TQQQ"])
+    assert order == ["TQQQ", "SOFI", "NIO", "AAPL", "INTC"]
+
+
+def test_budget_defers_remaining_symbols_to_next_cycle():
+    scheduler = CycleScheduler(cycle_budget=0.05, symbol_budget=0.02)
+    symbols = ["A", "B", "C", "D", "E"]
+
+    cycle = scheduler.begin_cycle(symbols)
+    for symbol in cycle:
+        time.sleep(0.03)
+    summary = cycle.finish()
+
+    assert summary["processed"] < len(symbols)
+    assert summary["deferred"] == symbols[summary["processed"] :]
+    assert summary["slow_symbols"] == symbols[: summary["processed"]]
+
+    # Deferred work runs first next time
+    next_order = scheduler.plan(symbols)
+    assert next_order[: len(summary["deferred"])] == summary["deferred"]
+
+    stats = scheduler.stats()
+    assert stats["cycles"] == 1 and stats["overrun_cycles"] == 1
+    assert stats["deferred_total"] == len(summary["deferred"])
+
+
+def test_cycle_within_budget_processes_everything():
+    scheduler = CycleScheduler(cycle_budget=5, symbol_budget=0.5)
+    cycle = scheduler.begin_cycle(["A", "B", "C"])
+    assert list(cycle) == ["A", "B", "C"]
+    summary = cycle.finish()
+    assert summary["deferred"] == [] and scheduler.stats()["overrun_rate"] == 0.0
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Emergency executor tests
+Tests concurrent submission and stream-confirmed fills against an in-memory broker
+"""
+
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from core.emergency_executor import EmergencyExecutor, percentile
+    from core.trade_updates import normalize_trade_update
+except ImportError as e:
+    pytest.skip(f"Emergency executor import failed: {e}", allow_module_level=True)
+
+
+class FakeFeed:
+    """Trade update feed driven by the fake broker instead of a websocket"""
+
+    is_connected = True
+
+    def __init__(self):
+        self.subscribers = []
+
+    def start(self):
+        return True
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+
+    def publish(self, event):
+        for callback in list(self.subscribers):
+            callback(event)
+
+
+class FakeBroker:
+    """Accepts orders and reports fills asynchronously on the feed"""
+
+    def __init__(self, feed, reject=()):
+        self.feed = feed
+        self.reject = set(reject)
+        self.cancel_all_calls = 0
+
+    def cancel_all_orders(self):
+        self.cancel_all_calls += 1
+        return []
+
+    def list_orders(self, **kwargs):
+        return []
+
+    def submit_order(self, **order):
+        if order["symbol"] in self.reject:
+            raise RuntimeError("insufficient qty available")
+
+        order_id = f"id-{order['client_order_id']}"
+        fill = {"id": order_id, "status": "filled", **order}
+        threading.Timer(
+            0.01,
+            self.feed.publish,
+            [normalize_trade_update({"event": "fill", "order": fill})],
+        ).start()
+        return SimpleNamespace(id=order_id, status="new")
+
+
+def test_flatten_confirms_fills_from_stream():
+    feed = FakeFeed()
+    broker = FakeBroker(feed, reject=["BAD"])
+    executor = EmergencyExecutor(broker, max_workers=4, feed=feed)
+
+    positions = [
+        {"symbol": "AAA", "qty": "10", "side": "long"},
+        {"symbol": "BBB", "qty": "-5", "side": "short"},
+        {"symbol": "BAD", "qty": "1", "side": "long"},
+    ]
+    report = executor.flatten(positions, timeout=5)
+
+    assert broker.cancel_all_calls == 1
+    assert report["submitted"] == 3
+    assert report["confirmed"] == 2
+    assert report["failed"] == 1
+    assert report["p50_seconds"] is not None
+    assert report["p99_seconds"] >= report["p50_seconds"]
+
+    sides = {r["symbol"]: r["status"] for r in report["results"].values()}
+    assert sides == {"AAA": "filled", "BBB": "filled", "BAD": "failed"}
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 50) is None
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile(list(range(1, 101)), 99) == 99
+
+
+class ReservingBroker:
+    """Accepts exit orders only while unreserved shares remain, like Alpaca"""
+
+    def __init__(self, positions):
+        self.positions = positions
+        self.reserved = {}
+        self.orders = []
+
+    def list_positions(self):
+        return self.positions
+
+    def list_orders(self, **kwargs):
+        return []
+
+    def submit_order(self, **order):
+        held = next(
+            abs(float(p.qty)) for p in self.positions if p.symbol == order["symbol"]
+        )
+        reserved = self.reserved.get(order["symbol"], 0.0)
+        if reserved + float(order["qty"]) > held:
+            raise RuntimeError("insufficient qty available for order")
+        self.reserved[order["symbol"]] = reserved + float(order["qty"])
+        self.orders.append(order)
+        return SimpleNamespace(id=f"id-{order['client_order_id']}", status="new")
+
+
+@pytest.mark.parametrize("mode", ["managed", "bracket"])
+def test_profit_protection_always_keeps_a_stop(monkeypatch, mode):
+    from config import config
+    from scripts import emergency_profit_protection as protection
+
+    monkeypatch.setattr(config, "ORDER_PROTECTION_MODE", mode)
+    monkeypatch.setattr(
+        protection,
+        "EmergencyExecutor",
+        lambda api: EmergencyExecutor(api, max_workers=4, feed=FakeFeed()),
+    )
+    positions = [
+        SimpleNamespace(
+            symbol="AAA",
+            side="long",
+            qty="10",
+            avg_entry_price="100",
+            market_value="1050",
+            unrealized_pl="50",
+        ),
+        SimpleNamespace(
+            symbol="BBB",
+            side="short",
+            qty="-4",
+            avg_entry_price="50",
+            market_value="-192",
+            unrealized_pl="8",
+        ),
+    ]
+    protector = protection.EmergencyProfitProtection.__new__(
+        protection.EmergencyProfitProtection
+    )
+    protector.api = ReservingBroker(positions)
+    protector.logger = protector._setup_logger()
+    protector.protect_all_positions()
+
+    stops = {o["symbol"]: o["stop_loss"]["stop_price"] for o in protector.api.orders}
+    assert len(protector.api.orders) == 2  # one OCO exit per symbol
+    assert stops["AAA"] < 105 and stops["BBB"] > 48
+    assert {o["order_class"] for o in protector.api.orders} == {"oco"}
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Event journal tests
+Tests event validation, sequence resume, byte-offset tailing and segment rollover
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.event_journal import (
+    EventJournal,
+    JournalReader,
+    read_events,
+    segment_name,
+)
+
+FILL = dict(symbol="AAPL", side="buy", qty=10, price=189.5, order_id="abc")
+
+
+def test_emit_validates_and_resumes_sequence(tmp_path):
+    journal = EventJournal(tmp_path)
+    with pytest.raises(ValueError):
+        journal.emit("heartbeat", symbol="AAPL")
+    with pytest.raises(ValueError, match="price"):
+        journal.emit("fill", symbol="AAPL", side="buy", qty=10, order_id="abc")
+
+    journal.emit("fill", **FILL)
+    journal.emit("rejection", symbol="TSLA", stage="execution", reason="risk_check")
+    journal.close()
+
+    reopened = EventJournal(tmp_path)
+    event = reopened.emit("fill", **FILL)
+    reopened.close()
+
+    assert event["seq"] == 3
+    assert [e["seq"] for e in read_events(tmp_path)] == [1, 2, 3]
+    assert read_events(tmp_path, types=("rejection",))[0]["reason"] == "risk_check"
+
+
+def test_reader_tails_new_events_and_waits_for_partial_lines(tmp_path):
+    journal = EventJournal(tmp_path)
+    journal.emit("fill", **FILL)
+    reader = JournalReader(tmp_path, from_end=True)
+    assert reader.poll() == []
+
+    journal.emit("fill", **dict(FILL, qty=5))
+    segment = tmp_path / segment_name(datetime.now())
+    with open(segment, "ab") as f:
+        f.write(b'{"v":1,"seq":99,')
+
+    (event,) = reader.poll()
+    assert event["qty"] == 5
+    assert reader.offset < segment.stat().st_size
+
+    with open(segment, "ab") as f:
+        f.write(b'"ts":0,"type":"fill"}\n')
+    assert reader.poll()[0]["seq"] == 99
+    assert reader.poll() == []
+
+
+def test_reader_moves_to_next_day_segment(tmp_path):
+    day1 = tmp_path / "events_20250811.jsonl"
+    day2 = tmp_path / "events_20250812.jsonl"
+    day1.write_text(json.dumps({"seq": 1, "ts": 1.0, "type": "fill"}) + "\n")
+
+    reader = JournalReader(tmp_path)
+    assert [e["seq"] for e in reader.poll()] == [1]
+
+    with open(day1, "a") as f:
+        f.write(json.dumps({"seq": 2, "ts": 2.0, "type": "fill"}) + "\n")
+    day2.write_text(json.dumps({"seq": 3, "ts": 3.0, "type": "fill"}) + "\n")
+
+    assert [e["seq"] for e in reader.poll()] == [2, 3]
+    assert reader.segment == day2
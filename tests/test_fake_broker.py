@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Fake broker tests
+Tests the real alpaca_trade_api REST client and the trade update feed
+against the local fake broker: market data, fills, partial fills, rejects,
+rate limiting, resting bracket exits and OCO exits
+"""
+
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+tradeapi = pytest.importorskip("alpaca_trade_api")
+from alpaca_trade_api.rest import APIError
+
+from core.trade_updates import TradeUpdateFeed
+from utils.fake_broker import FakeBroker
+from utils.synthetic_market import SESSION_MINUTES, SyntheticMarket
+
+FRIDAY = date(2024, 6, 14)
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    market = SyntheticMarket(["AAPL", "MSFT"], days=2, seed=5, end_date=FRIDAY)
+    market.rewind(SESSION_MINUTES + 60)
+    broker = FakeBroker(
+        market,
+        port=0,
+        latency_ms=0,
+        jitter_ms=0,
+        rate_limit=0,
+        fill_delay_ms=5,
+        partial_fill_probability=0,
+        reject_probability=0,
+    ).start()
+    for name, value in broker.environment().items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("APCA_RETRY_MAX", "0")
+    yield broker
+    broker.stop()
+
+
+def make_api(broker):
+    return tradeapi.REST("test-key", "test-secret", broker.url, api_version="v2")
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_market_data_and_market_order_round_trip(broker):
+    api = make_api(broker)
+    market = broker.market
+
+    assert float(api.get_account().equity) == 100000.0
+    assert api.get_clock().is_open
+
+    bars = api.get_bars("AAPL", "1Min", limit=50)
+    assert len(bars) == 50
+    assert bars[-1].c == market.latest_price("AAPL")
+    assert api.get_latest_bar("AAPL").c == market.latest_price("AAPL")
+    assert api.get_latest_trades(["AAPL", "MSFT"])["MSFT"].p == market.latest_price(
+        "MSFT"
+    )
+    quote = api.get_latest_quote("AAPL")
+    assert quote.ap > quote.bp
+
+    order = api.submit_order(
+        symbol="AAPL", qty=10, side="buy", type="market", client_order_id="entry-1"
+    )
+    assert wait_for(lambda: api.get_order(order.id).status == "filled")
+    assert api.get_order_by_client_order_id("entry-1").id == order.id
+    assert float(api.get_position("AAPL").qty) == 10
+    assert [a.type for a in api.get_activities(activity_types="FILL")] == ["fill"]
+
+    with pytest.raises(APIError) as missing:
+        api.get_order("no-such-order")
+    assert missing.value.status_code == 404
+
+
+def test_stream_reports_partial_fills_and_submit_rejects(broker):
+    broker.partial_fill_probability = 1.0
+    api = make_api(broker)
+    feed = TradeUpdateFeed("test-key", "test-secret", broker.url)
+    events = []
+    feed.subscribe(lambda event: events.append(event))
+    assert feed.start()
+    try:
+        assert wait_for(lambda: broker.stats()["streams"] == 1)
+        order = api.submit_order(symbol="MSFT", qty=10, side="sell", type="market")
+        assert wait_for(lambda: len(events) == 3)
+    finally:
+        feed.stop()
+
+    assert [e["event"] for e in events] == ["new", "partial_fill", "fill"]
+    assert [e["fill_qty"] for e in events[1:]] == [5.0, 5.0]
+    assert events[-1]["order_id"] == order.id and events[-1]["position_qty"] == -10.0
+    assert api.list_positions()[0].side == "short"
+
+    broker.reject_probability = 1.0
+    with pytest.raises(APIError) as rejected:
+        api.submit_order(symbol="MSFT", qty=1, side="buy", type="market")
+    assert rejected.value.status_code == 403
+    assert broker.stats()["rejected"] == 1
+
+
+def test_rate_limit_and_bracket_exits(broker):
+    api = make_api(broker)
+    price = broker.market.latest_price("AAPL")
+    entry = api.submit_order(
+        symbol="AAPL",
+        qty=5,
+        side="buy",
+        type="market",
+        order_class="bracket",
+        take_profit={"limit_price": round(price * 1.002, 2)},
+        stop_loss={"stop_price": round(price * 0.998, 2)},
+    )
+    assert broker.settle()
+    legs = api.get_order(entry.id).legs
+    assert [leg.status for leg in legs] == ["new", "new"]
+    assert len(api.list_orders(status="open")) == 2
+
+    while api.list_positions() and broker.advance():
+        pass
+    statuses = sorted(leg.status for leg in api.get_order(entry.id).legs)
+    assert statuses == ["canceled", "filled"]
+    assert api.list_orders(status="open") == []
+
+    broker.rate_limit = 3
+    for _ in range(3):
+        api.get_clock()
+    with pytest.raises(APIError) as limited:
+        api.get_clock()
+    assert limited.value.status_code == 429
+
+
+@pytest.mark.parametrize(
+    "target_pct, stop_pct, filled", [(0.05, 0.0005, "stop"), (0.0005, 0.05, "limit")]
+)
+def test_oco_exit_keeps_both_sides_live_until_one_fills(
+    broker, target_pct, stop_pct, filled
+):
+    api = make_api(broker)
+    api.submit_order(symbol="AAPL", qty=5, side="buy", type="market")
+    assert broker.settle()
+    price = broker.market.latest_price("AAPL")
+
+    exit_order = api.submit_order(
+        symbol="AAPL",
+        qty=5,
+        side="sell",
+        type="limit",
+        time_in_force="gtc",
+        order_class="oco",
+        take_profit={"limit_price": round(price * (1 + target_pct), 2)},
+        stop_loss={"stop_price": round(price * (1 - stop_pct), 2)},
+    )
+    assert broker.settle()
+    stop = api.get_order(exit_order.id).legs[0]
+    assert (stop.type, stop.side, float(stop.stop_price)) == (
+        "stop",
+        "sell",
+        round(price * (1 - stop_pct), 2),
+    )
+    assert sorted(o.type for o in api.list_orders(status="open")) == ["limit", "stop"]
+
+    while api.list_positions() and broker.advance():
+        pass
+    assert api.list_positions() == []
+    sides = [api.get_order(exit_order.id), api.get_order(stop.id)]
+    assert {o.type: o.status for o in sides}[filled] == "filled"
+    assert sorted(o.status for o in sides) == ["canceled", "filled"]
+
+    with pytest.raises(APIError) as unsupported:
+        api.submit_order(
+            symbol="AAPL", qty=1, side="buy", type="market", order_class="oto"
+        )
+    assert unsupported.value.status_code == 422
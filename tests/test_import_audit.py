@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Import audit tests
+Tests the -X importtime parser and that the trading engine's cold start does
+not pull in heavy optional dependencies
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.import_audit import audit, parse_importtime
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _bootlocale
+import time:       300 |        420 |   pandas.core
+import time:       500 |        920 | pandas
+not an importtime line
+"""
+
+
+def test_parse_importtime_rows():
+    rows = parse_importtime(SAMPLE)
+    assert [r["module"] for r in rows] == ["_bootlocale", "pandas.core", "pandas"]
+    assert rows[-1] == {
+        "module": "pandas",
+        "self_us": 500,
+        "cumulative_us": 920,
+        "depth": 0,
+    }
+    assert rows[0]["depth"] == 2
+
+
+def test_engine_cold_start_skips_heavy_optional_dependencies():
+    result = audit("core.intraday_engine")
+    if not result["ok"]:
+        pytest.skip(f"engine dependencies not installed: {result['error']}")
+    assert result["heavy_optional"] == []
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Latency histogram tests
+Tests bucket accuracy, percentiles and named spans
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.latency import LatencyHistogram, LatencyRecorder
+
+
+def test_buckets_cover_every_value_within_relative_error():
+    for us in (0, 1, 63, 64, 65, 1000, 123_456, 9_999_999):
+        low, high = LatencyHistogram._bucket_bounds(LatencyHistogram._index(us))
+        assert low <= us <= high
+        assert high - low <= max(1, us / 32)
+
+
+def test_percentiles_track_recorded_distribution():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.04)
+    assert histogram.percentile(95) == pytest.approx(0.95, rel=0.04)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.04)
+    assert histogram.percentile(100) <= 1.0
+
+
+def test_recorder_spans_and_summary():
+    recorder = LatencyRecorder()
+    with recorder.span("order_submit"):
+        pass
+    with pytest.raises(ValueError):
+        with recorder.span("order_submit"):
+            raise ValueError("rejected")
+
+    @recorder.timed("stop_check")
+    def check():
+        return 42
+
+    assert check() == 42
+    summary = recorder.summary()
+    assert summary["order_submit"]["count"] == 2
+    assert summary["stop_check"]["count"] == 1
+    assert {"p50_ms", "p95_ms", "p99_ms", "max_ms"} <= set(summary["stop_check"])
+
+    recorder.reset()
+    assert recorder.summary()["order_submit"] == {"count": 0}
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Logger tests
+Tests call-site rate limiting, the loggers exempt from it and the queued
+logging backend
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import config
+from utils.logger import CallSiteRateLimiter, flush_logging, setup_logger
+
+
+def _record(level=logging.INFO, lineno=10, msg="tick %s"):
+    return logging.LogRecord("engine", level, "engine.py", lineno, msg, (1,), None)
+
+
+def test_rate_limiter_bursts_then_samples_and_reports_drops():
+    limiter = CallSiteRateLimiter(rate=0.0, burst=3, sample_every=5)
+    passed = [r for r in (_record() for _ in range(13)) if limiter.filter(r)]
+
+    # 3 from the burst, then every 5th
+    assert len(passed) == 5
+    assert passed[3].getMessage() == "tick 1 [+4 suppressed]"
+    # Other call sites and warnings are unaffected
+    assert limiter.filter(_record(lineno=11))
+    assert limiter.filter(_record(level=logging.WARNING))
+
+
+def test_queued_logger_writes_lazily_formatted_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = setup_logger("test_queued_logger")
+    logger.info("Got %d bars of data for %s", 100, "AAPL")
+
+    assert flush_logging()
+    (log_file,) = (tmp_path / "logs").glob("intraday_test_queued_logger_*.log")
+    assert "Got 100 bars of data for AAPL" in log_file.read_text()
+
+
+def test_audit_loggers_are_never_rate_limited(tmp_path, monkeypatch):
+    assert {"order_manager", "emergency_executor", "trade_updates"} <= set(
+        config.get("LOG_RATE_LIMIT_EXEMPT")
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "LOG_RATE_LIMIT_EXEMPT", ("test_audit_logger",))
+    audit = setup_logger("test_audit_logger")
+    limited = setup_logger("test_limited_logger")
+    for logger in (audit, limited):
+        for i in range(100):
+            logger.info("flatten order %d", i)
+
+    assert flush_logging()
+    logs = tmp_path / "logs"
+    (audit_file,) = logs.glob("intraday_test_audit_logger_*.log")
+    (limited_file,) = logs.glob("intraday_test_limited_logger_*.log")
+    assert len(audit_file.read_text().splitlines()) == 100
+    assert len(limited_file.read_text().splitlines()) < 100
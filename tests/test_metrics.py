@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Metrics endpoint tests
+Tests Prometheus text rendering, the HTTP endpoint and API call instrumentation
+"""
+
+import sys
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.api_client import InstrumentedREST
+from utils.latency import LatencyRecorder
+from utils.metrics import MetricsRegistry, MetricsServer, metrics
+
+
+def test_render_counters_collectors_and_histograms():
+    registry = MetricsRegistry()
+    registry.describe("orders_total", "counter", "Orders submitted")
+    registry.inc("orders_total", side="buy")
+    registry.inc("orders_total", 2, side="buy")
+    registry.add_collector(
+        lambda: [("open_positions", "gauge", "Open positions", [({}, 3)])]
+    )
+    recorder = LatencyRecorder()
+    recorder.record("order_submit", 0.002)
+    recorder.record("order_submit", 0.2)
+    registry.add_histograms("stage_seconds", "Stage latency", recorder, "stage")
+
+    text = registry.render()
+    assert "# TYPE orders_total counter" in text
+    assert 'orders_total{side="buy"} 3' in text
+    assert "open_positions 3" in text
+    assert "# TYPE stage_seconds histogram" in text
+    assert 'stage_seconds_bucket{stage="order_submit",le="0.0025"} 1' in text
+    assert 'stage_seconds_bucket{stage="order_submit",le="+Inf"} 2' in text
+    assert 'stage_seconds_count{stage="order_submit"} 2' in text
+
+
+def test_endpoint_serves_metrics_from_background_thread():
+    registry = MetricsRegistry()
+    registry.inc("loop_iterations_total", 7)
+    server = MetricsServer(registry, port=0).start()
+    try:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert "loop_iterations_total 7" in response.read().decode()
+    finally:
+        server.stop()
+
+
+def test_instrumented_rest_counts_calls_and_errors():
+    class FakeREST:
+        base_url = "https://paper-api.alpaca.markets"
+
+        def list_positions(self):
+            return ["AAPL"]
+
+        def get_order(self, order_id):
+            raise RuntimeError("not found")
+
+    api = InstrumentedREST(FakeREST())
+    calls = metrics.value("alpaca_api_calls_total", endpoint="list_positions")
+    errors = metrics.value("alpaca_api_errors_total", endpoint="get_order")
+
+    assert api.list_positions() == ["AAPL"]
+    with pytest.raises(RuntimeError):
+        api.get_order("abc")
+
+    assert api.base_url == FakeREST.base_url
+    assert metrics.value("alpaca_api_calls_total", endpoint="list_positions") == (
+        calls + 1
+    )
+    assert metrics.value("alpaca_api_errors_total", endpoint="get_order") == errors + 1
+    assert 'alpaca_api_latency_seconds_count{endpoint="get_order"}' in metrics.render()
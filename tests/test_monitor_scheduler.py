@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Protective monitor scheduler tests
+Tests that check intervals follow the ATR distance to the nearest trigger
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+np = pytest.importorskip("numpy")
+
+from core.monitor_scheduler import MISSING_PRICE_INTERVAL, ProtectiveMonitorScheduler
+
+
+def _scheduler():
+    return ProtectiveMonitorScheduler(
+        min_interval=0.1, max_interval=5.0, seconds_per_atr=4.0
+    )
+
+
+def test_intervals_scale_with_distance():
+    scheduler = _scheduler()
+    scheduler.reschedule(
+        {"NEAR": 0.0, "MID": 0.5, "FAR": 10.0, "NOPRICE": float("nan")}, now=100.0
+    )
+
+    assert scheduler.intervals["NEAR"] == pytest.approx(0.1)
+    assert scheduler.intervals["MID"] == pytest.approx(2.1)
+    assert scheduler.intervals["FAR"] == pytest.approx(5.0)
+    assert scheduler.intervals["NOPRICE"] == MISSING_PRICE_INTERVAL
+
+    symbols = ["NEAR", "MID", "FAR", "NOPRICE", "NEW"]
+    assert scheduler.due(symbols, now=100.05) == ["NEW"]
+    assert scheduler.due(symbols, now=100.2) == ["NEAR", "NEW"]
+    assert scheduler.due(symbols, now=102.2) == ["NEAR", "MID", "NOPRICE", "NEW"]
+    assert scheduler.seconds_until_next(now=100.0) == pytest.approx(0.1)
+
+
+def test_retain_forgets_closed_positions():
+    scheduler = _scheduler()
+    scheduler.reschedule({"AAA": 1.0, "BBB": 1.0}, now=0.0)
+    scheduler.retain(["BBB"])
+    assert "AAA" not in scheduler.intervals
+    assert scheduler.seconds_until_next(now=0.0) == pytest.approx(4.1)
+
+    scheduler.retain([])
+    assert scheduler.seconds_until_next(now=0.0, default=1.0) == 1.0
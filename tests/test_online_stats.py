@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Online statistics tests
+Tests streaming trade statistics against batch calculations
+"""
+
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.online_stats import OnlinePerformanceStats, RollingWinRate
+
+PNLS = [12.5, -4.0, 7.25, -9.5, -3.0, 15.0, 2.0, -6.75, 4.5, -1.0]
+
+
+def test_matches_batch_statistics():
+    stats = OnlinePerformanceStats(window=4)
+    for pnl in PNLS:
+        stats.update(pnl)
+
+    assert stats.pnl.mean == pytest.approx(statistics.mean(PNLS))
+    assert stats.pnl.std == pytest.approx(statistics.stdev(PNLS))
+    assert stats.sharpe_ratio == pytest.approx(
+        statistics.mean(PNLS) / statistics.stdev(PNLS)
+    )
+    assert stats.win_rate == pytest.approx(0.5)
+    assert stats.expectancy == pytest.approx(statistics.mean(PNLS))
+
+    equity, peak, max_dd = 0.0, 0.0, 0.0
+    for pnl in PNLS:
+        equity += pnl
+        peak = max(peak, equity)
+        max_dd = max(max_dd, peak - equity)
+    assert stats.drawdown.high_water_mark == pytest.approx(peak)
+    assert stats.drawdown.max_drawdown == pytest.approx(max_dd)
+
+    snapshot = stats.snapshot()
+    assert snapshot["trades"] == len(PNLS)
+    assert snapshot["rolling_win_rate"] == pytest.approx(0.5)
+
+
+def test_rolling_win_rate_window():
+    rate = RollingWinRate(window=3)
+    assert rate.value is None
+    for won in (True, True, True, False, False):
+        rate.update(won)
+    assert rate.value == pytest.approx(1 / 3)
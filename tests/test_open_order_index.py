@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Open order index tests
+Tests symbol/type lookups, trade update handling and broker reconcile
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from core.open_order_index import STOP_ORDER_TYPES, OpenOrderIndex
+except ImportError as e:
+    pytest.skip(f"Open order index import failed: {e}", allow_module_level=True)
+
+
+def _order(order_id, symbol, order_type, status="new", legs=None):
+    return SimpleNamespace(
+        id=order_id,
+        client_order_id=f"c-{order_id}",
+        symbol=symbol,
+        side="sell",
+        order_type=order_type,
+        qty="10",
+        stop_price=None,
+        limit_price=None,
+        status=status,
+        legs=legs,
+    )
+
+
+def test_lookup_by_symbol_and_type():
+    index = OpenOrderIndex()
+    bracket = _order(
+        "entry",
+        "SOFI",
+        "market",
+        legs=[_order("tp", "SOFI", "limit"), _order("sl", "SOFI", "stop")],
+    )
+    index.add(bracket)
+    index.add(_order("other", "NIO", "stop"))
+
+    assert {o["id"] for o in index.orders_for("SOFI")} == {"entry", "tp", "sl"}
+    assert [o["id"] for o in index.orders_for("SOFI", STOP_ORDER_TYPES)] == ["sl"]
+
+    # Fill event removes; a late REST response can't bring it back
+    index.on_trade_update({"event": "fill", "order": {"id": "entry"}})
+    index.add(_order("entry", "SOFI", "market"))
+    assert "entry" not in index
+    assert len(index.orders_for("SOFI")) == 2
+
+
+def test_reconcile_replaces_drifted_state():
+    index = OpenOrderIndex()
+    index.add(_order("gone", "INTC", "stop"))
+    broker = SimpleNamespace(
+        list_orders=lambda **kwargs: [_order("missed", "TQQQ", "trailing_stop")]
+    )
+
+    assert index.is_stale(60)
+    assert index.reconcile(broker) == 2
+    assert [o["id"] for o in index.all_orders()] == ["missed"]
+    assert not index.is_stale(60)
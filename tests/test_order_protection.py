@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Order protection tests
+Tests broker-native protection modes against the local fake broker: bracket
+parameters, trailing stops attached from the entry's fill for the filled
+quantity, unfilled entries cancelled, and cancelling protective orders
+before a close, including stale open-order index entries
+"""
+
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+tradeapi = pytest.importorskip("alpaca_trade_api")
+
+from config import config
+from core.order_manager import OrderManager
+from utils.fake_broker import FakeBroker
+from utils.synthetic_market import SESSION_MINUTES, SyntheticMarket
+
+THRESHOLDS = {"trailing_distance_pct": 0.01}
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    market = SyntheticMarket(["AAPL"], days=2, seed=3, end_date=date(2024, 6, 14))
+    market.rewind(SESSION_MINUTES + 60)
+    broker = FakeBroker(
+        market,
+        port=0,
+        latency_ms=0,
+        jitter_ms=0,
+        rate_limit=0,
+        fill_delay_ms=30,
+        partial_fill_probability=0,
+        reject_probability=0,
+    ).start()
+    for name, value in broker.environment().items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("APCA_RETRY_MAX", "0")
+    monkeypatch.setattr(config, "TRADE_UPDATE_STREAM_ENABLED", False)
+    yield broker
+    broker.stop()
+
+
+def make_manager(broker, monkeypatch, mode):
+    monkeypatch.setattr(config, "ORDER_PROTECTION_MODE", mode)
+    api = tradeapi.REST("test-key", "test-secret", broker.url, api_version="v2")
+    data_manager = SimpleNamespace(
+        api=api,
+        get_positions=lambda: [],
+        get_current_price=lambda symbol: 100.0,
+        get_account_info=lambda: {"equity": 100000.0, "buying_power": 100000.0},
+    )
+    return OrderManager(data_manager, reconcile=False)
+
+
+def broker_orders(manager):
+    return sorted(
+        (o.type, o.side, float(o.qty), o.status)
+        for o in manager.api.list_orders(status="all")
+    )
+
+
+def test_bracket_entry_carries_stop_and_target_legs(broker, monkeypatch):
+    manager = make_manager(broker, monkeypatch, "bracket")
+    order = manager._submit_protected_entry(
+        "AAPL", 10, "buy", 99.123, 102.456, THRESHOLDS
+    )
+    assert broker.settle()
+
+    legs = {leg.type: leg for leg in manager.api.get_order(order.id).legs}
+    assert float(legs["stop"].stop_price) == 99.12
+    assert float(legs["limit"].limit_price) == 102.46
+    assert {leg.side for leg in legs.values()} == {"sell"}
+    assert manager.native_protection["AAPL"] == {
+        "mode": "bracket",
+        "order_ids": [leg.id for leg in manager.api.get_order(order.id).legs],
+    }
+
+
+def test_trailing_stop_follows_the_entry_fill(broker, monkeypatch):
+    manager = make_manager(broker, monkeypatch, "trailing")
+    result = manager.place_buy_order("AAPL", {"strategy": "test"})
+
+    # Nothing protective goes out while the entry is open - not even a plain stop
+    assert broker_orders(manager) == [("market", "buy", 10, "new")]
+    assert manager.is_natively_protected("AAPL")
+
+    assert broker.settle()
+    manager.maybe_reconcile_orders()  # per tick: polls the entry with no stream
+    entry = manager.api.get_order(result["order_id"])
+    trail_id = manager.native_protection["AAPL"]["order_ids"][0]
+    trail = manager.api.get_order(trail_id)
+    assert (trail.type, trail.side, float(trail.qty)) == ("trailing_stop", "sell", 10)
+    trail_pct = manager.get_stock_thresholds("AAPL")["trailing_distance_pct"]
+    assert float(trail.trail_percent) == round(trail_pct * 100, 2)
+    assert trail.submitted_at >= entry.filled_at
+    assert "AAPL" not in manager.trailing_stop_manager.stop_orders
+
+    # A manual close frees the shares by cancelling the broker-held stop
+    assert manager._cancel_native_protection("AAPL") == 1
+    assert manager.api.get_order(trail_id).status == "canceled"
+    assert not manager.is_natively_protected("AAPL")
+    assert manager._cancel_native_protection("AAPL") == 0
+
+
+def test_unfilled_entry_is_cancelled_without_any_exit(broker, monkeypatch):
+    broker.fill_delay_ms = 2000
+    monkeypatch.setattr(config, "NATIVE_PROTECTION_FILL_TIMEOUT", 0.1)
+    manager = make_manager(broker, monkeypatch, "trailing")
+    manager.place_buy_order("AAPL", {"strategy": "test"})
+    time.sleep(0.15)
+
+    manager.check_pending_protection()  # past the timeout: cancel the entry
+    manager.check_pending_protection()  # its final status settles it
+    assert broker_orders(manager) == [("market", "buy", 10, "canceled")]
+    assert not manager.is_natively_protected("AAPL")
+    assert not manager.pending_protection
+    assert manager.trailing_stop_manager.get_position_status("AAPL") is None
+
+
+@pytest.mark.parametrize("trailing_accepted", [True, False])
+def test_partial_fill_is_protected_for_the_filled_quantity(
+    broker, monkeypatch, trailing_accepted
+):
+    broker.fill_delay_ms = 2000
+    manager = make_manager(broker, monkeypatch, "trailing")
+    order = manager._submit_protected_entry("AAPL", 10, "buy", 99.0, 0, THRESHOLDS)
+    if not trailing_accepted:
+        submit = manager._submit_order
+
+        def reject_trailing(**kwargs):
+            if kwargs["type"] == "trailing_stop":
+                raise RuntimeError("trailing stops not allowed")
+            return submit(**kwargs)
+
+        monkeypatch.setattr(manager, "_submit_order", reject_trailing)
+
+    # Stream event: the entry was cancelled after 4 of 10 shares filled
+    manager.on_trade_update(
+        {
+            "event": "canceled",
+            "order_id": order.id,
+            "status": "canceled",
+            "filled_qty": 4.0,
+        }
+    )
+    exits = [o for o in manager.api.list_orders(status="all") if o.side == "sell"]
+    assert [float(o.qty) for o in exits] == [4.0]
+    if trailing_accepted:
+        assert exits[0].type == "trailing_stop"
+        assert manager.native_protection["AAPL"]["order_ids"] == [exits[0].id]
+    else:
+        assert (exits[0].type, float(exits[0].stop_price)) == ("stop", 99.0)
+        assert not manager.is_natively_protected("AAPL")
+        assert manager.trailing_stop_manager.stop_orders["AAPL"] == exits[0].id
+
+
+def test_stale_index_entry_does_not_stop_the_stop_cancels(broker, monkeypatch):
+    manager = make_manager(broker, monkeypatch, "managed")
+    stops = [
+        manager._submit_order(
+            symbol="AAPL",
+            qty=5,
+            side="sell",
+            type="stop",
+            stop_price=90.0,
+            time_in_force="day",
+        )
+        for _ in range(3)
+    ]
+    # The first stop closed at the broker without the index hearing about it
+    manager.api.cancel_order(stops[0].id)
+
+    manager._cancel_existing_stop_orders("AAPL")
+    assert [manager.api.get_order(o.id).status for o in stops] == ["canceled"] * 3
+    assert manager.open_orders.orders_for("AAPL") == []
+    assert manager.cancel_all_orders(symbol="AAPL") == 0
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Protective check tests
+Tests the batched stop / target / max-hold evaluation
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+np = pytest.importorskip("numpy")
+
+from core.protective_checks import ProtectiveChecker
+from utils.clock import SimulatedClock
+from utils.synthetic_market import EASTERN
+
+NOW = datetime(2025, 3, 4, 11, 0, 0)
+
+
+def _position(signal_type, entry, stop, target, age_seconds, original_stop=None):
+    return {
+        "signal": SimpleNamespace(signal_type=signal_type, profit_target=target),
+        "entry_price": entry,
+        "stop_loss": stop,
+        "original_stop_loss": original_stop if original_stop is not None else stop,
+        "profit_target": target,
+        "entry_ts": NOW.timestamp() - age_seconds,
+        "minimum_hold_time": 30,
+    }
+
+
+def _evaluate(positions, prices):
+    checker = ProtectiveChecker(
+        hard_stop_pct=0.25, emergency_stop_pct=2.0, max_hold_seconds=3600
+    )
+    triggers = checker.evaluate(positions, prices, now=NOW.timestamp())
+    return {t.symbol: t.reason for t in triggers}
+
+
+def test_all_exit_conditions_in_one_pass():
+    positions = {
+        "STOP": _position("BUY", 10.0, 9.90, 10.30, 120),
+        "TRAIL": _position("SELL", 20.0, 19.80, 19.40, 120, original_stop=20.30),
+        "HARD": _position("BUY", 50.0, 49.00, 52.00, 120),
+        "OLD": _position("BUY", 30.0, 29.00, 31.00, 7200),
+        "TGT": _position("SELL", 40.0, 40.60, 39.00, 120),
+        "HOLD": _position("BUY", 10.0, 9.90, 10.30, 5),
+        "PANIC": _position("BUY", 10.0, 9.90, 10.30, 5),
+        "OK": _position("BUY", 10.0, 9.90, 10.30, 120),
+        "NODATA": _position("BUY", 10.0, 9.90, 10.30, 120),
+    }
+    prices = {
+        "STOP": 9.89,
+        "TRAIL": 19.85,
+        "HARD": 49.80,
+        "OLD": 30.05,
+        "TGT": 38.90,
+        "HOLD": 9.85,
+        "PANIC": 9.70,
+        "OK": 10.01,
+    }
+
+    assert _evaluate(positions, prices) == {
+        "STOP": "stop_loss",
+        "TRAIL": "trailing_stop",
+        "HARD": "hard_stop",
+        "OLD": "max_hold",
+        "TGT": "profit_target",
+        "PANIC": "emergency_stop",
+    }
+
+
+def test_no_positions_or_prices():
+    assert _evaluate({}, {"AAA": 1.0}) == {}
+    positions = {"AAA": _position("BUY", 10.0, 9.90, 10.30, 120)}
+    assert _evaluate(positions, {"AAA": 0.0}) == {}
+
+
+def test_distance_to_nearest_trigger_in_atr_units():
+    positions = {
+        "OK": _position("BUY", 10.0, 9.90, 10.30, 120),
+        "ATR": dict(_position("SELL", 20.0, 20.30, 19.40, 120), atr_pct_entry=1.0),
+        "HIT": _position("BUY", 10.0, 9.90, 10.30, 120),
+    }
+    checker = ProtectiveChecker(max_hold_seconds=3600)
+    result = checker.check(
+        positions, {"OK": 10.01, "ATR": 20.10, "HIT": 9.80}, now=NOW.timestamp()
+    )
+
+    # No ATR recorded: the planned stop distance (0.10) is the unit
+    assert result.distance_atr["OK"] == pytest.approx(1.1)
+    assert result.distance_atr["ATR"] == pytest.approx(1.0)
+    assert result.distance_atr["HIT"] == 0.0
+
+
+def test_malformed_position_is_skipped_not_treated_as_fresh():
+    broken = _position("BUY", 10.0, 9.90, 10.30, 7200)
+    del broken["entry_ts"]
+    positions = {"OK": _position("BUY", 10.0, 9.90, 10.30, 7200), "BAD": broken}
+
+    checker = ProtectiveChecker(max_hold_seconds=3600)
+    for _ in range(2):
+        result = checker.check(
+            positions, {"OK": 10.01, "BAD": 10.01}, now=NOW.timestamp()
+        )
+    assert [(t.symbol, t.reason) for t in result.triggers] == [("OK", "max_hold")]
+    assert "BAD" not in result.distance_atr
+    assert checker.build_table(positions)["malformed"] == [("BAD", ["entry_ts"])]
+
+
+def test_hold_time_follows_the_engine_clock_in_any_host_zone(monkeypatch):
+    # A simulated session's naive now() is exchange time, not host time;
+    # hold times must not depend on how the host would read it
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    try:
+        clock = SimulatedClock(EASTERN.localize(datetime(2024, 6, 14, 9, 30)))
+        positions = {"AAA": dict(_position("BUY", 10.0, 9.90, 10.30, 0))}
+        positions["AAA"]["entry_ts"] = clock.time()
+        checker = ProtectiveChecker(max_hold_seconds=3600)
+
+        clock.sleep(31)
+        assert checker.evaluate(positions, {"AAA": 10.0}, now=clock.time()) == []
+        clock.sleep(3600)
+        triggers = checker.evaluate(positions, {"AAA": 10.0}, now=clock.time())
+        assert [t.reason for t in triggers] == ["max_hold"]
+    finally:
+        monkeypatch.undo()
+        time.tzset()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Risk ledger tests
+Tests incremental exposure/open-risk updates, the full reconcile and fills
+racing it, stops that arrive before their fill and the signal bias the
+engine derives from short exposure
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from core.risk_ledger import RiskLedger
+except ImportError as e:
+    pytest.skip(f"Risk ledger import failed: {e}", allow_module_level=True)
+
+
+def test_fills_update_aggregates_incrementally():
+    ledger = RiskLedger()
+    ledger.apply_fill("SOFI", "buy", 100, 10.0)
+    ledger.apply_fill("SOFI", "buy", 100, 11.0)
+    ledger.apply_fill("NIO", "sell", 50, 8.0)
+
+    assert ledger.position("SOFI")["avg_price"] == pytest.approx(10.5)
+    assert ledger.long_exposure == pytest.approx(2100.0)
+    assert ledger.short_exposure == pytest.approx(400.0)
+    assert ledger.gross_exposure == pytest.approx(2500.0)
+    assert ledger.net_exposure == pytest.approx(1700.0)
+
+    ledger.set_stop("SOFI", 10.0)
+    ledger.set_stop("NIO", 8.5)
+    assert ledger.open_risk == pytest.approx(200 * 0.5 + 50 * 0.5)
+
+    # Partial exit keeps the entry price, full exit removes the symbol
+    ledger.apply_fill("SOFI", "sell", 150, 12.0)
+    assert ledger.position("SOFI")["qty"] == 50
+    assert ledger.long_exposure == pytest.approx(525.0)
+    ledger.apply_fill("NIO", "buy", 50, 7.5)
+    assert "NIO" not in ledger
+    assert ledger.short_exposure == pytest.approx(0.0)
+    assert ledger.open_risk == pytest.approx(25.0)
+
+
+def test_reconcile_corrects_drift_and_keeps_stops():
+    ledger = RiskLedger()
+    ledger.apply_fill("SOFI", "buy", 100, 10.0)
+    ledger.set_stop("SOFI", 9.8)
+    ledger.apply_fill("GONE", "buy", 10, 5.0)
+
+    drift = ledger.reconcile(
+        [
+            {"symbol": "SOFI", "qty": 100, "side": "long", "avg_entry_price": 10.0},
+            {"symbol": "NEW", "qty": -20, "side": "short", "avg_entry_price": 4.0},
+        ]
+    )
+    assert drift == 2
+    assert len(ledger) == 2
+    assert ledger.open_risk == pytest.approx(20.0)
+    assert ledger.short_exposure == pytest.approx(80.0)
+    assert ledger.reconcile_count == 1
+    assert ledger.total_reconcile_seconds >= 0
+
+
+def test_reconcile_keeps_fills_that_race_the_position_listing():
+    ledger = RiskLedger()
+    ledger.apply_fill("SOFI", "buy", 100, 10.0)
+    started = time.monotonic()
+    # Stream fills applied while list_positions was in flight
+    ledger.apply_fill("SOFI", "buy", 50, 10.0)
+    ledger.apply_fill("NIO", "sell", 50, 8.0)
+
+    listing = [
+        {"symbol": "SOFI", "qty": 100, "avg_entry_price": 10.0},
+        {"symbol": "INTC", "qty": 10, "avg_entry_price": 20.0},
+    ]
+    assert ledger.reconcile(listing, started=started) == 1
+    assert ledger.position("SOFI")["qty"] == 150
+    assert ledger.position("NIO")["qty"] == -50
+    assert ledger.long_exposure == pytest.approx(1700.0)
+
+    # A fill the listing already held, delivered afterwards, is not doubled
+    ledger.reconcile([{"symbol": "AMD", "qty": 20, "avg_entry_price": 5.0}])
+    ledger.apply_fill("AMD", "buy", 20, 5.0, position_qty=20)
+    assert ledger.position("AMD")["qty"] == 20
+    ledger.apply_fill("AMD", "buy", 10, 5.0, position_qty=30)
+    assert ledger.position("AMD")["qty"] == 30
+
+
+def test_stop_set_before_the_fill_event_is_applied_on_arrival():
+    from core.risk_manager import RiskManager
+
+    manager = RiskManager()
+    manager.trade_updates = SimpleNamespace(is_connected=True)
+    manager.track_position_opened("SOFI", "BUY", 100, 10.0, stop_price=9.8)
+    assert "SOFI" not in manager.ledger and manager.ledger.open_risk == 0
+
+    fill = {"event": "fill", "symbol": "SOFI", "side": "buy", "price": 10.0}
+    manager.on_trade_update(dict(fill, fill_qty=100))
+    assert manager.ledger.open_risk == pytest.approx(20.0)
+
+    # A stop whose fill was never seen is not carried to a later position
+    manager.track_position_opened("NIO", "SELL", 50, 8.0, stop_price=8.5)
+    manager.track_position_closed("NIO", 50, 8.0, 0.0)
+    manager.on_trade_update(dict(fill, symbol="NIO", side="sell", fill_qty=50))
+    assert manager.ledger.position("NIO")["stop"] is None
+
+
+def test_short_exposure_bias_applies_near_a_configured_limit(monkeypatch):
+    try:
+        from config import config
+        from core.intraday_engine import IntradayEngine
+    except ImportError as e:
+        pytest.skip(f"Engine import failed: {e}")
+
+    ledger = RiskLedger()
+    engine = IntradayEngine.__new__(IntradayEngine)
+    engine.risk_manager = SimpleNamespace(total_short_exposure=0.0)
+
+    def biased(short_notional):
+        ledger.reconcile(
+            [{"symbol": "NIO", "qty": -100, "avg_entry_price": short_notional / 100}]
+        )
+        engine.risk_manager.total_short_exposure = ledger.short_exposure
+        signals = [
+            SimpleNamespace(signal_type="BUY", confidence=0.5),
+            SimpleNamespace(signal_type="SELL", confidence=0.6),
+        ]
+        engine._apply_short_exposure_bias(signals)
+        return [s.confidence for s in signals]
+
+    # Inert until a limit is configured
+    assert config.get("MAX_SHORT_EXPOSURE") is None
+    assert biased(900.0) == [0.5, 0.6]
+
+    monkeypatch.setattr(config, "MAX_SHORT_EXPOSURE", 1000, raising=False)
+    assert biased(500.0) == [0.5, 0.6]
+    assert biased(900.0) == pytest.approx([0.65, 0.42])
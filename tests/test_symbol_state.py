@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Symbol state table tests
+Tests interning, dict-style column views, vectorized cooldowns and pruning
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+np = pytest.importorskip("numpy")
+
+from core.symbol_state import SymbolStateTable
+
+
+def test_column_views_behave_like_dicts():
+    table = SymbolStateTable(capacity=2)
+    last_order = table.view("last_order_time")
+    counts = table.view("trade_count")
+
+    last_order["AAPL"] = 100.0
+    for symbol in ("MSFT", "NIO", "SOFI"):  # grows past the initial capacity
+        table.increment("trade_count", symbol)
+    table.increment("trade_count", "NIO")
+
+    assert last_order.get("AAPL", 0) == 100.0
+    assert last_order.get("MSFT", 0) == 0
+    assert "AAPL" in last_order and "MSFT" not in last_order
+    assert dict(counts) == {"MSFT": 1, "NIO": 2, "SOFI": 1}
+
+    del last_order["AAPL"]
+    assert "AAPL" not in last_order
+    with pytest.raises(KeyError):
+        del last_order["AAPL"]
+
+    counts.clear()
+    assert len(counts) == 0 and len(table) == 4
+
+
+def test_signal_cooldown_mask():
+    table = SymbolStateTable()
+    now = 1000.0
+    table.set("last_signal_time", "SIGNAL", now - 30)
+    table.set("failed_signal_time", "FAILED", now - 200)
+    table.set("profitable_close_time", "CLOSED", now - 500)
+    table.set("last_signal_time", "EXPIRED", now - 120)
+
+    symbols = ["SIGNAL", "FAILED", "CLOSED", "EXPIRED", "NEW"]
+    mask = table.signal_cooldown_mask(
+        symbols, now, signal_cooldown=60, failed_cooldown=300, profitable_cooldown=120
+    )
+    assert mask.tolist() == [True, True, False, False, False]
+
+
+def test_prune_recycles_idle_rows():
+    table = SymbolStateTable()
+    now = 10_000.0
+    table.set("last_signal_time", "OLD", now - 1000)
+    table.set("last_signal_time", "HELD", now - 1000)
+    table.set("last_signal_time", "RECENT", now - 10)
+    table.increment("trade_count", "TRADED")
+    old_id = table.intern("OLD")
+
+    released = table.prune(now, max_age=600, keep=["HELD"])
+
+    assert released == 1
+    assert "OLD" not in table and {"HELD", "RECENT", "TRADED"} <= set(table._ids)
+    assert table.intern("NEWCOMER") == old_id
+    assert table.get("last_signal_time", "NEWCOMER") == 0
+
+
+def test_table_survives_pickle():
+    table = SymbolStateTable()
+    table.view("last_order_time")["AAPL"] = 5.0
+    restored = pickle.loads(pickle.dumps(table))
+    assert restored.view("last_order_time")["AAPL"] == 5.0
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Synthetic market tests
+Tests determinism, DataManager-shaped output, the market clock, halts and
+the intraday volume profile
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.synthetic_market import (
+    SESSION_MINUTES,
+    SyntheticDataManager,
+    SyntheticMarket,
+)
+
+FRIDAY = date(2024, 6, 14)
+
+
+def test_same_seed_same_data_regardless_of_universe():
+    small = SyntheticMarket(["AAPL", "TSLA"], days=2, seed=7, end_date=FRIDAY)
+    large = SyntheticMarket(300, days=2, seed=7, end_date=FRIDAY)
+    large.symbols.append("TSLA")
+    other = SyntheticMarket(["TSLA"], days=2, seed=8, end_date=FRIDAY)
+
+    pd.testing.assert_frame_equal(small.bars("TSLA"), large.bars("TSLA"))
+    assert not small.bars("TSLA").equals(other.bars("TSLA"))
+
+
+def test_bars_quotes_and_trades_have_consistent_shapes():
+    market = SyntheticMarket(["AAPL"], days=3, seed=1, end_date=FRIDAY)
+    bars = market.bars("AAPL", limit=100)
+
+    assert list(bars.columns) == ["open", "high", "low", "close", "volume"]
+    assert bars.index.name == "timestamp" and str(bars.index.tz) == "UTC"
+    assert len(bars) == 100 and bars.index.is_monotonic_increasing
+    assert (bars["high"] >= bars[["open", "close"]].max(axis=1)).all()
+    assert (bars["low"] <= bars[["open", "close"]].min(axis=1)).all()
+    assert bars.index[-1] == pd.Timestamp("2024-06-14 19:59", tz="UTC")
+
+    quotes = market.quotes("AAPL", limit=100)
+    assert (quotes["ask_price"] > quotes["bid_price"]).all()
+    trades = market.trades("AAPL", limit=100, per_bar=4)
+    assert len(trades) == 400
+    assert (
+        trades["size"]
+        .groupby(np.arange(400) // 4)
+        .sum()
+        .le(bars["volume"].to_numpy() + 4)
+        .all()
+    )
+
+    daily = market.bars("AAPL", timeframe="1Day")
+    assert len(daily) == 3
+    assert daily["volume"].iloc[-1] == market.bars("AAPL").iloc[-390:]["volume"].sum()
+
+
+def test_clock_replays_sessions_and_data_manager_follows():
+    market = SyntheticMarket(["AAPL"], days=2, seed=3, end_date=FRIDAY)
+    data_manager = SyntheticDataManager(market)
+    market.rewind(SESSION_MINUTES)
+    first_close = data_manager.get_current_price("AAPL")
+
+    assert len(data_manager.get_bars("AAPL", "1Min", limit=500)) <= SESSION_MINUTES
+    assert market.advance(30)
+    assert market.now == pd.Timestamp("2024-06-14 13:59", tz="UTC")
+    assert data_manager.get_bars("AAPL", "1Min", limit=5).index[-1] == market.now
+    assert data_manager.get_current_price("AAPL") != first_close
+    assert data_manager.get_current_price("MSFT") is None
+
+
+def test_halts_leave_gaps_and_volume_is_u_shaped():
+    market = SyntheticMarket(400, days=2, seed=11, end_date=FRIDAY)
+    series = [market.series(symbol) for symbol in market.symbols]
+
+    halted = [m for m, s in zip(market.symbols, series) if not s["present"].all()]
+    assert halted
+    for symbol in halted:
+        assert len(market.bars(symbol)) < 2 * SESSION_MINUTES
+
+    volume = np.mean(
+        [s["volume"].reshape(2, SESSION_MINUTES).mean(axis=0) for s in series], axis=0
+    )
+    midday = volume[150:240].mean()
+    assert volume[:15].mean() > 2 * midday
+    assert volume[-15:].mean() > 1.5 * midday
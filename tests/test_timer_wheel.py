@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Timer wheel tests
+Tests expiry timing across wheel levels and the cooldown eligibility set
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.timer_wheel import GLOBAL, CooldownService, TimerWheel
+
+
+def test_timers_fire_on_time_across_levels():
+    rng = random.Random(7)
+    wheel = TimerWheel(tick=1.0, wheel_sizes=(4, 4, 4), now=0)
+    deadlines = {k: rng.uniform(0, 500) for k in range(500)}
+    for key, deadline in deadlines.items():
+        wheel.schedule(key, deadline)
+    for key in range(0, 500, 5):
+        assert wheel.cancel(key)
+        del deadlines[key]
+
+    fired = {}
+    now = 0.0
+    while now < 600:
+        now += rng.uniform(0.5, 30)
+        for key in wheel.advance(now):
+            fired[key] = now
+
+    assert fired.keys() == deadlines.keys()
+    assert len(wheel) == 0
+    for key, at in fired.items():
+        # Never early, and due at the first advance past the deadline's tick
+        assert at >= deadlines[key]
+
+
+def test_rescheduling_replaces_timer_and_runs_callback():
+    calls = []
+    wheel = TimerWheel(tick=0.1, now=100.0)
+    wheel.schedule("AAPL", 101.0, calls.append)
+    wheel.schedule("AAPL", 105.0, calls.append)
+
+    assert wheel.advance(102.0) == [] and calls == []
+    assert wheel.advance(105.05) == ["AAPL"] and calls == ["AAPL"]
+
+
+def test_cooldown_service_tracks_eligible_symbols():
+    expired = []
+    cooldowns = CooldownService(wheel=TimerWheel(tick=0.1, now=0.0))
+    cooldowns.watch(["AAPL", "NIO", "SOFI"])
+
+    cooldowns.start("signal", "AAPL", 60, now=0.0)
+    cooldowns.start("failed_signal", "AAPL", 300, now=0.0)
+    cooldowns.start(
+        "profitable_close", "NIO", 120, callback=lambda *e: expired.append(e), now=0.0
+    )
+    cooldowns.start("order", "SOFI", 3, now=0.0)  # not a signal-blocking kind
+    cooldowns.start("global_pause", GLOBAL, 600, now=0.0)
+
+    assert cooldowns.eligible_symbols(now=1.0) == {"SOFI"}
+    assert cooldowns.remaining("order", "SOFI", now=1.0) == 2.0
+
+    assert cooldowns.eligible_symbols(now=130.0) == {"SOFI", "NIO"}
+    assert expired == [("profitable_close", "NIO")]
+    assert not cooldowns.is_eligible("AAPL", now=130.0)
+    assert cooldowns.is_eligible("AAPL", now=301.0)
+    assert cooldowns.active("global_pause", GLOBAL, now=301.0)
+
+    cooldowns.cancel("global_pause", GLOBAL)
+    assert cooldowns.active_count() == 0
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Trailing stop book tests
+Tests the vectorized struct-of-arrays trailing stop update
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+np = pytest.importorskip("numpy")
+
+from core.trailing_stop_book import TrailingStopBook
+
+
+def _book():
+    book = TrailingStopBook(capacity=2)
+    book.add("LONG", 100.0, 10, "long", 98.50, 0.01, 0.015, 0.005)
+    book.add("SHORT", 50.0, 5, "short", 50.75, 0.01, 0.015, 0.005)
+    return book
+
+
+def test_stops_ratchet_and_trigger():
+    """Stops move toward price once active and trigger on a cross"""
+    book = _book()
+
+    result = book.update(book.price_vector({"LONG": 102.0, "SHORT": 49.0}))
+    assert sorted(book.symbols[i] for i in result.activated) == ["LONG", "SHORT"]
+    assert book.stop[book.slot("LONG")] == pytest.approx(100.47)
+    assert book.stop[book.slot("SHORT")] == pytest.approx(49.74)
+    assert len(result.triggered) == 0
+
+    # Stops never loosen when price pulls back
+    result = book.update(book.price_vector({"LONG": 101.0, "SHORT": 49.5}))
+    assert len(result.moved) == 0
+    assert book.stop[book.slot("LONG")] == pytest.approx(100.47)
+
+    result = book.update(book.price_vector({"LONG": 100.40, "SHORT": 49.80}))
+    assert sorted(book.symbols[i] for i in result.triggered) == ["LONG", "SHORT"]
+
+
+def test_missing_prices_and_slot_reuse():
+    """NaN prices leave rows untouched and freed slots are reused"""
+    book = _book()
+    result = book.update(book.price_vector({"LONG": 90.0}))
+    assert [book.symbols[i] for i in result.triggered] == ["LONG"]
+    assert book.price[book.slot("SHORT")] == 50.0
+
+    slot = book.slot("LONG")
+    book.remove("LONG")
+    assert "LONG" not in book
+    assert book.add("NEW", 10.0, 1, "long", 9.85, 0.01, 0.015, 0.005) == slot
+
+    # Growing past capacity keeps existing rows
+    book.add("MORE", 20.0, 1, "long", 19.70, 0.01, 0.015, 0.005)
+    assert book.capacity == 4
+    assert book.entry[book.slot("SHORT")] == 50.0
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+API Cassettes
+Record and replay of Alpaca REST traffic, so a real session can be
+profiled, benchmarked and regression-tested offline. The cassette sits
+under the REST client's HTTP session (InstrumentedREST attaches it), so
+every trading and market data call is covered without touching call sites.
+
+Record mode writes each exchange to one SQLite file per session in
+logs/cassettes/: when it started relative to the session, how long it took,
+the request (URL, query, JSON body; never the credential headers) and the
+response (status, body), zlib-compressed, indexed by a hash of the request.
+
+Replay mode serves those responses instead of the network. A request gets
+the next unserved response recorded for the same method, path and fields;
+volatile fields (API_CASSETTE_IGNORE_FIELDS: start/end windows, client order
+ids) are left out of the match. Failing that it gets the next unserved
+response for the same endpoint, then the last one it was given, so polling
+past the end of a recording keeps working; a request never seen raises
+CassetteMiss. Responses come back as fast as possible or at the recorded
+latency scaled by API_CASSETTE_REPLAY_SPEED.
+
+    # config.py
+    API_CASSETTE_MODE = "record"   # or "replay"
+
+    player = CassettePlayer("logs/cassettes/session_20250820_093000_1234.cassette")
+    attach_cassette(rest, player)
+"""
+
+import atexit
+import hashlib
+import http
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import config
+from utils.logger import setup_logger
+
+CASSETTE_SUFFIX = ".cassette"
+COMMIT_EVERY = 100  # Recorded exchanges per commit...
+COMMIT_SECONDS = 2.0  # ...or at most this long between commits
+KEPT_HEADERS = ("content-type", "x-ratelimit-limit", "x-ratelimit-remaining")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS interactions (
+    seq INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    duration REAL NOT NULL,
+    route TEXT NOT NULL,
+    key INTEGER NOT NULL,
+    status INTEGER NOT NULL,
+    request BLOB NOT NULL,
+    response BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS interactions_key ON interactions (key, seq);
+"""
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Replay has no recorded response for a request"""
+
+
+def session_name(when: datetime, pid: int) -> str:
+    return f"session_{when.strftime('%Y%m%d_%H%M%S')}_{pid}{CASSETTE_SUFFIX}"
+
+
+def latest_cassette(directory=None) -> Optional[Path]:
+    directory = Path(directory or config.get("API_CASSETTE_DIR", "logs/cassettes"))
+    cassettes = sorted(
+        directory.glob(f"*{CASSETTE_SUFFIX}"), key=lambda p: p.stat().st_mtime
+    )
+    return cassettes[-1] if cassettes else None
+
+
+def match_key(method: str, url: str, params=None, body=None) -> Tuple[str, int]:
+    """(route, hash) identifying a request, without its volatile fields"""
+    ignored = set(config.get("API_CASSETTE_IGNORE_FIELDS", ()))
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.update({k: v for k, v in (params or {}).items() if v is not None})
+    fields = {
+        "query": {k: str(v) for k, v in query.items() if k not in ignored},
+        "body": (
+            {k: v for k, v in body.items() if k not in ignored}
+            if isinstance(body, dict)
+            else body
+        ),
+    }
+    route = f"{method.upper()} {parts.path}"
+    canonical = json.dumps(fields, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.blake2b(f"{route} {canonical}".encode(), digest_size=8).digest()
+    return route, int.from_bytes(digest, "big", signed=True)
+
+
+def _pack(value) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack(blob: bytes):
+    return json.loads(zlib.decompress(blob))
+
+
+class _RecordingSession:
+    """requests.Session stand-in that records each exchange it passes on"""
+
+    def __init__(self, session, recorder: "CassetteRecorder"):
+        self._session = session
+        self._recorder = recorder
+
+    def request(self, method, url, **opts):
+        started = self._recorder.elapsed()
+        begun = time.perf_counter()
+        try:
+            response = self._session.request(method, url, **opts)
+        except requests.RequestException as e:
+            self._recorder.record(
+                method, url, opts, started, time.perf_counter() - begun, error=str(e)
+            )
+            raise
+        self._recorder.record(
+            method, url, opts, started, time.perf_counter() - begun, response
+        )
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
+class _ReplaySession:
+    """requests.Session stand-in answered from a cassette"""
+
+    def __init__(self, player: "CassettePlayer"):
+        self._player = player
+
+    def request(self, method, url, **opts):
+        return self._player.respond(method, url, opts)
+
+    def close(self):
+        pass
+
+
+class CassetteRecorder:
+    """Writes every REST exchange of this process to one session file"""
+
+    mode = "record"
+
+    def __init__(self, path=None, directory=None):
+        self.logger = setup_logger("api_cassette")
+        if path is None:
+            directory = Path(
+                directory or config.get("API_CASSETTE_DIR", "logs/cassettes")
+            )
+            path = directory / session_name(datetime.now(), os.getpid())
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+            [
+                ("started_at", datetime.now().isoformat()),
+                ("base_url", str(config.get("ALPACA_BASE_URL", ""))),
+                ("watchlist", json.dumps(list(config.get("INTRADAY_WATCHLIST", [])))),
+            ],
+        )
+        self._conn.commit()
+        self._started = time.monotonic()
+        self._last_commit = self._started
+        self._pending = 0
+        self.recorded = 0
+        self.logger.info(f"📼 Recording API traffic to {self.path}")
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def wrap(self, session):
+        return _RecordingSession(session, self)
+
+    def record(self, method, url, opts, started, duration, response=None, error=None):
+        route, key = match_key(method, url, opts.get("params"), opts.get("json"))
+        request = _pack(
+            {"url": url, "params": opts.get("params"), "body": opts.get("json")}
+        )
+        if response is not None:
+            status = response.status_code
+            headers = {
+                k: v for k, v in response.headers.items() if k.lower() in KEPT_HEADERS
+            }
+            payload = _pack({"headers": headers, "body": response.text})
+        else:
+            status, payload = 0, _pack({"error": error})
+
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT INTO interactions (started, duration, route, key, "
+                    "status, request, response) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (started, duration, route, key, status, request, payload),
+                )
+                self.recorded += 1
+                self._pending += 1
+                now = time.monotonic()
+                if (
+                    self._pending >= COMMIT_EVERY
+                    or now - self._last_commit >= COMMIT_SECONDS
+                ):
+                    self._conn.commit()
+                    self._pending, self._last_commit = 0, now
+            except sqlite3.Error as e:
+                self.logger.error(f"Cassette write failed: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+                self.logger.info(
+                    f"📼 Recorded {self.recorded} API exchanges to {self.path}"
+                )
+
+    def stats(self) -> Dict:
+        return {"mode": self.mode, "path": str(self.path), "recorded": self.recorded}
+
+
+class CassettePlayer:
+    """Serves a recorded session's responses in place of the network"""
+
+    mode = "replay"
+
+    def __init__(self, path=None, directory=None, speed: Optional[float] = None):
+        self.logger = setup_logger("api_cassette")
+        path = path or config.get("API_CASSETTE_PATH") or latest_cassette(directory)
+        if path is None or not Path(path).exists():
+            raise FileNotFoundError(f"No API cassette to replay ({path})")
+        self.path = Path(path)
+        self.speed = (
+            speed if speed is not None else config.get("API_CASSETTE_REPLAY_SPEED", 0.0)
+        )
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self.meta = dict(self._conn.execute("SELECT name, value FROM meta"))
+
+        # Only the index is held in memory; payloads are read when served
+        self._by_key: Dict[int, deque] = {}
+        self._by_route: Dict[str, deque] = {}
+        self._durations: Dict[int, float] = {}
+        for seq, key, route, duration in self._conn.execute(
+            "SELECT seq, key, route, duration FROM interactions ORDER BY seq"
+        ):
+            self._by_key.setdefault(key, deque()).append(seq)
+            self._by_route.setdefault(route, deque()).append(seq)
+            self._durations[seq] = duration
+        self._served = set()
+        self._last_by_key: Dict[int, int] = {}
+        self._last_by_route: Dict[str, int] = {}
+
+        self.total = len(self._durations)
+        self.repeats = 0
+        self.misses = 0
+        self.logger.info(
+            f"📼 Replaying {self.total} API exchanges from {self.path} "
+            f"({'as fast as possible' if not self.speed else f'{self.speed:g}x'})"
+        )
+
+    @property
+    def served(self) -> int:
+        return len(self._served)
+
+    @property
+    def remaining(self) -> int:
+        return self.total - self.served
+
+    def wrap(self, session):
+        return _ReplaySession(self)
+
+    def _next(self, queue: Optional[deque]) -> Optional[int]:
+        while queue and queue[0] in self._served:
+            queue.popleft()
+        return queue.popleft() if queue else None
+
+    def respond(self, method, url, opts) -> requests.Response:
+        route, key = match_key(method, url, opts.get("params"), opts.get("json"))
+        with self._lock:
+            seq = self._next(self._by_key.get(key)) or self._next(
+                self._by_route.get(route)
+            )
+            if seq is not None:
+                self._served.add(seq)
+            else:
+                seq = self._last_by_key.get(key) or self._last_by_route.get(route)
+                if seq is None:
+                    self.misses += 1
+                    raise CassetteMiss(f"No recorded response for {route}")
+                self.repeats += 1
+            self._last_by_key[key] = self._last_by_route[route] = seq
+            status, blob = self._conn.execute(
+                "SELECT status, response FROM interactions WHERE seq = ?", (seq,)
+            ).fetchone()
+
+        if self.speed:
+            time.sleep(self._durations[seq] / self.speed)
+        payload = _unpack(blob)
+        if status == 0:
+            raise requests.ConnectionError(payload["error"])
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.HTTPStatus(status).phrase
+        response.headers = CaseInsensitiveDict(payload["headers"])
+        response._content = payload["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = url
+        return response
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict:
+        return {
+            "mode": self.mode,
+            "path": str(self.path),
+            "total": self.total,
+            "served": self.served,
+            "repeats": self.repeats,
+            "misses": self.misses,
+        }
+
+
+_shared_cassette = None
+_shared_cassette_lock = threading.Lock()
+
+
+def get_cassette():
+    """The process-wide recorder or player for API_CASSETTE_MODE, else None"""
+    global _shared_cassette
+    mode = config.get("API_CASSETTE_MODE", "off")
+    with _shared_cassette_lock:
+        if _shared_cassette is None and mode == "record":
+            _shared_cassette = CassetteRecorder()
+            atexit.register(_shared_cassette.close)
+        elif _shared_cassette is None and mode == "replay":
+            _shared_cassette = CassettePlayer()
+        return _shared_cassette
+
+
+def attach_cassette(rest, cassette=None):
+    """Route a tradeapi.REST client's HTTP traffic through a cassette"""
+    cassette = cassette or get_cassette()
+    session = getattr(rest, "_session", None)
+    if cassette is not None and session is not None:
+        rest._session = cassette.wrap(session)
+    return cassette
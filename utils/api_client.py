@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Alpaca API Client
+Shared wrapper around the alpaca_trade_api REST client. Every method call is
+counted per endpoint, timed into the API latency histograms and counted as
+an error when it raises, so API usage shows up on the metrics endpoint
+without touching each call site. Attribute access is otherwise passed
+through, so the wrapper is a drop-in replacement for the REST client.
+With API_CASSETTE_MODE set, the client's HTTP traffic is also recorded to,
+or replayed from, a session cassette (utils/api_cassette.py).
+"""
+
+import time
+
+from utils.api_cassette import attach_cassette
+from utils.latency import LatencyRecorder
+from utils.metrics import metrics
+
+# API call latency by endpoint (REST method name)
+api_latency = LatencyRecorder()
+
+metrics.describe("alpaca_api_calls_total", "counter", "Alpaca REST calls by endpoint")
+metrics.describe(
+    "alpaca_api_errors_total", "counter", "Alpaca REST calls that raised, by endpoint"
+)
+metrics.add_histograms(
+    "alpaca_api_latency_seconds",
+    "Alpaca REST call latency by endpoint",
+    api_latency,
+    label="endpoint",
+)
+
+
+class InstrumentedREST:
+    """Proxy for a tradeapi.REST instance that records per-endpoint metrics"""
+
+    def __init__(self, rest):
+        self._rest = rest
+        self._wrapped = {}
+        self.cassette = attach_cassette(rest)
+
+    @property
+    def rest(self):
+        """The underlying REST client"""
+        return self._rest
+
+    def __getattr__(self, name):
+        attr = getattr(self._rest, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        wrapper = self._wrapped.get(name)
+        if wrapper is None:
+            wrapper = self._wrapped[name] = self._instrument(name)
+        return wrapper
+
+    def _instrument(self, endpoint: str):
+        histogram = api_latency.histogram(endpoint)
+        rest = self._rest
+
+        def call(*args, **kwargs):
+            metrics.inc("alpaca_api_calls_total", endpoint=endpoint)
+            started = time.perf_counter()
+            try:
+                return getattr(rest, endpoint)(*args, **kwargs)
+            except Exception:
+                metrics.inc("alpaca_api_errors_total", endpoint=endpoint)
+                raise
+            finally:
+                histogram.record(time.perf_counter() - started)
+
+        call.__name__ = endpoint
+        return call
+
+    def __repr__(self) -> str:
+        return f"InstrumentedREST({self._rest!r})"
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Clocks
+The engine asks a clock for the time and for sleeps instead of calling
+time/datetime directly. SystemClock is the wall clock. SimulatedClock only
+moves when someone sleeps on it: a sleep jumps straight to its end, firing
+the events scheduled on the way (the synthetic market's next bar, say) at
+their own timestamps, so a whole session runs as fast as the code does.
+
+    clock = SimulatedClock(EASTERN.localize(datetime(2024, 6, 14, 9, 30)))
+    clock.call_every(60, broker.advance)
+    engine = IntradayEngine(clock=clock)
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple, Union
+
+
+class SystemClock:
+    """Wall-clock time and real sleeps"""
+
+    simulated = False
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def now(self, tz=None) -> datetime:
+        return datetime.now(tz)
+
+    def utcnow(self) -> datetime:
+        return datetime.utcnow()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+system_clock = SystemClock()
+
+
+class SimulatedClock:
+    """Time that advances only through sleep(), advance() and scheduled events
+
+    start is an epoch, a naive local datetime or an aware one; with an aware
+    start, now() returns naive times in that zone, so the engine's market
+    hour checks see exchange time whatever the host's zone is. speed > 0
+    also sleeps for real (seconds / speed), e.g. 60 for a minute per second.
+    """
+
+    simulated = True
+
+    def __init__(
+        self,
+        start: Union[None, float, datetime] = None,
+        speed: Optional[float] = None,
+    ):
+        if isinstance(start, datetime):
+            self.tz = start.tzinfo
+            start = start.timestamp()
+        else:
+            self.tz = None
+        self._now = time.time() if start is None else float(start)
+        self.started = self._now
+        self.speed = speed
+        self._lock = threading.RLock()
+        self._events: List[Tuple[float, int, Callable]] = []
+        self._order = itertools.count()
+        self._sleep_hooks: List[Callable[[], None]] = []
+        self.slept = 0.0  # simulated seconds spent in sleep()
+
+    # Reading the time -------------------------------------------------------
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def now(self, tz=None) -> datetime:
+        if tz is not None:
+            return datetime.fromtimestamp(self._now, tz)
+        if self.tz is not None:
+            return datetime.fromtimestamp(self._now, self.tz).replace(tzinfo=None)
+        return datetime.fromtimestamp(self._now)
+
+    def utcnow(self) -> datetime:
+        return datetime.fromtimestamp(self._now, timezone.utc).replace(tzinfo=None)
+
+    @property
+    def elapsed(self) -> float:
+        return self._now - self.started
+
+    # Scheduling -------------------------------------------------------------
+
+    def call_at(self, when: float, callback: Callable[[], None]):
+        """Run callback() once simulated time reaches when (epoch seconds)"""
+        with self._lock:
+            heapq.heappush(self._events, (when, next(self._order), callback))
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        self.call_at(self._now + delay, callback)
+
+    def call_every(self, interval: float, callback: Callable[[], Optional[bool]]):
+        """Run callback() every interval seconds until it returns False"""
+
+        def tick():
+            if callback() is not False:
+                self.call_later(interval, tick)
+
+        self.call_later(interval, tick)
+
+    def next_event(self) -> Optional[float]:
+        with self._lock:
+            return self._events[0][0] if self._events else None
+
+    def on_sleep(self, hook: Callable[[], None]):
+        """Run hook() before every sleep, e.g. to let a fake broker's fills land"""
+        self._sleep_hooks.append(hook)
+
+    # Moving time ------------------------------------------------------------
+
+    def advance_to(self, when: float):
+        """Jump to when, firing due events in order at their own timestamps"""
+        while True:
+            with self._lock:
+                if not self._events or self._events[0][0] > when:
+                    self._now = max(self._now, when)
+                    return
+                due, _, callback = heapq.heappop(self._events)
+                self._now = max(self._now, due)
+            callback()
+
+    def advance(self, seconds: float):
+        self.advance_to(self._now + max(0.0, seconds))
+
+    def skip_to_next_event(self, limit: Optional[float] = None) -> bool:
+        """Jump to the next scheduled event (at most limit seconds ahead)"""
+        when = self.next_event()
+        if when is None:
+            return False
+        if limit is not None:
+            when = min(when, self._now + limit)
+        self.advance_to(when)
+        return True
+
+    def sleep(self, seconds: float):
+        for hook in self._sleep_hooks:
+            hook()
+        seconds = max(0.0, seconds)
+        self.slept += seconds
+        self.advance(seconds)
+        # Always yield, so threads the sleeper is waiting on get to run
+        time.sleep(seconds / self.speed if self.speed else 0)
@@ -11,7 +11,9 @@ from pathlib import Path
 # Add the project root to the path
 sys.path.append(str(Path(__file__).parent))
 
+from config import config
 from core.data_manager import DataManager
+from core.emergency_executor import EmergencyExecutor
 from core.order_manager import OrderManager
 from utils.logger import setup_logger
 
@@ -23,6 +25,7 @@ class TradeCloser:
         self.logger = setup_logger("trade_closer")
         self.data_manager = DataManager()
         self.order_manager = OrderManager(self.data_manager)
+        self.emergency_executor = EmergencyExecutor(self.data_manager.api)
 
     def list_open_positions(self):
         """List all open positions"""
@@ -144,18 +147,27 @@ class TradeCloser:
                 print("❌ Mass closure cancelled")
                 return
 
-            closed_count = 0
-            for position in positions:
-                symbol = position["symbol"]
-                print(f"\n🔄 Closing {symbol}...")
+            # Cancel everything in bulk, then liquidate all positions at once
+            print(f"\n🔄 Closing {len(positions)} positions concurrently...")
+            report = self.emergency_executor.flatten(
+                positions, timeout=config.get("EMERGENCY_CONFIRM_TIMEOUT", 30)
+            )
 
-                if self.close_position_silent(symbol):
-                    print(f"✅ {symbol} closed successfully")
-                    closed_count += 1
+            for result in report["results"].values():
+                if result["confirmed"]:
+                    print(f"✅ {result['symbol']} closed in {result['seconds']:.2f}s")
                 else:
-                    print(f"❌ Failed to close {symbol}")
+                    print(f"❌ Failed to close {result['symbol']} ({result['status']})")
 
-            print(f"\n📊 Summary: {closed_count}/{len(positions)} positions closed")
+            print(
+                f"\n📊 Summary: {report['confirmed']}/{len(positions)} positions closed"
+            )
+            if report["p50_seconds"] is not None:
+                print(
+                    f"⏱️  Time-to-flat: p50 {report['p50_seconds']:.2f}s | "
+                    f"p99 {report['p99_seconds']:.2f}s | "
+                    f"total {report['total_seconds']:.2f}s"
+                )
 
         except Exception as e:
             print(f"❌ Error in mass closure: {e}")
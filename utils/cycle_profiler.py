@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Cycle Profiler
+Stack sampler for slow trading cycles. A daemon thread samples the trading
+thread's stack every few milliseconds while a cycle is running; when the
+cycle ends over its budget the samples are written to logs/profiles/ in
+collapsed-stack format (one "frame;frame;frame count" line per distinct
+stack), which flamegraph.pl, speedscope and similar tools read directly.
+Fast cycles cost one dictionary update per sample and are discarded.
+
+    profiler = CycleProfiler(slow_seconds=5.0).start()
+    profiler.begin_cycle()
+    run_trading_cycle()
+    path = profiler.end_cycle(symbols)  # None unless the cycle was slow
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from config import config
+
+PROFILE_SUFFIX = ".collapsed"
+MAX_STACK_DEPTH = 128
+MAX_NAME_SYMBOLS = 6  # Symbols spelled out in a profile's file name
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)})"
+
+
+def collapse_stack(frame) -> str:
+    """Root-first "a;b;c" label for a frame's stack"""
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+def profile_name(cycle_number: int, symbols: Iterable[str], when: datetime) -> str:
+    symbols = list(symbols)
+    tag = "-".join(symbols[:MAX_NAME_SYMBOLS]) or "none"
+    if len(symbols) > MAX_NAME_SYMBOLS:
+        tag += f"+{len(symbols) - MAX_NAME_SYMBOLS}"
+    return (
+        f"cycle_{cycle_number:06d}_{when.strftime('%Y%m%d_%H%M%S')}_{tag}"
+        f"{PROFILE_SUFFIX}"
+    )
+
+
+class CycleProfiler:
+    """Samples the thread running each cycle and keeps profiles of slow ones"""
+
+    def __init__(
+        self,
+        directory=None,
+        interval: Optional[float] = None,
+        slow_seconds: Optional[float] = None,
+        max_files: Optional[int] = None,
+    ):
+        self.directory = Path(directory or config.get("PROFILE_DIR", "logs/profiles"))
+        self.interval = interval or config.get("PROFILE_SAMPLE_SECONDS", 0.005)
+        self.slow_seconds = (
+            slow_seconds
+            if slow_seconds is not None
+            else config.get("PROFILE_SLOW_CYCLE_SECONDS", 5.0)
+        )
+        self.max_files = max_files or config.get("PROFILE_MAX_FILES", 200)
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._target: Optional[int] = None  # thread id of the running cycle
+        self._samples: Counter = Counter()
+        self._cycle_started = 0.0
+
+        self.cycle_number = 0
+        self.slow_cycles = 0
+        self.last_profile: Optional[Path] = None
+
+    def start(self) -> "CycleProfiler":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="cycle-profiler", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            target = self._target
+            if target is None:
+                continue
+            frame = sys._current_frames().get(target)
+            if frame is None:
+                continue
+            stack = collapse_stack(frame)
+            with self._lock:
+                if self._target == target:
+                    self._samples[stack] += 1
+
+    def begin_cycle(self):
+        """Start collecting samples of the calling thread"""
+        with self._lock:
+            self.cycle_number += 1
+            self._samples = Counter()
+            self._cycle_started = time.monotonic()
+            self._target = threading.get_ident()
+
+    def end_cycle(self, symbols: Iterable[str] = ()) -> Optional[Path]:
+        """Stop collecting; write the samples out if the cycle ran over budget"""
+        with self._lock:
+            self._target = None
+            elapsed = time.monotonic() - self._cycle_started
+            samples, self._samples = self._samples, Counter()
+        if elapsed <= self.slow_seconds or not samples:
+            return None
+
+        self.slow_cycles += 1
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / profile_name(self.cycle_number, symbols, datetime.now())
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+        self.last_profile = path
+        self._prune()
+        return path
+
+    def _prune(self):
+        """Keep only the newest max_files profiles"""
+        profiles = sorted(
+            self.directory.glob(f"cycle_*{PROFILE_SUFFIX}"),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for old in profiles[: -self.max_files]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def stats(self):
+        return {
+            "cycles": self.cycle_number,
+            "slow_cycles": self.slow_cycles,
+            "slow_cycle_s": self.slow_seconds,
+            "sample_interval_s": self.interval,
+            "last_profile": str(self.last_profile) if self.last_profile else None,
+        }
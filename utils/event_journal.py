@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Event Journal
+Append-only, typed JSONL journal of trading events (signals, rejections,
+orders, fills, exits, stop moves). Every event carries a monotonic sequence
+number; files are split into one segment per trading day. Readers tail the
+journal by byte offset, so each poll costs O(new events) and needs no regex.
+The schema is documented in docs/EVENT_JOURNAL.md.
+
+    journal = EventJournal("logs/journal")
+    journal.emit("fill", symbol="AAPL", side="buy", qty=10, price=189.5, ...)
+
+    reader = JournalReader("logs/journal")
+    for event in reader.poll():
+        ...
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCHEMA_VERSION = 1
+SEGMENT_PREFIX = "events_"
+SEGMENT_SUFFIX = ".jsonl"
+
+# Required fields per event type; any other fields are optional extras
+EVENT_SCHEMA = {
+    "signal": ("symbol", "side", "strategy", "confidence", "price"),
+    "rejection": ("symbol", "stage", "reason"),
+    "order": ("symbol", "side", "qty", "order_id", "purpose"),
+    "fill": ("symbol", "side", "qty", "price", "order_id"),
+    "exit": ("symbol", "side", "qty", "entry_price", "exit_price", "pnl", "reason"),
+    "stop_move": ("symbol", "old_stop", "new_stop", "reason"),
+}
+
+
+def segment_name(day: datetime) -> str:
+    return f"{SEGMENT_PREFIX}{day.strftime('%Y%m%d')}{SEGMENT_SUFFIX}"
+
+
+def list_segments(directory) -> List[Path]:
+    """Segment files oldest first (names sort by date)"""
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"))
+
+
+def _last_line(path: Path) -> Optional[bytes]:
+    """Last complete line of a file, read backwards from the end"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        block = b""
+        position = end
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            block = f.read(step) + block
+            lines = block.rstrip(b"\n").split(b"\n")
+            if len(lines) > 1 or position == 0:
+                return lines[-1] or None
+    return None
+
+
+class EventJournal:
+    """Writer side: validates, sequences and appends events"""
+
+    def __init__(self, directory="logs/journal"):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = None
+        self._segment: Optional[str] = None
+        self.seq = self._last_seq()
+
+    def _last_seq(self) -> int:
+        """Resume numbering after the newest event already on disk"""
+        for path in reversed(list_segments(self.directory)):
+            line = _last_line(path)
+            if line:
+                try:
+                    return int(json.loads(line)["seq"])
+                except (ValueError, KeyError):
+                    continue
+        return 0
+
+    def _segment_file(self, now: float):
+        name = segment_name(datetime.fromtimestamp(now))
+        if name != self._segment:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.directory / name, "ab")
+            self._segment = name
+        return self._file
+
+    def emit(self, event_type: str, **fields) -> Dict:
+        """Append one event; raises ValueError for unknown types or missing fields"""
+        required = EVENT_SCHEMA.get(event_type)
+        if required is None:
+            raise ValueError(f"Unknown event type: {event_type}")
+        missing = [name for name in required if fields.get(name) is None]
+        if missing:
+            raise ValueError(f"{event_type} event missing {', '.join(missing)}")
+
+        with self._lock:
+            now = time.time()
+            self.seq += 1
+            event = {
+                "v": SCHEMA_VERSION,
+                "seq": self.seq,
+                "ts": now,
+                "type": event_type,
+            }
+            event.update(fields)
+            line = json.dumps(event, separators=(",", ":"), default=str)
+            f = self._segment_file(now)
+            f.write(line.encode("utf-8") + b"\n")
+            f.flush()
+        return event
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._segment = None
+
+
+class JournalReader:
+    """Tails a journal directory by (segment, byte offset)
+
+    poll() returns only events appended since the previous call, moving on
+    to the next day's segment once the current one is exhausted. A trailing
+    partial line (a write in progress) is left for the next poll.
+    """
+
+    def __init__(self, directory="logs/journal", from_end: bool = False):
+        self.directory = Path(directory)
+        self.segment: Optional[Path] = None
+        self.offset = 0
+        if from_end:
+            segments = list_segments(self.directory)
+            if segments:
+                self.segment = segments[-1]
+                self.offset = self.segment.stat().st_size
+
+    def _next_segment(self) -> Optional[Path]:
+        for path in list_segments(self.directory):
+            if self.segment is None or path.name > self.segment.name:
+                return path
+        return None
+
+    def _read_segment(self) -> List[Dict]:
+        try:
+            with open(self.segment, "rb") as f:
+                f.seek(self.offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        end = data.rfind(b"\n")
+        if end < 0:
+            return []
+        self.offset += end + 1
+        events = []
+        for line in data[: end + 1].splitlines():
+            if line:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue  # torn write from a crash; skip it
+        return events
+
+    def poll(self) -> List[Dict]:
+        events: List[Dict] = []
+        if self.segment is None:
+            self.segment = self._next_segment()
+            if self.segment is None:
+                return events
+        while True:
+            events.extend(self._read_segment())
+            following = self._next_segment()
+            if following is None:
+                return events
+            # A newer segment exists, so the current one is complete
+            events.extend(self._read_segment())
+            self.segment, self.offset = following, 0
+
+
+def read_events(
+    directory="logs/journal",
+    since: Optional[float] = None,
+    types: Optional[tuple] = None,
+) -> List[Dict]:
+    """All events, optionally only those at or after `since` (epoch seconds)
+    and of the given types; segments older than `since` are skipped"""
+    reader = JournalReader(directory)
+    if since is not None:
+        first_day = segment_name(datetime.fromtimestamp(since))
+        older = [p for p in list_segments(directory) if p.name < first_day]
+        if older:
+            reader.segment = older[-1]
+            reader.offset = reader.segment.stat().st_size
+    return [
+        event
+        for event in reader.poll()
+        if (since is None or event["ts"] >= since)
+        and (types is None or event["type"] in types)
+    ]
+
+
+def describe_event(event: Dict) -> str:
+    """One-line human readable summary of an event"""
+    when = datetime.fromtimestamp(event["ts"]).strftime("%H:%M:%S")
+    kind = event["type"]
+    symbol = event.get("symbol", "")
+    if kind == "signal":
+        detail = (
+            f"{event['side'].upper()} {event['strategy']} "
+            f"conf={float(event['confidence']):.2f} @ ${float(event['price']):.2f}"
+        )
+    elif kind == "rejection":
+        detail = f"{event['stage']}: {event['reason']}"
+    elif kind == "order":
+        detail = (
+            f"{event['purpose']} {event['side'].upper()} {event['qty']} "
+            f"(id {event['order_id']})"
+        )
+    elif kind == "fill":
+        detail = (
+            f"{event['side'].upper()} {event['qty']} @ ${float(event['price']):.2f}"
+        )
+    elif kind == "exit":
+        detail = (
+            f"{event['reason']} {event['qty']} @ ${float(event['exit_price']):.2f} "
+            f"P&L ${float(event['pnl']):+.2f}"
+        )
+    elif kind == "stop_move":
+        detail = (
+            f"{event['reason']} ${float(event['old_stop']):.2f} -> "
+            f"${float(event['new_stop']):.2f}"
+        )
+    else:
+        detail = ""
+    return f"{when} #{event['seq']} {kind.upper()} {symbol} {detail}".rstrip()
@@ -0,0 +1,1166 @@
+#!/usr/bin/env python3
+"""
+Fake Broker
+Local stand-in for the Alpaca trading and market data APIs, for end-to-end
+latency and throughput runs without network access or a paper account. One
+port serves the REST endpoints the bot calls (account, positions, orders,
+fill activities, clock, bars, latest bar/quote/trades) and the trade_updates
+websocket, with market data from a SyntheticMarket, so the real
+alpaca_trade_api REST and Stream code paths run unchanged.
+
+Every request waits a configurable latency plus uniform jitter, requests
+over the per-key rate limit get Alpaca's 429, and orders can be refused at
+submission or filled in two pieces. Market orders fill at the quote after a
+fill delay; limit, stop, trailing stop, bracket exit and OCO orders rest
+until advance() moves the market clock through their prices. Other order
+classes (oto) are refused with a 422 rather than accepted as plain orders. A halted symbol
+fills nothing until it reopens.
+
+    broker = FakeBroker(SyntheticMarket(20, seed=7), latency_ms=20).start()
+    os.environ.update(broker.environment())
+    ...
+    broker.advance()  # next minute: new bars, resting orders checked
+    broker.stop()
+
+The SDK takes the market data host from APCA_API_DATA_URL, so that has to
+point at the broker as well as ALPACA_BASE_URL (environment() returns both).
+Bars are the newest `limit` up to the market clock in a single page; start
+and end are accepted but not applied, because the synthetic sessions need
+not line up with the wall clock. Order and fill timestamps are wall-clock.
+"""
+
+import base64
+import hashlib
+import json
+import math
+import random
+import re
+import socket
+import struct
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from config import config
+from utils.logger import setup_logger
+from utils.synthetic_market import (
+    EASTERN,
+    RESAMPLE_RULES,
+    SESSION_MINUTES,
+    SESSION_OPEN,
+    SyntheticMarket,
+)
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OPEN_STATUSES = ("new", "accepted", "partially_filled", "held")
+ORDER_TYPES = ("market", "limit", "stop", "stop_limit", "trailing_stop")
+ORDER_CLASSES = ("simple", "bracket", "oco")
+DEFAULT_BAR_LIMIT = 1000
+DEFAULT_ORDER_LIMIT = 50
+DEFAULT_PAGE_SIZE = 100
+MARGIN_MULTIPLIER = 4
+
+# (method, path pattern, handler); path groups become handler arguments
+ROUTES = [
+    ("GET", r"/v2/account", "_get_account"),
+    ("GET", r"/v2/clock", "_get_clock"),
+    ("GET", r"/v2/positions", "_list_positions"),
+    ("GET", r"/v2/positions/([^/]+)", "_get_position"),
+    ("DELETE", r"/v2/positions", "_close_all_positions"),
+    ("DELETE", r"/v2/positions/([^/]+)", "_close_position"),
+    ("GET", r"/v2/orders", "_list_orders"),
+    ("POST", r"/v2/orders", "_submit_order"),
+    ("DELETE", r"/v2/orders", "_cancel_all_orders"),
+    ("GET", r"/v2/orders:by_client_order_id", "_get_order_by_client_id"),
+    ("GET", r"/v2/orders/([^/]+)", "_get_order"),
+    ("DELETE", r"/v2/orders/([^/]+)", "_cancel_order"),
+    ("GET", r"/v2/account/activities(?:/([A-Z_,]+))?", "_get_activities"),
+    ("GET", r"/v2/stocks/bars", "_get_multi_bars"),
+    ("GET", r"/v2/stocks/trades/latest", "_get_latest_trades"),
+    ("GET", r"/v2/stocks/([^/]+)/bars", "_get_bars"),
+    ("GET", r"/v2/stocks/([^/]+)/bars/latest", "_get_latest_bar"),
+    ("GET", r"/v2/stocks/([^/]+)/quotes/latest", "_get_latest_quote"),
+]
+ROUTES = [(method, re.compile(pattern), name) for method, pattern, name in ROUTES]
+
+
+class BrokerError(Exception):
+    """Error response in Alpaca's {"code": ..., "message": ...} shape"""
+
+    def __init__(self, status: int, code: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _decimal(value) -> Optional[str]:
+    """Alpaca sends quantities and prices as strings"""
+    return None if value is None else f"{value:.10g}"
+
+
+class TokenBucket:
+    """Requests per minute, with up to a minute's worth available as a burst"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        return int(self.tokens)
+
+
+@dataclass
+class FakeOrder:
+    id: str
+    client_order_id: str
+    symbol: str
+    side: str
+    qty: float
+    type: str
+    time_in_force: str
+    order_class: str = "simple"
+    limit_price: Optional[float] = None
+    stop_price: Optional[float] = None
+    trail_percent: Optional[float] = None
+    trail_price: Optional[float] = None
+    hwm: Optional[float] = None  # Trailing stops: best price since submission
+    status: str = "new"
+    filled_qty: float = 0.0
+    filled_avg_price: Optional[float] = None
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: Optional[str] = None
+    filled_at: Optional[str] = None
+    canceled_at: Optional[str] = None
+    parent_id: Optional[str] = None
+    legs: List["FakeOrder"] = field(default_factory=list)
+
+    @property
+    def remaining(self) -> float:
+        return self.qty - self.filled_qty
+
+    @property
+    def is_open(self) -> bool:
+        return self.status in OPEN_STATUSES
+
+    def to_json(self) -> Dict:
+        return {
+            "id": self.id,
+            "client_order_id": self.client_order_id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at or self.created_at,
+            "submitted_at": self.created_at,
+            "filled_at": self.filled_at,
+            "expired_at": None,
+            "canceled_at": self.canceled_at,
+            "failed_at": None,
+            "asset_class": "us_equity",
+            "symbol": self.symbol,
+            "qty": _decimal(self.qty),
+            "filled_qty": _decimal(self.filled_qty),
+            "filled_avg_price": _decimal(self.filled_avg_price),
+            "order_class": "" if self.order_class == "simple" else self.order_class,
+            "order_type": self.type,
+            "type": self.type,
+            "side": self.side,
+            "time_in_force": self.time_in_force,
+            "limit_price": _decimal(self.limit_price),
+            "stop_price": _decimal(self.stop_price),
+            "trail_percent": _decimal(self.trail_percent),
+            "trail_price": _decimal(self.trail_price),
+            "hwm": _decimal(self.hwm),
+            "status": self.status,
+            "extended_hours": False,
+            "legs": [leg.to_json() for leg in self.legs] if self.legs else None,
+        }
+
+
+# Websocket framing (RFC 6455), just enough for the trade_updates stream
+
+
+def _ws_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    size = len(payload)
+    if size < 126:
+        head = struct.pack("!BB", 0x80 | opcode, size)
+    elif size < 1 << 16:
+        head = struct.pack("!BBH", 0x80 | opcode, 126, size)
+    else:
+        head = struct.pack("!BBQ", 0x80 | opcode, 127, size)
+    return head + payload
+
+
+def _ws_read(rfile) -> Tuple[int, bytes]:
+    head = rfile.read(2)
+    if len(head) < 2:
+        raise ConnectionError("websocket closed")
+    opcode, size = head[0] & 0x0F, head[1] & 0x7F
+    if size == 126:
+        size = struct.unpack("!H", rfile.read(2))[0]
+    elif size == 127:
+        size = struct.unpack("!Q", rfile.read(8))[0]
+    mask = rfile.read(4) if head[1] & 0x80 else None
+    payload = rfile.read(size)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+class _StreamClient:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.streams = set()
+        self._lock = threading.Lock()
+
+    def send(self, payload: bytes, opcode: int = 0x1) -> bool:
+        try:
+            with self._lock:
+                self.sock.sendall(_ws_frame(payload, opcode))
+            return True
+        except OSError:
+            return False
+
+    def send_json(self, message: Dict) -> bool:
+        return self.send(json.dumps(message).encode("utf-8"))
+
+    def close(self):
+        self.send(struct.pack("!H", 1001), opcode=0x8)  # going away
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _BrokerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, as the SDK's session expects
+    broker: "FakeBroker" = None
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle's
+        # algorithm and delayed ACKs add ~40 ms to every keep-alive response
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            self.broker._serve_stream(self)
+        else:
+            self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _handle(self, method: str):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length)) if length else {}
+        except ValueError:
+            status, payload, headers = 400, {"message": "malformed json"}, {}
+        else:
+            status, payload, headers = self.broker.handle(
+                method, url.path, query, body, self.headers.get("APCA-API-KEY-ID")
+            )
+
+        data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # a benchmark run makes thousands of requests
+
+
+class FakeBroker:
+    """Alpaca-compatible REST + trade_updates server over a SyntheticMarket"""
+
+    def __init__(
+        self,
+        market: Optional[SyntheticMarket] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        latency_ms: Optional[float] = None,
+        jitter_ms: Optional[float] = None,
+        rate_limit: Optional[int] = None,
+        fill_delay_ms: Optional[float] = None,
+        partial_fill_probability: Optional[float] = None,
+        reject_probability: Optional[float] = None,
+        starting_cash: float = 100_000.0,
+        seed: int = 0,
+    ):
+        def setting(value, key, default):
+            return value if value is not None else config.get(key, default)
+
+        self.market = market or SyntheticMarket(20, seed=seed)
+        self.host = setting(host, "FAKE_BROKER_HOST", "127.0.0.1")
+        self.port = setting(port, "FAKE_BROKER_PORT", 8765)
+        self.latency_ms = setting(latency_ms, "FAKE_BROKER_LATENCY_MS", 20.0)
+        self.jitter_ms = setting(jitter_ms, "FAKE_BROKER_JITTER_MS", 10.0)
+        self.rate_limit = setting(rate_limit, "FAKE_BROKER_RATE_LIMIT", 200)
+        self.fill_delay_ms = setting(fill_delay_ms, "FAKE_BROKER_FILL_DELAY_MS", 50.0)
+        self.partial_fill_probability = setting(
+            partial_fill_probability, "FAKE_BROKER_PARTIAL_FILL_PROB", 0.1
+        )
+        self.reject_probability = setting(
+            reject_probability, "FAKE_BROKER_REJECT_PROB", 0.02
+        )
+        self.starting_cash = starting_cash
+        self.logger = setup_logger("fake_broker")
+
+        # Broker state; every handler runs under _lock
+        self._lock = threading.RLock()
+        self._random = random.Random(seed)  # rejects and partial fills
+        self._jitter = random.Random(seed + 1)
+        self.cash = starting_cash
+        self.positions: Dict[str, Dict[str, float]] = {}  # symbol -> qty, avg
+        self.orders: Dict[str, FakeOrder] = {}
+        self.activities: List[Dict] = []
+        self._client_ids: Dict[str, str] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.counts: Counter = Counter()
+
+        # Trade updates are queued under _lock and sent in order under _send_lock
+        self._outbox: List[bytes] = []
+        self._send_lock = threading.Lock()
+        self._streams: List[_StreamClient] = []
+        self._timers = set()
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # Server lifecycle ----------------------------------------------------
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2] if self._server else (self.host, 0)
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def environment(self) -> Dict[str, str]:
+        """Environment variables that point the bot and the SDK at this broker"""
+        return {
+            "ALPACA_BASE_URL": self.url,
+            "APCA_API_BASE_URL": self.url,
+            "APCA_API_DATA_URL": self.url,
+        }
+
+    def start(self) -> "FakeBroker":
+        handler = type("FakeBrokerHandler", (_BrokerHandler,), {"broker": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-broker", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(
+            f"🧪 Fake broker at {self.url} ({len(self.market.symbols)} symbols, "
+            f"{self.latency_ms:g}±{self.jitter_ms:g} ms, "
+            f"{self.rate_limit or 'unlimited'} req/min)"
+        )
+        return self
+
+    def stop(self):
+        with self._lock:
+            for timer in self._timers:
+                timer.cancel()
+            self._timers.clear()
+            streams, self._streams = self._streams, []
+        for client in streams:
+            client.close()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def settle(self, timeout: float = 5.0) -> bool:
+        """Wait until no scheduled fills are outstanding"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._timers:
+                    return True
+            time.sleep(0.005)
+        return False
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self.counts,
+                "open_orders": sum(o.is_open for o in self.orders.values()),
+                "positions": len(self.positions),
+                "streams": len(self._streams),
+            }
+
+    # Market clock ---------------------------------------------------------
+
+    def advance(self, minutes: int = 1) -> bool:
+        """Move the market forward and fill resting orders the new bars reach"""
+        with self._lock:
+            start = self.market.position
+            more = self.market.advance(minutes)
+            self._check_resting(start, self.market.position)
+        self._flush()
+        return more
+
+    # Request dispatch -------------------------------------------------------
+
+    def handle(
+        self, method: str, path: str, query: Dict, body: Dict, key_id: Optional[str]
+    ) -> Tuple[int, object, Dict[str, str]]:
+        """Route one REST request; returns (status, JSON payload, headers)"""
+        delay = self.latency_ms + self._jitter.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        if not key_id:
+            return 401, {"code": 40110000, "message": "request is not authorized"}, {}
+
+        headers = {}
+        if self.rate_limit:
+            bucket = self._buckets.get(key_id)
+            if bucket is None:
+                bucket = self._buckets.setdefault(key_id, TokenBucket(self.rate_limit))
+            allowed = bucket.take()
+            headers = {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(bucket.remaining),
+            }
+            if not allowed:
+                with self._lock:
+                    self.counts["rate_limited"] += 1
+                return (
+                    429,
+                    {"code": 42910000, "message": "rate limit exceeded"},
+                    headers,
+                )
+
+        for route_method, pattern, name in ROUTES:
+            match = pattern.fullmatch(path) if route_method == method else None
+            if match:
+                break
+        else:
+            return 404, {"code": 40410000, "message": "endpoint not found"}, headers
+
+        try:
+            with self._lock:
+                self.counts["requests"] += 1
+                self.counts[name.lstrip("_")] += 1
+                result = getattr(self, name)(query, body, *match.groups())
+        except BrokerError as e:
+            return e.status, {"code": e.code, "message": e.message}, headers
+        finally:
+            self._flush()
+        return (204 if result is None else 200), result, headers
+
+    # Market data ------------------------------------------------------------
+
+    def _require_symbol(self, symbol: str):
+        if symbol not in self.market.symbol_set:
+            raise BrokerError(404, 40410000, f"symbol {symbol} not found")
+
+    def _bars_json(self, symbol: str, limit: int, timeframe: str) -> List[Dict]:
+        if timeframe not in RESAMPLE_RULES:
+            raise BrokerError(422, 42210000, f"invalid timeframe: {timeframe}")
+        frame = self.market.bars(symbol, limit, timeframe)
+        times = frame.index.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return [
+            {
+                "t": t,
+                "o": o,
+                "h": h,
+                "l": l,
+                "c": c,
+                "v": v,
+                "n": max(1, v // 100),
+                "vw": round((h + l + c) / 3, 4),
+            }
+            for t, o, h, l, c, v in zip(
+                times,
+                frame["open"].tolist(),
+                frame["high"].tolist(),
+                frame["low"].tolist(),
+                frame["close"].tolist(),
+                frame["volume"].tolist(),
+            )
+        ]
+
+    def _get_bars(self, query, body, symbol):
+        self._require_symbol(symbol)
+        limit = int(query.get("limit") or DEFAULT_BAR_LIMIT)
+        return {
+            "symbol": symbol,
+            "bars": self._bars_json(symbol, limit, query.get("timeframe", "1Min")),
+            "next_page_token": None,
+        }
+
+    def _get_multi_bars(self, query, body):
+        limit = int(query.get("limit") or DEFAULT_BAR_LIMIT)
+        timeframe = query.get("timeframe", "1Min")
+        symbols = [s for s in query.get("symbols", "").split(",") if s]
+        return {
+            "bars": {
+                symbol: self._bars_json(symbol, limit, timeframe)
+                for symbol in symbols
+                if symbol in self.market.symbol_set
+            },
+            "next_page_token": None,
+        }
+
+    def _get_latest_bar(self, query, body, symbol):
+        self._require_symbol(symbol)
+        bars = self._bars_json(symbol, 1, "1Min")
+        if not bars:
+            raise BrokerError(404, 40410000, f"no bars for {symbol}")
+        return {"symbol": symbol, "bar": bars[0]}
+
+    def _get_latest_quote(self, query, body, symbol):
+        self._require_symbol(symbol)
+        quote = self.market.quotes(symbol, 1)
+        if quote.empty:
+            raise BrokerError(404, 40410000, f"no quotes for {symbol}")
+        row = quote.iloc[-1]
+        return {
+            "symbol": symbol,
+            "quote": {
+                "t": quote.index[-1].strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "ax": "V",
+                "ap": float(row["ask_price"]),
+                "as": int(row["ask_size"]),
+                "bx": "V",
+                "bp": float(row["bid_price"]),
+                "bs": int(row["bid_size"]),
+                "c": ["R"],
+                "z": "C",
+            },
+        }
+
+    def _get_latest_trades(self, query, body):
+        trades = {}
+        for symbol in query.get("symbols", "").split(","):
+            if symbol not in self.market.symbol_set:
+                continue
+            last = self.market.trades(symbol, 1)
+            if last.empty:
+                continue
+            trades[symbol] = {
+                "t": last.index[-1].strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                "x": "V",
+                "p": float(last["price"].iloc[-1]),
+                "s": int(last["size"].iloc[-1]),
+                "c": ["@"],
+                "i": self.market.position,
+                "z": "C",
+            }
+        return {"trades": trades}
+
+    def _get_clock(self, query, body):
+        now = self.market.now
+        day = now.tz_convert(EASTERN).date()
+        session_open = EASTERN.localize(datetime.combine(day, SESSION_OPEN))
+        next_day = day + timedelta(days=1)
+        while next_day.weekday() >= 5:
+            next_day += timedelta(days=1)
+        return {
+            "timestamp": now.isoformat(),
+            "is_open": True,  # the synthetic timeline only has session minutes
+            "next_open": EASTERN.localize(
+                datetime.combine(next_day, SESSION_OPEN)
+            ).isoformat(),
+            "next_close": (
+                session_open + timedelta(minutes=SESSION_MINUTES)
+            ).isoformat(),
+        }
+
+    # Account and positions ------------------------------------------------------
+
+    def _mark(self, symbol: str) -> float:
+        return self.market.latest_price(symbol) or self.positions[symbol]["avg"]
+
+    def _exposure(self) -> Tuple[float, float]:
+        long_value = short_value = 0.0
+        for symbol, position in self.positions.items():
+            value = position["qty"] * self._mark(symbol)
+            if value >= 0:
+                long_value += value
+            else:
+                short_value += value
+        return long_value, short_value
+
+    def _buying_power(self) -> float:
+        long_value, short_value = self._exposure()
+        equity = self.cash + long_value + short_value
+        return max(0.0, MARGIN_MULTIPLIER * equity - (long_value - short_value))
+
+    def _get_account(self, query, body):
+        long_value, short_value = self._exposure()
+        equity = self.cash + long_value + short_value
+        buying_power = self._buying_power()
+        return {
+            "id": "fake-account",
+            "account_number": "FAKE00001",
+            "status": "ACTIVE",
+            "currency": "USD",
+            "cash": _decimal(round(self.cash, 2)),
+            "equity": _decimal(round(equity, 2)),
+            "portfolio_value": _decimal(round(equity, 2)),
+            "last_equity": _decimal(self.starting_cash),
+            "long_market_value": _decimal(round(long_value, 2)),
+            "short_market_value": _decimal(round(short_value, 2)),
+            "buying_power": _decimal(round(buying_power, 2)),
+            "daytrading_buying_power": _decimal(round(buying_power, 2)),
+            "regt_buying_power": _decimal(round(buying_power / 2, 2)),
+            "multiplier": str(MARGIN_MULTIPLIER),
+            "pattern_day_trader": False,
+            "shorting_enabled": True,
+            "trading_blocked": False,
+            "transfers_blocked": False,
+            "account_blocked": False,
+            "daytrade_count": 0,
+        }
+
+    def _position_json(self, symbol: str) -> Dict:
+        position = self.positions[symbol]
+        qty, avg = position["qty"], position["avg"]
+        price = self._mark(symbol)
+        cost_basis = qty * avg
+        unrealized = qty * (price - avg)
+        return {
+            "asset_class": "us_equity",
+            "exchange": "FAKE",
+            "symbol": symbol,
+            "qty": _decimal(abs(qty)),
+            "qty_available": _decimal(abs(qty)),
+            "side": "long" if qty > 0 else "short",
+            "avg_entry_price": _decimal(round(avg, 4)),
+            "current_price": _decimal(price),
+            "market_value": _decimal(round(qty * price, 2)),
+            "cost_basis": _decimal(round(cost_basis, 2)),
+            "unrealized_pl": _decimal(round(unrealized, 2)),
+            "unrealized_plpc": _decimal(round(unrealized / abs(cost_basis), 6)),
+            "unrealized_intraday_pl": _decimal(round(unrealized, 2)),
+            "unrealized_intraday_plpc": _decimal(
+                round(unrealized / abs(cost_basis), 6)
+            ),
+        }
+
+    def _list_positions(self, query, body):
+        return [self._position_json(symbol) for symbol in sorted(self.positions)]
+
+    def _get_position(self, query, body, symbol):
+        if symbol not in self.positions:
+            raise BrokerError(404, 40410000, "position does not exist")
+        return self._position_json(symbol)
+
+    def _close_position(self, query, body, symbol):
+        if symbol not in self.positions:
+            raise BrokerError(404, 40410000, "position does not exist")
+        held = self.positions[symbol]["qty"]
+        qty = min(float(query.get("qty") or abs(held)), abs(held))
+        order = self._place(symbol, qty, "sell" if held > 0 else "buy", "market")
+        return order.to_json()
+
+    def _close_all_positions(self, query, body):
+        return [
+            {
+                "symbol": symbol,
+                "status": 200,
+                "body": self._close_position({}, {}, symbol),
+            }
+            for symbol in sorted(self.positions)
+        ]
+
+    # Orders ---------------------------------------------------------------
+
+    def _find_order(self, order_id: str) -> FakeOrder:
+        order = self.orders.get(order_id)
+        if order is None:
+            raise BrokerError(404, 40410000, "order not found")
+        return order
+
+    def _get_order(self, query, body, order_id):
+        return self._find_order(order_id).to_json()
+
+    def _get_order_by_client_id(self, query, body):
+        order_id = self._client_ids.get(query.get("client_order_id", ""))
+        if order_id is None:
+            raise BrokerError(404, 40410000, "order not found")
+        return self.orders[order_id].to_json()
+
+    def _list_orders(self, query, body):
+        status = query.get("status", "open")
+        nested = query.get("nested", "").lower() == "true"
+        symbols = set(filter(None, query.get("symbols", "").split(",")))
+        orders = [
+            order
+            for order in self.orders.values()
+            if (status == "all" or order.is_open == (status == "open"))
+            and not (nested and order.parent_id)
+            and (not symbols or order.symbol in symbols)
+            and query.get("side", order.side) == order.side
+        ]
+        if query.get("direction", "desc") == "desc":
+            orders.reverse()
+        limit = int(query.get("limit") or DEFAULT_ORDER_LIMIT)
+        return [order.to_json() for order in orders[:limit]]
+
+    def _submit_order(self, query, body):
+        symbol = body.get("symbol")
+        if symbol not in self.market.symbol_set:
+            raise BrokerError(422, 40010001, f"asset not found: {symbol}")
+        try:
+            qty = float(body.get("qty") or 0)
+        except (TypeError, ValueError):
+            qty = 0
+        side, order_type = body.get("side"), body.get("type", "market")
+        if qty <= 0 or side not in ("buy", "sell") or order_type not in ORDER_TYPES:
+            raise BrokerError(422, 40010001, "invalid qty, side or order type")
+        client_order_id = body.get("client_order_id") or str(uuid.uuid4())
+        if client_order_id in self._client_ids:
+            raise BrokerError(422, 40010001, "client_order_id must be unique")
+        order_class = body.get("order_class") or "simple"
+        if order_class not in ORDER_CLASSES:
+            raise BrokerError(
+                422, 40010001, f"order_class not supported: {order_class}"
+            )
+        take_profit = body.get("take_profit") or {}
+        stop_loss = body.get("stop_loss") or {}
+        limit_price = body.get("limit_price")
+        if order_class == "oco":
+            # The order itself is the take-profit limit; the stop is its leg
+            if (
+                order_type != "limit"
+                or take_profit.get("limit_price") is None
+                or stop_loss.get("stop_price") is None
+            ):
+                raise BrokerError(
+                    422, 40010001, "oco orders need a limit take_profit and stop_loss"
+                )
+            limit_price = take_profit["limit_price"]
+
+        held = self.positions.get(symbol, {}).get("qty", 0.0)
+        opening = held == 0 or (held > 0) == (side == "buy")
+        if opening and qty * self._mark_or_zero(symbol) > self._buying_power():
+            self.counts["rejected"] += 1
+            raise BrokerError(403, 40310000, "insufficient buying power")
+        if self._random.random() < self.reject_probability:
+            self.counts["rejected"] += 1
+            raise BrokerError(403, 40310000, "order rejected by the fake broker")
+
+        order = self._place(
+            symbol,
+            qty,
+            side,
+            order_type,
+            time_in_force=body.get("time_in_force", "day"),
+            client_order_id=client_order_id,
+            limit_price=limit_price,
+            stop_price=body.get("stop_price"),
+            trail_percent=body.get("trail_percent"),
+            trail_price=body.get("trail_price"),
+            order_class=order_class,
+        )
+        if order_class == "oco":
+            stop = self._new_order(
+                symbol,
+                qty,
+                side,
+                "stop_limit" if stop_loss.get("limit_price") else "stop",
+                order.time_in_force,
+                stop_price=stop_loss["stop_price"],
+                limit_price=stop_loss.get("limit_price"),
+                parent_id=order.id,
+            )
+            stop.status = "new"  # both sides are live from the start
+            order.legs.append(stop)
+            self._emit("new", stop)
+        elif order_class == "bracket":
+            exit_side = "sell" if side == "buy" else "buy"
+            if take_profit.get("limit_price") is not None:
+                order.legs.append(
+                    self._new_order(
+                        symbol,
+                        qty,
+                        exit_side,
+                        "limit",
+                        order.time_in_force,
+                        limit_price=take_profit["limit_price"],
+                        parent_id=order.id,
+                    )
+                )
+            if stop_loss.get("stop_price") is not None:
+                order.legs.append(
+                    self._new_order(
+                        symbol,
+                        qty,
+                        exit_side,
+                        "stop_limit" if stop_loss.get("limit_price") else "stop",
+                        order.time_in_force,
+                        stop_price=stop_loss["stop_price"],
+                        limit_price=stop_loss.get("limit_price"),
+                        parent_id=order.id,
+                    )
+                )
+        return order.to_json()
+
+    def _mark_or_zero(self, symbol: str) -> float:
+        return self.market.latest_price(symbol) or 0.0
+
+    def _new_order(
+        self,
+        symbol: str,
+        qty: float,
+        side: str,
+        order_type: str,
+        time_in_force: str = "day",
+        client_order_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        **prices,
+    ) -> FakeOrder:
+        prices = {k: float(v) for k, v in prices.items() if v is not None}
+        order = FakeOrder(
+            id=str(uuid.uuid4()),
+            client_order_id=client_order_id or str(uuid.uuid4()),
+            symbol=symbol,
+            side=side,
+            qty=qty,
+            type=order_type,
+            time_in_force=time_in_force,
+            status="held" if parent_id else "new",
+            parent_id=parent_id,
+            **prices,
+        )
+        if order_type == "trailing_stop":
+            order.hwm = self._mark_or_zero(symbol)
+            order.stop_price = self._trail_stop(order)
+        self.orders[order.id] = order
+        self._client_ids[order.client_order_id] = order.id
+        self.counts["orders"] += 1
+        return order
+
+    def _place(
+        self, symbol: str, qty: float, side: str, order_type: str, **options
+    ) -> FakeOrder:
+        """Create an order, announce it and fill it now if it is marketable"""
+        order_class = options.pop("order_class", "simple")
+        order = self._new_order(symbol, qty, side, order_type, **options)
+        order.order_class = order_class
+        self._emit("new", order)
+        if order_type in ("market", "limit"):
+            self._schedule_fill(
+                order.id, self._random.random() < self.partial_fill_probability
+            )
+        return order
+
+    def _cancel(self, order: FakeOrder):
+        if not order.is_open:
+            return
+        order.status = "canceled"
+        order.canceled_at = order.updated_at = _now_iso()
+        self._emit("canceled", order)
+        for leg in order.legs:
+            self._cancel(leg)
+
+    def _cancel_order(self, query, body, order_id):
+        order = self._find_order(order_id)
+        if not order.is_open:
+            raise BrokerError(422, 42210000, "order is not cancelable")
+        self._cancel(order)
+        return None
+
+    def _cancel_all_orders(self, query, body):
+        canceled = []
+        for order in list(self.orders.values()):
+            if order.is_open and not order.parent_id:
+                self._cancel(order)
+                canceled.append(
+                    {"id": order.id, "status": 200, "body": order.to_json()}
+                )
+        return canceled
+
+    # Fills ----------------------------------------------------------------
+
+    def _schedule_fill(self, order_id: str, partial: bool):
+        def run():
+            with self._lock:
+                self._timers.discard(timer)
+                order = self.orders.get(order_id)
+                if order is not None and order.is_open:
+                    price = self._quote_price(order)
+                    if price is not None:
+                        qty = order.remaining
+                        if partial and qty >= 2:
+                            qty = math.floor(qty / 2)
+                            self._schedule_fill(order_id, False)
+                        self._fill(order, qty, price)
+            self._flush()
+
+        timer = threading.Timer(self.fill_delay_ms / 1000, run)
+        timer.daemon = True
+        self._timers.add(timer)
+        timer.start()
+
+    def _quote_price(self, order: FakeOrder) -> Optional[float]:
+        """Execution price against the current quote, None if not marketable"""
+        if self.market.is_halted(order.symbol):
+            return None
+        quotes = self.market.quotes(order.symbol, 1)
+        if quotes.empty:
+            return None
+        bid, ask = float(quotes["bid_price"].iloc[-1]), float(
+            quotes["ask_price"].iloc[-1]
+        )
+        price = ask if order.side == "buy" else bid
+        if order.type == "limit":
+            if order.side == "buy" and price > order.limit_price:
+                return None
+            if order.side == "sell" and price < order.limit_price:
+                return None
+        return price
+
+    def _trail_stop(self, order: FakeOrder) -> float:
+        offset = (
+            order.hwm * order.trail_percent / 100
+            if order.trail_percent is not None
+            else order.trail_price or 0.0
+        )
+        stop = order.hwm - offset if order.side == "sell" else order.hwm + offset
+        return round(stop, 2)
+
+    def _bar_price(self, order: FakeOrder, o, h, l) -> Optional[float]:
+        """Fill price if a bar reaches the order, gapping through at the open"""
+        buy = order.side == "buy"
+        if order.type == "market":
+            return o
+        if order.type == "limit":
+            if buy and l <= order.limit_price:
+                return min(o, order.limit_price)
+            if not buy and h >= order.limit_price:
+                return max(o, order.limit_price)
+            return None
+        # Stops, stop limits (treated as stops) and trailing stops
+        if buy and h >= order.stop_price:
+            return max(o, order.stop_price)
+        if not buy and l <= order.stop_price:
+            return min(o, order.stop_price)
+        if order.type == "trailing_stop":
+            order.hwm = min(order.hwm, l) if buy else max(order.hwm, h)
+            order.stop_price = self._trail_stop(order)
+        return None
+
+    def _check_resting(self, start: int, end: int):
+        resting = [o for o in self.orders.values() if o.is_open and o.status != "held"]
+        for order in resting:
+            data = self.market.series(order.symbol)
+            for row in range(start, end):
+                if not order.is_open:
+                    break  # an OCO sibling filled earlier in this loop
+                if not data["present"][row]:
+                    continue
+                price = self._bar_price(
+                    order, data["open"][row], data["high"][row], data["low"][row]
+                )
+                if price is not None:
+                    self._fill(order, order.remaining, round(float(price), 2))
+                    break
+
+    def _fill(self, order: FakeOrder, qty: float, price: float):
+        filled = order.filled_qty + qty
+        order.filled_avg_price = (
+            (order.filled_avg_price or 0.0) * order.filled_qty + price * qty
+        ) / filled
+        order.filled_qty = filled
+        order.updated_at = now = _now_iso()
+        done = order.remaining <= 1e-9
+        order.status = "filled" if done else "partially_filled"
+        if done:
+            order.filled_at = now
+
+        signed = qty if order.side == "buy" else -qty
+        position = self.positions.get(order.symbol, {"qty": 0.0, "avg": price})
+        held, avg = position["qty"], position["avg"]
+        new_qty = held + signed
+        if held == 0 or (held > 0) == (signed > 0):
+            avg = (held * avg + signed * price) / new_qty
+        elif new_qty != 0 and (new_qty > 0) != (held > 0):
+            avg = price  # flipped through flat
+        if abs(new_qty) < 1e-9:
+            self.positions.pop(order.symbol, None)
+            new_qty = 0.0
+        else:
+            self.positions[order.symbol] = {"qty": new_qty, "avg": avg}
+        self.cash -= signed * price
+
+        event = "fill" if done else "partial_fill"
+        self.counts["fills" if done else "partial_fills"] += 1
+        self.activities.append(
+            {
+                "id": f"{now}::{uuid.uuid4()}",
+                "activity_type": "FILL",
+                "transaction_time": now,
+                "type": event,
+                "price": _decimal(price),
+                "qty": _decimal(qty),
+                "side": "sell_short" if signed < 0 and held <= 0 else order.side,
+                "symbol": order.symbol,
+                "leaves_qty": _decimal(order.remaining),
+                "order_id": order.id,
+                "cum_qty": _decimal(order.filled_qty),
+                "order_status": order.status,
+            }
+        )
+        self._emit(
+            event, order, price=price, qty=qty, position_qty=new_qty, timestamp=now
+        )
+
+        if done and order.legs:
+            for leg in order.legs:
+                if order.order_class == "oco":
+                    self._cancel(leg)  # the take profit filled: drop the stop
+                else:
+                    leg.status = "new"  # bracket exits go live once the entry fills
+                    self._emit("new", leg)
+        if done and order.parent_id:
+            parent = self.orders[order.parent_id]
+            if parent.order_class == "oco":
+                self._cancel(parent)  # the stop filled: drop the take profit
+            for sibling in parent.legs:
+                if sibling is not order:
+                    self._cancel(sibling)
+
+    def _get_activities(self, query, body, activity_types=None):
+        types = activity_types or query.get("activity_types", "")
+        if types and "FILL" not in types.split(","):
+            return []
+        activities = list(self.activities)
+        if query.get("direction", "desc") == "desc":
+            activities.reverse()
+        token = query.get("page_token")
+        if token:
+            ids = [activity["id"] for activity in activities]
+            activities = activities[ids.index(token) + 1 :] if token in ids else []
+        return activities[: int(query.get("page_size") or DEFAULT_PAGE_SIZE)]
+
+    # Trade update stream ----------------------------------------------------
+
+    def _emit(self, event: str, order: FakeOrder, **fields):
+        """Queue a trade update; _flush sends queued updates in order"""
+        data = {"event": event, "order": order.to_json()}
+        for name, value in fields.items():
+            data[name] = _decimal(value) if isinstance(value, float) else value
+        self._outbox.append(
+            json.dumps({"stream": "trade_updates", "data": data}).encode("utf-8")
+        )
+
+    def _flush(self):
+        with self._send_lock:
+            with self._lock:
+                if not self._outbox:
+                    return
+                messages, self._outbox = self._outbox, []
+                clients = [c for c in self._streams if "trade_updates" in c.streams]
+            for client in clients:
+                for message in messages:
+                    if not client.send(message):
+                        break
+                else:
+                    continue
+                with self._lock:
+                    if client in self._streams:
+                        self._streams.remove(client)
+            with self._lock:
+                self.counts["stream_events"] += len(messages)
+
+    def _serve_stream(self, handler: _BrokerHandler):
+        """Speak Alpaca's trading stream protocol on an upgraded connection"""
+        handler.close_connection = True
+        key = handler.headers.get("Sec-WebSocket-Key", "")
+        accept = base64.b64encode(
+            hashlib.sha1((key + WS_GUID).encode("ascii")).digest()
+        ).decode("ascii")
+        handler.send_response(101, "Switching Protocols")
+        handler.send_header("Upgrade", "websocket")
+        handler.send_header("Connection", "Upgrade")
+        handler.send_header("Sec-WebSocket-Accept", accept)
+        handler.end_headers()
+
+        client = _StreamClient(handler.connection)
+        authorized = False
+        try:
+            while True:
+                opcode, payload = _ws_read(handler.rfile)
+                if opcode == 0x8:
+                    client.send(payload[:2], opcode=0x8)
+                    break
+                if opcode == 0x9:
+                    client.send(payload, opcode=0xA)
+                    continue
+                if opcode not in (0x1, 0x2):
+                    continue
+                message = json.loads(payload)
+                action, data = message.get("action"), message.get("data") or {}
+                if action == "authenticate":
+                    authorized = bool(data.get("key_id"))
+                    client.send_json(
+                        {
+                            "stream": "authorization",
+                            "data": {
+                                "action": "authenticate",
+                                "status": (
+                                    "authorized" if authorized else "unauthorized"
+                                ),
+                            },
+                        }
+                    )
+                elif action == "listen" and authorized:
+                    client.streams = set(data.get("streams") or [])
+                    with self._lock:
+                        if client not in self._streams:
+                            self._streams.append(client)
+                    client.send_json(
+                        {
+                            "stream": "listening",
+                            "data": {"streams": sorted(client.streams)},
+                        }
+                    )
+        except (OSError, ValueError):
+            pass  # client went away or sent something unreadable
+        finally:
+            with self._lock:
+                if client in self._streams:
+                    self._streams.remove(client)
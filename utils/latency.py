@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Latency Instrumentation
+Named spans on the signal-to-fill hot path recorded into fixed-bucket,
+HDR-style log-linear histograms. Recording is O(1) with no allocation;
+percentiles are read from the bucket counts on demand.
+
+    from utils.latency import latency
+
+    with latency.span("data_fetch"):
+        bars = data_manager.get_bars(symbol)
+
+    latency.summary()  # {"data_fetch": {"count": .., "p50_ms": .., ...}}
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+# Values are recorded in microseconds. Below 2 * SUB_BUCKETS each microsecond
+# has its own bucket; above, every power of two is split into SUB_BUCKETS
+# buckets, so any value is known to within 1/SUB_BUCKETS (~3%).
+SUB_BUCKETS = 32
+DEFAULT_MAX_SECONDS = 600.0
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """Log-linear bucketed histogram of durations"""
+
+    def __init__(self, max_seconds: float = DEFAULT_MAX_SECONDS):
+        self.max_us = int(max_seconds * 1e6)
+        self._counts = [0] * (self._index(self.max_us) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_seen_us = 0
+
+    @staticmethod
+    def _index(us: int) -> int:
+        if us < 2 * SUB_BUCKETS:
+            return us
+        shift = us.bit_length() - SUB_BUCKETS.bit_length()
+        # (us >> shift) is in [SUB_BUCKETS, 2 * SUB_BUCKETS)
+        return SUB_BUCKETS * shift + (us >> shift)
+
+    @staticmethod
+    def _bucket_bounds(index: int):
+        """[low, high] microseconds covered by a bucket"""
+        if index < 2 * SUB_BUCKETS:
+            return index, index
+        shift = index // SUB_BUCKETS - 1
+        mantissa = index - SUB_BUCKETS * shift
+        low = mantissa << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, seconds: float):
+        us = min(max(int(seconds * 1e6), 0), self.max_us)
+        index = self._index(us)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total_us += us
+            self.min_us = us if self.min_us is None else min(self.min_us, us)
+            self.max_seen_us = max(self.max_seen_us, us)
+
+    def percentile(self, pct: float) -> float:
+        """Value (seconds) at or below which pct percent of samples fall"""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, int(round(pct / 100.0 * self.count)))
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank:
+                    low, high = self._bucket_bounds(index)
+                    return min((low + high) / 2.0, self.max_seen_us) / 1e6
+        return self.max_seen_us / 1e6
+
+    def bucket_counts(self) -> Iterable:
+        """(upper bound in seconds, count) for each non-empty bucket"""
+        with self._lock:
+            counts = list(self._counts)
+        return [(self._bucket_bounds(i)[1] / 1e6, c) for i, c in enumerate(counts) if c]
+
+    def cumulative_counts(self, bounds: Iterable[float]) -> List[int]:
+        """Samples at or below each bound (seconds), for fixed-bucket export
+
+        A fine bucket counts toward a bound when its upper edge is within it,
+        so counts are exact to the histogram's resolution.
+        """
+        with self._lock:
+            counts = list(self._counts)
+        limits = [int(bound * 1e6) for bound in bounds]
+        result = [0] * len(limits)
+        for index, count in enumerate(counts):
+            if not count:
+                continue
+            high = self._bucket_bounds(index)[1]
+            for i, limit in enumerate(limits):
+                if high <= limit:
+                    result[i] += count
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self.count = self.total_us = self.max_seen_us = 0
+            self.min_us = None
+
+    def summary(self) -> Dict:
+        result = {"count": self.count}
+        if not self.count:
+            return result
+        for pct in PERCENTILES:
+            result[f"p{pct}_ms"] = round(self.percentile(pct) * 1000, 3)
+        result["mean_ms"] = round(self.total_us / self.count / 1000, 3)
+        result["max_ms"] = round(self.max_seen_us / 1000, 3)
+        return result
+
+
+class LatencyRecorder:
+    """Histograms by span name"""
+
+    def __init__(self, max_seconds: float = DEFAULT_MAX_SECONDS):
+        self.max_seconds = max_seconds
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    name, LatencyHistogram(self.max_seconds)
+                )
+        return histogram
+
+    def record(self, name: str, seconds: float):
+        self.histogram(name).record(seconds)
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the body of a with block (recorded even if it raises)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name).record(time.perf_counter() - started)
+
+    def timed(self, name: str):
+        """Decorator form of span()"""
+
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def names(self):
+        return sorted(self._histograms)
+
+    def summary(self) -> Dict[str, Dict]:
+        return {name: self._histograms[name].summary() for name in self.names()}
+
+    def reset(self):
+        for histogram in list(self._histograms.values()):
+            histogram.reset()
+
+
+# Process-wide recorder shared by the engine, managers and strategies
+latency = LatencyRecorder()
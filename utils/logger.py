@@ -2,14 +2,138 @@
 """
 ASCII-only logging system for Intraday Trading Bot
 No Unicode characters to prevent charmap errors
+
+Loggers hand records to a queue; one background listener thread formats
+them and does the file/console I/O, so the trading loop only pays for
+creating the record. Use %-style arguments on hot paths so formatting also
+happens on the listener thread:
+
+    logger.info("📊 Getting market data for %s...", symbol)
+
+Records below WARNING are rate limited per call site (file and line): each
+site may burst, then is sampled, and the next record that gets through
+reports how many were dropped.
 """
 
+import atexit
 import logging
-import os
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
+from config import config
+
+
+class CallSiteRateLimiter(logging.Filter):
+    """Token bucket per call site with 1-in-N sampling once it runs dry
+
+    WARNING and above always pass. A record that passes after some were
+    dropped gets a "[+N suppressed]" suffix.
+    """
+
+    def __init__(self, rate: float, burst: int, sample_every: int):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.sample_every = max(1, sample_every)
+        self._sites = {}  # (pathname, lineno) -> [tokens, last refill, dropped]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        now = time.monotonic()
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                site = self._sites[key] = [float(self.burst), now, 0]
+            site[0] = min(self.burst, site[0] + (now - site[1]) * self.rate)
+            site[1] = now
+            if site[0] >= 1.0:
+                site[0] -= 1.0
+            elif (site[2] + 1) % self.sample_every:
+                site[2] += 1
+                return False
+            dropped, site[2] = site[2], 0
+        if dropped:
+            record.msg = f"{record.msg} [+{dropped} suppressed]"
+        return True
+
+
+class _RoutingHandler(logging.Handler):
+    """Listener-side handler: sends each record to its own logger's handlers"""
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}
+
+    def handle(self, record: logging.LogRecord):
+        flushed = getattr(record, "flushed", None)
+        if flushed is not None:
+            for handlers in list(self.routes.values()):
+                for handler in handlers:
+                    handler.flush()
+            flushed.set()
+            return
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records unformatted; the listener thread formats them
+
+    Arguments must not be mutated after the logging call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_router = _RoutingHandler()
+_queue = queue.SimpleQueue()
+_listener = None
+_listener_lock = threading.Lock()
+_rate_limiter = CallSiteRateLimiter(
+    rate=config.get("LOG_SITE_RATE", 0.2),
+    burst=config.get("LOG_SITE_BURST", 30),
+    sample_every=config.get("LOG_SAMPLE_EVERY", 10),
+)
+
+
+def _ensure_listener():
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = logging.handlers.QueueListener(_queue, _router)
+            _listener.start()
+
+
+def flush_logging(timeout: float = 5.0) -> bool:
+    """Wait until records queued so far are written; False on timeout"""
+    if _listener is None:
+        return True
+    flushed = threading.Event()
+    _queue.put(logging.makeLogRecord({"flushed": flushed}))
+    return flushed.wait(timeout)
+
+
+def shutdown_logging():
+    """Drain queued records and stop the listener thread"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(shutdown_logging)
+
 
 def setup_logger(name, level="INFO"):
     """Setup ASCII-only logger"""
@@ -23,6 +147,8 @@ def setup_logger(name, level="INFO"):
     logger.setLevel(getattr(logging, level.upper()))
 
     # Clear existing handlers
+    for handler in logger.handlers + _router.routes.pop(name, []):
+        handler.close()
     logger.handlers = []
 
     # Create formatters - ASCII only
@@ -39,13 +165,26 @@ def setup_logger(name, level="INFO"):
     file_handler = logging.FileHandler(log_file, encoding="ascii", errors="replace")
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+
+    if not config.get("LOG_ASYNC", True):
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
+        return logger
+
+    # Formatting and I/O happen on the listener thread
+    _router.routes[name] = [file_handler, console_handler]
+    queue_handler = _DeferredQueueHandler(_queue)
+    if config.get("LOG_RATE_LIMIT_ENABLED", True) and name not in config.get(
+        "LOG_RATE_LIMIT_EXEMPT", ()
+    ):
+        queue_handler.addFilter(_rate_limiter)
+    logger.addHandler(queue_handler)
+    _ensure_listener()
 
     return logger
 
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Metrics Exposition
+Process-wide counters and gauges, plus the latency histograms, rendered in
+the Prometheus text format by an optional HTTP endpoint. The endpoint runs
+on a daemon ThreadingHTTPServer, so scrapes never block the trading thread;
+values owned by the engine are read by collectors at scrape time instead of
+being pushed from the loop.
+
+    from utils.metrics import metrics, MetricsServer
+
+    metrics.inc("alpaca_api_calls_total", endpoint="get_bars")
+    server = MetricsServer(metrics, port=9108).start()
+    # curl http://127.0.0.1:9108/metrics
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.latency import LatencyRecorder, latency
+from utils.logger import setup_logger
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bucket bounds (seconds) for exported histograms
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# A collector returns (name, type, help, [(labels, value), ...]) families
+Sample = Tuple[Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Counters, gauges, latency histograms and scrape-time collectors"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}  # name -> (type, help)
+        self._values: Dict[str, Dict[Tuple, float]] = {}
+        self._histograms: List[Tuple[str, str, str, LatencyRecorder]] = []
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+        self.logger = setup_logger("metrics")
+
+    def describe(self, name: str, kind: str, help_text: str):
+        self._help[name] = (kind, help_text)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter (created on first use)"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+        if name not in self._help:
+            self._help[name] = ("counter", "")
+
+    def set(self, name: str, value: float, **labels):
+        """Set a gauge (created on first use)"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values.setdefault(name, {})[key] = value
+        if name not in self._help:
+            self._help[name] = ("gauge", "")
+
+    def value(self, name: str, **labels) -> float:
+        return self._values.get(name, {}).get(tuple(sorted(labels.items())), 0)
+
+    def add_histograms(
+        self, name: str, help_text: str, recorder: LatencyRecorder, label: str
+    ):
+        """Export every histogram of a recorder as one family, labelled by span"""
+        self._histograms.append((name, help_text, label, recorder))
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]):
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], Iterable[Family]]):
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def render(self) -> str:
+        """Everything in the Prometheus text exposition format"""
+        lines: List[str] = []
+
+        with self._lock:
+            values = {name: dict(series) for name, series in self._values.items()}
+        for name in sorted(values):
+            kind, help_text = self._help.get(name, ("untyped", ""))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(values[name].items()):
+                lines.append(
+                    f"{name}{_format_labels(dict(key))} {_format_value(value)}"
+                )
+
+        for collector in list(self._collectors):
+            try:
+                families = list(collector())
+            except Exception as e:
+                self.logger.warning(f"⚠️ Metrics collector failed: {e}")
+                continue
+            for name, kind, help_text, samples in families:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    if value is None:
+                        continue
+                    lines.append(
+                        f"{name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+
+        for name, help_text, label, recorder in self._histograms:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for span in recorder.names():
+                histogram = recorder.histogram(span)
+                counts = histogram.cumulative_counts(DEFAULT_BUCKETS)
+                total = histogram.count
+                for bound, count in zip(DEFAULT_BUCKETS, counts):
+                    labels = {label: span, "le": _format_value(bound)}
+                    lines.append(f"{name}_bucket{_format_labels(labels)} {count}")
+                labels = {label: span, "le": "+Inf"}
+                lines.append(f"{name}_bucket{_format_labels(labels)} {total}")
+                lines.append(
+                    f"{name}_sum{_format_labels({label: span})} "
+                    f"{_format_value(histogram.total_us / 1e6)}"
+                )
+                lines.append(f"{name}_count{_format_labels({label: span})} {total}")
+
+        return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = None
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = self.registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+        elif path == "/healthz":
+            body = b"ok\n"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+        else:
+            body = b"not found\n"
+            self.send_response(404)
+            self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # scrapes every few seconds would flood the logs
+
+
+class MetricsServer:
+    """Serves a registry at /metrics from a daemon thread"""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        host: str = "127.0.0.1",
+        port: int = 9108,
+    ):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.logger = setup_logger("metrics_server")
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2] if self._server else (self.host, 0)
+
+    def start(self) -> "MetricsServer":
+        handler = type(
+            "MetricsHandler", (_MetricsHandler,), {"registry": self.registry}
+        )
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="metrics-server",
+            daemon=True,
+        )
+        self._thread.start()
+        host, port = self.address
+        self.logger.info(f"📈 Metrics endpoint at http://{host}:{port}/metrics")
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# Process-wide registry shared by the API client, engine and managers
+metrics = MetricsRegistry()
+metrics.describe(
+    "indicator_cache_requests_total", "counter", "Indicator requests by cache result"
+)
+metrics.add_histograms(
+    "engine_stage_latency_seconds",
+    "Signal-to-fill stage latency (data fetch, strategies, order submit, ...)",
+    latency,
+    label="stage",
+)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Online Statistics
+Streaming trade statistics updated in O(1) per closed trade: Welford
+mean/variance, equity high-water mark and max drawdown, rolling win rate and
+expectancy
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional
+
+
+class WelfordAccumulator:
+    """Running mean and variance (Welford's algorithm)"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 until there are two observations)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class DrawdownTracker:
+    """Cumulative P&L with its high-water mark and deepest drawdown"""
+
+    def __init__(self, starting_equity: float = 0.0):
+        self.equity = starting_equity
+        self.high_water_mark = starting_equity
+        self.max_drawdown = 0.0
+
+    def update(self, pnl: float):
+        self.equity += pnl
+        self.high_water_mark = max(self.high_water_mark, self.equity)
+        self.max_drawdown = max(self.max_drawdown, self.drawdown)
+
+    @property
+    def drawdown(self) -> float:
+        return self.high_water_mark - self.equity
+
+
+class RollingWinRate:
+    """Win rate over the last `window` trades"""
+
+    def __init__(self, window: int = 50):
+        self._results = deque(maxlen=window)
+        self._wins = 0
+
+    def update(self, won: bool):
+        if len(self._results) == self._results.maxlen and self._results[0]:
+            self._wins -= 1
+        self._results.append(bool(won))
+        self._wins += bool(won)
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._wins / len(self._results) if self._results else None
+
+
+class OnlinePerformanceStats:
+    """Per-trade P&L statistics for the live engine"""
+
+    def __init__(self, window: int = 50):
+        self.pnl = WelfordAccumulator()
+        self.wins = WelfordAccumulator()
+        self.losses = WelfordAccumulator()
+        self.drawdown = DrawdownTracker()
+        self.rolling_win_rate = RollingWinRate(window)
+
+    def update(self, pnl: float):
+        """Add one closed trade's realized P&L"""
+        self.pnl.update(pnl)
+        if pnl > 0:
+            self.wins.update(pnl)
+        else:
+            self.losses.update(pnl)
+        self.drawdown.update(pnl)
+        self.rolling_win_rate.update(pnl > 0)
+
+    @property
+    def sharpe_ratio(self) -> float:
+        """Per-trade Sharpe: mean P&L over its standard deviation"""
+        std = self.pnl.std
+        return self.pnl.mean / std if std > 0 else 0.0
+
+    @property
+    def win_rate(self) -> Optional[float]:
+        return self.wins.count / self.pnl.count if self.pnl.count else None
+
+    @property
+    def expectancy(self) -> float:
+        """Expected P&L per trade: win% x avg win + loss% x avg loss"""
+        if not self.pnl.count:
+            return 0.0
+        win_rate = self.wins.count / self.pnl.count
+        return win_rate * self.wins.mean + (1 - win_rate) * self.losses.mean
+
+    def snapshot(self) -> Dict:
+        return {
+            "trades": self.pnl.count,
+            "mean_pnl": round(self.pnl.mean, 4),
+            "pnl_std": round(self.pnl.std, 4),
+            "sharpe_ratio": round(self.sharpe_ratio, 4),
+            "win_rate": self.win_rate,
+            "rolling_win_rate": self.rolling_win_rate.value,
+            "avg_win": round(self.wins.mean, 4),
+            "avg_loss": round(self.losses.mean, 4),
+            "expectancy": round(self.expectancy, 4),
+            "equity": round(self.drawdown.equity, 2),
+            "high_water_mark": round(self.drawdown.high_water_mark, 2),
+            "drawdown": round(self.drawdown.drawdown, 2),
+            "max_drawdown": round(self.drawdown.max_drawdown, 2),
+        }
@@ -2,11 +2,19 @@
 Signal types for trading system
 """
 
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 
+def make_signal_id(symbol: str, signal_type: str, strategy: str, timestamp) -> str:
+    """Short stable id for a signal (same inputs always give the same id)"""
+    stamp = timestamp.isoformat() if hasattr(timestamp, "isoformat") else timestamp
+    key = f"{symbol}|{signal_type}|{strategy}|{stamp}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
 @dataclass
 class ScalpingSignal:
     """Represents a scalping trading signal"""
@@ -25,6 +33,13 @@ class ScalpingSignal:
         if self.metadata is None:
             self.metadata = {}
 
+    @property
+    def signal_id(self) -> str:
+        """Stable id for this signal, used to build its client_order_ids"""
+        return make_signal_id(
+            self.symbol, self.signal_type, self.strategy, self.timestamp
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert signal to dictionary"""
         return {
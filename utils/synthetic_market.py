@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Synthetic Market
+Deterministic intraday market data for benchmarks and soak tests, so the
+engine can be driven without Alpaca and faster than real time.
+
+Prices follow a geometric Brownian motion with Poisson jumps and an
+overnight gap at each session open. Volatility, volume and spreads follow
+the usual intraday U shape (busy open and close, quiet midday), and a few
+sessions contain a trading halt: no bars print while a symbol is halted and
+it reopens with a jump and wide spreads.
+
+Every symbol is generated from (seed, symbol) alone, lazily and vectorized,
+so any subset of thousands of symbols is reproducible and cheap (well under
+a millisecond per symbol-session). Output matches what DataManager returns: bars
+are a DataFrame indexed by a UTC "timestamp" with open/high/low/close/volume;
+quotes and trades use Alpaca's column names.
+
+    market = SyntheticMarket(symbols=500, days=5, seed=7)
+    market.bars("SYM001", limit=100)
+    market.advance()  # move the market clock one minute forward
+    data_manager = SyntheticDataManager(market)
+"""
+
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pytz
+
+EASTERN = pytz.timezone("US/Eastern")
+SESSION_OPEN = time(9, 30)
+SESSION_MINUTES = 390
+MINUTE_DT = 1.0 / (252 * SESSION_MINUTES)  # one minute in years
+
+RESAMPLE_RULES = {
+    "1Min": None,
+    "5Min": "5min",
+    "15Min": "15min",
+    "1Hour": "1h",
+    "1Day": "1D",
+}
+
+
+@dataclass
+class SymbolProfile:
+    """Per-symbol parameters, drawn once from the symbol's seed"""
+
+    symbol: str
+    start_price: float
+    annual_vol: float
+    daily_volume: float
+    spread_bps: float
+    jumps_per_day: float
+    jump_sigma: float
+
+
+def symbol_seed(seed: int, symbol: str) -> List[int]:
+    return [seed, zlib.crc32(symbol.encode())]
+
+
+def intraday_shape(minutes: int = SESSION_MINUTES) -> np.ndarray:
+    """U-shaped activity curve over a session, mean 1"""
+    m = np.arange(minutes)
+    shape = 1 + 2.5 * np.exp(-m / 25) + 1.5 * np.exp(-(minutes - 1 - m) / 25)
+    return shape / shape.mean()
+
+
+def session_days(days: int, end_date: Optional[date] = None) -> List[date]:
+    """The last `days` weekdays up to and including end_date"""
+    day = end_date or datetime.now(EASTERN).date()
+    sessions = []
+    while len(sessions) < days:
+        if day.weekday() < 5:
+            sessions.append(day)
+        day -= timedelta(days=1)
+    return sessions[::-1]
+
+
+def session_index(sessions: Iterable[date]) -> pd.DatetimeIndex:
+    """UTC minute timestamps of every regular-hours bar in the sessions"""
+    parts = []
+    for day in sessions:
+        open_et = EASTERN.localize(datetime.combine(day, SESSION_OPEN))
+        parts.append(
+            pd.date_range(open_et, periods=SESSION_MINUTES, freq="1min").tz_convert(
+                "UTC"
+            )
+        )
+    index = parts[0].append(parts[1:]) if len(parts) > 1 else parts[0]
+    return index.rename("timestamp")
+
+
+class SyntheticMarket:
+    """Seeded multi-symbol market with a movable clock"""
+
+    def __init__(
+        self,
+        symbols: Union[int, Iterable[str]] = 100,
+        days: int = 5,
+        seed: int = 0,
+        end_date: Optional[date] = None,
+        drift: float = 0.0,
+        gap_sigma: float = 0.01,
+        halt_probability: float = 0.02,
+        halt_minutes: tuple = (5, 15),
+    ):
+        if isinstance(symbols, int):
+            symbols = [f"SYM{i:04d}" for i in range(symbols)]
+        self.symbols = list(symbols)
+        self.symbol_set = set(self.symbols)
+        self.seed = seed
+        self.drift = drift
+        self.gap_sigma = gap_sigma
+        self.halt_probability = halt_probability
+        self.halt_minutes = halt_minutes
+
+        self.sessions = session_days(days, end_date)
+        self.index = session_index(self.sessions)
+        self.shape = np.tile(intraday_shape(), len(self.sessions))
+        self.position = len(self.index)  # bars visible so far
+        self._series: Dict[str, Dict[str, np.ndarray]] = {}
+
+    # Market clock -------------------------------------------------------
+
+    @property
+    def now(self) -> pd.Timestamp:
+        """Timestamp of the latest visible bar"""
+        return self.index[max(self.position, 1) - 1]
+
+    def rewind(self, position: int = SESSION_MINUTES):
+        """Show only the first `position` minutes; advance() replays the rest"""
+        self.position = max(1, min(position, len(self.index)))
+
+    def advance(self, minutes: int = 1) -> bool:
+        """Move the clock forward; False once the last bar is visible"""
+        self.position = min(self.position + minutes, len(self.index))
+        return self.position < len(self.index)
+
+    # Generation ---------------------------------------------------------
+
+    def profile(self, symbol: str) -> SymbolProfile:
+        rng = np.random.default_rng(symbol_seed(self.seed, symbol) + [0])
+        price = float(np.exp(rng.uniform(np.log(5), np.log(500))))
+        daily_volume = float(np.exp(rng.uniform(np.log(2e5), np.log(5e7))))
+        return SymbolProfile(
+            symbol=symbol,
+            start_price=round(price, 2),
+            annual_vol=float(rng.uniform(0.15, 0.9)),
+            daily_volume=daily_volume,
+            # Cheaper, thinner names trade on wider spreads
+            spread_bps=float(
+                np.clip(2 + 40 / np.sqrt(price) + 2e6 / daily_volume, 1, 80)
+            ),
+            jumps_per_day=float(rng.uniform(0.1, 1.5)),
+            jump_sigma=float(rng.uniform(0.002, 0.01)),
+        )
+
+    def series(self, symbol: str) -> Dict[str, np.ndarray]:
+        """Full-timeline arrays for a symbol (generated once, then cached)"""
+        cached = self._series.get(symbol)
+        if cached is None:
+            cached = self._series[symbol] = self._generate(symbol)
+        return cached
+
+    def _generate(self, symbol: str) -> Dict[str, np.ndarray]:
+        p = self.profile(symbol)
+        rng = np.random.default_rng(symbol_seed(self.seed, symbol) + [1])
+        n = len(self.index)
+        days = len(self.sessions)
+        day_starts = np.arange(days) * SESSION_MINUTES
+
+        sigma = p.annual_vol * np.sqrt(MINUTE_DT * self.shape)
+        z = rng.standard_normal(n)
+        intrabar = (self.drift * MINUTE_DT - 0.5 * sigma**2) + sigma * z
+        jumps = rng.random(n) < p.jumps_per_day / SESSION_MINUTES
+        intrabar[jumps] += rng.normal(0, p.jump_sigma, jumps.sum())
+
+        # Gaps land between the previous close and this bar's open
+        gap = np.zeros(n)
+        gap[day_starts[1:]] = rng.normal(0, self.gap_sigma, days - 1) * np.where(
+            rng.random(days - 1) < 0.1, 4.0, 1.0
+        )
+
+        present = np.ones(n, dtype=bool)
+        widen = np.ones(n)
+        for start in day_starts[rng.random(days) < self.halt_probability]:
+            begin = start + rng.integers(30, SESSION_MINUTES - 45)
+            end = begin + rng.integers(*self.halt_minutes, endpoint=True)
+            present[begin:end] = False
+            intrabar[begin:end] = 0.0
+            gap[end] += rng.normal(0, 4 * p.jump_sigma)
+            widen[end : end + 10] = 4.0
+
+        log_close = np.log(p.start_price) + np.cumsum(gap + intrabar)
+        close = np.exp(log_close)
+        open_ = np.exp(log_close - intrabar)
+        wick = np.abs(rng.standard_normal((2, n))) * sigma * 0.6
+        high = np.maximum(open_, close) * np.exp(wick[0])
+        low = np.minimum(open_, close) * np.exp(-wick[1])
+
+        open_, close = np.round(open_, 2), np.round(close, 2)
+        high = np.maximum(np.round(high, 2), np.maximum(open_, close))
+        low = np.minimum(np.round(low, 2), np.minimum(open_, close))
+        low = np.maximum(low, 0.01)
+
+        volume = (
+            p.daily_volume
+            / SESSION_MINUTES
+            * self.shape
+            * rng.lognormal(0, 0.5, n)
+            * (1 + 0.5 * np.abs(z) + 20 * np.abs(gap))
+        )
+        spread = np.maximum(
+            0.01, np.round(close * p.spread_bps / 1e4 * np.sqrt(self.shape) * widen, 2)
+        )
+        return {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": np.maximum(1, volume).astype(np.int64),
+            "spread": spread,
+            "present": present,
+            "quote_size": rng.integers(1, 20, (2, n)) * 100,
+        }
+
+    def _visible(self, symbol: str, limit: Optional[int]):
+        """Positions of the printed bars up to the clock, newest `limit` of them"""
+        rows = np.flatnonzero(self.series(symbol)["present"][: self.position])
+        return rows if limit is None else rows[-limit:]
+
+    # DataManager-shaped views -------------------------------------------
+
+    def bars(
+        self, symbol: str, limit: Optional[int] = None, timeframe: str = "1Min"
+    ) -> pd.DataFrame:
+        """OHLCV bars up to the market clock, as DataManager.get_bars returns"""
+        data = self.series(symbol)
+        rule = RESAMPLE_RULES[timeframe]
+        rows = self._visible(symbol, None if rule else limit)
+        frame = pd.DataFrame(
+            {name: data[name][rows] for name in ("open", "high", "low", "close")},
+            index=self.index[rows],
+        )
+        frame["volume"] = data["volume"][rows]
+        if rule is None:
+            return frame
+        frame = (
+            frame.resample(rule)
+            .agg(
+                {
+                    "open": "first",
+                    "high": "max",
+                    "low": "min",
+                    "close": "last",
+                    "volume": "sum",
+                }
+            )
+            .dropna()
+        )
+        frame["volume"] = frame["volume"].astype(np.int64)
+        return frame if limit is None else frame.iloc[-limit:]
+
+    def quotes(self, symbol: str, limit: Optional[int] = None) -> pd.DataFrame:
+        """NBBO at each bar close (bid/ask price and size)"""
+        data = self.series(symbol)
+        rows = self._visible(symbol, limit)
+        close, half = data["close"][rows], data["spread"][rows] / 2
+        bid = np.maximum(0.01, np.floor((close - half) * 100 + 1e-6) / 100)
+        ask = np.maximum(bid + 0.01, np.ceil((close + half) * 100 - 1e-6) / 100)
+        return pd.DataFrame(
+            {
+                "bid_price": bid,
+                "bid_size": data["quote_size"][0][rows],
+                "ask_price": np.round(ask, 2),
+                "ask_size": data["quote_size"][1][rows],
+            },
+            index=self.index[rows],
+        )
+
+    def trades(
+        self, symbol: str, limit: Optional[int] = None, per_bar: int = 4
+    ) -> pd.DataFrame:
+        """Prints inside each bar: the open, the close and some in between"""
+        data = self.series(symbol)
+        rows = self._visible(symbol, limit)
+        rng = np.random.default_rng(symbol_seed(self.seed, symbol) + [2, len(rows)])
+        low, high = data["low"][rows, None], data["high"][rows, None]
+        prices = np.round(low + (high - low) * rng.random((len(rows), per_bar)), 2)
+        prices[:, 0] = data["open"][rows]
+        prices[:, -1] = data["close"][rows]
+        weights = rng.random((len(rows), per_bar)) + 0.1
+        sizes = np.maximum(
+            1,
+            (weights / weights.sum(axis=1, keepdims=True)) * data["volume"][rows, None],
+        ).astype(np.int64)
+        offsets = pd.to_timedelta(
+            np.sort(rng.random((len(rows), per_bar)), axis=1).ravel() * 60, unit="s"
+        )
+        return pd.DataFrame(
+            {"price": prices.ravel(), "size": sizes.ravel()},
+            index=(self.index[rows].repeat(per_bar) + offsets).rename("timestamp"),
+        )
+
+    def latest_price(self, symbol: str) -> Optional[float]:
+        rows = self._visible(symbol, 1)
+        return float(self.series(symbol)["close"][rows[0]]) if len(rows) else None
+
+    def is_halted(self, symbol: str) -> bool:
+        return not self.series(symbol)["present"][self.position - 1]
+
+
+class SyntheticDataManager:
+    """Drop-in for DataManager that serves a SyntheticMarket
+
+    lookback: bars returned by get_bars regardless of the requested limit,
+    for benchmarks that scale history beyond what the engine asks for.
+    """
+
+    api = None
+
+    def __init__(self, market: SyntheticMarket, lookback: Optional[int] = None):
+        self.market = market
+        self.lookback = lookback
+
+    def verify_connection(self):
+        return True
+
+    def ensure_connection(self):
+        return True
+
+    def get_account_info(self):
+        return {
+            "equity": 100000.0,
+            "buying_power": 400000.0,
+            "cash": 100000.0,
+            "day_trading_buying_power": 400000.0,
+            "portfolio_value": 100000.0,
+        }
+
+    def get_positions(self):
+        return []
+
+    def get_current_price(self, symbol):
+        if symbol not in self.market.symbol_set:
+            return None
+        return self.market.latest_price(symbol)
+
+    def get_latest_prices(self, symbols):
+        return {
+            symbol: self.market.latest_price(symbol)
+            for symbol in symbols
+            if symbol in self.market.symbol_set
+        }
+
+    def get_bars(self, symbol, timeframe="15Min", limit=100):
+        if isinstance(symbol, list):
+            return {}  # multi-symbol bar objects are not simulated
+        if symbol not in self.market.symbol_set:
+            return pd.DataFrame()
+        return self.market.bars(symbol, self.lookback or limit, timeframe)
+
+    def get_market_status(self):
+        return {"is_open": True, "next_open": None, "next_close": None}